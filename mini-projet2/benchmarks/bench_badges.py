@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Benchmark du rendu des badges d'état d'un tableau de véhicules: un widget
+avec sa propre feuille de style par ligne (avant) face au BadgeDelegate
+partagé qui peint les badges depuis une palette précalculée (après).
+
+Chaque variante est remplie puis parcourue page par page jusqu'à la
+dernière ligne, en peignant la zone visible à chaque page.
+
+Usage:
+    python benchmarks/bench_badges.py             # 10 000 lignes
+    python benchmarks/bench_badges.py -n 2000
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Sans affichage disponible, Qt peint hors écran
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import (
+    QApplication, QWidget, QHBoxLayout, QLabel, QTableView, QTableWidget, QTableWidgetItem
+)
+from PyQt6.QtCore import Qt
+
+from models.vehicle import Car, VehicleCategory, VehicleState
+from gui.delegates import BadgeDelegate, BADGE_COLORS
+from gui.entity_table import EntityTableModel
+from gui.vehicles_page import VEHICLE_COLUMNS
+
+STATE_COLUMN = 6
+
+# Feuille de style d'un badge, telle qu'elle était appliquée à chaque ligne
+LEGACY_BADGE_STYLE = """
+    QLabel {{
+        background-color: {background};
+        color: {foreground};
+        padding: 2px 8px;
+        border-radius: 10px;
+        font-weight: 600;
+        font-size: 11px;
+        border: 1px solid {border};
+    }}
+"""
+
+
+def build_vehicles(count: int) -> list:
+    """Construit des véhicules dans des états variés."""
+    states = list(VehicleState)
+    vehicles = []
+    for i in range(count):
+        car = Car(
+            brand="Renault", model=f"Modele {i % 50}",
+            category=VehicleCategory.ECONOMY, daily_rate=30.0 + i % 70,
+            year=2020 + i % 5, license_plate=f"AA-{i:05d}",
+            vehicle_id=f"V{i:07d}"
+        )
+        car.state = states[i % len(states)]
+        vehicles.append(car)
+    return vehicles
+
+
+def fill_legacy_table(vehicles: list) -> QTableWidget:
+    """Avant: éléments pour chaque cellule et un widget stylé par badge."""
+    table = QTableWidget(len(vehicles), len(VEHICLE_COLUMNS))
+    table.setHorizontalHeaderLabels([column.header for column in VEHICLE_COLUMNS])
+    for row, vehicle in enumerate(vehicles):
+        for col, column in enumerate(VEHICLE_COLUMNS):
+            if column.text:
+                table.setItem(row, col, QTableWidgetItem(column.text(vehicle)))
+
+        state_widget = QWidget()
+        state_layout = QHBoxLayout(state_widget)
+        state_layout.setContentsMargins(2, 2, 2, 2)
+        state_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        state_label = QLabel(vehicle.state.value)
+        background, foreground, border = BADGE_COLORS[vehicle.state]
+        state_label.setStyleSheet(LEGACY_BADGE_STYLE.format(
+            background=background, foreground=foreground, border=border
+        ))
+        state_layout.addWidget(state_label)
+        table.setCellWidget(row, STATE_COLUMN, state_widget)
+    return table
+
+
+def fill_delegate_table(vehicles: list) -> QTableView:
+    """Après: modèle virtualisé et BadgeDelegate partagé."""
+    table = QTableView()
+    model = EntityTableModel(VEHICLE_COLUMNS, table)
+    model.set_items(vehicles)
+    table.setModel(model)
+    table.setItemDelegateForColumn(STATE_COLUMN, BadgeDelegate(table))
+    return table
+
+
+def render_all_rows(app: QApplication, table) -> int:
+    """Affiche le tableau et le peint page par page jusqu'à la dernière ligne."""
+    table.resize(1100, 700)
+    table.show()
+    app.processEvents()
+    bar = table.verticalScrollBar()
+    pages = 0
+    value = 0
+    while True:
+        bar.setValue(value)
+        table.viewport().repaint()
+        pages += 1
+        if value >= bar.maximum():
+            break
+        value += max(bar.pageStep(), 1)
+    table.hide()
+    return pages
+
+
+def timed(label: str, func):
+    """Exécute `func` et affiche sa durée."""
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<32} {elapsed:8.3f} s")
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark des badges peints par délégué")
+    parser.add_argument("-n", "--rows", type=int, default=10_000,
+                        help="Nombre de lignes")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    vehicles = build_vehicles(args.rows)
+    print(f"[BENCH] Badges d'état - {args.rows} lignes")
+
+    print("Avant (widget et feuille de style par ligne):")
+    legacy = timed("Remplissage", lambda: fill_legacy_table(vehicles))
+    pages = timed("Rendu de toutes les lignes", lambda: render_all_rows(app, legacy))
+    legacy.deleteLater()
+    app.processEvents()
+
+    print("Après (BadgeDelegate, palette précalculée):")
+    table = timed("Remplissage", lambda: fill_delegate_table(vehicles))
+    timed("Rendu de toutes les lignes", lambda: render_all_rows(app, table))
+    print(f"  {'Pages peintes':<32} {pages:8d}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la restauration des locations: constructeur validant
+face au chemin de restauration en masse (Rental.from_record).
+
+Usage:
+    python benchmarks/bench_restore.py               # 1 million d'enregistrements
+    python benchmarks/bench_restore.py -n 100000
+"""
+
+import argparse
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from models.rental import Rental
+from models.persistence import restore_rentals
+
+
+def build_records(count: int) -> list:
+    """Construit des enregistrements de locations futures (valides pour le constructeur)."""
+    start = date.today() + timedelta(days=1)
+    created_at = f"{date.today().isoformat()}T09:00:00"
+    records = []
+    for i in range(count):
+        start_date = start + timedelta(days=i % 365)
+        end_date = start_date + timedelta(days=1 + i % 10)
+        records.append({
+            'id': f"R{i:08d}",
+            'customer_id': f"C{i % 5000:07d}",
+            'vehicle_id': f"V{i % 1000:07d}",
+            'start_date': start_date.isoformat(),
+            'end_date': end_date.isoformat(),
+            'actual_return_date': end_date.isoformat(),
+            'status': "terminée",
+            '_status': "COMPLETED",
+            'daily_rate': 30.0 + i % 70,
+            'discount_applied': 0.0,
+            'penalty': 0.0,
+            'start_mileage': 0.0,
+            'end_mileage': 250.0,
+            'notes': "",
+            'created_at': created_at,
+        })
+    return records
+
+
+def construct_rentals(records: list) -> dict:
+    """Chemin historique: constructeur validant puis mise à jour de l'état."""
+    rentals = {}
+    for item in records:
+        rental = Rental(
+            customer_id=item['customer_id'],
+            vehicle_id=item['vehicle_id'],
+            start_date=date.fromisoformat(item['start_date']),
+            end_date=date.fromisoformat(item['end_date']),
+            daily_rate=item['daily_rate'],
+            start_mileage=item['start_mileage'],
+            rental_id=item['id']
+        )
+        rental.complete_rental(date.fromisoformat(item['actual_return_date']), item['end_mileage'])
+        rentals[rental.id] = rental
+    return rentals
+
+
+def timed(label: str, func):
+    """Exécute `func` et affiche sa durée."""
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed:8.3f} s")
+    return result, elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark constructeur vs restauration en masse")
+    parser.add_argument("-n", "--records", type=int, default=1_000_000,
+                        help="Nombre d'enregistrements")
+    args = parser.parse_args()
+
+    print(f"[BENCH] Restauration - {args.records} locations")
+    records, _ = timed("Génération des données", lambda: build_records(args.records))
+
+    constructed, constructor_time = timed("Constructeur validant", lambda: construct_rentals(records))
+    del constructed
+    restored, restore_time = timed("Restauration en masse", lambda: restore_rentals(records))
+
+    assert len(restored) == args.records
+    print(f"  {'Gain':<28} {constructor_time / restore_time:8.1f} x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
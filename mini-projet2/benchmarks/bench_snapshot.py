@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark du snapshot binaire face aux fichiers JSON.
+
+Usage:
+    python benchmarks/bench_snapshot.py             # 100 000 locations
+    python benchmarks/bench_snapshot.py -n 1000000  # 1 million de locations
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from models.vehicle import Car, VehicleCategory
+from models.customer import Customer
+from models.rental import Rental
+from models.persistence import DataPersistence
+
+
+def build_dataset(num_rentals: int, num_vehicles: int = 1000, num_customers: int = 5000):
+    """Construit un jeu de données synthétique."""
+    vehicles = {}
+    for i in range(num_vehicles):
+        car = Car(
+            brand="Renault", model=f"Modele {i % 50}",
+            category=VehicleCategory.ECONOMY, daily_rate=30.0 + i % 70,
+            year=2020 + i % 5, license_plate=f"AA-{i:05d}",
+            vehicle_id=f"V{i:07d}"
+        )
+        vehicles[car.id] = car
+
+    customers = {}
+    for i in range(num_customers):
+        customer = Customer(
+            first_name=f"Prenom{i}", last_name=f"Nom{i}",
+            birth_date=date(1970 + i % 30, 1 + i % 12, 1 + i % 28),
+            license_number=f"{i:012d}", license_types={"B"},
+            license_date=date(2000, 1, 1), email=f"client{i}@example.com",
+            phone="0600000000", customer_id=f"C{i:07d}"
+        )
+        customers[customer.id] = customer
+
+    start = date.today() + timedelta(days=1)
+    rentals = {}
+    for i in range(num_rentals):
+        rental = Rental(
+            customer_id=f"C{i % num_customers:07d}",
+            vehicle_id=f"V{i % num_vehicles:07d}",
+            start_date=start + timedelta(days=i % 365),
+            end_date=start + timedelta(days=i % 365 + 1 + i % 10),
+            daily_rate=30.0 + i % 70,
+            rental_id=f"R{i:08d}"
+        )
+        rentals[rental.id] = rental
+
+    return vehicles, customers, rentals
+
+
+def timed(label: str, func):
+    """Exécute `func` et affiche sa durée."""
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed:8.3f} s")
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark snapshot binaire vs JSON")
+    parser.add_argument("-n", "--rentals", type=int, default=100_000,
+                        help="Nombre de locations")
+    args = parser.parse_args()
+
+    print(f"[BENCH] Snapshot binaire - {args.rentals} locations")
+    vehicles, customers, rentals = timed(
+        "Génération des données", lambda: build_dataset(args.rentals)
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        persistence = DataPersistence(tmp)
+
+        timed("Sauvegarde JSON", lambda: persistence.save_all(vehicles, customers, rentals))
+        timed("Chargement JSON", persistence.load_all)
+
+        timed("Sauvegarde snapshot", lambda: persistence.save_snapshot(vehicles, customers, rentals))
+        loaded = timed("Chargement snapshot", persistence.load_snapshot)
+
+        size = persistence.snapshot_path.stat().st_size
+        print(f"  {'Taille du snapshot':<28} {size / 1e6:8.1f} Mo")
+        assert len(loaded[2]) == len(rentals)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
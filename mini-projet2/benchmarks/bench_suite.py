@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Suite de benchmarks des chemins critiques de CarRentalSystem.
+
+Chaque palier (1k, 100k, 1M locations, une flotte d'un véhicule pour 100
+locations) est généré par SyntheticDataGenerator, puis chaque opération
+est chronométrée plusieurs fois: création de location, disponibilités
+sur une période, recherches, rapports, mise à jour des statuts,
+sauvegarde et chargement (DataPersistence).
+
+Les résultats sont écrits en JSON avec la description de la machine. Avec
+--compare, ils sont comparés à une référence enregistrée (--save-baseline):
+le script échoue si une opération est plus lente de plus de
+--max-regression pourcents. Sans référence, les résultats deviennent la
+référence. Les opérations de moins de MIN_REGRESSION_DELTA ne sont pas
+comparées (bruit de mesure): le palier 100k est le plus petit où presque
+toutes le dépassent.
+
+Usage:
+    python benchmarks/bench_suite.py                      # Tous les paliers
+    python benchmarks/bench_suite.py --tiers 1k,100k
+    python benchmarks/bench_suite.py --tiers 1k --save-baseline
+    python benchmarks/bench_suite.py --tiers 1k --compare --max-regression 20
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from car_rental_system import CarRentalSystem
+from models.data_generator import BOOKING_HORIZON_DAYS, SyntheticDataGenerator
+from models.persistence import DataPersistence
+from models.rental import Rental, RentalStatus
+from models.vehicle import VehicleState
+
+# Paliers: nom -> (nombre de locations visé, répétitions par défaut)
+TIERS = {
+    "1k": (1_000, 7),
+    "100k": (100_000, 5),
+    "1M": (1_000_000, 2),
+}
+RENTALS_PER_VEHICLE = 100
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+BASELINE_FILE = RESULTS_DIR / "baseline.json"
+DEFAULT_MAX_REGRESSION = 20.0
+# En dessous de cet écart absolu (s), une différence est du bruit de mesure
+MIN_REGRESSION_DELTA = 0.001
+
+Case = Tuple[str, Callable[[], object], Optional[Callable[[], None]]]
+
+
+def machine_info() -> Dict:
+    """Décrit la machine et l'environnement de la mesure."""
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'numpy': np.__version__,
+        'system': platform.system(),
+        'release': platform.release(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'node': platform.node(),
+    }
+
+
+def measure(func: Callable[[], object], repeat: int,
+            setup: Optional[Callable[[], None]] = None) -> Dict:
+    """
+    Chronomètre `func` `repeat` fois, après un appel de chauffe.
+
+    Args:
+        func: Opération mesurée
+        repeat: Nombre de mesures
+        setup: Préparation exécutée (hors chronomètre) avant chaque appel
+
+    Returns:
+        Dictionnaire {best, median, repeat} (durées en secondes)
+    """
+    times = []
+    for run in range(repeat + 1):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        if run:
+            times.append(elapsed)
+    return {'best': min(times), 'median': statistics.median(times), 'repeat': repeat}
+
+
+def rental_requests(system: CarRentalSystem, today: date) -> Iterator[Tuple[str, str, date, date]]:
+    """
+    Fournit des demandes de location acceptables, une par appel mesuré.
+
+    Les périodes sont au-delà de l'horizon des réservations générées: elles
+    ne recoupent aucune location existante ni les demandes précédentes.
+    """
+    customers = [c for c in system.get_all_customers() if not c.is_blocked]
+    first_start = today + timedelta(days=BOOKING_HORIZON_DAYS + 60)
+    week = 0
+    while True:
+        for vehicle in system.get_all_vehicles():
+            for customer in customers:
+                can_rent, _ = customer.can_rent_vehicle(
+                    vehicle.get_required_license(), vehicle.get_minimum_driver_age()
+                )
+                if can_rent:
+                    start = first_start + timedelta(weeks=week)
+                    yield customer.id, vehicle.id, start, start + timedelta(days=3)
+                    break
+        week += 1
+
+
+def system_cases(system: CarRentalSystem, data_dir: Path, rentals_format: str) -> List[Case]:
+    """Opérations mesurées: (nom, opération, préparation éventuelle)."""
+    today = date.today()
+    period = (today + timedelta(days=10), today + timedelta(days=16))
+    requests = rental_requests(system, today)
+    holder = {}
+
+    def next_request():
+        # Demande préparée hors chronomètre
+        holder['request'] = next(requests)
+
+    def create_rental():
+        rental, message = system.create_rental(*holder['request'])
+        assert rental is not None, message
+
+    def new_persistence():
+        holder['persistence'] = DataPersistence(data_dir, rentals_format)
+
+    # Véhicules disponibles au départ: une réservation commençant aujourd'hui
+    # chacun, recréée avant chaque appel pour que chaque mesure la démarre
+    idle_vehicles = [vehicle for vehicle in system.get_all_vehicles() if vehicle.is_available()]
+    customer_id = system.get_all_customers()[0].id
+
+    def arm_reservations():
+        for index, vehicle in enumerate(idle_vehicles):
+            vehicle.state = VehicleState.AVAILABLE
+            rental = Rental.restore(
+                f"BENCH{index:06d}", customer_id, vehicle.id, today,
+                today + timedelta(days=3), None, RentalStatus.RESERVED, vehicle.daily_rate
+            )
+            system._rentals[rental.id] = rental
+
+    vehicles, customers, rentals = system.snapshot()
+    return [
+        ("get_available_vehicles[dates]",
+         lambda: system.get_available_vehicles(start_date=period[0], end_date=period[1]), None),
+        ("search_vehicles", lambda: system.search_vehicles(brand="Renault", max_daily_rate=80.0), None),
+        ("search_customers", lambda: system.search_customers(name="martin"), None),
+        ("generate_available_vehicles_report", system.generate_available_vehicles_report, None),
+        ("generate_active_rentals_report", system.generate_active_rentals_report, None),
+        ("generate_revenue_report", system.generate_revenue_report, None),
+        ("generate_statistics_report", system.generate_statistics_report, None),
+        # Le rapport est mis en cache: la mesure porte sur son calcul
+        ("generate_demand_forecast_report", system.generate_demand_forecast_report,
+         lambda: system._forecast_cache.clear()),
+        # Une instance neuve par mesure: pas d'écriture évitée par empreinte
+        ("save_all", lambda: holder['persistence'].save_all(vehicles, customers, rentals),
+         new_persistence),
+        ("load_all", lambda: holder['persistence'].load_all(), new_persistence),
+        # En dernier: les locations créées ou démarrées ne sont pas dans la copie
+        # sauvegardée, et les véhicules démarrés ne sont plus disponibles
+        ("create_rental", create_rental, next_request),
+        ("check_and_update_rentals", system.check_and_update_rentals, arm_reservations),
+    ]
+
+
+def run_tier(name: str, repeat: Optional[int], seed: int, rentals_format: str) -> Dict:
+    """Génère un palier et mesure toutes les opérations."""
+    num_rentals, default_repeat = TIERS[name]
+    repeat = repeat or default_repeat
+    num_vehicles = max(num_rentals // RENTALS_PER_VEHICLE, 10)
+
+    dataset = SyntheticDataGenerator(seed=seed).generate(num_vehicles, num_rentals=num_rentals)
+    system = CarRentalSystem("Benchmark")
+    dataset.load_into(system)
+    sizes = {
+        'vehicles': len(dataset.vehicles),
+        'customers': len(dataset.customers),
+        'rentals': len(dataset.rentals),
+    }
+    print(f"[BENCH] Palier {name} - {sizes['vehicles']} véhicules, "
+          f"{sizes['customers']} clients, {sizes['rentals']} locations")
+    del dataset
+
+    cases = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, func, setup in system_cases(system, Path(tmp), rentals_format):
+            cases[label] = measure(func, repeat, setup)
+            print(f"  {label:<36} {cases[label]['best']:8.4f} s "
+                  f"(médiane {cases[label]['median']:.4f} s)")
+
+    return {**sizes, 'repeat': repeat, 'cases': cases}
+
+
+def compare(results: Dict, baseline: Dict, max_regression: float) -> List[str]:
+    """
+    Compare des résultats à la référence (meilleures durées).
+
+    Args:
+        results: Résultats de la mesure
+        baseline: Résultats de référence
+        max_regression: Ralentissement toléré, en pourcents
+
+    Returns:
+        Descriptions des régressions (vide si aucune)
+    """
+    regressions = []
+    below_noise = []
+    for tier, tier_results in results['tiers'].items():
+        reference = baseline.get('tiers', {}).get(tier)
+        if reference is None:
+            print(f"  Palier {tier} absent de la référence, non comparé")
+            continue
+        for label, stats in tier_results['cases'].items():
+            previous = reference['cases'].get(label)
+            if previous is None:
+                continue
+            before, after = previous['best'], stats['best']
+            if max(before, after) < MIN_REGRESSION_DELTA:
+                below_noise.append(f"{tier} / {label}")
+                continue
+            change = (after / before - 1) * 100 if before > 0 else 0.0
+            if change > max_regression and after - before > MIN_REGRESSION_DELTA:
+                regressions.append(
+                    f"{tier} / {label}: {before:.4f} s -> {after:.4f} s (+{change:.1f}%)"
+                )
+    if below_noise:
+        print(f"  Non comparées (moins de {MIN_REGRESSION_DELTA * 1000:.0f} ms): "
+              f"{', '.join(below_noise)}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks des opérations de CarRentalSystem")
+    parser.add_argument("--tiers", default=",".join(TIERS),
+                        help=f"Paliers à mesurer, séparés par des virgules ({', '.join(TIERS)})")
+    parser.add_argument("-r", "--repeat", type=int,
+                        help="Nombre de mesures par opération (selon le palier par défaut)")
+    parser.add_argument("--seed", type=int, default=0, help="Graine du générateur de données")
+    parser.add_argument("--rentals-format", choices=DataPersistence.RENTALS_FORMATS,
+                        default="json", help="Format des locations pour save_all/load_all")
+    parser.add_argument("-o", "--output", type=Path,
+                        help="Fichier de résultats (results/bench-<date>.json par défaut)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE,
+                        help="Fichier de référence")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Enregistre aussi les résultats comme référence")
+    parser.add_argument("--compare", action="store_true",
+                        help="Compare à la référence et échoue en cas de régression")
+    parser.add_argument("--max-regression", type=float, default=DEFAULT_MAX_REGRESSION,
+                        help="Ralentissement toléré par opération, en pourcents")
+    args = parser.parse_args()
+
+    tiers = [tier.strip() for tier in args.tiers.split(",") if tier.strip()]
+    unknown = [tier for tier in tiers if tier not in TIERS]
+    if unknown:
+        parser.error(f"Palier(s) inconnu(s): {', '.join(unknown)}")
+
+    results = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'machine': machine_info(),
+        'seed': args.seed,
+        'rentals_format': args.rentals_format,
+        'tiers': {tier: run_tier(tier, args.repeat, args.seed, args.rentals_format)
+                  for tier in tiers},
+    }
+
+    output = args.output or RESULTS_DIR / f"bench-{datetime.now():%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding='utf-8')
+    print(f"[OK] Résultats enregistrés dans {output}")
+
+    # Première comparaison: les résultats servent de référence
+    first_baseline = args.compare and not args.baseline.exists()
+    if args.save_baseline or first_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding='utf-8')
+        print(f"[OK] Référence enregistrée dans {args.baseline}")
+
+    if not args.compare:
+        return 0
+    if first_baseline:
+        print("[INFO] Aucune référence existante: rien à comparer pour cette exécution")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+    if baseline.get('machine') != results['machine']:
+        print("[ATTENTION] Référence mesurée sur une autre machine ou un autre environnement")
+    if baseline.get('rentals_format') != results['rentals_format']:
+        print("[ATTENTION] Référence mesurée avec un autre format de locations")
+    regressions = compare(results, baseline, args.max_regression)
+    if regressions:
+        print(f"[ERREUR] {len(regressions)} régression(s) de plus de {args.max_regression:.0f}%:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print(f"[OK] Aucune régression de plus de {args.max_regression:.0f}% "
+          f"par rapport à {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,13 +3,68 @@ Module principal du système de location de voitures.
 Contient la classe centrale CarRentalSystem.
 """
 
+import functools
+import math
+import threading
 from datetime import date, datetime, timedelta
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, List, Dict, Tuple, Iterable, Iterator, Set
 from collections import defaultdict
 
 from models.vehicle import Vehicle, Car, Truck, Motorcycle, VehicleState, VehicleCategory
 from models.customer import Customer
 from models.rental import Rental, RentalStatus
+from models.ranking import TopKRanking
+from models.constants import ForecastConstants
+from models.utils import gc_paused
+from models.events import (
+    EventBus, SystemEvent, DataReloaded,
+    VehicleAdded, VehicleRemoved, VehicleUpdated,
+    CustomerAdded, CustomerRemoved, CustomerUpdated, CustomerBlocked, CustomerUnblocked,
+    RentalCreated, RentalStarted, RentalCompleted, RentalCancelled, RentalExtended,
+    RentalUpdated
+)
+
+
+def _copy_entity(entity):
+    """
+    Copie une entité avec ses conteneurs internes (listes, ensembles...).
+    
+    Le __dict__ est recopié directement (deux fois plus rapide que
+    copy.copy), ce qui compte sous le verrou pour des dizaines de milliers
+    de locations.
+    """
+    clone = object.__new__(type(entity))
+    attributes = clone.__dict__
+    attributes.update(entity.__dict__)
+    for name, value in attributes.items():
+        if isinstance(value, (list, set, dict)):
+            attributes[name] = value.copy()
+    return clone
+
+
+def _mutation(method):
+    """
+    Décore une méthode qui modifie l'état du système.
+    
+    La méthode s'exécute sous le verrou du système. Si elle a émis des
+    événements, la modification a eu lieu: la version des données est
+    incrémentée, puis les événements sont publiés sur le bus (hors verrou).
+    Un refus (doublon, location impossible...) ou une opération sans effet
+    ne change pas la version et ne publie rien.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            try:
+                result = method(self, *args, **kwargs)
+            finally:
+                # Événements d'une modification en échec: abandonnés
+                events, self._pending_events = self._pending_events, []
+            if events:
+                self._data_version += 1
+        self._events.publish(*events)
+        return result
+    return wrapper
 
 
 class CarRentalSystem:
@@ -28,10 +83,145 @@ class CarRentalSystem:
         self._vehicles: Dict[str, Vehicle] = {}
         self._customers: Dict[str, Customer] = {}
         self._rentals: Dict[str, Rental] = {}
+        self._history_store = None
+        self._rankings: Optional[Dict[str, TopKRanking]] = None
+        self._data_version = 0
+        self._forecast_cache: Dict[tuple, Dict] = {}
         self._created_at = datetime.now()
+        self._lock = threading.RLock()
+        self._events = EventBus()
+        self._pending_events: List[SystemEvent] = []
+    
+    # === Notifications de modification ===
+    
+    @property
+    def lock(self) -> threading.RLock:
+        """
+        Verrou tenu pendant chaque modification.
+        
+        Un autre thread doit le tenir pour lire un état cohérent.
+        """
+        return self._lock
+    
+    @property
+    def data_version(self) -> int:
+        """Version des données, incrémentée à chaque modification effective."""
+        return self._data_version
+    
+    @property
+    def events(self) -> EventBus:
+        """
+        Bus des événements du système (VehicleAdded, RentalStarted...).
+        
+        Les événements sont publiés après chaque modification, hors verrou,
+        dans le thread qui a fait la modification.
+        """
+        return self._events
+    
+    def batch_events(self):
+        """
+        Regroupe les événements des modifications faites dans le bloc.
+        
+        Exemple:
+            with system.batch_events():
+                for vehicle in vehicles:
+                    system.add_vehicle(vehicle)
+            # Les abonnés par lot reçoivent tous les VehicleAdded en une fois
+        """
+        return self._events.batch()
+    
+    def _emit(self, event: SystemEvent) -> None:
+        """Retient un événement, publié à la fin de la modification en cours."""
+        self._pending_events.append(event)
+    
+    def _emit_rental(self, event_class, rental: Rental) -> None:
+        self._emit(event_class(rental.id, rental.customer_id, rental.vehicle_id))
+    
+    def snapshot(self) -> Tuple[Dict[str, Vehicle], Dict[str, Customer], Dict[str, Rental]]:
+        """
+        Retourne une copie des collections (véhicules, clients, locations).
+        
+        Les entités sont partagées: tenir `lock` tant qu'elles sont lues.
+        """
+        with self._lock:
+            return dict(self._vehicles), dict(self._customers), dict(self._rentals)
+    
+    def snapshot_system(self) -> "CarRentalSystem":
+        """
+        Retourne un système de lecture bâti sur une copie des données.
+        
+        Les collections et les entités sont copiées sous le verrou: les
+        rapports calculés sur la copie ne bloquent pas les modifications du
+        système et n'en voient aucune (ajouts, suppressions, changements
+        d'état). L'historique des locations est partagé: HistoricalRentalStore
+        protège ses propres lectures.
+        
+        Returns:
+            Nouveau CarRentalSystem, avec le même historique des locations
+        """
+        with self._lock, gc_paused():
+            clone = CarRentalSystem(self._agency_name)
+            clone._vehicles, clone._customers, clone._rentals = (
+                {entity_id: _copy_entity(entity) for entity_id, entity in collection.items()}
+                for collection in (self._vehicles, self._customers, self._rentals)
+            )
+            clone._history_store = self._history_store
+            clone._data_version = self._data_version
+        return clone
+    
+    def load_data(
+        self,
+        vehicles: Dict[str, Vehicle],
+        customers: Dict[str, Customer],
+        rentals: Dict[str, Rental]
+    ) -> None:
+        """
+        Remplace les données du système (ex: après DataPersistence.load_all).
+        
+        Args:
+            vehicles: Dictionnaire des véhicules {id: vehicle}
+            customers: Dictionnaire des clients {id: customer}
+            rentals: Dictionnaire des locations {id: rental}
+        """
+        with self._lock:
+            self._vehicles = dict(vehicles)
+            self._customers = dict(customers)
+            self._rentals = dict(rentals)
+            self._rankings = None
+            self._data_version += 1
+        self._events.publish(DataReloaded())
+    
+    # === Historique des locations ===
+    
+    def attach_history_store(self, history_store) -> None:
+        """
+        Associe un stockage d'historique des locations (chargé à la demande).
+        
+        Args:
+            history_store: Instance de HistoricalRentalStore, ou None
+        """
+        with self._lock:
+            self._history_store = history_store
+            self._rankings = None
+            self._data_version += 1
+        self._events.publish(DataReloaded())
+    
+    def _iter_rentals_with_history(self, months: Iterable[str]) -> Iterator[Rental]:
+        """
+        Parcourt les locations en mémoire puis celles des partitions demandées.
+        
+        Une location présente en mémoire masque sa version historisée.
+        """
+        yield from self._rentals.values()
+        if self._history_store is None:
+            return
+        for rental in self._history_store.iter_rentals(months):
+            if rental.id not in self._rentals:
+                yield rental
     
     # === Gestion des véhicules ===
     
+    @_mutation
     def add_vehicle(self, vehicle: Vehicle) -> bool:
         """
         Ajoute un véhicule à la flotte
@@ -45,8 +235,27 @@ class CarRentalSystem:
         if vehicle.id in self._vehicles:
             return False
         self._vehicles[vehicle.id] = vehicle
+        self._emit(VehicleAdded(vehicle.id))
+        return True
+    
+    @_mutation
+    def update_vehicle(self, vehicle: Vehicle) -> bool:
+        """
+        Remplace un véhicule de la flotte par sa version modifiée.
+        
+        Args:
+            vehicle: Le véhicule modifié (même ID que celui à remplacer)
+            
+        Returns:
+            True si le véhicule a été remplacé
+        """
+        if vehicle.id not in self._vehicles:
+            return False
+        self._vehicles[vehicle.id] = vehicle
+        self._emit(VehicleUpdated(vehicle.id))
         return True
     
+    @_mutation
     def remove_vehicle(self, vehicle_id: str) -> bool:
         """
         Retire un véhicule de la flotte.
@@ -65,6 +274,7 @@ class CarRentalSystem:
             return False  # Ne peut pas retirer un véhicule loué
         
         del self._vehicles[vehicle_id]
+        self._emit(VehicleRemoved(vehicle_id))
         return True
     
     def get_vehicle(self, vehicle_id: str) -> Optional[Vehicle]:
@@ -96,6 +306,12 @@ class CarRentalSystem:
         """
         available = []
         
+        # Véhicules déjà pris sur la période, en un seul parcours des locations
+        booked = (
+            self.get_booked_vehicle_ids(start_date, end_date)
+            if start_date and end_date else set()
+        )
+        
         for vehicle in self._vehicles.values():
             # Vérifier l'état du véhicule
             if not vehicle.is_available():
@@ -110,14 +326,36 @@ class CarRentalSystem:
                 continue
             
             # Vérifier la disponibilité sur la période
-            if start_date and end_date:
-                if not self._is_vehicle_available_for_period(vehicle.id, start_date, end_date):
-                    continue
+            if vehicle.id in booked:
+                continue
             
             available.append(vehicle)
         
         return available
     
+    def get_booked_vehicle_ids(self, start_date: date, end_date: date) -> Set[str]:
+        """
+        Retourne les véhicules réservés ou loués sur une période.
+        
+        Les locations sont parcourues une seule fois, quel que soit le
+        nombre de véhicules à vérifier.
+        
+        Args:
+            start_date: Début de la période
+            end_date: Fin de la période
+            
+        Returns:
+            IDs des véhicules dont une location en cours ou réservée
+            chevauche la période
+        """
+        booked = set()
+        for rental in self._rentals.values():
+            if rental.status in [RentalStatus.CANCELLED, RentalStatus.COMPLETED]:
+                continue
+            if not (end_date < rental.start_date or start_date > rental.end_date):
+                booked.add(rental.vehicle_id)
+        return booked
+    
     def _is_vehicle_available_for_period(
         self,
         vehicle_id: str,
@@ -175,6 +413,7 @@ class CarRentalSystem:
     
     # === Gestion des clients ===
     
+    @_mutation
     def add_customer(self, customer: Customer) -> bool:
         """
         Ajoute un client.
@@ -188,8 +427,32 @@ class CarRentalSystem:
         if customer.id in self._customers:
             return False
         self._customers[customer.id] = customer
+        self._update_customer_rank(customer)
+        self._emit(CustomerAdded(customer.id))
         return True
     
+    @_mutation
+    def update_customer(self, customer: Customer) -> bool:
+        """
+        Remplace un client par sa version modifiée.
+        
+        Le client garde sa place dans les classements: son chiffre
+        d'affaires cumulé n'est pas remis à zéro.
+        
+        Args:
+            customer: Le client modifié (même ID que celui à remplacer)
+            
+        Returns:
+            True si le client a été remplacé
+        """
+        if customer.id not in self._customers:
+            return False
+        self._customers[customer.id] = customer
+        self._update_customer_rank(customer)
+        self._emit(CustomerUpdated(customer.id))
+        return True
+    
+    @_mutation
     def remove_customer(self, customer_id: str) -> bool:
         """
         Retire un client.
@@ -208,6 +471,47 @@ class CarRentalSystem:
             return False  # Ne peut pas retirer un client avec des locations actives
         
         del self._customers[customer_id]
+        if self._rankings is not None:
+            for ranking in self._rankings.values():
+                ranking.remove(customer_id)
+        self._emit(CustomerRemoved(customer_id))
+        return True
+    
+    @_mutation
+    def block_customer(self, customer_id: str, reason: str) -> bool:
+        """
+        Bloque un client (il ne peut plus louer).
+        
+        Args:
+            customer_id: ID du client
+            reason: Raison du blocage
+            
+        Returns:
+            True si le client a été bloqué (False s'il est inconnu ou déjà bloqué)
+        """
+        customer = self._customers.get(customer_id)
+        if not customer or customer.is_blocked:
+            return False
+        customer.block(reason)
+        self._emit(CustomerBlocked(customer_id))
+        return True
+    
+    @_mutation
+    def unblock_customer(self, customer_id: str) -> bool:
+        """
+        Débloque un client.
+        
+        Args:
+            customer_id: ID du client
+            
+        Returns:
+            True si le client a été débloqué (False s'il est inconnu ou non bloqué)
+        """
+        customer = self._customers.get(customer_id)
+        if not customer or not customer.is_blocked:
+            return False
+        customer.unblock()
+        self._emit(CustomerUnblocked(customer_id))
         return True
     
     def get_customer(self, customer_id: str) -> Optional[Customer]:
@@ -248,14 +552,83 @@ class CarRentalSystem:
         
         return results
     
+    # === Classement des clients ===
+    
+    TOP_CUSTOMERS_CRITERIA = ("rentals", "revenue", "loyalty")
+    
+    def _build_rankings(self) -> Dict[str, TopKRanking]:
+        """
+        Construit les classements des clients (un parcours de toutes les locations).
+        
+        Ils sont ensuite tenus à jour par les opérations du système.
+        """
+        revenue_by_customer: Dict[str, float] = defaultdict(float)
+        months = self._history_store.months() if self._history_store else []
+        for rental in self._iter_rentals_with_history(months):
+            if rental.status == RentalStatus.COMPLETED:
+                revenue_by_customer[rental.customer_id] += rental.total_cost
+        
+        self._rankings = {name: TopKRanking() for name in self.TOP_CUSTOMERS_CRITERIA}
+        for customer in self._customers.values():
+            self._update_customer_rank(customer)
+            self._rankings["revenue"].update(
+                customer.id, (round(revenue_by_customer[customer.id], 2),)
+            )
+        return self._rankings
+    
+    def _update_customer_rank(self, customer: Customer, revenue: float = 0.0) -> None:
+        """
+        Met à jour le rang d'un client après une modification.
+        
+        Args:
+            customer: Client modifié
+            revenue: Chiffre d'affaires à ajouter à son total
+        """
+        if self._rankings is None:
+            return  # Classements pas encore construits
+        total_rentals = customer.get_total_rentals()
+        self._rankings["rentals"].update(customer.id, (total_rentals,))
+        self._rankings["loyalty"].update(
+            customer.id, (customer.get_loyalty_discount(), total_rentals)
+        )
+        current = self._rankings["revenue"].get(customer.id, (0.0,))[0]
+        self._rankings["revenue"].update(customer.id, (round(current + revenue, 2),))
+    
+    def get_top_customers(self, k: int = 10, by: str = "rentals") -> List[Customer]:
+        """
+        Retourne les meilleurs clients.
+        
+        Le premier appel construit les classements; les suivants ne font
+        que lire les K premiers (sans trier tous les clients).
+        
+        Args:
+            k: Nombre de clients voulus
+            by: Critère: "rentals" (nombre de locations), "revenue" (chiffre
+                d'affaires cumulé) ou "loyalty" (réduction fidélité)
+            
+        Returns:
+            Liste des clients, du meilleur au moins bon
+            
+        Raises:
+            ValueError: Si le critère est inconnu
+        """
+        if by not in self.TOP_CUSTOMERS_CRITERIA:
+            raise ValueError(f"Critère de classement inconnu: {by}")
+        with self._lock:
+            rankings = self._rankings or self._build_rankings()
+            return [self._customers[customer_id]
+                    for customer_id, _ in rankings[by].top(k)]
+    
     # === Gestion des locations ===
     
+    @_mutation
     def create_rental(
         self,
         customer_id: str,
         vehicle_id: str,
         start_date: date,
-        end_date: date
+        end_date: date,
+        notes: str = ""
     ) -> Tuple[Optional[Rental], str]:
         """
         Crée une nouvelle location.
@@ -265,6 +638,7 @@ class CarRentalSystem:
             vehicle_id: ID du véhicule
             start_date: Date de début
             end_date: Date de fin
+            notes: Notes de la location
             
         Returns:
             Tuple (Rental ou None, message d'erreur/succès)
@@ -303,6 +677,7 @@ class CarRentalSystem:
             )
         except ValueError as e:
             return None, str(e)
+        rental.notes = notes
         
         # Appliquer la réduction fidélité
         discount = customer.get_loyalty_discount()
@@ -312,14 +687,18 @@ class CarRentalSystem:
         # Enregistrer la location
         self._rentals[rental.id] = rental
         customer.add_rental(rental.id)
+        self._update_customer_rank(customer)
+        self._emit_rental(RentalCreated, rental)
         
         # Si la location commence aujourd'hui, marquer le véhicule comme loué
         if start_date == date.today():
             vehicle.rent()
             rental.start_rental()
+            self._emit_rental(RentalStarted, rental)
         
         return rental, f"Location créée avec succès (ID: {rental.id})"
     
+    @_mutation
     def start_rental(self, rental_id: str) -> Tuple[bool, str]:
         """
         Démarre une location réservée.
@@ -345,8 +724,10 @@ class CarRentalSystem:
             return False, "Impossible de louer le véhicule"
         
         rental.start_rental()
+        self._emit_rental(RentalStarted, rental)
         return True, "Location démarrée"
     
+    @_mutation
     def complete_rental(
         self,
         rental_id: str,
@@ -388,9 +769,12 @@ class CarRentalSystem:
         
         # Mettre à jour le client
         customer.complete_rental(rental_id)
+        self._update_customer_rank(customer, revenue=total_cost)
+        self._emit_rental(RentalCompleted, rental)
         
         return total_cost, f"Location terminée. Coût total: {total_cost:.2f}€"
     
+    @_mutation
     def cancel_rental(self, rental_id: str) -> Tuple[Optional[float], str]:
         """
         Annule une location.
@@ -420,11 +804,13 @@ class CarRentalSystem:
         # Mettre à jour le client
         if customer:
             customer.complete_rental(rental_id)
+        self._emit_rental(RentalCancelled, rental)
         
         if cancellation_fee > 0:
             return cancellation_fee, f"Location annulée. Frais d'annulation: {cancellation_fee:.2f}€"
         return 0, "Location annulée sans frais"
     
+    @_mutation
     def extend_rental(
         self,
         rental_id: str,
@@ -453,9 +839,54 @@ class CarRentalSystem:
             return False, "Véhicule non disponible pour la période de prolongation"
         
         if rental.extend_rental(new_end_date):
+            self._emit_rental(RentalExtended, rental)
             return True, f"Location prolongée jusqu'au {new_end_date}"
         return False, "Impossible de prolonger la location"
     
+    @_mutation
+    def update_rental(
+        self,
+        rental_id: str,
+        end_date: Optional[date] = None,
+        notes: Optional[str] = None
+    ) -> Tuple[bool, str]:
+        """
+        Modifie une location: avance sa date de fin et/ou change ses notes.
+        
+        Une date de fin plus tardive doit passer par extend_rental, qui
+        vérifie la disponibilité du véhicule.
+        
+        Args:
+            rental_id: ID de la location
+            end_date: Nouvelle date de fin (au plus la date actuelle)
+            notes: Nouvelles notes
+            
+        Returns:
+            Tuple (succès, message)
+        """
+        rental = self._rentals.get(rental_id)
+        if not rental:
+            return False, "Location non trouvée"
+        
+        if end_date is not None and end_date > rental.end_date:
+            return False, "Une prolongation doit passer par extend_rental"
+        
+        changed = False
+        if end_date is not None and end_date != rental.end_date:
+            try:
+                rental.end_date = end_date
+            except ValueError as e:
+                return False, str(e)
+            changed = True
+        
+        if notes is not None and notes != rental.notes:
+            rental.notes = notes
+            changed = True
+        
+        if changed:
+            self._emit_rental(RentalUpdated, rental)
+        return True, "Location modifiée"
+    
     def get_rental(self, rental_id: str) -> Optional[Rental]:
         """Récupère une location par son ID."""
         return self._rentals.get(rental_id)
@@ -475,17 +906,54 @@ class CarRentalSystem:
                 if r.is_overdue()]
     
     def get_customer_rentals(self, customer_id: str) -> List[Rental]:
-        """Retourne les locations d'un client."""
-        return [r for r in self._rentals.values() 
+        """Retourne les locations d'un client (historique compris)."""
+        months = (self._history_store.months_for_customer(customer_id)
+                  if self._history_store else [])
+        return [r for r in self._iter_rentals_with_history(months)
                 if r.customer_id == customer_id]
     
     def get_vehicle_rentals(self, vehicle_id: str) -> List[Rental]:
-        """Retourne les locations d'un véhicule."""
-        return [r for r in self._rentals.values() 
+        """Retourne les locations d'un véhicule (historique compris)."""
+        months = (self._history_store.months_for_vehicle(vehicle_id)
+                  if self._history_store else [])
+        return [r for r in self._iter_rentals_with_history(months)
                 if r.vehicle_id == vehicle_id]
     
+    def get_rentals_between(self, start_date: date, end_date: date) -> List[Rental]:
+        """
+        Retourne les locations qui occupent un véhicule pendant la période
+        (historique compris, locations annulées exclues).
+        
+        Args:
+            start_date: Premier jour de la période
+            end_date: Dernier jour de la période
+        """
+        # L'historique est partitionné par mois de fin: seules les
+        # partitions qui peuvent recouper la période sont lues
+        months = (self._history_store.months_occupied_in_period(start_date, end_date)
+                  if self._history_store else [])
+        
+        today = date.today()
+        rentals = []
+        for rental in self._iter_rentals_with_history(months):
+            last_day = rental.occupied_until(today)
+            if last_day is not None and rental.start_date <= end_date and last_day >= start_date:
+                rentals.append(rental)
+        return rentals
+    
     # === Rapports ===
     
+    def iter_available_vehicles_report_rows(self) -> Iterator[Dict]:
+        """
+        Produit une ligne (to_dict) par véhicule disponible, sans liste intermédiaire.
+        
+        Yields:
+            Dictionnaire d'un véhicule disponible
+        """
+        for vehicle in self._vehicles.values():
+            if vehicle.is_available():
+                yield vehicle.to_dict()
+    
     def generate_available_vehicles_report(self) -> Dict:
         """
         Génère un rapport des véhicules disponibles.
@@ -493,38 +961,39 @@ class CarRentalSystem:
         Returns:
             Dictionnaire contenant le rapport
         """
-        available = self.get_available_vehicles()
+        vehicles = list(self.iter_available_vehicles_report_rows())
         
+        # Chaque véhicule n'est sérialisé qu'une fois: les regroupements
+        # référencent les mêmes dictionnaires
         by_type = defaultdict(list)
         by_category = defaultdict(list)
         
-        for vehicle in available:
-            by_type[vehicle.get_vehicle_type()].append(vehicle.to_dict())
-            by_category[vehicle.category.value].append(vehicle.to_dict())
+        for row in vehicles:
+            by_type[row['type']].append(row)
+            by_category[row['category']].append(row)
         
         return {
             'report_type': 'Véhicules disponibles',
             'generated_at': datetime.now().isoformat(),
-            'total_available': len(available),
+            'total_available': len(vehicles),
             'total_fleet': len(self._vehicles),
-            'availability_rate': len(available) / len(self._vehicles) * 100 if self._vehicles else 0,
+            'availability_rate': len(vehicles) / len(self._vehicles) * 100 if self._vehicles else 0,
             'by_type': dict(by_type),
             'by_category': dict(by_category),
-            'vehicles': [v.to_dict() for v in available]
+            'vehicles': vehicles
         }
     
-    def generate_active_rentals_report(self) -> Dict:
+    def iter_active_rentals_report_rows(self) -> Iterator[Dict]:
         """
-        Génère un rapport des locations en cours.
+        Produit une ligne détaillée par location en cours, sans liste intermédiaire.
         
-        Returns:
-            Dictionnaire contenant le rapport
+        Yields:
+            Dictionnaire d'une location (to_dict, nom du client, véhicule,
+            retard et jours restants)
         """
-        active = self.get_active_rentals()
-        overdue = self.get_overdue_rentals()
-        
-        rentals_details = []
-        for rental in active:
+        for rental in self._rentals.values():
+            if rental.status != RentalStatus.ACTIVE:
+                continue
             customer = self._customers.get(rental.customer_id)
             vehicle = self._vehicles.get(rental.vehicle_id)
             
@@ -533,13 +1002,22 @@ class CarRentalSystem:
             detail['vehicle_info'] = str(vehicle) if vehicle else "Inconnu"
             detail['is_overdue'] = rental.is_overdue()
             detail['days_remaining'] = rental.days_remaining()
-            rentals_details.append(detail)
+            yield detail
+    
+    def generate_active_rentals_report(self) -> Dict:
+        """
+        Génère un rapport des locations en cours.
+        
+        Returns:
+            Dictionnaire contenant le rapport
+        """
+        rentals_details = list(self.iter_active_rentals_report_rows())
         
         return {
             'report_type': 'Locations en cours',
             'generated_at': datetime.now().isoformat(),
-            'total_active': len(active),
-            'total_overdue': len(overdue),
+            'total_active': len(rentals_details),
+            'total_overdue': sum(1 for detail in rentals_details if detail['is_overdue']),
             'rentals': rentals_details
         }
     
@@ -565,8 +1043,10 @@ class CarRentalSystem:
         if not end_date:
             end_date = date.today()
         
+        months = (self._history_store.months_in_period(start_date, end_date)
+                  if self._history_store else [])
         completed_rentals = [
-            r for r in self._rentals.values()
+            r for r in self._iter_rentals_with_history(months)
             if r.status == RentalStatus.COMPLETED
             and r.actual_return_date
             and start_date <= r.actual_return_date <= end_date
@@ -606,6 +1086,249 @@ class CarRentalSystem:
             'revenue_by_month': dict(revenue_by_month)
         }
     
+    UTILIZATION_GROUPS = ("type", "category", "vehicle")
+    
+    def _vehicle_group_key(self, vehicle: Vehicle, group_by: str) -> str:
+        """Retourne la clé de regroupement d'un véhicule."""
+        if group_by == "type":
+            return vehicle.get_vehicle_type()
+        if group_by == "category":
+            return vehicle.category.value
+        return vehicle.id
+    
+    def _occupancy_intervals(self, group_by: str, months: Iterable[str]) -> Tuple:
+        """
+        Extrait les intervalles d'occupation des véhicules de la flotte.
+        
+        Chaque location occupe son véhicule de son début jusqu'à
+        Rental.occupied_until(). Les locations annulées et celles des
+        véhicules retirés de la flotte sont ignorées.
+        
+        Args:
+            group_by: "type", "category" ou "vehicle"
+            months: Partitions de l'historique à parcourir
+            
+        Returns:
+            Tuple (noms des groupes, taille de flotte par groupe, premiers
+            jours, derniers jours, indices de groupe), jours en ordinaux
+        """
+        from models.analytics import index_groups
+        
+        vehicle_keys = {
+            vehicle.id: self._vehicle_group_key(vehicle, group_by)
+            for vehicle in self._vehicles.values()
+        }
+        group_names, group_indices = index_groups(vehicle_keys.values())
+        fleet_sizes = [0] * len(group_names)
+        for key in vehicle_keys.values():
+            fleet_sizes[group_indices[key]] += 1
+        
+        today = date.today()
+        starts, ends, groups = [], [], []
+        for rental in self._iter_rentals_with_history(months):
+            key = vehicle_keys.get(rental.vehicle_id)
+            last_day = rental.occupied_until(today)
+            if key is None or last_day is None:
+                continue
+            starts.append(rental.start_date.toordinal())
+            ends.append(last_day.toordinal())
+            groups.append(group_indices[key])
+        
+        return group_names, fleet_sizes, starts, ends, groups
+    
+    def generate_utilization_series(
+        self,
+        start_date: date,
+        end_date: date,
+        group_by: str = "type"
+    ) -> Dict:
+        """
+        Génère la série journalière d'utilisation de la flotte.
+        
+        Pour chaque jour et chaque groupe, compte les véhicules occupés par
+        une location (voir _occupancy_intervals). Le calcul est vectorisé
+        (voir analytics.daily_occupancy): son coût dépend du nombre de
+        locations plus le nombre de jours, pas de leur produit.
+        
+        Args:
+            start_date: Premier jour de la série
+            end_date: Dernier jour de la série
+            group_by: "type", "category" ou "vehicle"
+            
+        Returns:
+            Dictionnaire contenant le rapport
+            
+        Raises:
+            ValueError: Si group_by est inconnu ou la période inversée
+        """
+        from models.analytics import daily_occupancy
+        
+        if group_by not in self.UTILIZATION_GROUPS:
+            raise ValueError(f"Regroupement inconnu: {group_by}")
+        if end_date < start_date:
+            raise ValueError("La date de fin ne peut pas être antérieure à la date de début")
+        
+        # Seules les partitions qui peuvent recouper la période sont lues
+        months = (self._history_store.months_occupied_in_period(start_date, end_date)
+                  if self._history_store else [])
+        
+        group_names, fleet_sizes, starts, ends, groups = self._occupancy_intervals(
+            group_by, months
+        )
+        occupied = daily_occupancy(
+            starts, ends, groups, len(group_names),
+            start_date.toordinal(), end_date.toordinal()
+        )
+        
+        # Chaque groupe contient au moins un véhicule de la flotte
+        series = {}
+        for index, name in enumerate(group_names):
+            row = occupied[index]
+            rates = (row * (100.0 / fleet_sizes[index])).round(2)
+            series[name] = {
+                'fleet_size': fleet_sizes[index],
+                'occupied': row.tolist(),
+                'utilization_rate': rates.tolist(),
+                'average_utilization': round(float(rates.mean()), 2)
+            }
+        
+        return {
+            'report_type': 'Utilisation journalière',
+            'generated_at': datetime.now().isoformat(),
+            'period': {
+                'start': start_date.isoformat(),
+                'end': end_date.isoformat()
+            },
+            'group_by': group_by,
+            'dates': [
+                date.fromordinal(day).isoformat()
+                for day in range(start_date.toordinal(), end_date.toordinal() + 1)
+            ],
+            'series': series
+        }
+    
+    FORECAST_GROUPS = ("category", "type")
+    
+    def generate_demand_forecast_report(
+        self,
+        weeks: int = ForecastConstants.DEFAULT_WEEKS,
+        group_by: str = "category",
+        alpha: float = ForecastConstants.SMOOTHING_ALPHA
+    ) -> Dict:
+        """
+        Génère la prévision de la demande par catégorie ou type de véhicule.
+        
+        La demande d'un jour est le nombre de véhicules du groupe occupés ce
+        jour-là, sur tout l'historique jusqu'à aujourd'hui. Le rapport donne
+        la série journalière, les profils par jour de semaine et par mois, et
+        une prévision sur `weeks` semaines (lissage exponentiel avec
+        saisonnalité hebdomadaire, voir analytics.smoothed_forecast).
+        
+        Le rapport est mis en cache tant que les données (data_version) et la
+        date du jour ne changent pas: le dictionnaire renvoyé est partagé et
+        ne doit pas être modifié.
+        
+        Args:
+            weeks: Nombre de semaines à prévoir
+            group_by: "category" ou "type"
+            alpha: Coefficient de lissage (0 < alpha <= 1)
+            
+        Returns:
+            Dictionnaire contenant le rapport
+            
+        Raises:
+            ValueError: Si un paramètre est invalide
+        """
+        from models.analytics import (
+            daily_occupancy, mean_profile, month_indices,
+            smoothed_forecast, weekday_indices
+        )
+        
+        if group_by not in self.FORECAST_GROUPS:
+            raise ValueError(f"Regroupement inconnu: {group_by}")
+        if weeks < 1:
+            raise ValueError("L'horizon doit être d'au moins une semaine")
+        if not 0 < alpha <= 1:
+            raise ValueError("Le coefficient de lissage doit être compris entre 0 et 1")
+        
+        today = date.today()
+        with self._lock:
+            key = (self._data_version, today, group_by, weeks, alpha)
+            cached = self._forecast_cache.get(key)
+            if cached is not None:
+                return cached
+            months = self._history_store.months() if self._history_store else []
+            group_names, fleet_sizes, starts, ends, groups = self._occupancy_intervals(
+                group_by, months
+            )
+        
+        last_day = today.toordinal()
+        first_day = min(min(starts, default=last_day), last_day)
+        num_days = last_day - first_day + 1
+        horizon = weeks * 7
+        
+        demand = daily_occupancy(
+            starts, ends, groups, len(group_names), first_day, last_day
+        )
+        weekdays = weekday_indices(first_day, num_days)
+        weekday_profiles = mean_profile(demand, weekdays, 7)
+        seasonal_profiles = mean_profile(demand, month_indices(first_day, num_days), 12)
+        forecast = smoothed_forecast(
+            demand.astype(float), weekdays, weekday_indices(last_day + 1, horizon), alpha
+        ).round(2)
+        
+        series = {}
+        for index, name in enumerate(group_names):
+            weekly = forecast[index].reshape(weeks, 7)
+            forecast_weeks = [
+                {
+                    'week_start': (today + timedelta(days=1 + 7 * week)).isoformat(),
+                    'daily': weekly[week].tolist(),
+                    'vehicle_days': round(float(weekly[week].sum()), 2),
+                    'peak': math.ceil(weekly[week].max())
+                }
+                for week in range(weeks)
+            ]
+            series[name] = {
+                'fleet_size': fleet_sizes[index],
+                'daily_demand': demand[index].tolist(),
+                'average_demand': round(float(demand[index].mean()), 2),
+                'weekday_profile': dict(zip(
+                    ForecastConstants.WEEKDAY_NAMES,
+                    weekday_profiles[index].round(2).tolist()
+                )),
+                'seasonal_profile': dict(zip(
+                    ForecastConstants.MONTH_NAMES,
+                    seasonal_profiles[index].round(2).tolist()
+                )),
+                'forecast': forecast_weeks,
+                'recommended_fleet': max(week['peak'] for week in forecast_weeks)
+            }
+        
+        report = {
+            'report_type': 'Prévision de la demande',
+            'generated_at': datetime.now().isoformat(),
+            'history': {
+                'start': date.fromordinal(first_day).isoformat(),
+                'end': today.isoformat(),
+                'days': num_days
+            },
+            'group_by': group_by,
+            'weeks': weeks,
+            'alpha': alpha,
+            'series': series
+        }
+        
+        with self._lock:
+            # Ne garder que les rapports de la version courante
+            self._forecast_cache = {
+                cached_key: cached_report
+                for cached_key, cached_report in self._forecast_cache.items()
+                if cached_key[:2] == key[:2]
+            }
+            self._forecast_cache[key] = report
+        return report
+    
     def generate_statistics_report(self) -> Dict:
         """
         Génère un rapport de statistiques générales.
@@ -717,6 +1440,7 @@ class CarRentalSystem:
     
     # === Utilitaires ===
     
+    @_mutation
     def check_and_update_rentals(self) -> None:
         """
         Vérifie et met à jour le statut des locations.
@@ -731,6 +1455,7 @@ class CarRentalSystem:
                 if vehicle and vehicle.is_available():
                     vehicle.rent()
                     rental.start_rental()
+                    self._emit_rental(RentalStarted, rental)
     
     def get_summary(self) -> Dict:
         """Retourne un résumé rapide de l'état du système."""
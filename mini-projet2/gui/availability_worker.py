@@ -0,0 +1,138 @@
+"""
+Recherche des véhicules louables par un client hors du thread de l'interface.
+
+Les véhicules réservés sur la période sont déterminés en un seul parcours
+des locations, puis la flotte est vérifiée par lots (état, disponibilité,
+permis et âge du client). Chaque lot est vérifié sous le verrou du
+système et envoyé dès qu'il est prêt: la liste du dialogue se remplit
+progressivement et le verrou est relâché entre deux lots.
+"""
+
+from datetime import date
+from typing import Callable, Iterator, List, Tuple
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from car_rental_system import CarRentalSystem
+
+# Nombre de véhicules vérifiés par lot
+BATCH_SIZE = 250
+
+
+class AvailabilityCancelled(Exception):
+    """La recherche a été annulée (résultat périmé)."""
+
+
+def iter_rentable_vehicles(
+    system: CarRentalSystem,
+    customer_id: str,
+    start: date,
+    end: date,
+    is_cancelled: Callable[[], bool] = lambda: False,
+    batch_size: int = BATCH_SIZE
+) -> Iterator[List[Tuple[str, str]]]:
+    """
+    Parcourt par lots les véhicules que le client peut louer sur la période.
+    
+    Args:
+        system: Système de location
+        customer_id: ID du client
+        start: Date de début de la location
+        end: Date de fin de la location
+        is_cancelled: Fonction indiquant si le résultat est devenu inutile
+        batch_size: Nombre de véhicules vérifiés par lot
+    
+    Yields:
+        Listes de tuples (ID du véhicule, libellé), éventuellement vides
+    
+    Raises:
+        AvailabilityCancelled: Si la recherche a été annulée
+    """
+    with system.lock:
+        customer = system.get_customer(customer_id)
+        if customer is None:
+            return
+        vehicles = system.get_all_vehicles()
+        booked = system.get_booked_vehicle_ids(start, end)
+    
+    # can_rent_vehicle ne dépend que du permis requis et de l'âge minimum
+    eligibility = {}
+    for offset in range(0, len(vehicles), batch_size):
+        if is_cancelled():
+            raise AvailabilityCancelled()
+        batch = []
+        with system.lock:
+            for vehicle in vehicles[offset:offset + batch_size]:
+                if vehicle.id in booked or not vehicle.is_available():
+                    continue
+                rule = (vehicle.get_required_license(), vehicle.get_minimum_driver_age())
+                can_rent = eligibility.get(rule)
+                if can_rent is None:
+                    can_rent, _ = customer.can_rent_vehicle(*rule)
+                    eligibility[rule] = can_rent
+                if can_rent:
+                    batch.append((
+                        vehicle.id,
+                        f"{vehicle.get_vehicle_type()} - {vehicle.brand} {vehicle.model} "
+                        f"({vehicle.daily_rate:.2f}€/jour)"
+                    ))
+        yield batch
+
+
+class AvailabilityTaskSignals(QObject):
+    """Signaux d'une recherche (émis depuis le thread de calcul)."""
+    
+    batch_ready = pyqtSignal(int, object)  # (génération, [(id, libellé)])
+    finished = pyqtSignal(int)  # génération
+    failed = pyqtSignal(int, str)  # (génération, message)
+
+
+class AvailabilityTask(QRunnable):
+    """
+    Tâche de recherche des véhicules louables par un client.
+    
+    Comme pour les rapports, chaque tâche porte un numéro de génération:
+    le dialogue ignore les lots d'une génération dépassée, et cancel()
+    interrompt la recherche au lot suivant.
+    """
+    
+    def __init__(
+        self,
+        generation: int,
+        system: CarRentalSystem,
+        customer_id: str,
+        start: date,
+        end: date
+    ):
+        super().__init__()
+        self.generation = generation
+        self.system = system
+        self.customer_id = customer_id
+        self.start = start
+        self.end = end
+        self.signals = AvailabilityTaskSignals()
+        self._cancelled = False
+    
+    def cancel(self) -> None:
+        """Demande l'abandon de la recherche."""
+        self._cancelled = True
+    
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+    
+    def run(self) -> None:
+        if self._cancelled:
+            return
+        try:
+            for batch in iter_rentable_vehicles(
+                self.system, self.customer_id, self.start, self.end, self.is_cancelled
+            ):
+                if batch and not self._cancelled:
+                    self.signals.batch_ready.emit(self.generation, batch)
+        except AvailabilityCancelled:
+            return
+        except Exception as e:
+            self.signals.failed.emit(self.generation, str(e))
+            return
+        if not self._cancelled:
+            self.signals.finished.emit(self.generation)
@@ -6,16 +6,49 @@ from datetime import date
 from typing import Optional
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QFrame, QPushButton, QTableWidget, QTableWidgetItem,
+    QLabel, QFrame, QPushButton, QTableView,
     QHeaderView, QDialog, QFormLayout, QLineEdit,
     QCheckBox, QMessageBox, QDateEdit,
     QGroupBox, QScrollArea
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QDate
+from PyQt6.QtCore import Qt, pyqtSignal, QDate, QTimer
 
 from car_rental_system import CarRentalSystem
 from models.customer import Customer
-from gui.icons import get_icon, create_action_button
+from gui.icons import get_icon
+from gui.delegates import (
+    BadgeDelegate, ActionButtonsDelegate, CustomerBadge, EDIT_DELETE_ACTIONS
+)
+from gui.entity_table import (
+    Column, EntityTableModel, IncrementalFilterProxyModel, SEARCH_DEBOUNCE_MS
+)
+
+
+def customer_status_badge(customer: Customer) -> CustomerBadge:
+    """Badge de statut d'un client."""
+    if customer.is_blocked:
+        return CustomerBadge.BLOCKED
+    if customer.is_loyal_customer():
+        return CustomerBadge.LOYAL
+    return CustomerBadge.ACTIVE
+
+
+def customer_search_text(customer: Customer) -> str:
+    """Texte dans lequel la recherche est faite (nom, prénom, email, téléphone)."""
+    return f"{customer.first_name}\n{customer.last_name}\n{customer.email}\n{customer.phone}"
+
+
+CUSTOMER_COLUMNS = [
+    Column("ID", lambda c: c.id),
+    Column("Nom complet", lambda c: c.full_name),
+    Column("Âge", lambda c: f"{c.age} ans"),
+    Column("Email", lambda c: c.email),
+    Column("Téléphone", lambda c: c.phone),
+    Column("Permis", lambda c: ", ".join(sorted(c.license_types))),
+    Column("Locations", lambda c: str(c.get_total_rentals())),
+    Column("Statut", badge=customer_status_badge),
+    Column("Actions"),
+]
 
 
 class CustomerDialog(QDialog):
@@ -312,21 +345,34 @@ class CustomersPage(QWidget):
         
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText("Rechercher par nom, email ou telephone...")
-        self.search_edit.textChanged.connect(self.apply_filter)
         self.search_edit.setMaximumWidth(400)
         
+        # La recherche attend une pause de frappe avant de filtrer
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.apply_filter)
+        self.search_edit.textChanged.connect(self.search_timer.start)
+        
         search_layout.addWidget(self.search_edit)
         search_layout.addStretch()
         
         layout.addLayout(search_layout)
         
-        # Tableau des clients
-        self.table = QTableWidget()
-        self.table.setColumnCount(9)
-        self.table.setHorizontalHeaderLabels([
-            "ID", "Nom complet", "Âge", "Email", "Téléphone", 
-            "Permis", "Locations", "Statut", "Actions"
-        ])
+        # Tableau des clients (modèle, filtre incrémental, délégués peints)
+        self.model = EntityTableModel(CUSTOMER_COLUMNS, self)
+        self.proxy = IncrementalFilterProxyModel(customer_search_text, parent=self)
+        self.proxy.setSourceModel(self.model)
+        
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
+        self.table.setItemDelegateForColumn(7, BadgeDelegate(self.table))
+        self.actions_delegate = ActionButtonsDelegate(
+            EDIT_DELETE_ACTIONS, self.table, button_size=28, spacing=6
+        )
+        self.actions_delegate.action_triggered.connect(self.on_customer_action)
+        self.table.setItemDelegateForColumn(8, self.actions_delegate)
+        self.table.setMouseTracking(True)
         
         # Configuration du tableau
         header = self.table.horizontalHeader()
@@ -350,7 +396,7 @@ class CustomersPage(QWidget):
         self.table.setColumnWidth(7, 100)  # Statut
         self.table.setColumnWidth(8, 120)  # Actions
         
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.table.setAlternatingRowColors(True)
         v_header = self.table.verticalHeader()
         if v_header:
@@ -363,115 +409,24 @@ class CustomersPage(QWidget):
     def refresh_data(self):
         """Rafraîchit les données du tableau."""
         self.all_customers = self.system.get_all_customers()
-        self.apply_filter()
+        self.model.set_items(self.all_customers)
     
     def apply_filter(self):
-        """Applique le filtre de recherche."""
-        customers = self.all_customers
-        
-        search = self.search_edit.text().lower()
-        if search:
-            customers = [c for c in customers 
-                        if search in c.first_name.lower()
-                        or search in c.last_name.lower()
-                        or search in c.email.lower()
-                        or search in c.phone]
-        
-        self.display_customers(customers)
+        """
+        Applique le filtre de recherche.
+        
+        Le filtre est incrémental: seules les lignes qui apparaissent ou
+        disparaissent sont transmises à la vue.
+        """
+        self.search_timer.stop()
+        self.proxy.set_filter(self.search_edit.text())
     
-    def display_customers(self, customers: list):
-        """Affiche les clients dans le tableau."""
-        self.table.setRowCount(len(customers))
-        
-        for row, customer in enumerate(customers):
-            self.table.setItem(row, 0, QTableWidgetItem(customer.id))
-            self.table.setItem(row, 1, QTableWidgetItem(customer.full_name))
-            self.table.setItem(row, 2, QTableWidgetItem(f"{customer.age} ans"))
-            self.table.setItem(row, 3, QTableWidgetItem(customer.email))
-            self.table.setItem(row, 4, QTableWidgetItem(customer.phone))
-            self.table.setItem(row, 5, QTableWidgetItem(", ".join(sorted(customer.license_types))))
-            self.table.setItem(row, 6, QTableWidgetItem(str(customer.get_total_rentals())))
-            
-            # Statut avec badge
-            status_widget = QWidget()
-            status_layout = QHBoxLayout(status_widget)
-            status_layout.setContentsMargins(2, 2, 2, 2)
-            status_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            status_label = QLabel()
-            if customer.is_blocked:
-                status_label.setText("Bloqué")
-                status_label.setStyleSheet("""
-                    QLabel {
-                        background-color: #fef2f2;
-                        color: #dc2626;
-                        padding: 2px 8px;
-                        border-radius: 10px;
-                        font-weight: 600;
-                        font-size: 11px;
-                        border: 1px solid #fecaca;
-                    }
-                """)
-            elif customer.is_loyal_customer():
-                status_label.setText("Fidèle")
-                status_label.setStyleSheet("""
-                    QLabel {
-                        background-color: #f0fdf4;
-                        color: #16a34a;
-                        padding: 2px 8px;
-                        border-radius: 10px;
-                        font-weight: 600;
-                        font-size: 11px;
-                        border: 1px solid #bbf7d0;
-                    }
-                """)
-            else:
-                status_label.setText("Actif")
-                status_label.setStyleSheet("""
-                    QLabel {
-                        background-color: #eff6ff;
-                        color: #2563eb;
-                        padding: 2px 8px;
-                        border-radius: 10px;
-                        font-weight: 600;
-                        font-size: 11px;
-                        border: 1px solid #bfdbfe;
-                    }
-                """)
-            status_layout.addWidget(status_label)
-            self.table.setCellWidget(row, 7, status_widget)
-            
-            # Boutons d'action
-            actions_widget = QWidget()
-            actions_layout = QHBoxLayout(actions_widget)
-            actions_layout.setContentsMargins(4, 0, 4, 0)
-            actions_layout.setSpacing(6)
-            actions_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            edit_btn = create_action_button(
-                "edit", "Modifier",
-                icon_color="#3b82f6",
-                bg_color="#eff6ff",
-                hover_color="#dbeafe",
-                border_color="#bfdbfe",
-                size=28
-            )
-            edit_btn.clicked.connect(lambda checked, c=customer: self.edit_customer(c))
-            
-            delete_btn = create_action_button(
-                "delete", "Supprimer",
-                icon_color="#ef4444",
-                bg_color="#fef2f2",
-                hover_color="#fee2e2",
-                border_color="#fecaca",
-                size=28
-            )
-            delete_btn.clicked.connect(lambda checked, c=customer: self.delete_customer(c))
-            
-            actions_layout.addWidget(edit_btn)
-            actions_layout.addWidget(delete_btn)
-            
-            self.table.setCellWidget(row, 8, actions_widget)
+    def on_customer_action(self, action: str, customer: Customer):
+        """Exécute l'action cliquée sur une ligne du tableau."""
+        if action == "edit":
+            self.edit_customer(customer)
+        elif action == "delete":
+            self.delete_customer(customer)
     
     def add_customer(self):
         """Ouvre le dialogue pour ajouter un client."""
@@ -495,7 +450,6 @@ class CustomersPage(QWidget):
             old_blocked = customer.is_blocked
             old_blocked_reason = customer.blocked_reason
             
-            self.system.remove_customer(customer.id)
             new_customer = dialog.get_customer()
             # Restaurer l'état via la méthode publique
             new_customer.restore_state(
@@ -505,10 +459,13 @@ class CustomersPage(QWidget):
                 blocked_reason=old_blocked_reason
             )
             
-            self.system.add_customer(new_customer)
-            self.refresh_data()
-            self.data_changed.emit()
-            QMessageBox.information(self, "Succès", "Client modifié avec succès!")
+            # Remplacer le client (même ID) sans perdre son classement
+            if self.system.update_customer(new_customer):
+                self.refresh_data()
+                self.data_changed.emit()
+                QMessageBox.information(self, "Succès", "Client modifié avec succès!")
+            else:
+                QMessageBox.warning(self, "Erreur", "Impossible de modifier le client.")
     
     def delete_customer(self, customer: Customer):
         """Supprime un client."""
@@ -0,0 +1,255 @@
+"""
+Délégués partagés des tableaux (badges et boutons d'action peints).
+
+Les tableaux sont virtualisés: au lieu de créer des widgets pour chaque
+ligne, ces délégués peignent les badges et les boutons des seules cellules
+visibles. Les couleurs des badges sont converties une seule fois en objets
+Qt (palette précalculée) au lieu d'une feuille de style par ligne.
+"""
+
+from enum import Enum
+from typing import Dict, List, Optional, Tuple
+
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle, QToolTip
+from PyQt6.QtGui import QColor, QFont, QFontMetricsF, QPainter, QPen, QPixmap
+from PyQt6.QtCore import Qt, QEvent, QRect, QRectF, QSize, pyqtSignal
+
+from models.vehicle import VehicleState
+from models.rental import RentalStatus
+from gui.icons import get_icon
+
+
+# Rôle donnant l'objet métier d'une ligne
+ItemRole = Qt.ItemDataRole.UserRole
+
+# Rôle donnant le badge d'une cellule: une clé de BADGE_COLORS (son texte est sa valeur)
+BadgeRole = Qt.ItemDataRole.UserRole + 1
+
+
+class CustomerBadge(Enum):
+    """Statuts affichés d'un client."""
+    BLOCKED = "Bloqué"
+    LOYAL = "Fidèle"
+    ACTIVE = "Actif"
+
+
+# Couleurs des badges (fond, texte, bordure)
+BADGE_COLORS: Dict[Enum, Tuple[str, str, str]] = {
+    VehicleState.AVAILABLE: ("#f0fdf4", "#16a34a", "#bbf7d0"),
+    VehicleState.RENTED: ("#fefce8", "#ca8a04", "#fef08a"),
+    VehicleState.MAINTENANCE: ("#eff6ff", "#2563eb", "#bfdbfe"),
+    VehicleState.OUT_OF_SERVICE: ("#fef2f2", "#dc2626", "#fecaca"),
+    RentalStatus.ACTIVE: ("#f0fdf4", "#16a34a", "#bbf7d0"),
+    RentalStatus.RESERVED: ("#eff6ff", "#2563eb", "#bfdbfe"),
+    RentalStatus.COMPLETED: ("#f1f5f9", "#64748b", "#e2e8f0"),
+    RentalStatus.CANCELLED: ("#fef2f2", "#dc2626", "#fecaca"),
+    CustomerBadge.BLOCKED: ("#fef2f2", "#dc2626", "#fecaca"),
+    CustomerBadge.LOYAL: ("#f0fdf4", "#16a34a", "#bbf7d0"),
+    CustomerBadge.ACTIVE: ("#eff6ff", "#2563eb", "#bfdbfe"),
+}
+
+# Actions: (clé, icône, infobulle, couleur icône, fond, survol, bordure)
+EDIT_DELETE_ACTIONS = [
+    ("edit", "edit", "Modifier", "#3b82f6", "#eff6ff", "#dbeafe", "#bfdbfe"),
+    ("delete", "delete", "Supprimer", "#ef4444", "#fef2f2", "#fee2e2", "#fecaca"),
+]
+
+
+class BadgeDelegate(QStyledItemDelegate):
+    """
+    Peint la valeur d'une cellule sous forme de badge arrondi.
+    
+    La cellule donne une clé (BadgeRole) dont le style est précalculé:
+    couleurs et crayon sont créés une fois pour toute la palette, la police
+    et la largeur de chaque texte une fois par police de la vue.
+    
+    Args:
+        parent: Vue parente
+        colors: Couleurs (fond, texte, bordure) par clé (BADGE_COLORS par défaut)
+    """
+    
+    HEIGHT = 20
+    PADDING = 8
+    
+    def __init__(self, parent=None, colors: Optional[Dict[Enum, Tuple[str, str, str]]] = None):
+        super().__init__(parent)
+        self._palette: Dict[Enum, Tuple[str, QColor, QColor, QPen]] = {
+            key: (key.value, QColor(background), QColor(foreground), QPen(QColor(border), 1))
+            for key, (background, foreground, border) in (colors or BADGE_COLORS).items()
+        }
+        self._font_key: Optional[str] = None
+        self._font: Optional[QFont] = None
+        self._widths: Dict[Enum, float] = {}
+    
+    def _badge_font(self, base: QFont) -> QFont:
+        """Police des badges, recalculée seulement si la police de la vue change."""
+        if base.key() != self._font_key:
+            self._font_key = base.key()
+            self._font = QFont(base)
+            self._font.setPointSize(8)
+            self._font.setWeight(QFont.Weight.DemiBold)
+            self._widths.clear()
+        return self._font
+    
+    def _badge_width(self, key: Enum, font: QFont) -> float:
+        width = self._widths.get(key)
+        if width is None:
+            width = QFontMetricsF(font).horizontalAdvance(self._palette[key][0]) + 2 * self.PADDING
+            self._widths[key] = width
+        return width
+    
+    def sizeHint(self, option, index) -> QSize:
+        hint = super().sizeHint(option, index)
+        key = index.data(BadgeRole)
+        if key not in self._palette:
+            return hint
+        width = self._badge_width(key, self._badge_font(option.font))
+        return QSize(max(hint.width(), int(width) + 2 * self.PADDING), max(hint.height(), self.HEIGHT + 4))
+    
+    def paint(self, painter: QPainter, option, index) -> None:
+        self.initStyleOption(option, index)
+        style = option.widget.style() if option.widget else None
+        if style:
+            # Fond de la cellule (sélection, alternance) sans le texte
+            option.text = ""
+            style.drawControl(QStyle.ControlElement.CE_ItemViewItem, option, painter, option.widget)
+        
+        key = index.data(BadgeRole)
+        badge_style = self._palette.get(key)
+        if badge_style is None:
+            return
+        text, background, foreground, border = badge_style
+        
+        font = self._badge_font(option.font)
+        width = self._badge_width(key, font)
+        
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(font)
+        badge = QRectF(0, 0, width, self.HEIGHT)
+        badge.moveCenter(QRectF(option.rect).center())
+        painter.setPen(border)
+        painter.setBrush(background)
+        radius = self.HEIGHT / 2
+        painter.drawRoundedRect(badge, radius, radius)
+        painter.setPen(foreground)
+        painter.drawText(badge, Qt.AlignmentFlag.AlignCenter, text)
+        painter.restore()
+
+
+class ActionButtonsDelegate(QStyledItemDelegate):
+    """
+    Peint les boutons d'action d'une ligne et gère leurs clics.
+    
+    Chaque action est un tuple (clé, icône, infobulle, couleur icône, fond,
+    survol, bordure). Les icônes sont rendues une seule fois puis
+    réutilisées pour toutes les lignes.
+    """
+    
+    action_triggered = pyqtSignal(str, object)  # (clé de l'action, objet de la ligne)
+    
+    BUTTON_SIZE = 26
+    SPACING = 4
+    
+    def __init__(
+        self,
+        actions: Optional[list] = None,
+        parent=None,
+        button_size: Optional[int] = None,
+        spacing: Optional[int] = None
+    ):
+        super().__init__(parent)
+        self.actions = list(actions or [])
+        if button_size is not None:
+            self.BUTTON_SIZE = button_size
+        if spacing is not None:
+            self.SPACING = spacing
+        self._pixmaps: Dict[Tuple[str, str], QPixmap] = {}
+        self._hovered: Optional[Tuple[int, str]] = None
+    
+    def _actions_for(self, item) -> list:
+        """Actions proposées pour l'objet d'une ligne (toutes par défaut)."""
+        return self.actions
+    
+    def _button_rects(self, rect: QRect, actions: list) -> List[QRect]:
+        """Position des boutons, centrés dans la cellule."""
+        size, spacing = self.BUTTON_SIZE, self.SPACING
+        total = len(actions) * size + max(len(actions) - 1, 0) * spacing
+        x = rect.x() + (rect.width() - total) // 2
+        y = rect.y() + (rect.height() - size) // 2
+        return [QRect(x + i * (size + spacing), y, size, size) for i in range(len(actions))]
+    
+    def _action_at(self, rect: QRect, item, pos) -> Optional[tuple]:
+        actions = self._actions_for(item)
+        for action, button in zip(actions, self._button_rects(rect, actions)):
+            if button.contains(pos):
+                return action
+        return None
+    
+    def _pixmap(self, icon_name: str, color: str) -> QPixmap:
+        key = (icon_name, color)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            icon_size = int(self.BUTTON_SIZE * 0.55)
+            pixmap = get_icon(icon_name, color, icon_size * 2).pixmap(icon_size, icon_size)
+            self._pixmaps[key] = pixmap
+        return pixmap
+    
+    def paint(self, painter: QPainter, option, index) -> None:
+        self.initStyleOption(option, index)
+        style = option.widget.style() if option.widget else None
+        if style:
+            style.drawControl(QStyle.ControlElement.CE_ItemViewItem, option, painter, option.widget)
+        
+        item = index.data(ItemRole)
+        if item is None:
+            return
+        actions = self._actions_for(item)
+        
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        radius = self.BUTTON_SIZE // 4
+        for action, button in zip(actions, self._button_rects(option.rect, actions)):
+            key, icon_name, _, icon_color, background, hover, border = action[:7]
+            hovered = self._hovered == (index.row(), key)
+            painter.setPen(QPen(QColor(border), 1))
+            painter.setBrush(QColor(hover if hovered else background))
+            painter.drawRoundedRect(QRectF(button).adjusted(0.5, 0.5, -0.5, -0.5), radius, radius)
+            pixmap = self._pixmap(icon_name, icon_color)
+            target = QRect(0, 0, pixmap.width(), pixmap.height())
+            target.moveCenter(button.center())
+            painter.drawPixmap(target, pixmap)
+        painter.restore()
+    
+    def editorEvent(self, event, model, option, index) -> bool:
+        item = index.data(ItemRole)
+        if item is None:
+            return False
+        event_type = event.type()
+        
+        if event_type == QEvent.Type.MouseMove:
+            action = self._action_at(option.rect, item, event.position().toPoint())
+            hovered = (index.row(), action[0]) if action else None
+            if hovered != self._hovered:
+                self._hovered = hovered
+                if option.widget:
+                    option.widget.viewport().update()
+            return False
+        
+        if (event_type == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton):
+            action = self._action_at(option.rect, item, event.position().toPoint())
+            if action:
+                self.action_triggered.emit(action[0], item)
+                return True
+        return False
+    
+    def helpEvent(self, event, view, option, index) -> bool:
+        item = index.data(ItemRole)
+        if item is not None and event.type() == QEvent.Type.ToolTip:
+            action = self._action_at(option.rect, item, event.pos())
+            if action:
+                QToolTip.showText(event.globalPos(), action[2], view)
+                return True
+        QToolTip.hideText()
+        return True
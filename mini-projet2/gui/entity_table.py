@@ -0,0 +1,386 @@
+"""
+Modèles génériques des vues: tableau, filtrage incrémental et listes de choix.
+
+EntityTableModel affiche une liste d'objets métier décrite par des colonnes.
+IncrementalFilterProxyModel filtre ce modèle par recherche textuelle et
+filtres de sélection: quand la recherche est prolongée, seules les lignes
+déjà affichées sont réexaminées, et seules les lignes qui apparaissent ou
+disparaissent sont signalées à la vue. ChoiceListModel alimente les listes
+déroulantes et n'applique, lui aussi, que les différences.
+"""
+
+from bisect import bisect_left
+from enum import Enum
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from PyQt6.QtCore import (
+    Qt, QAbstractListModel, QAbstractTableModel, QAbstractProxyModel, QModelIndex
+)
+
+from gui.delegates import ItemRole, BadgeRole
+
+
+# Délai avant d'appliquer une recherche (ms): une frappe rapide ne filtre qu'une fois
+SEARCH_DEBOUNCE_MS = 200
+
+
+class Column:
+    """
+    Description d'une colonne d'EntityTableModel.
+    
+    Args:
+        header: Titre de la colonne
+        text: Fonction donnant le texte de la cellule à partir de l'objet
+        badge: Fonction donnant la clé du badge de la cellule (voir BADGE_COLORS)
+    """
+    
+    def __init__(
+        self,
+        header: str,
+        text: Optional[Callable[[Any], str]] = None,
+        badge: Optional[Callable[[Any], Enum]] = None
+    ):
+        self.header = header
+        self.text = text
+        self.badge = badge
+
+
+class EntityTableModel(QAbstractTableModel):
+    """Modèle d'une liste d'objets (les cellules sont calculées à la demande)."""
+    
+    def __init__(self, columns: Sequence[Column], parent=None):
+        super().__init__(parent)
+        self.columns = list(columns)
+        self._items: List[Any] = []
+    
+    def set_items(self, items: Sequence[Any]) -> None:
+        """Remplace les objets affichés."""
+        self.beginResetModel()
+        self._items = list(items)
+        self.endResetModel()
+    
+    def item_at(self, row: int) -> Optional[Any]:
+        """Retourne l'objet d'une ligne."""
+        if 0 <= row < len(self._items):
+            return self._items[row]
+        return None
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._items)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.columns)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.columns[section].header
+        return None
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        item = self._items[index.row()]
+        column = self.columns[index.column()]
+        
+        if role == ItemRole:
+            return item
+        if role == Qt.ItemDataRole.DisplayRole and column.text:
+            return column.text(item)
+        if role == BadgeRole and column.badge:
+            return column.badge(item)
+        return None
+
+
+class IncrementalFilterProxyModel(QAbstractProxyModel):
+    """
+    Filtre un EntityTableModel sans rebalayer toute la liste à chaque frappe.
+    
+    Les lignes affichées sont gardées sous forme de liste triée des lignes
+    source. Avec les mêmes filtres de sélection:
+    - une recherche qui contient la précédente ne peut que retirer des
+      lignes: seules les lignes affichées sont réexaminées;
+    - une recherche contenue dans la précédente ne peut qu'en ajouter:
+      seules les lignes masquées sont réexaminées.
+    Le texte de recherche de chaque objet est mis en minuscules une seule
+    fois, au premier filtrage après un chargement.
+    
+    Args:
+        search_text: Fonction donnant le texte dans lequel chercher
+        accepts: Fonction (objet, filtres) indiquant si l'objet passe les
+            filtres de sélection
+    """
+    
+    # Au-delà de ce nombre de plages modifiées, une réinitialisation coûte moins cher
+    MAX_CHANGED_RANGES = 64
+    
+    def __init__(
+        self,
+        search_text: Callable[[Any], str],
+        accepts: Optional[Callable[[Any, tuple], bool]] = None,
+        parent=None
+    ):
+        super().__init__(parent)
+        self._search_text = search_text
+        self._accepts = accepts
+        self._search = ""
+        self._filters: tuple = ()
+        self._rows: List[int] = []
+        self._haystacks: Optional[List[str]] = None
+    
+    # --- Filtrage ---
+    
+    def set_filter(self, search: str = "", filters: tuple = ()) -> None:
+        """
+        Applique une recherche et des filtres de sélection.
+        
+        Args:
+            search: Texte recherché (sans distinction de casse)
+            filters: Valeurs des filtres de sélection, passées à accepts
+        """
+        search = search.lower()
+        if search == self._search and filters == self._filters:
+            return
+        
+        if filters == self._filters and self._search in search:
+            # Recherche prolongée: on restreint le résultat précédent
+            rows = [row for row in self._rows if self._matches(row, search, filters)]
+        elif filters == self._filters and search in self._search:
+            # Recherche raccourcie: seules les lignes masquées peuvent revenir
+            shown = set(self._rows)
+            added = [
+                row for row in range(self._source_row_count())
+                if row not in shown and self._matches(row, search, filters)
+            ]
+            rows = sorted(self._rows + added)
+        else:
+            rows = self._scan(search, filters)
+        
+        self._search = search
+        self._filters = filters
+        self._apply_rows(rows)
+    
+    def visible_count(self) -> int:
+        """Nombre de lignes affichées."""
+        return len(self._rows)
+    
+    def item_at(self, row: int) -> Optional[Any]:
+        """Retourne l'objet d'une ligne affichée."""
+        if 0 <= row < len(self._rows):
+            return self.sourceModel().item_at(self._rows[row])
+        return None
+    
+    def _source_row_count(self) -> int:
+        source = self.sourceModel()
+        return source.rowCount() if source is not None else 0
+    
+    def _haystack(self, row: int) -> str:
+        if self._haystacks is None:
+            source = self.sourceModel()
+            self._haystacks = [
+                self._search_text(source.item_at(r)).lower()
+                for r in range(source.rowCount())
+            ]
+        return self._haystacks[row]
+    
+    def _matches(self, row: int, search: str, filters: tuple) -> bool:
+        if search and search not in self._haystack(row):
+            return False
+        if self._accepts is not None and filters:
+            return self._accepts(self.sourceModel().item_at(row), filters)
+        return True
+    
+    def _scan(self, search: str, filters: tuple) -> List[int]:
+        return [
+            row for row in range(self._source_row_count())
+            if self._matches(row, search, filters)
+        ]
+    
+    def _apply_rows(self, rows: List[int]) -> None:
+        """Remplace les lignes affichées en ne signalant que les différences."""
+        old_set = set(self._rows)
+        new_set = set(rows)
+        removed = _ranges([i for i, row in enumerate(self._rows) if row not in new_set])
+        inserted = _ranges([i for i, row in enumerate(rows) if row not in old_set])
+        
+        if len(removed) + len(inserted) > self.MAX_CHANGED_RANGES:
+            self.beginResetModel()
+            self._rows = rows
+            self.endResetModel()
+            return
+        
+        # Suppressions depuis la fin pour garder les positions valides
+        for first, last in reversed(removed):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._rows[first:last + 1]
+            self.endRemoveRows()
+        
+        # Insertions dans l'ordre: les positions sont celles du résultat final
+        for first, last in inserted:
+            self.beginInsertRows(QModelIndex(), first, last)
+            self._rows[first:first] = rows[first:last + 1]
+            self.endInsertRows()
+    
+    # --- Modèle source ---
+    
+    def setSourceModel(self, source) -> None:
+        previous = self.sourceModel()
+        if previous is not None:
+            previous.modelReset.disconnect(self._on_source_reset)
+            previous.dataChanged.disconnect(self._on_source_data_changed)
+        
+        self.beginResetModel()
+        super().setSourceModel(source)
+        self._haystacks = None
+        self._rows = self._scan(self._search, self._filters)
+        self.endResetModel()
+        
+        source.modelReset.connect(self._on_source_reset)
+        source.dataChanged.connect(self._on_source_data_changed)
+    
+    def _on_source_reset(self) -> None:
+        self.beginResetModel()
+        self._haystacks = None
+        self._rows = self._scan(self._search, self._filters)
+        self.endResetModel()
+    
+    def _on_source_data_changed(self, top_left, bottom_right, roles=()) -> None:
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self._rows) - 1, self.columnCount() - 1),
+                roles
+            )
+    
+    # --- Correspondance des index ---
+    
+    def mapToSource(self, proxy_index: QModelIndex) -> QModelIndex:
+        if not proxy_index.isValid() or proxy_index.row() >= len(self._rows):
+            return QModelIndex()
+        return self.sourceModel().index(self._rows[proxy_index.row()], proxy_index.column())
+    
+    def mapFromSource(self, source_index: QModelIndex) -> QModelIndex:
+        if not source_index.isValid():
+            return QModelIndex()
+        position = bisect_left(self._rows, source_index.row())
+        if position < len(self._rows) and self._rows[position] == source_index.row():
+            return self.index(position, source_index.column())
+        return QModelIndex()
+    
+    def index(self, row: int, column: int, parent=QModelIndex()) -> QModelIndex:
+        if parent.isValid() or not (0 <= row < len(self._rows)):
+            return QModelIndex()
+        if not (0 <= column < self.columnCount()):
+            return QModelIndex()
+        return self.createIndex(row, column)
+    
+    def parent(self, index=None):
+        if index is None:
+            return super().parent()
+        return QModelIndex()
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        source = self.sourceModel()
+        return 0 if parent.isValid() or source is None else source.columnCount()
+
+
+class ChoiceListModel(QAbstractListModel):
+    """
+    Liste de choix (libellé, clé) pour une ou plusieurs listes déroulantes.
+    
+    La première entrée est fixe (par exemple "Tous les clients", clé None).
+    set_entries() compare les clés à la liste courante et ne signale que
+    les entrées retirées, ajoutées ou renommées: les listes déroulantes
+    gardent leur sélection sans être reconstruites.
+    
+    Args:
+        first_label: Libellé de la première entrée (clé None)
+    """
+    
+    def __init__(self, first_label: str, parent=None):
+        super().__init__(parent)
+        self._labels: List[str] = [first_label]
+        self._keys: List[Any] = [None]
+    
+    def set_entries(self, entries: Sequence[Tuple[str, Any]]) -> None:
+        """
+        Remplace les entrées (après la première) en n'appliquant que les différences.
+        
+        Args:
+            entries: Liste de tuples (libellé, clé), clés uniques
+        """
+        labels = [self._labels[0]] + [label for label, _ in entries]
+        keys = [None] + [key for _, key in entries]
+        new_keys = set(keys)
+        
+        for first, last in reversed(_ranges(
+                [i for i, key in enumerate(self._keys) if key not in new_keys])):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._labels[first:last + 1]
+            del self._keys[first:last + 1]
+            self.endRemoveRows()
+        
+        kept = set(self._keys)
+        if self._keys != [key for key in keys if key in kept]:
+            # Ordre modifié: une réinitialisation est plus simple qu'un déplacement
+            self.beginResetModel()
+            self._labels, self._keys = labels, keys
+            self.endResetModel()
+            return
+        
+        for first, last in _ranges([i for i, key in enumerate(keys) if key not in kept]):
+            self.beginInsertRows(QModelIndex(), first, last)
+            self._labels[first:first] = labels[first:last + 1]
+            self._keys[first:first] = keys[first:last + 1]
+            self.endInsertRows()
+        
+        for first, last in _ranges(
+                [i for i, label in enumerate(labels) if self._labels[i] != label]):
+            self._labels[first:last + 1] = labels[first:last + 1]
+            self.dataChanged.emit(self.index(first), self.index(last))
+    
+    def append_entries(self, entries: Sequence[Tuple[str, Any]]) -> None:
+        """
+        Ajoute des entrées en fin de liste (remplissage progressif).
+        
+        Args:
+            entries: Liste de tuples (libellé, clé), clés absentes de la liste
+        """
+        if not entries:
+            return
+        first = len(self._keys)
+        self.beginInsertRows(QModelIndex(), first, first + len(entries) - 1)
+        self._labels.extend(label for label, _ in entries)
+        self._keys.extend(key for _, key in entries)
+        self.endInsertRows()
+    
+    def set_first_label(self, label: str) -> None:
+        """Change le libellé de la première entrée (ex: état d'une recherche)."""
+        if self._labels[0] != label:
+            self._labels[0] = label
+            self.dataChanged.emit(self.index(0), self.index(0))
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._keys)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._labels[index.row()]
+        if role == ItemRole:
+            return self._keys[index.row()]
+        return None
+
+
+def _ranges(positions: List[int]) -> List[Tuple[int, int]]:
+    """Regroupe des positions croissantes en plages contiguës (début, fin)."""
+    ranges: List[Tuple[int, int]] = []
+    for position in positions:
+        if ranges and ranges[-1][1] == position - 1:
+            ranges[-1] = (ranges[-1][0], position)
+        else:
+            ranges.append((position, position))
+    return ranges
@@ -3,8 +3,11 @@ Module de gestion des icônes pour l'interface graphique.
 Utilise des icônes SVG intégrées pour une apparence professionnelle.
 """
 
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
 from PyQt6.QtWidgets import QStyle, QApplication, QPushButton
-from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor, QFont
+from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor, QFont, QGuiApplication
 from PyQt6.QtCore import Qt, QSize, QRect
 from PyQt6.QtSvg import QSvgRenderer
 from io import BytesIO
@@ -170,14 +173,22 @@ SVG_ICONS = {
 }
 
 
-def create_icon_from_svg(svg_content: str, color: str = "#ffffff", size: int = 24) -> QIcon:
+def create_icon_from_svg(
+    svg_content: str,
+    color: str = "#ffffff",
+    size: int = 24,
+    device_pixel_ratio: float = 1.0
+) -> QIcon:
     """Crée une QIcon à partir d'un contenu SVG."""
     # Remplacer la couleur
     svg_data = svg_content.format(color=color).encode('utf-8')
     
+    # Taille réelle en pixels sur un écran haute densité
+    pixel_size = max(1, round(size * device_pixel_ratio))
+    
     # Utiliser une résolution plus élevée pour un meilleur rendu
     scale = 2  # Facteur d'échelle pour la qualité
-    render_size = size * scale
+    render_size = pixel_size * scale
     
     # Créer le pixmap avec une résolution plus élevée
     pixmap = QPixmap(render_size, render_size)
@@ -194,19 +205,103 @@ def create_icon_from_svg(svg_content: str, color: str = "#ffffff", size: int = 2
     
     # Redimensionner pour la taille finale avec une bonne qualité
     final_pixmap = pixmap.scaled(
-        size, size,
+        pixel_size, pixel_size,
         Qt.AspectRatioMode.KeepAspectRatio,
         Qt.TransformationMode.SmoothTransformation
     )
+    final_pixmap.setDevicePixelRatio(device_pixel_ratio)
     
     return QIcon(final_pixmap)
 
 
+# === Cache des icônes ===
+
+# Nombre maximum d'icônes gardées (les moins récemment utilisées sont retirées)
+ICON_CACHE_SIZE = 512
+
+# Icônes des tableaux et de la barre latérale, rendues au démarrage:
+# (nom, couleur, taille)
+ICON_ATLAS = [
+    # Actions du tableau des locations (boutons de 26 px) et notes
+    ("eye", "#64748b", 28), ("play", "#ffffff", 28), ("edit", "#3b82f6", 28),
+    ("check", "#ffffff", 28), ("calendar", "#8b5cf6", 28), ("cancel", "#ffffff", 28),
+    ("documents", "#64748b", 16),
+    # Actions des tableaux des véhicules et des clients (boutons de 28 px)
+    ("edit", "#3b82f6", 30), ("delete", "#ef4444", 30),
+]
+
+_icon_cache: "OrderedDict[Tuple[str, str, int, float], QIcon]" = OrderedDict()
+_icon_cache_stats = {'hits': 0, 'misses': 0}
+
+
+def _device_pixel_ratio() -> float:
+    """Densité de pixels de l'écran principal (1.0 sans application)."""
+    app = QGuiApplication.instance()
+    return app.devicePixelRatio() if app is not None else 1.0
+
+
 def get_icon(name: str, color: str = "#ffffff", size: int = 24) -> QIcon:
-    """Récupère une icône par son nom."""
-    if name in SVG_ICONS:
-        return create_icon_from_svg(SVG_ICONS[name], color, size)
-    return QIcon()
+    """
+    Récupère une icône par son nom.
+    
+    Les icônes rendues sont gardées dans un cache LRU (clé: nom, couleur,
+    taille, densité de l'écran): le SVG n'est analysé et rasterisé qu'une
+    fois par combinaison.
+    """
+    if name not in SVG_ICONS:
+        return QIcon()
+    
+    key = (name, color, size, _device_pixel_ratio())
+    icon = _icon_cache.get(key)
+    if icon is not None:
+        _icon_cache.move_to_end(key)
+        _icon_cache_stats['hits'] += 1
+        return icon
+    
+    _icon_cache_stats['misses'] += 1
+    icon = create_icon_from_svg(SVG_ICONS[name], color, size, key[3])
+    _icon_cache[key] = icon
+    if len(_icon_cache) > ICON_CACHE_SIZE:
+        _icon_cache.popitem(last=False)
+    return icon
+
+
+def prewarm_icons(specs: Optional[Iterable[Tuple[str, str, int]]] = None) -> int:
+    """
+    Rend à l'avance des icônes dans le cache (à appeler après QApplication).
+    
+    Args:
+        specs: Tuples (nom, couleur, taille); ICON_ATLAS par défaut
+        
+    Returns:
+        Nombre d'icônes rendues (celles déjà en cache ne comptent pas)
+    """
+    misses_before = _icon_cache_stats['misses']
+    for name, color, size in (ICON_ATLAS if specs is None else specs):
+        get_icon(name, color, size)
+    return _icon_cache_stats['misses'] - misses_before
+
+
+def get_icon_cache_stats() -> Dict[str, int]:
+    """
+    Retourne les statistiques du cache des icônes.
+    
+    Returns:
+        Dictionnaire (hits, misses, size, capacity)
+    """
+    return {
+        'hits': _icon_cache_stats['hits'],
+        'misses': _icon_cache_stats['misses'],
+        'size': len(_icon_cache),
+        'capacity': ICON_CACHE_SIZE
+    }
+
+
+def clear_icon_cache() -> None:
+    """Vide le cache des icônes et remet les statistiques à zéro."""
+    _icon_cache.clear()
+    _icon_cache_stats['hits'] = 0
+    _icon_cache_stats['misses'] = 0
 
 
 def create_colored_icon(icon_name: str, color: str, size: int = 32) -> QIcon:
@@ -0,0 +1,50 @@
+"""
+Lecture des données sauvegardées hors du thread de l'interface.
+
+DataPersistence.load_all est exécuté par une tâche QThreadPool pendant que
+l'écran de chargement reste animé. Le résultat est gardé par la tâche et
+signalé à la fenêtre, qui le donne au système à l'étape suivante du
+démarrage (dans le thread de l'interface).
+"""
+
+from typing import Dict, Optional, Tuple
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from models.persistence import DataPersistence
+
+
+class DataLoadTaskSignals(QObject):
+    """Signaux de la lecture (émis depuis le thread de lecture)."""
+    
+    finished = pyqtSignal()
+
+
+class DataLoadTask(QRunnable):
+    """
+    Tâche de lecture des véhicules, clients et locations sauvegardés.
+    
+    Attributes:
+        done: La lecture est terminée (avec ou sans erreur)
+        result: Tuple (véhicules, clients, locations) si la lecture a réussi
+        error: Message d'erreur si la lecture a échoué
+    """
+    
+    def __init__(self, persistence: DataPersistence, parallel: bool = True):
+        super().__init__()
+        self.persistence = persistence
+        self.parallel = parallel
+        self.signals = DataLoadTaskSignals()
+        self.done = False
+        self.result: Optional[Tuple[Dict, Dict, Dict]] = None
+        self.error: Optional[str] = None
+        # La fenêtre garde la tâche: elle ne doit pas être détruite par le pool
+        self.setAutoDelete(False)
+    
+    def run(self) -> None:
+        try:
+            self.result = self.persistence.load_all(parallel=self.parallel)
+        except Exception as e:
+            self.error = str(e)
+        self.done = True
+        self.signals.finished.emit()
@@ -2,17 +2,23 @@
 Fenêtre principale de l'application.
 """
 
+import logging
+from typing import List, Optional, Set
+
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QStackedWidget, QPushButton, QLabel, QFrame,
-    QMessageBox, QApplication, QSplitter
+    QMessageBox, QApplication, QSplitter, QProgressBar
 )
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtGui import QIcon, QFont, QAction, QPixmap
 
 from car_rental_system import CarRentalSystem
 from models.vehicle import Car, Truck, Motorcycle, VehicleCategory
 from models.customer import Customer
+from models.persistence import DataPersistence
+from models.autosave import AutosaveService
+from models.events import SystemEvent
 from datetime import date
 
 from gui.styles import get_full_stylesheet, COLORS
@@ -20,8 +26,15 @@ from gui.dashboard_page import DashboardPage
 from gui.vehicles_page import VehiclesPage
 from gui.customers_page import CustomersPage
 from gui.rentals_page import RentalsPage
+from gui.planning_page import PlanningPage
 from gui.reports_page import ReportsPage
-from gui.icons import get_icon, ICON_COLORS
+from gui.icons import get_icon, get_icon_cache_stats, prewarm_icons, ICON_COLORS
+from gui.startup import StartupTimer
+from gui.load_worker import DataLoadTask
+
+logger = logging.getLogger(__name__)
+
+APP_VERSION = "1.0.0"
 
 
 class SidebarButton(QPushButton):
@@ -47,22 +60,223 @@ class SidebarButton(QPushButton):
 
 
 class MainWindow(QMainWindow):
-    """Fenêtre principale de l'application."""
+    """
+    Fenêtre principale de l'application.
+    
+    La fenêtre s'affiche avant le chargement des données: les étapes de
+    chargement s'exécutent ensuite une par une depuis la boucle
+    d'événements, derrière un indicateur de progression. Les pages ne sont
+    construites qu'à leur première ouverture.
+    """
+    
+    AUTOSAVE_STATUS_INTERVAL_MS = 1000
+    
+    # Pages (attribut, classe), dans l'ordre des boutons de navigation
+    PAGES = [
+        ("dashboard_page", DashboardPage),
+        ("vehicles_page", VehiclesPage),
+        ("customers_page", CustomersPage),
+        ("rentals_page", RentalsPage),
+        ("planning_page", PlanningPage),
+        ("reports_page", ReportsPage),
+    ]
     
-    def __init__(self):
+    # Émis quand le chargement initial est terminé
+    loading_finished = pyqtSignal()
+    
+    def __init__(
+        self,
+        data_dir: str = DataPersistence.DEFAULT_DATA_DIR,
+        rentals_format: str = "json",
+        prewarm_icon_atlas: bool = True,
+        deferred_loading: bool = True,
+        startup_timer: Optional[StartupTimer] = None
+    ):
         super().__init__()
+        self.startup_timer = startup_timer or StartupTimer()
         
-        # Initialiser le système
+        # Initialiser le système (vide jusqu'à l'étape de chargement)
         self.system = CarRentalSystem("ShopTaLoc31 Premium")
-        
-        # Charger les données de démonstration
-        self.load_demo_data()
+        self.persistence = DataPersistence(data_dir, rentals_format)
+        self.autosave: Optional[AutosaveService] = None
+        self.autosave_timer: Optional[QTimer] = None
+        self.loaded = False
+        self._prewarm_icon_atlas = prewarm_icon_atlas
+        self._pages: List[Optional[QWidget]] = [None] * len(self.PAGES)
+        self._stale_pages: Set[int] = set()
+        self._thread_pool = QThreadPool(self)
+        self._data_task: Optional[DataLoadTask] = None
+        
+        # Les modifications du système rendent les pages masquées périmées
+        self.system.events.subscribe_batch(self.on_system_events)
         
         # Configurer l'interface
         self.setup_ui()
         
         # Appliquer le style
         self.setStyleSheet(get_full_stylesheet())
+        self.startup_timer.mark("window_created")
+        
+        # Étapes du chargement: (message affiché, action)
+        self._loading_steps = [
+            ("Lecture des données...", self.start_data_loading),
+            ("Chargement des données...", self.load_initial_data),
+            ("Préparation des icônes...", self.prepare_icons),
+            ("Démarrage de la sauvegarde automatique...", self.start_autosave),
+            ("Ouverture du tableau de bord...", self.open_first_page),
+        ]
+        self._loading_step = 0
+        self.loading_progress.setRange(0, len(self._loading_steps))
+        self.loading_label.setText(self._loading_steps[0][0])
+        
+        if deferred_loading:
+            QTimer.singleShot(0, self._on_loading_timer)
+        else:
+            self.finish_loading()
+    
+    # --- Chargement différé ---
+    
+    def _run_loading_step(self) -> bool:
+        """
+        Exécute la prochaine étape du chargement.
+        
+        Returns:
+            True s'il reste des étapes
+        """
+        if self._loading_step >= len(self._loading_steps):
+            return False
+        
+        _, action = self._loading_steps[self._loading_step]
+        action()
+        self._loading_step += 1
+        self.loading_progress.setValue(self._loading_step)
+        
+        if self._loading_step < len(self._loading_steps):
+            self.loading_label.setText(self._loading_steps[self._loading_step][0])
+            return True
+        
+        self._on_loading_done()
+        return False
+    
+    def _on_loading_timer(self):
+        # Une étape par passage dans la boucle d'événements: l'indicateur est repeint entre deux
+        if self._run_loading_step():
+            if self._data_task is not None and not self._data_task.done:
+                # Lecture en cours: reprise par _on_data_read
+                return
+            QTimer.singleShot(0, self._on_loading_timer)
+    
+    def _on_data_read(self):
+        """Reprend le chargement différé une fois les données lues."""
+        QTimer.singleShot(0, self._on_loading_timer)
+    
+    def finish_loading(self):
+        """Exécute immédiatement les étapes de chargement restantes."""
+        while self._run_loading_step():
+            pass
+    
+    def _on_loading_done(self):
+        """Retire l'indicateur de chargement et active la navigation."""
+        self.stack.removeWidget(self.loading_page)
+        self.loading_page.deleteLater()
+        for btn in self.nav_buttons:
+            btn.setEnabled(True)
+        status_bar = self.statusBar()
+        if status_bar:
+            status_bar.showMessage("Prêt")
+        
+        self.loaded = True
+        self.startup_timer.mark("ready")
+        logger.info(f"Démarrage: {self.startup_timer.summary()}")
+        self.loading_finished.emit()
+    
+    def start_data_loading(self):
+        """Lance la lecture des données sauvegardées dans un thread du pool."""
+        if not self.persistence.data_exists():
+            return
+        self._data_task = DataLoadTask(self.persistence)
+        self._data_task.signals.finished.connect(self._on_data_read)
+        self._thread_pool.start(self._data_task)
+    
+    def load_initial_data(self):
+        """Applique les données sauvegardées, ou charge la démonstration à défaut."""
+        if not self.load_saved_data():
+            self.load_demo_data()
+        self.startup_timer.mark("data_loaded")
+    
+    def prepare_icons(self):
+        """Rend à l'avance les icônes des tableaux."""
+        if self._prewarm_icon_atlas:
+            prewarm_icons()
+        self.startup_timer.mark("icons_ready")
+    
+    def start_autosave(self):
+        """Démarre la sauvegarde automatique en arrière-plan."""
+        self.autosave = AutosaveService(self.system, self.persistence)
+        self.autosave.start()
+        self.autosave_timer = QTimer(self)
+        self.autosave_timer.timeout.connect(self.update_autosave_status)
+        self.autosave_timer.start(self.AUTOSAVE_STATUS_INTERVAL_MS)
+    
+    def open_first_page(self):
+        """Construit et affiche le tableau de bord."""
+        self.switch_page(0)
+        self.startup_timer.mark("first_page_ready")
+    
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.startup_timer.has_mark("first_frame"):
+            self.startup_timer.mark("first_frame")
+    
+    # --- Pages construites à la demande ---
+    
+    def page(self, index: int) -> QWidget:
+        """
+        Retourne une page, en la construisant à sa première utilisation.
+        
+        Args:
+            index: Position de la page (ordre de PAGES)
+        """
+        page = self._pages[index]
+        if page is None:
+            page_class = self.PAGES[index][1]
+            page = page_class(self.system)
+            
+            # Remplacer l'emplacement vide par la page
+            placeholder = self.stack.widget(index)
+            self.stack.insertWidget(index, page)
+            self.stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self._pages[index] = page
+            logger.debug(f"Page {self.PAGES[index][0]} construite")
+        return page
+    
+    def is_page_built(self, index: int) -> bool:
+        return self._pages[index] is not None
+    
+    @property
+    def dashboard_page(self) -> DashboardPage:
+        return self.page(0)
+    
+    @property
+    def vehicles_page(self) -> VehiclesPage:
+        return self.page(1)
+    
+    @property
+    def customers_page(self) -> CustomersPage:
+        return self.page(2)
+    
+    @property
+    def rentals_page(self) -> RentalsPage:
+        return self.page(3)
+    
+    @property
+    def planning_page(self) -> PlanningPage:
+        return self.page(4)
+    
+    @property
+    def reports_page(self) -> ReportsPage:
+        return self.page(5)
     
     def setup_ui(self):
         """Configure l'interface principale."""
@@ -131,6 +345,7 @@ class MainWindow(QMainWindow):
         self.btn_vehicles = SidebarButton("Vehicules", "car")
         self.btn_customers = SidebarButton("Clients", "customers")
         self.btn_rentals = SidebarButton("Locations", "rental")
+        self.btn_planning = SidebarButton("Planning", "calendar")
         self.btn_reports = SidebarButton("Rapports", "reports")
         
         self.nav_buttons = [
@@ -138,6 +353,7 @@ class MainWindow(QMainWindow):
             self.btn_vehicles,
             self.btn_customers,
             self.btn_rentals,
+            self.btn_planning,
             self.btn_reports
         ]
         
@@ -167,11 +383,15 @@ class MainWindow(QMainWindow):
         
         self.btn_dashboard.set_active(True)
         
+        # Navigation inactive jusqu'à la fin du chargement
+        for btn in self.nav_buttons:
+            btn.setEnabled(False)
+        
         sidebar_layout.addLayout(nav_layout)
         sidebar_layout.addStretch()
         
         # Info version
-        version_label = QLabel("Version 1.0.0")
+        version_label = QLabel(f"Version {APP_VERSION}")
         version_label.setStyleSheet("color: #475569; font-size: 11px; padding: 16px;")
         version_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         sidebar_layout.addWidget(version_label)
@@ -184,27 +404,16 @@ class MainWindow(QMainWindow):
         content_layout = QVBoxLayout(content_frame)
         content_layout.setContentsMargins(0, 0, 0, 0)
         
-        # Stack pour les pages
+        # Stack pour les pages: un emplacement vide par page, remplacé
+        # par la page à sa première ouverture
         self.stack = QStackedWidget()
+        for _ in self.PAGES:
+            self.stack.addWidget(QWidget())
         
-        # Créer les pages
-        self.dashboard_page = DashboardPage(self.system)
-        self.vehicles_page = VehiclesPage(self.system)
-        self.customers_page = CustomersPage(self.system)
-        self.rentals_page = RentalsPage(self.system)
-        self.reports_page = ReportsPage(self.system)
-        
-        # Connecter les signaux de mise à jour
-        self.vehicles_page.data_changed.connect(self.refresh_all)
-        self.customers_page.data_changed.connect(self.refresh_all)
-        self.rentals_page.data_changed.connect(self.refresh_all)
-        
-        # Ajouter les pages au stack
-        self.stack.addWidget(self.dashboard_page)
-        self.stack.addWidget(self.vehicles_page)
-        self.stack.addWidget(self.customers_page)
-        self.stack.addWidget(self.rentals_page)
-        self.stack.addWidget(self.reports_page)
+        # Indicateur de chargement, affiché jusqu'à l'ouverture de la première page
+        self.loading_page = self.create_loading_page()
+        self.stack.addWidget(self.loading_page)
+        self.stack.setCurrentWidget(self.loading_page)
         
         content_layout.addWidget(self.stack)
         
@@ -215,38 +424,130 @@ class MainWindow(QMainWindow):
         self.btn_vehicles.clicked.connect(lambda: self.switch_page(1))
         self.btn_customers.clicked.connect(lambda: self.switch_page(2))
         self.btn_rentals.clicked.connect(lambda: self.switch_page(3))
-        self.btn_reports.clicked.connect(lambda: self.switch_page(4))
+        self.btn_planning.clicked.connect(lambda: self.switch_page(4))
+        self.btn_reports.clicked.connect(lambda: self.switch_page(5))
         
         # Barre de statut
+        self.autosave_label = QLabel("")
+        self.autosave_label.setStyleSheet("color: #64748b; font-size: 11px; padding-right: 12px;")
         status_bar = self.statusBar()
         if status_bar:
-            status_bar.showMessage("Prêt")
+            status_bar.showMessage("Chargement...")
             status_bar.setStyleSheet("background-color: #ffffff; border-top: 1px solid #e2e8f0;")
+            status_bar.addPermanentWidget(self.autosave_label)
+    
+    def create_loading_page(self) -> QWidget:
+        """Crée l'indicateur affiché pendant le chargement initial."""
+        page = QWidget()
+        layout = QVBoxLayout(page)
+        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.setSpacing(12)
+        
+        title = QLabel("ShopTaLoc31")
+        title.setStyleSheet("font-size: 24px; font-weight: 700; color: #0f172a;")
+        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        
+        self.loading_label = QLabel("Chargement...")
+        self.loading_label.setStyleSheet("color: #64748b;")
+        self.loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        
+        self.loading_progress = QProgressBar()
+        self.loading_progress.setFixedSize(320, 8)
+        self.loading_progress.setTextVisible(False)
+        
+        layout.addWidget(title)
+        layout.addWidget(self.loading_label)
+        layout.addWidget(self.loading_progress, alignment=Qt.AlignmentFlag.AlignCenter)
+        return page
     
     def switch_page(self, index: int):
-        """Change la page affichée."""
-        self.stack.setCurrentIndex(index)
+        """Change la page affichée (construite à sa première ouverture)."""
+        just_built = not self.is_page_built(index)
+        page = self.page(index)
+        self.stack.setCurrentWidget(page)
         
         # Mettre à jour les boutons avec les icônes
         for i, btn in enumerate(self.nav_buttons):
             btn.set_active(i == index)
         
-        # Rafraîchir la page si nécessaire
-        if index == 0:
-            self.dashboard_page.refresh_data()
-        elif index == 1:
-            self.vehicles_page.refresh_data()
-        elif index == 2:
-            self.customers_page.refresh_data()
-        elif index == 3:
-            self.rentals_page.refresh_data()
-        elif index == 4:
-            self.reports_page.refresh_data()
-    
-    def refresh_all(self):
-        """Rafraîchit toutes les pages."""
-        self.dashboard_page.refresh_data()
-        # Les autres pages se rafraîchissent à l'ouverture
+        # Rafraîchir la page seulement si les données ont changé depuis
+        # son dernier affichage (une page neuve est déjà à jour)
+        if index in self._stale_pages:
+            self._stale_pages.discard(index)
+            if not just_built:
+                page.refresh_data()
+    
+    def on_system_events(self, events: List[SystemEvent]):
+        """
+        Marque les pages construites et masquées comme périmées.
+        
+        La page affichée se rafraîchit elle-même après ses propres actions;
+        les autres ne seront rafraîchies qu'à leur prochaine ouverture.
+        """
+        current = self.stack.currentIndex()
+        for index, page in enumerate(self._pages):
+            if page is not None and index != current:
+                self._stale_pages.add(index)
+    
+    def update_autosave_status(self):
+        """Affiche l'état de la sauvegarde automatique dans la barre de statut."""
+        if self.autosave is None:
+            return
+        status = self.autosave.get_status()
+        
+        if status['last_error']:
+            text = f"Erreur de sauvegarde: {status['last_error']}"
+        elif status['saving']:
+            text = "Sauvegarde en cours..."
+        elif status['pending_changes']:
+            text = f"{status['pending_changes']} modification(s) en attente"
+        elif status['last_saved_at']:
+            text = f"Sauvegardé à {status['last_saved_at'].strftime('%H:%M:%S')}"
+        else:
+            text = "Aucune modification"
+        
+        self.autosave_label.setText(text)
+    
+    def closeEvent(self, event):
+        """Sauvegarde les modifications en attente avant de fermer."""
+        if self.autosave_timer is not None:
+            self.autosave_timer.stop()
+        if self.is_page_built(5):
+            self.reports_page.wait_for_reports()
+        if self.autosave is not None:
+            self.autosave.stop(flush=True)
+            if self.autosave.pending_changes:
+                QMessageBox.warning(
+                    self, "Sauvegarde",
+                    f"Des modifications n'ont pas pu être sauvegardées:\n{self.autosave.last_error}"
+                )
+        stats = get_icon_cache_stats()
+        logger.info(
+            f"Cache des icônes: {stats['hits']} succès, {stats['misses']} rendus "
+            f"({stats['size']}/{stats['capacity']} icônes)"
+        )
+        super().closeEvent(event)
+    
+    def load_saved_data(self) -> bool:
+        """
+        Donne au système les données lues par start_data_loading.
+        
+        Si la lecture n'est pas terminée (chargement immédiat, voir
+        finish_loading), elle est attendue.
+        
+        Returns:
+            True si des données ont été chargées
+        """
+        task, self._data_task = self._data_task, None
+        if task is None:
+            return False
+        if not task.done:
+            self._thread_pool.waitForDone()
+        if task.error is not None:
+            QMessageBox.warning(None, "Chargement", f"Données illisibles: {task.error}")
+            return False
+        self.persistence.load_into(self.system, loaded=task.result)
+        return True
     
     def load_demo_data(self):
         """Charge des données de démonstration."""
@@ -0,0 +1,798 @@
+"""
+Page du planning de la flotte (véhicules × jours).
+
+Le planning est une QGraphicsView sur un seul élément qui couvre toute la
+grille. L'élément est peint par tuiles de TILE_SIZE pixels gardées en
+cache: seules les tuiles visibles sont dessinées, et chacune ne parcourt
+que les lignes et les jours qu'elle couvre.
+
+Selon le zoom, une tuile montre:
+- le détail: une barre par location, aux couleurs de son statut;
+- une vue agrégée: le taux d'occupation par blocs de véhicules × jours,
+  dès qu'une ligne ou un jour fait moins de quelques pixels.
+
+Une location modifiée ne recalcule que sa barre et la ligne de son
+véhicule, et n'invalide que les tuiles qui contiennent cette ligne.
+"""
+
+import logging
+import math
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import List, Optional, Set, Tuple
+
+import numpy as np
+
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QPushButton,
+    QDateEdit, QGraphicsItem, QGraphicsScene, QGraphicsView, QToolTip
+)
+from PyQt6.QtCore import Qt, QDate, QEvent, QPointF, QRectF, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QImage, QPainter, QPen, QPixmap, QTransform
+
+from car_rental_system import CarRentalSystem
+from models.events import DataReloaded, RentalEvent, SystemEvent, VehicleEvent
+from models.planning import FleetPlanning, PlanningBar
+from models.rental import RentalStatus
+from gui.delegates import BADGE_COLORS
+from gui.icons import get_icon
+
+logger = logging.getLogger(__name__)
+
+
+# Taille d'un jour et d'une ligne au zoom 1 (unités de la scène)
+DAY_WIDTH = 28.0
+ROW_HEIGHT = 26.0
+
+# En-têtes fixes (pixels): noms des véhicules à gauche, dates en haut
+LABEL_WIDTH = 180
+HEADER_HEIGHT = 44
+
+# Tuiles de rendu (pixels) et nombre de tuiles gardées en cache
+TILE_SIZE = 256
+TILE_CACHE_SIZE = 192
+
+# En dessous de ces tailles (pixels), le planning passe en vue agrégée
+DETAIL_MIN_DAY_PX = 6.0
+DETAIL_MIN_ROW_PX = 8.0
+
+# Taille minimale d'un bloc de la vue agrégée (pixels)
+MIN_BLOCK_PX = 3.0
+
+# Bornes du zoom (taille d'un jour et d'une ligne en pixels)
+MIN_DAY_PX, MAX_DAY_PX = 1.0, 96.0
+MIN_ROW_PX, MAX_ROW_PX = 0.05, 48.0
+
+ZOOM_STEP = 1.25
+
+MONTH_NAMES = [
+    "janvier", "février", "mars", "avril", "mai", "juin", "juillet",
+    "août", "septembre", "octobre", "novembre", "décembre"
+]
+
+BACKGROUND = QColor("#ffffff")
+ALTERNATE_BACKGROUND = QColor("#f8fafc")
+WEEKEND_BACKGROUND = QColor("#f1f5f9")
+GRID_PEN = QPen(QColor("#e2e8f0"), 1)
+TODAY_PEN = QPen(QColor("#ef4444"), 2)
+HEADER_BACKGROUND = QColor("#f8fafc")
+HEADER_TEXT = QColor("#334155")
+MUTED_TEXT = QColor("#94a3b8")
+
+# Statuts affichés (les locations annulées n'occupent pas de véhicule)
+PLANNING_STATUSES = (RentalStatus.ACTIVE, RentalStatus.RESERVED, RentalStatus.COMPLETED)
+
+
+def _block_step(pixels: float) -> int:
+    """Nombre de lignes (ou de jours) par bloc pour que le bloc fasse MIN_BLOCK_PX."""
+    if pixels >= MIN_BLOCK_PX:
+        return 1
+    return 2 ** math.ceil(math.log2(MIN_BLOCK_PX / pixels))
+
+
+def _occupancy_lut() -> np.ndarray:
+    """Couleurs ARGB des 256 niveaux d'occupation (blanc à bleu)."""
+    levels = (np.arange(256) / 255.0) ** 0.6
+    low, high = np.array([255, 255, 255]), np.array([37, 99, 235])
+    rgb = (low + (high - low) * levels[:, None]).round().astype(np.uint32)
+    return (0xFF000000 | (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]).astype(np.uint32)
+
+
+class PlanningItem(QGraphicsItem):
+    """
+    Grille du planning, peinte par tuiles mises en cache.
+    
+    Les tuiles sont repérées en pixels à l'échelle courante: un
+    changement de zoom utilise d'autres tuiles, et les anciennes quittent
+    le cache (LRU) au fil des rendus.
+    """
+    
+    def __init__(self, planning: FleetPlanning, system: CarRentalSystem):
+        super().__init__()
+        self.planning = planning
+        self.system = system
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption)
+        self._tiles: "OrderedDict[Tuple[float, float, int, int], QPixmap]" = OrderedDict()
+        self._scale: Tuple[float, float] = (1.0, 1.0)
+        self._lut = _occupancy_lut()
+        self._bar_styles = {
+            status: (QColor(background), QColor(foreground), QPen(QColor(border), 1))
+            for status, (background, foreground, border) in BADGE_COLORS.items()
+            if status in PLANNING_STATUSES
+        }
+        self._font = QFont()
+        self._font.setPointSize(8)
+        self.tiles_rendered = 0
+    
+    def boundingRect(self) -> QRectF:
+        return QRectF(0, 0, self.planning.num_days * DAY_WIDTH, self.planning.row_count * ROW_HEIGHT)
+    
+    def content_changed(self) -> None:
+        """À appeler après un rechargement du planning (taille et contenu)."""
+        self.prepareGeometryChange()
+        self._tiles.clear()
+        self.update()
+    
+    # --- Invalidation ---
+    
+    @staticmethod
+    def row_span(row: int, sy: float) -> Tuple[int, int]:
+        """Lignes (début, fin exclue) redessinées avec une ligne à l'échelle sy."""
+        row_px = ROW_HEIGHT * sy
+        step = 1 if row_px >= DETAIL_MIN_ROW_PX else _block_step(row_px)
+        first = row // step * step
+        return first, first + step
+    
+    def invalidate_row(self, row: int) -> None:
+        """Retire du cache les tuiles qui montrent une ligne, puis la redessine."""
+        for key in list(self._tiles):
+            sx, sy, _, tile_y = key
+            first, last = self.row_span(row, sy)
+            top, bottom = first * ROW_HEIGHT * sy, last * ROW_HEIGHT * sy
+            if top < (tile_y + 1) * TILE_SIZE and bottom > tile_y * TILE_SIZE:
+                del self._tiles[key]
+        first, last = self.row_span(row, self._scale[1])
+        self.update(QRectF(0, first * ROW_HEIGHT, self.boundingRect().width(),
+                           (last - first) * ROW_HEIGHT))
+    
+    # --- Rendu ---
+    
+    def paint(self, painter: QPainter, option, widget=None) -> None:
+        transform = painter.worldTransform()
+        sx, sy = round(transform.m11(), 6), round(transform.m22(), 6)
+        self._scale = (sx, sy)
+        exposed = option.exposedRect.intersected(self.boundingRect())
+        if exposed.isEmpty():
+            return
+        
+        tile_w, tile_h = TILE_SIZE / sx, TILE_SIZE / sy
+        first_x, last_x = int(exposed.left() // tile_w), int((exposed.right() - 1e-9) // tile_w)
+        first_y, last_y = int(exposed.top() // tile_h), int((exposed.bottom() - 1e-9) // tile_h)
+        dpr = widget.devicePixelRatioF() if widget is not None else 1.0
+        
+        for tile_y in range(first_y, last_y + 1):
+            for tile_x in range(first_x, last_x + 1):
+                pixmap = self._tile(sx, sy, tile_x, tile_y, dpr)
+                painter.drawPixmap(
+                    QRectF(tile_x * tile_w, tile_y * tile_h, tile_w, tile_h),
+                    pixmap, QRectF(pixmap.rect())
+                )
+    
+    def _tile(self, sx: float, sy: float, tile_x: int, tile_y: int, dpr: float) -> QPixmap:
+        key = (sx, sy, tile_x, tile_y)
+        pixmap = self._tiles.get(key)
+        if pixmap is not None:
+            self._tiles.move_to_end(key)
+            return pixmap
+        
+        pixmap = QPixmap(round(TILE_SIZE * dpr), round(TILE_SIZE * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(BACKGROUND)
+        tile_painter = QPainter(pixmap)
+        self._paint_tile(tile_painter, tile_x * TILE_SIZE, tile_y * TILE_SIZE, sx, sy)
+        tile_painter.end()
+        self.tiles_rendered += 1
+        
+        self._tiles[key] = pixmap
+        if len(self._tiles) > TILE_CACHE_SIZE:
+            self._tiles.popitem(last=False)
+        return pixmap
+    
+    def _paint_tile(self, painter: QPainter, origin_x: float, origin_y: float, sx: float, sy: float) -> None:
+        """
+        Peint une tuile, en pixels (origin_x, origin_y: position de la tuile
+        par rapport au coin de la grille à cette échelle).
+        """
+        day_px, row_px = DAY_WIDTH * sx, ROW_HEIGHT * sy
+        planning = self.planning
+        first_day = max(int(origin_x // day_px), 0)
+        last_day = min(int((origin_x + TILE_SIZE) // day_px), planning.num_days - 1)
+        first_row = max(int(origin_y // row_px), 0)
+        last_row = min(int((origin_y + TILE_SIZE) // row_px), planning.row_count - 1)
+        if first_day > last_day or first_row > last_row:
+            return
+        
+        if day_px >= DETAIL_MIN_DAY_PX and row_px >= DETAIL_MIN_ROW_PX:
+            self._paint_detail(painter, origin_x, origin_y, day_px, row_px,
+                               first_row, last_row, first_day, last_day)
+        else:
+            self._paint_aggregated(painter, origin_x, origin_y, day_px, row_px,
+                                   first_row, last_row, first_day, last_day)
+        
+        # Aujourd'hui
+        today = (date.today() - planning.start_date).days
+        if first_day <= today <= last_day:
+            x = (today + 0.5) * day_px - origin_x
+            painter.setPen(TODAY_PEN)
+            painter.drawLine(QPointF(x, 0), QPointF(x, TILE_SIZE))
+    
+    def _paint_detail(self, painter, origin_x, origin_y, day_px, row_px,
+                      first_row, last_row, first_day, last_day) -> None:
+        """Vue détaillée: fond, grille et une barre par location."""
+        width = (last_day + 1) * day_px - origin_x
+        
+        # Lignes alternées et week-ends
+        for row in range(first_row, last_row + 1):
+            if row % 2:
+                painter.fillRect(QRectF(0, row * row_px - origin_y, width, row_px), ALTERNATE_BACKGROUND)
+        if day_px >= 10:
+            weekday = (self.planning.start_date + timedelta(days=first_day)).weekday()
+            for day in range(first_day, last_day + 1):
+                if (weekday + day - first_day) % 7 >= 5:
+                    painter.fillRect(QRectF(day * day_px - origin_x, 0, day_px, TILE_SIZE), WEEKEND_BACKGROUND)
+        
+        painter.setPen(GRID_PEN)
+        bottom = (last_row + 1) * row_px - origin_y
+        if day_px >= 12:
+            for day in range(first_day, last_day + 2):
+                x = day * day_px - origin_x
+                painter.drawLine(QPointF(x, 0), QPointF(x, bottom))
+        for row in range(first_row, last_row + 2):
+            y = row * row_px - origin_y
+            painter.drawLine(QPointF(0, y), QPointF(width, y))
+        
+        # Barres des locations
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(self._font)
+        metrics = painter.fontMetrics()
+        padding = max(1.0, row_px * 0.18)
+        radius = min(4.0, (row_px - 2 * padding) / 2)
+        show_labels = row_px >= 14
+        for row, bar in self.planning.bars(first_row, last_row, first_day, last_day):
+            background, foreground, border = self._bar_styles[bar.status]
+            rect = QRectF(
+                bar.first_day * day_px - origin_x + 1, row * row_px - origin_y + padding,
+                (bar.last_day - bar.first_day + 1) * day_px - 2, row_px - 2 * padding
+            )
+            painter.setPen(border)
+            painter.setBrush(background)
+            painter.drawRoundedRect(rect, radius, radius)
+            if show_labels and rect.width() >= 40:
+                painter.setPen(foreground)
+                text = metrics.elidedText(self._bar_label(bar), Qt.TextElideMode.ElideRight,
+                                          int(rect.width()) - 8)
+                painter.drawText(rect.adjusted(4, 0, -4, 0),
+                                 Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, text)
+    
+    def _paint_aggregated(self, painter, origin_x, origin_y, day_px, row_px,
+                          first_row, last_row, first_day, last_day) -> None:
+        """Vue agrégée: taux d'occupation par blocs, en une seule image."""
+        row_step, day_step = _block_step(row_px), _block_step(day_px)
+        grid = self.planning.occupancy_grid(row_step, day_step)
+        block_w, block_h = day_px * day_step, row_px * row_step
+        first_block_row, last_block_row = first_row // row_step, last_row // row_step
+        first_block_col, last_block_col = first_day // day_step, last_day // day_step
+        
+        levels = (grid[first_block_row:last_block_row + 1, first_block_col:last_block_col + 1]
+                  * 255).astype(np.uint8)
+        colors = np.ascontiguousarray(self._lut[levels])
+        rows, cols = colors.shape
+        image = QImage(colors.tobytes(), cols, rows, cols * 4, QImage.Format.Format_ARGB32)
+        painter.drawImage(
+            QRectF(first_block_col * block_w - origin_x, first_block_row * block_h - origin_y,
+                   cols * block_w, rows * block_h),
+            image
+        )
+    
+    def _bar_label(self, bar: PlanningBar) -> str:
+        customer = self.system.get_customer(bar.customer_id)
+        return customer.full_name if customer else bar.rental_id
+
+
+class PlanningView(QGraphicsView):
+    """
+    Vue zoomable du planning, avec en-têtes fixes (véhicules et dates).
+    
+    Ctrl + molette zoome sur les deux axes, Ctrl + Maj + molette sur les
+    jours seulement.
+    """
+    
+    def __init__(self, planning: FleetPlanning, system: CarRentalSystem, parent=None):
+        super().__init__(parent)
+        self.planning = planning
+        self.system = system
+        self.item = PlanningItem(planning, system)
+        self.setScene(QGraphicsScene(self))
+        self.scene().addItem(self.item)
+        
+        self.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        self.setTransformationAnchor(QGraphicsView.ViewportAnchor.NoAnchor)
+        # Les en-têtes fixes empêchent de décaler les pixels au défilement;
+        # le contenu est redessiné depuis les tuiles en cache
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        self.setBackgroundBrush(HEADER_BACKGROUND)
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self._header_font = QFont()
+        self._header_font.setPointSize(8)
+        self._update_scene_rect()
+    
+    # --- Échelle ---
+    
+    @property
+    def day_px(self) -> float:
+        return DAY_WIDTH * self.transform().m11()
+    
+    @property
+    def row_px(self) -> float:
+        return ROW_HEIGHT * self.transform().m22()
+    
+    def set_scale(self, sx: float, sy: float, anchor: Optional[QPointF] = None) -> None:
+        """
+        Change l'échelle en gardant le point de la scène sous `anchor` (coin
+        de la grille par défaut) à la même place dans la vue.
+        """
+        sx = min(max(sx, MIN_DAY_PX / DAY_WIDTH), MAX_DAY_PX / DAY_WIDTH)
+        sy = min(max(sy, MIN_ROW_PX / ROW_HEIGHT), MAX_ROW_PX / ROW_HEIGHT)
+        if anchor is None:
+            anchor = QPointF(LABEL_WIDTH, HEADER_HEIGHT)
+        scene_point = self.mapToScene(anchor.toPoint())
+        
+        self.setTransform(QTransform.fromScale(sx, sy))
+        self._update_scene_rect()
+        
+        moved = self.mapFromScene(scene_point) - anchor.toPoint()
+        self.horizontalScrollBar().setValue(self.horizontalScrollBar().value() + moved.x())
+        self.verticalScrollBar().setValue(self.verticalScrollBar().value() + moved.y())
+    
+    def zoom(self, factor: float, days_only: bool = False, anchor: Optional[QPointF] = None) -> None:
+        transform = self.transform()
+        sy = transform.m22() if days_only else transform.m22() * factor
+        self.set_scale(transform.m11() * factor, sy, anchor)
+    
+    def fit_all(self) -> None:
+        """Ajuste le zoom pour montrer toute la flotte sur toute la fenêtre."""
+        viewport = self.viewport().rect()
+        sx = (viewport.width() - LABEL_WIDTH) / (self.planning.num_days * DAY_WIDTH)
+        sy = (viewport.height() - HEADER_HEIGHT) / (max(self.planning.row_count, 1) * ROW_HEIGHT)
+        self.set_scale(sx, sy)
+        self.horizontalScrollBar().setValue(self.horizontalScrollBar().minimum())
+        self.verticalScrollBar().setValue(self.verticalScrollBar().minimum())
+    
+    def scroll_to_day(self, day: int) -> None:
+        """Fait défiler la vue pour montrer un jour près du bord gauche."""
+        value = (day - 2) * self.day_px - LABEL_WIDTH
+        self.horizontalScrollBar().setValue(int(value))
+    
+    def content_changed(self) -> None:
+        self.item.content_changed()
+        self._update_scene_rect()
+    
+    def _update_scene_rect(self) -> None:
+        """Réserve la place des en-têtes fixes devant la grille."""
+        transform = self.transform()
+        content = self.item.boundingRect()
+        self.setSceneRect(content.adjusted(
+            -LABEL_WIDTH / transform.m11(), -HEADER_HEIGHT / transform.m22(), 0, 0
+        ))
+    
+    # --- Événements ---
+    
+    def wheelEvent(self, event):
+        modifiers = event.modifiers()
+        if modifiers & Qt.KeyboardModifier.ControlModifier:
+            factor = ZOOM_STEP ** (event.angleDelta().y() / 120)
+            days_only = bool(modifiers & Qt.KeyboardModifier.ShiftModifier)
+            self.zoom(factor, days_only, event.position())
+            event.accept()
+            return
+        super().wheelEvent(event)
+    
+    def viewportEvent(self, event):
+        if event.type() == QEvent.Type.ToolTip:
+            text = self._tooltip_at(event.pos().x(), event.pos().y())
+            if text:
+                QToolTip.showText(event.globalPos(), text, self)
+            else:
+                QToolTip.hideText()
+            return True
+        return super().viewportEvent(event)
+    
+    def _cell_at(self, x: int, y: int) -> Optional[Tuple[int, int]]:
+        """Case (ligne, jour) sous un point de la vue, hors en-têtes."""
+        if x < LABEL_WIDTH or y < HEADER_HEIGHT:
+            return None
+        point = self.mapToScene(x, y)
+        row, day = int(point.y() // ROW_HEIGHT), int(point.x() // DAY_WIDTH)
+        if 0 <= row < self.planning.row_count and 0 <= day < self.planning.num_days:
+            return row, day
+        return None
+    
+    def _tooltip_at(self, x: int, y: int) -> str:
+        cell = self._cell_at(x, y)
+        if cell is None:
+            return ""
+        row, day = cell
+        
+        if self.day_px < DETAIL_MIN_DAY_PX or self.row_px < DETAIL_MIN_ROW_PX:
+            row_step, day_step = _block_step(self.row_px), _block_step(self.day_px)
+            rate = self.planning.occupancy_grid(row_step, day_step)[row // row_step, day // day_step]
+            first_row, first_day = row // row_step * row_step, day // day_step * day_step
+            last_row = min(first_row + row_step, self.planning.row_count)
+            start = self.planning.start_date + timedelta(days=first_day)
+            end = min(start + timedelta(days=day_step - 1), self.planning.end_date)
+            return (f"Véhicules {first_row + 1} à {last_row}\n"
+                    f"Du {start:%d/%m/%Y} au {end:%d/%m/%Y}\n"
+                    f"Occupation: {rate:.0%}")
+        
+        vehicle = self.system.get_vehicle(self.planning.vehicle_id(row))
+        bar = self.planning.bar_at(row, day)
+        vehicle_text = f"{vehicle.brand} {vehicle.model} ({vehicle.license_plate})" if vehicle else ""
+        if bar is None:
+            current = self.planning.start_date + timedelta(days=day)
+            return f"{vehicle_text}\n{current:%d/%m/%Y}: libre"
+        rental = self.system.get_rental(bar.rental_id)
+        customer = self.system.get_customer(bar.customer_id)
+        if rental is not None:
+            period = f"Du {rental.start_date:%d/%m/%Y} au {rental.end_date:%d/%m/%Y}"
+        else:
+            start = self.planning.start_date + timedelta(days=bar.first_day)
+            end = self.planning.start_date + timedelta(days=bar.last_day)
+            period = f"Du {start:%d/%m/%Y} au {end:%d/%m/%Y}"
+        return (f"Location {bar.rental_id} ({bar.status.value})\n"
+                f"{vehicle_text}\n"
+                f"Client: {customer.full_name if customer else bar.customer_id}\n"
+                f"{period}")
+    
+    # --- En-têtes ---
+    
+    def drawForeground(self, painter: QPainter, rect: QRectF) -> None:
+        painter.save()
+        painter.resetTransform()
+        painter.setFont(self._header_font)
+        viewport = self.viewport().rect()
+        
+        self._draw_day_header(painter, viewport.width())
+        self._draw_vehicle_header(painter, viewport.height())
+        
+        # Coin
+        painter.fillRect(QRectF(0, 0, LABEL_WIDTH, HEADER_HEIGHT), HEADER_BACKGROUND)
+        painter.setPen(HEADER_TEXT)
+        painter.drawText(QRectF(12, 0, LABEL_WIDTH - 12, HEADER_HEIGHT - 6),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom,
+                         f"{self.planning.row_count} véhicules")
+        painter.setPen(GRID_PEN)
+        painter.drawLine(LABEL_WIDTH, 0, LABEL_WIDTH, viewport.height())
+        painter.drawLine(0, HEADER_HEIGHT, viewport.width(), HEADER_HEIGHT)
+        painter.restore()
+    
+    def _visible_days(self, width: int) -> Tuple[int, int]:
+        first = int(self.mapToScene(LABEL_WIDTH, 0).x() // DAY_WIDTH)
+        last = int(self.mapToScene(width, 0).x() // DAY_WIDTH)
+        return max(first, 0), min(last, self.planning.num_days - 1)
+    
+    def _visible_rows(self, height: int) -> Tuple[int, int]:
+        first = int(self.mapToScene(0, HEADER_HEIGHT).y() // ROW_HEIGHT)
+        last = int(self.mapToScene(0, height).y() // ROW_HEIGHT)
+        return max(first, 0), min(last, self.planning.row_count - 1)
+    
+    def _day_x(self, day: int) -> float:
+        return self.mapFromScene(QPointF(day * DAY_WIDTH, 0)).x()
+    
+    def _row_y(self, row: int) -> float:
+        return self.mapFromScene(QPointF(0, row * ROW_HEIGHT)).y()
+    
+    def _draw_day_header(self, painter: QPainter, width: int) -> None:
+        """Mois (première ligne) et numéros des jours si la place le permet."""
+        painter.fillRect(QRectF(LABEL_WIDTH, 0, width - LABEL_WIDTH, HEADER_HEIGHT), HEADER_BACKGROUND)
+        first_day, last_day = self._visible_days(width)
+        if first_day > last_day:
+            return
+        start = self.planning.start_date
+        day_px = self.day_px
+        
+        # Mois
+        month_start = (start + timedelta(days=first_day)).replace(day=1)
+        while (month_start - start).days <= last_day:
+            next_month = (month_start + timedelta(days=32)).replace(day=1)
+            left = max(self._day_x((month_start - start).days), LABEL_WIDTH)
+            right = self._day_x((next_month - start).days)
+            painter.setPen(GRID_PEN)
+            painter.drawLine(QPointF(right, 0), QPointF(right, HEADER_HEIGHT))
+            if right - left > 30:
+                painter.setPen(HEADER_TEXT)
+                label = painter.fontMetrics().elidedText(
+                    f"{MONTH_NAMES[month_start.month - 1]} {month_start.year}",
+                    Qt.TextElideMode.ElideRight, int(right - left - 10)
+                )
+                painter.drawText(QRectF(left + 6, 0, right - left - 6, 22),
+                                 Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, label)
+            month_start = next_month
+        
+        # Jours
+        if day_px < 16:
+            return
+        today = date.today()
+        for day in range(first_day, last_day + 1):
+            current = start + timedelta(days=day)
+            x = self._day_x(day)
+            if x + day_px <= LABEL_WIDTH:
+                continue
+            if current == today:
+                painter.setPen(QColor("#2563eb"))
+            else:
+                painter.setPen(MUTED_TEXT if current.weekday() >= 5 else HEADER_TEXT)
+            painter.drawText(QRectF(x, 22, day_px, HEADER_HEIGHT - 22),
+                             Qt.AlignmentFlag.AlignCenter, str(current.day))
+    
+    def _draw_vehicle_header(self, painter: QPainter, height: int) -> None:
+        """Noms des véhicules, ou repères de position si les lignes sont trop fines."""
+        painter.fillRect(QRectF(0, HEADER_HEIGHT, LABEL_WIDTH, height - HEADER_HEIGHT), BACKGROUND)
+        first_row, last_row = self._visible_rows(height)
+        if first_row > last_row:
+            return
+        row_px = self.row_px
+        metrics = painter.fontMetrics()
+        
+        if row_px >= 14:
+            for row in range(first_row, last_row + 1):
+                y = self._row_y(row)
+                if y + row_px <= HEADER_HEIGHT:
+                    continue
+                vehicle = self.system.get_vehicle(self.planning.vehicle_id(row))
+                if vehicle is None:
+                    continue
+                painter.setPen(MUTED_TEXT)
+                plate_width = metrics.horizontalAdvance(vehicle.license_plate)
+                painter.drawText(QRectF(LABEL_WIDTH - plate_width - 10, y, plate_width, row_px),
+                                 Qt.AlignmentFlag.AlignVCenter, vehicle.license_plate)
+                painter.setPen(HEADER_TEXT)
+                name = metrics.elidedText(f"{vehicle.brand} {vehicle.model}", Qt.TextElideMode.ElideRight,
+                                          LABEL_WIDTH - plate_width - 30)
+                painter.drawText(QRectF(12, y, LABEL_WIDTH - 12, row_px),
+                                 Qt.AlignmentFlag.AlignVCenter, name)
+            return
+        
+        # Lignes fines: un repère tous les `step` véhicules
+        step = _block_step(row_px)
+        step *= 2 ** max(math.ceil(math.log2(24 / (row_px * step))), 0)
+        painter.setPen(MUTED_TEXT)
+        for row in range(first_row // step * step, last_row + 1, step):
+            y = self._row_y(row)
+            if y - 8 < HEADER_HEIGHT:
+                continue
+            painter.drawText(QRectF(12, y - 8, LABEL_WIDTH - 24, 16),
+                             Qt.AlignmentFlag.AlignVCenter, f"Véhicule {row + 1}")
+
+
+class PlanningPage(QWidget):
+    """
+    Page du planning d'occupation de la flotte.
+    
+    Les événements du système sont reçus dans le thread de l'interface:
+    une location modifiée ne recalcule que sa barre dans le planning, un
+    ajout ou retrait de véhicule (ou un rechargement) reconstruit le
+    planning. Quand la page est masquée, les modifications sont seulement
+    notées et appliquées à son prochain affichage (refresh_data).
+    """
+    
+    # Fenêtre affichée (jours), à partir du premier jour du mois précédent
+    WINDOW_DAYS = 365
+    
+    events_received = pyqtSignal(object)
+    
+    def __init__(self, system: CarRentalSystem):
+        super().__init__()
+        self.system = system
+        self.planning = FleetPlanning(self.default_start_date(), self.WINDOW_DAYS)
+        self._needs_rebuild = False
+        self._dirty_rentals: Set[str] = set()
+        self._shown = False
+        
+        self.setup_ui()
+        self.rebuild()
+        
+        # Les événements peuvent être publiés depuis un autre thread
+        self.events_received.connect(self.on_system_events)
+        self.system.events.subscribe_batch(
+            self.events_received.emit, (RentalEvent, VehicleEvent, DataReloaded)
+        )
+    
+    @staticmethod
+    def default_start_date() -> date:
+        first_of_month = date.today().replace(day=1)
+        return (first_of_month - timedelta(days=1)).replace(day=1)
+    
+    def setup_ui(self):
+        """Configure l'interface de la page."""
+        layout = QVBoxLayout(self)
+        layout.setSpacing(16)
+        layout.setContentsMargins(24, 24, 24, 24)
+        
+        # En-tête
+        header_layout = QHBoxLayout()
+        title_layout = QVBoxLayout()
+        title = QLabel("Planning de la flotte")
+        title.setStyleSheet("font-size: 24px; font-weight: 700; color: #0f172a;")
+        subtitle = QLabel("Occupation des véhicules jour par jour (Ctrl + molette pour zoomer)")
+        subtitle.setStyleSheet("color: #64748b;")
+        title_layout.addWidget(title)
+        title_layout.addWidget(subtitle)
+        header_layout.addLayout(title_layout)
+        header_layout.addStretch()
+        
+        self.summary_label = QLabel("")
+        self.summary_label.setStyleSheet("color: #64748b;")
+        header_layout.addWidget(self.summary_label)
+        layout.addLayout(header_layout)
+        
+        # Barre d'outils
+        toolbar = QFrame()
+        toolbar.setObjectName("planningToolbar")
+        toolbar.setStyleSheet(
+            "#planningToolbar { background-color: #ffffff; border: 1px solid #e2e8f0; border-radius: 8px; }"
+        )
+        toolbar_layout = QHBoxLayout(toolbar)
+        toolbar_layout.setContentsMargins(12, 8, 12, 8)
+        
+        toolbar_layout.addWidget(QLabel("Début:"))
+        self.start_edit = QDateEdit()
+        self.start_edit.setCalendarPopup(True)
+        self.start_edit.setDisplayFormat("dd/MM/yyyy")
+        self.start_edit.setDate(QDate(self.planning.start_date))
+        self.start_edit.dateChanged.connect(self.on_start_changed)
+        toolbar_layout.addWidget(self.start_edit)
+        
+        for text, tooltip, months in (("‹", "Mois précédent", -1), ("›", "Mois suivant", 1)):
+            button = self._tool_button(text, tooltip)
+            button.clicked.connect(lambda _, m=months: self.start_edit.setDate(self.start_edit.date().addMonths(m)))
+            toolbar_layout.addWidget(button)
+        
+        today_btn = self._tool_button("Aujourd'hui", "Afficher la date du jour")
+        today_btn.clicked.connect(self.show_today)
+        toolbar_layout.addWidget(today_btn)
+        
+        toolbar_layout.addSpacing(16)
+        zoom_out = self._tool_button("−", "Dézoomer")
+        zoom_out.clicked.connect(lambda: self.view.zoom(1 / ZOOM_STEP))
+        zoom_in = self._tool_button("+", "Zoomer")
+        zoom_in.clicked.connect(lambda: self.view.zoom(ZOOM_STEP))
+        fit_btn = self._tool_button("Vue d'ensemble", "Afficher toute la flotte sur toute la période")
+        fit_btn.clicked.connect(lambda: self.view.fit_all())
+        toolbar_layout.addWidget(zoom_out)
+        toolbar_layout.addWidget(zoom_in)
+        toolbar_layout.addWidget(fit_btn)
+        
+        toolbar_layout.addStretch()
+        
+        # Légende
+        for status in PLANNING_STATUSES:
+            background, foreground, border = BADGE_COLORS[status]
+            chip = QLabel(status.value)
+            chip.setStyleSheet(
+                f"background-color: {background}; color: {foreground}; border: 1px solid {border};"
+                " border-radius: 8px; padding: 2px 8px; font-size: 11px; font-weight: 600;"
+            )
+            toolbar_layout.addWidget(chip)
+        
+        refresh_btn = QPushButton()
+        refresh_btn.setIcon(get_icon("refresh", "#64748b", 18))
+        refresh_btn.setFixedSize(36, 36)
+        refresh_btn.setStyleSheet("QPushButton { background-color: #f1f5f9; border-radius: 6px; } QPushButton:hover { background-color: #e2e8f0; }")
+        refresh_btn.setToolTip("Actualiser")
+        refresh_btn.clicked.connect(self.rebuild)
+        toolbar_layout.addWidget(refresh_btn)
+        
+        layout.addWidget(toolbar)
+        
+        # Planning
+        frame = QFrame()
+        frame.setObjectName("planningFrame")
+        frame.setStyleSheet("#planningFrame { background-color: #ffffff; border: 1px solid #e2e8f0; border-radius: 8px; }")
+        frame_layout = QVBoxLayout(frame)
+        frame_layout.setContentsMargins(1, 1, 1, 1)
+        self.view = PlanningView(self.planning, self.system)
+        frame_layout.addWidget(self.view)
+        layout.addWidget(frame, 1)
+    
+    def _tool_button(self, text: str, tooltip: str) -> QPushButton:
+        button = QPushButton(text)
+        button.setToolTip(tooltip)
+        button.setFixedHeight(32)
+        button.setMinimumWidth(32)
+        button.setStyleSheet("""
+            QPushButton {
+                background-color: #f1f5f9;
+                color: #334155;
+                border: 1px solid #e2e8f0;
+                border-radius: 6px;
+                padding: 0 10px;
+                font-weight: 600;
+            }
+            QPushButton:hover {
+                background-color: #e2e8f0;
+            }
+        """)
+        return button
+    
+    # --- Données ---
+    
+    def rebuild(self):
+        """Reconstruit tout le planning depuis le système."""
+        with self.system.lock:
+            vehicles = sorted(
+                self.system.get_all_vehicles(),
+                key=lambda v: (v.get_vehicle_type(), v.brand, v.model, v.id)
+            )
+            rentals = self.system.get_rentals_between(self.planning.start_date, self.planning.end_date)
+            self.planning.load(vehicles, rentals)
+        self._needs_rebuild = False
+        self._dirty_rentals.clear()
+        self.view.content_changed()
+        self.update_summary()
+    
+    def refresh_data(self):
+        """Applique les modifications reçues depuis le dernier affichage."""
+        self.apply_pending_changes()
+    
+    def on_system_events(self, events: List[SystemEvent]):
+        """Note les locations touchées, et les met à jour si la page est affichée."""
+        for event in events:
+            if isinstance(event, (DataReloaded, VehicleEvent)):
+                self._needs_rebuild = True
+            elif isinstance(event, RentalEvent):
+                self._dirty_rentals.add(event.rental_id)
+        if self.isVisible():
+            self.apply_pending_changes()
+    
+    def apply_pending_changes(self):
+        """Met à jour les seules barres des locations touchées (ou reconstruit)."""
+        if self._needs_rebuild:
+            self.rebuild()
+            return
+        if not self._dirty_rentals:
+            return
+        rows = set()
+        for rental_id in self._dirty_rentals:
+            rows |= self.planning.update_rental(rental_id, self.system.get_rental(rental_id))
+        for row in rows:
+            self.view.item.invalidate_row(row)
+        logger.debug(f"Planning: {len(self._dirty_rentals)} location(s) mise(s) à jour")
+        self._dirty_rentals.clear()
+        self.update_summary()
+    
+    def update_summary(self):
+        planning = self.planning
+        self.summary_label.setText(
+            f"{planning.row_count} véhicules, {planning.bar_count} locations "
+            f"du {planning.start_date:%d/%m/%Y} au {planning.end_date:%d/%m/%Y}"
+        )
+    
+    # --- Navigation ---
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._shown:
+            # Premier affichage: la vue a sa taille, montrer aujourd'hui
+            self._shown = True
+            self.show_today()
+    
+    def on_start_changed(self, qdate: QDate):
+        self.planning.start_date = qdate.toPyDate()
+        self.rebuild()
+    
+    def show_today(self):
+        """Affiche la date du jour (en décalant la fenêtre si besoin)."""
+        today = date.today()
+        if not self.planning.start_date <= today <= self.planning.end_date:
+            self.start_edit.setDate(QDate(self.default_start_date()))
+        self.view.scroll_to_day((today - self.planning.start_date).days)
@@ -0,0 +1,124 @@
+"""
+Modèle et délégués du tableau des locations.
+
+Le tableau est virtualisé: QTableView ne demande au modèle que les cellules
+visibles, et les badges de statut (BadgeDelegate partagé) comme les boutons
+d'action sont peints par des délégués au lieu d'être des widgets créés pour
+chaque ligne.
+"""
+
+from datetime import date
+from typing import Optional
+
+from PyQt6.QtGui import QColor
+from PyQt6.QtCore import Qt
+
+from car_rental_system import CarRentalSystem
+from models.rental import Rental, RentalStatus
+from gui.icons import get_icon
+from gui.delegates import ItemRole, ActionButtonsDelegate
+from gui.entity_table import Column, EntityTableModel
+
+
+# Rôle donnant la location d'une ligne
+RentalRole = ItemRole
+
+# Actions: (clé, icône, infobulle, couleur icône, fond, survol, bordure, statuts)
+RENTAL_ACTIONS = [
+    ("details", "eye", "Voir les détails", "#64748b", "#f1f5f9", "#e2e8f0", "#e2e8f0",
+     tuple(RentalStatus)),
+    ("start", "play", "Démarrer la location", "#ffffff", "#22c55e", "#16a34a", "#16a34a",
+     (RentalStatus.RESERVED,)),
+    ("edit", "edit", "Modifier", "#3b82f6", "#eff6ff", "#dbeafe", "#bfdbfe",
+     (RentalStatus.RESERVED,)),
+    ("complete", "check", "Terminer la location", "#ffffff", "#22c55e", "#16a34a", "#16a34a",
+     (RentalStatus.ACTIVE,)),
+    ("extend", "calendar", "Prolonger", "#8b5cf6", "#f5f3ff", "#ede9fe", "#ddd6fe",
+     (RentalStatus.ACTIVE,)),
+    ("cancel", "cancel", "Annuler", "#ffffff", "#ef4444", "#dc2626", "#dc2626",
+     (RentalStatus.ACTIVE, RentalStatus.RESERVED)),
+]
+
+
+def remaining_days_text(rental: Rental) -> str:
+    """Texte de la colonne des jours restants (ou du retard)."""
+    if rental.status == RentalStatus.ACTIVE:
+        if rental.is_overdue():
+            return f"-{abs(rental.days_remaining())} j"
+        return f"{rental.days_remaining()} j"
+    if rental.status == RentalStatus.RESERVED:
+        return f"dans {(rental.start_date - date.today()).days} j"
+    return "-"
+
+
+class RentalTableModel(EntityTableModel):
+    """
+    Modèle des locations affichées (les cellules sont calculées à la demande).
+    
+    Aux colonnes d'EntityTableModel s'ajoutent la couleur des jours restants
+    et l'icône/infobulle des notes.
+    """
+    
+    STATUS_COLUMN = 5
+    REMAINING_COLUMN = 7
+    NOTES_COLUMN = 8
+    ACTIONS_COLUMN = 9
+    
+    def __init__(self, system: CarRentalSystem, parent=None):
+        super().__init__([
+            Column("ID", lambda r: r.id),
+            Column("Client", self._customer_name),
+            Column("Véhicule", self._vehicle_name),
+            Column("Début", lambda r: str(r.start_date)),
+            Column("Fin", lambda r: str(r.end_date)),
+            Column("Statut", lambda r: r.status.value, badge=lambda r: r.status),
+            Column("Coût", lambda r: f"{r.total_cost:.2f}€"),
+            Column("Jours restants", remaining_days_text),
+            Column("Notes"),
+            Column("Actions"),
+        ], parent)
+        self.system = system
+        self._notes_icon = None
+    
+    def _customer_name(self, rental: Rental) -> str:
+        customer = self.system.get_customer(rental.customer_id)
+        return customer.full_name if customer else "Inconnu"
+    
+    def _vehicle_name(self, rental: Rental) -> str:
+        vehicle = self.system.get_vehicle(rental.vehicle_id)
+        return f"{vehicle.brand} {vehicle.model}" if vehicle else "Inconnu"
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        column = index.column()
+        
+        if column == self.REMAINING_COLUMN and role == Qt.ItemDataRole.ForegroundRole:
+            return self._remaining_color(self.item_at(index.row()))
+        if column == self.NOTES_COLUMN:
+            rental = self.item_at(index.row())
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return rental.notes if rental.notes else "Pas de notes"
+            if role == Qt.ItemDataRole.DecorationRole and rental.notes:
+                if self._notes_icon is None:
+                    self._notes_icon = get_icon("documents", "#64748b", 16)
+                return self._notes_icon
+        return super().data(index, role)
+    
+    def _remaining_color(self, rental: Rental) -> Optional[QColor]:
+        """Couleur de la colonne des jours restants."""
+        if rental.status == RentalStatus.ACTIVE:
+            return QColor(Qt.GlobalColor.red if rental.is_overdue() else Qt.GlobalColor.darkGreen)
+        if rental.status == RentalStatus.RESERVED:
+            return QColor(Qt.GlobalColor.darkBlue)
+        return None
+
+
+class RentalActionsDelegate(ActionButtonsDelegate):
+    """Boutons d'action d'une location (selon son statut)."""
+    
+    def __init__(self, parent=None):
+        super().__init__(RENTAL_ACTIONS, parent)
+    
+    def _actions_for(self, rental: Rental) -> list:
+        return [action for action in self.actions if rental.status in action[7]]
@@ -2,24 +2,45 @@
 Page de gestion des locations et réservations.
 """
 
+import logging
+from contextlib import ExitStack
 from datetime import date
+from typing import Dict, List, Optional, Tuple
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QFrame, QPushButton, QTableWidget, QTableWidgetItem,
+    QLabel, QFrame, QPushButton, QTableView,
     QHeaderView, QDialog, QFormLayout, QComboBox,
     QDoubleSpinBox, QCheckBox, QMessageBox, QDateEdit,
     QGroupBox, QTextEdit, QScrollArea,
     QDialogButtonBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QDate
+from PyQt6.QtCore import Qt, pyqtSignal, QDate, QSignalBlocker, QThreadPool, QTimer
 
 from car_rental_system import CarRentalSystem
 from models.rental import Rental, RentalStatus
-from gui.icons import get_icon, create_action_button
+from gui.icons import get_icon
+from gui.delegates import BadgeDelegate
+from gui.rental_table import (
+    RentalTableModel, RentalActionsDelegate
+)
+from gui.entity_table import ChoiceListModel, SEARCH_DEBOUNCE_MS
+from gui.availability_worker import AvailabilityTask
+
+logger = logging.getLogger(__name__)
+
+# Période demandée: (client, début, fin)
+PeriodKey = Tuple[str, date, date]
 
 
 class NewRentalDialog(QDialog):
-    """Dialogue pour créer une nouvelle location."""
+    """
+    Dialogue pour créer une nouvelle location.
+    
+    Les véhicules louables par le client sur la période sont recherchés en
+    arrière-plan et ajoutés à la liste au fil des lots. Les résultats et
+    les aperçus du coût sont gardés pour la durée du dialogue, par
+    (client, début, fin): revenir à une période déjà vue ne relance rien.
+    """
     
     def __init__(self, parent, system: CarRentalSystem):
         super().__init__(parent)
@@ -28,6 +49,21 @@ class NewRentalDialog(QDialog):
         self.setMinimumWidth(600)
         self.setMinimumHeight(400)
         self.setMaximumHeight(700)
+        
+        # Une seule recherche à la fois; la précédente est abandonnée
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(1)
+        self._generation = 0
+        self._current_task: Optional[AvailabilityTask] = None
+        self._selected_vehicle: Optional[str] = None
+        self._found_vehicles: List[Tuple[str, str]] = []
+        
+        # Caches du dialogue (vidés si les données du système changent)
+        self._listed_key: Optional[PeriodKey] = None
+        self._vehicles_cache: Dict[PeriodKey, List[Tuple[str, str]]] = {}
+        self._preview_cache: Dict[PeriodKey, Dict[str, str]] = {}
+        self._cache_version = system.data_version
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -73,9 +109,11 @@ class NewRentalDialog(QDialog):
         vehicle_group = QGroupBox("Véhicule")
         vehicle_layout = QFormLayout(vehicle_group)
         
+        # Liste remplie progressivement par la recherche en arrière-plan
+        self.vehicle_choices = ChoiceListModel("-- Sélectionner d'abord un client --", self)
         self.vehicle_combo = QComboBox()
-        self.vehicle_combo.addItem("-- Sélectionner d'abord un client --", None)
-        self.vehicle_combo.currentIndexChanged.connect(self.update_cost_preview)
+        self.vehicle_combo.setModel(self.vehicle_choices)
+        self.vehicle_combo.currentIndexChanged.connect(self.on_vehicle_changed)
         vehicle_layout.addRow("Véhicule:", self.vehicle_combo)
         
         layout.addWidget(vehicle_group)
@@ -95,11 +133,17 @@ class NewRentalDialog(QDialog):
         self.end_date_edit.setCalendarPopup(True)
         self.end_date_edit.setDate(QDate.currentDate().addDays(3))
         self.end_date_edit.setMinimumDate(QDate.currentDate())  # Permettre même jour
-        self.end_date_edit.dateChanged.connect(self.update_cost_preview)
+        self.end_date_edit.dateChanged.connect(self.on_period_changed)
         dates_layout.addRow("Date de fin:", self.end_date_edit)
         
         layout.addWidget(dates_group)
         
+        # Les dates défilent jour par jour: une seule recherche à la fin
+        self.availability_timer = QTimer(self)
+        self.availability_timer.setSingleShot(True)
+        self.availability_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.availability_timer.timeout.connect(self.update_available_vehicles)
+        
         # Notes
         notes_group = QGroupBox("Notes (optionnel)")
         notes_layout = QVBoxLayout(notes_group)
@@ -190,69 +234,176 @@ class NewRentalDialog(QDialog):
         self.end_date_edit.setMinimumDate(start)  # Permettre même jour
         if self.end_date_edit.date() < start:
             self.end_date_edit.setDate(start)
-        self.update_available_vehicles()
+        self.on_period_changed()
     
-    def update_available_vehicles(self):
-        """Met à jour la liste des véhicules disponibles."""
-        self.vehicle_combo.clear()
-        
+    def on_period_changed(self):
+        """Relance la recherche des véhicules une fois les dates stabilisées."""
+        self.availability_timer.start()
+        self.update_cost_preview()
+    
+    def on_vehicle_changed(self):
+        """Retient le véhicule choisi par l'utilisateur et met à jour l'aperçu."""
+        vehicle_id = self.vehicle_combo.currentData()
+        if vehicle_id:
+            self._selected_vehicle = vehicle_id
+        self.update_cost_preview()
+    
+    def selected_period(self) -> Tuple[date, date]:
+        """Retourne les dates de début et de fin choisies."""
+        start_qdate = self.start_date_edit.date()
+        end_qdate = self.end_date_edit.date()
+        return (
+            date(start_qdate.year(), start_qdate.month(), start_qdate.day()),
+            date(end_qdate.year(), end_qdate.month(), end_qdate.day())
+        )
+    
+    def current_key(self) -> Optional[PeriodKey]:
+        """Clé (client, début, fin) de la sélection, None sans client."""
         customer_id = self.customer_combo.currentData()
         if not customer_id:
-            self.vehicle_combo.addItem("-- Sélectionner d'abord un client --", None)
-            return
+            return None
+        return (customer_id, *self.selected_period())
+    
+    def check_cache_version(self):
+        """Vide les caches si les données du système ont changé depuis."""
+        if self.system.data_version != self._cache_version:
+            self._vehicles_cache.clear()
+            self._preview_cache.clear()
+            self._cache_version = self.system.data_version
+    
+    def update_available_vehicles(self):
+        """
+        Met à jour la liste des véhicules louables par le client sur la période.
         
-        customer = self.system.get_customer(customer_id)
-        if not customer:
+        Une période déjà recherchée est reprise du cache; sinon la recherche
+        est lancée en arrière-plan. Le véhicule choisi reste sélectionné
+        s'il est encore disponible.
+        """
+        self.availability_timer.stop()
+        self.cancel_search()
+        self.check_cache_version()
+        
+        key = self.current_key()
+        self._listed_key = key
+        if key is None:
+            self.show_vehicles([], "-- Sélectionner d'abord un client --")
+        elif key in self._vehicles_cache:
+            vehicles = self._vehicles_cache[key]
+            self.show_vehicles(vehicles, self.vehicles_placeholder(vehicles))
+        else:
+            self.show_vehicles([], "-- Recherche des véhicules disponibles... --")
+            self.start_search(key)
+        self.update_cost_preview()
+    
+    def show_vehicles(self, vehicles: List[Tuple[str, str]], placeholder: str):
+        """Affiche une liste de véhicules, en gardant le véhicule choisi s'il y figure."""
+        with QSignalBlocker(self.vehicle_combo):
+            self.vehicle_choices.set_first_label(placeholder)
+            self.vehicle_choices.set_entries([(label, vehicle_id) for vehicle_id, label in vehicles])
+            self.vehicle_combo.setCurrentIndex(max(self.vehicle_combo.findData(self._selected_vehicle), 0))
+    
+    @staticmethod
+    def vehicles_placeholder(vehicles: List[Tuple[str, str]]) -> str:
+        if vehicles:
+            return "-- Sélectionner un véhicule --"
+        return "-- Aucun véhicule disponible pour ce client --"
+    
+    def start_search(self, key: PeriodKey):
+        """Lance la recherche des véhicules louables en arrière-plan."""
+        self._found_vehicles = []
+        task = AvailabilityTask(self._generation, self.system, *key)
+        task.signals.batch_ready.connect(self.on_vehicles_found)
+        task.signals.finished.connect(self.on_search_finished)
+        task.signals.failed.connect(self.on_search_failed)
+        self._current_task = task
+        self._thread_pool.start(task)
+    
+    def cancel_search(self):
+        """Abandonne la recherche en cours ou en attente."""
+        # Les lots déjà envoyés par l'ancienne recherche seront ignorés
+        self._generation += 1
+        if self._current_task is not None:
+            self._current_task.cancel()
+            self._current_task = None
+        self._thread_pool.clear()
+    
+    def on_vehicles_found(self, generation: int, vehicles: list):
+        """Ajoute un lot de véhicules à la liste, s'il est toujours d'actualité."""
+        if generation != self._generation:
             return
-        
-        start_qdate = self.start_date_edit.date()
-        end_qdate = self.end_date_edit.date()
-        start = date(start_qdate.year(), start_qdate.month(), start_qdate.day())
-        end = date(end_qdate.year(), end_qdate.month(), end_qdate.day())
-        
-        available = self.system.get_available_vehicles(start_date=start, end_date=end)
-        
-        self.vehicle_combo.addItem("-- Sélectionner un véhicule --", None)
-        
-        for vehicle in available:
-            # Vérifier si le client peut louer ce véhicule
-            can_rent, reason = customer.can_rent_vehicle(
-                vehicle.get_required_license(),
-                vehicle.get_minimum_driver_age()
-            )
-            
-            if can_rent:
-                self.vehicle_combo.addItem(
-                    f"{vehicle.get_vehicle_type()} - {vehicle.brand} {vehicle.model} ({vehicle.daily_rate:.2f}€/jour)",
-                    vehicle.id
-                )
-        
-        if self.vehicle_combo.count() == 1:
-            self.vehicle_combo.clear()
-            self.vehicle_combo.addItem("-- Aucun véhicule disponible pour ce client --", None)
+        self._found_vehicles.extend(vehicles)
+        self.vehicle_choices.append_entries([(label, vehicle_id) for vehicle_id, label in vehicles])
+        if not self.vehicle_combo.currentData() and self._selected_vehicle:
+            row = self.vehicle_combo.findData(self._selected_vehicle)
+            if row > 0:
+                self.vehicle_combo.setCurrentIndex(row)
+    
+    def on_search_finished(self, generation: int):
+        """Termine la liste et garde le résultat pour cette période."""
+        if generation != self._generation:
+            return
+        self._current_task = None
+        self._vehicles_cache[self._listed_key] = self._found_vehicles
+        self.vehicle_choices.set_first_label(self.vehicles_placeholder(self._found_vehicles))
+        logger.debug(f"{len(self._found_vehicles)} véhicule(s) louable(s) pour {self._listed_key}")
+    
+    def on_search_failed(self, generation: int, message: str):
+        """Signale l'échec de la recherche."""
+        if generation != self._generation:
+            return
+        self._current_task = None
+        self.vehicle_choices.set_first_label("-- Recherche impossible --")
+        QMessageBox.warning(self, "Erreur", f"Impossible de rechercher les véhicules:\n{message}")
     
     def update_cost_preview(self):
-        """Met à jour l'aperçu du coût."""
+        """Met à jour l'aperçu du coût (gardé par période et par véhicule)."""
         vehicle_id = self.vehicle_combo.currentData()
-        customer_id = self.customer_combo.currentData()
+        key = self.current_key()
         
-        if not vehicle_id or not customer_id:
+        if not vehicle_id or key is None:
             self.cost_preview.setText("Sélectionnez un véhicule pour voir l'aperçu")
             self.create_btn.setEnabled(False)
             return
         
-        vehicle = self.system.get_vehicle(vehicle_id)
-        customer = self.system.get_customer(customer_id)
-        
-        if not vehicle or not customer:
-            self.cost_preview.setText("Erreur: véhicule ou client non trouvé")
+        if key != self._listed_key:
+            # Dates modifiées: la disponibilité n'est pas encore vérifiée
+            self.cost_preview.setText("Vérification de la disponibilité...")
             self.create_btn.setEnabled(False)
             return
         
-        start_qdate = self.start_date_edit.date()
-        end_qdate = self.end_date_edit.date()
+        self.check_cache_version()
+        previews = self._preview_cache.setdefault(key, {})
+        preview_text = previews.get(vehicle_id)
+        if preview_text is None:
+            preview_text = self.compute_cost_preview(vehicle_id, *key)
+            if preview_text is None:
+                self.cost_preview.setText("Erreur: véhicule ou client non trouvé")
+                self.create_btn.setEnabled(False)
+                return
+            previews[vehicle_id] = preview_text
+        
+        self.cost_preview.setText(preview_text)
+        self.create_btn.setEnabled(True)
+    
+    def compute_cost_preview(
+        self,
+        vehicle_id: str,
+        customer_id: str,
+        start: date,
+        end: date
+    ) -> Optional[str]:
+        """
+        Calcule le texte de l'aperçu du coût.
         
-        days = start_qdate.daysTo(end_qdate) + 1
+        Returns:
+            Texte HTML de l'aperçu, None si le véhicule ou le client n'existe plus
+        """
+        vehicle = self.system.get_vehicle(vehicle_id)
+        customer = self.system.get_customer(customer_id)
+        if not vehicle or not customer:
+            return None
+        
+        days = (end - start).days + 1
         base_cost = vehicle.calculate_rental_cost(days)
         
         discount = customer.get_loyalty_discount()
@@ -271,24 +422,25 @@ class NewRentalDialog(QDialog):
             """
         
         preview_text += f"""<br><b style="font-size: 16px;">Total: {final_cost:.2f}€</b>"""
-        
-        self.cost_preview.setText(preview_text)
-        self.create_btn.setEnabled(True)
+        return preview_text
+    
+    def done(self, result: int):
+        """Abandonne la recherche en cours à la fermeture du dialogue."""
+        self.availability_timer.stop()
+        self.cancel_search()
+        super().done(result)
     
     def create_rental(self):
         """Crée la location."""
         customer_id = self.customer_combo.currentData()
         vehicle_id = self.vehicle_combo.currentData()
+        start, end = self.selected_period()
         
-        start_qdate = self.start_date_edit.date()
-        end_qdate = self.end_date_edit.date()
-        start = date(start_qdate.year(), start_qdate.month(), start_qdate.day())
-        end = date(end_qdate.year(), end_qdate.month(), end_qdate.day())
-        
-        rental, message = self.system.create_rental(customer_id, vehicle_id, start, end)
+        rental, message = self.system.create_rental(
+            customer_id, vehicle_id, start, end, notes=self.notes_edit.toPlainText()
+        )
         
         if rental:
-            rental.notes = self.notes_edit.toPlainText()
             self.rental = rental
             self.accept()
         else:
@@ -389,16 +541,19 @@ class EditRentalDialog(QDialog):
         end_qdate = self.end_date_edit.date()
         new_end = date(end_qdate.year(), end_qdate.month(), end_qdate.day())
         
-        if new_end != self.rental.end_date:
-            if new_end > self.rental.end_date:
-                success = self.rental.extend_rental(new_end)
-                if not success:
-                    QMessageBox.warning(self, "Erreur", "Impossible de prolonger cette location.")
-                    return
-            else:
-                self.rental.end_date = new_end
+        # Prolongation: vérifie la disponibilité du véhicule
+        if new_end > self.rental.end_date:
+            success, message = self.system.extend_rental(self.rental.id, new_end)
+            if not success:
+                QMessageBox.warning(self, "Erreur", message)
+                return
         
-        self.rental.notes = self.notes_edit.toPlainText()
+        success, message = self.system.update_rental(
+            self.rental.id, end_date=new_end, notes=self.notes_edit.toPlainText()
+        )
+        if not success:
+            QMessageBox.warning(self, "Erreur", message)
+            return
         self.accept()
 
 
@@ -749,15 +904,19 @@ class RentalsPage(QWidget):
         self.status_filter.currentIndexChanged.connect(self.apply_filters)
         filter_layout.addWidget(self.status_filter)
         
+        # Listes des clients et véhicules: modèles mis à jour par différence
+        self.customer_choices = ChoiceListModel("Tous les clients", self)
+        self.vehicle_choices = ChoiceListModel("Tous les véhicules", self)
+        
         filter_layout.addWidget(QLabel("Client:"))
         self.customer_filter = QComboBox()
-        self.customer_filter.addItem("Tous les clients", None)
+        self.customer_filter.setModel(self.customer_choices)
         self.customer_filter.currentIndexChanged.connect(self.apply_filters)
         filter_layout.addWidget(self.customer_filter)
         
         filter_layout.addWidget(QLabel("Véhicule:"))
         self.vehicle_filter = QComboBox()
-        self.vehicle_filter.addItem("Tous les véhicules", None)
+        self.vehicle_filter.setModel(self.vehicle_choices)
         self.vehicle_filter.currentIndexChanged.connect(self.apply_filters)
         filter_layout.addWidget(self.vehicle_filter)
         
@@ -778,12 +937,17 @@ class RentalsPage(QWidget):
         layout.addWidget(filter_frame)
         
         # Tableau des locations
-        self.table = QTableWidget()
-        self.table.setColumnCount(10)
-        self.table.setHorizontalHeaderLabels([
-            "ID", "Client", "Véhicule", "Début", "Fin", 
-            "Statut", "Coût", "Jours restants", "Notes", "Actions"
-        ])
+        # (modèle virtualisé: seules les lignes visibles sont peintes)
+        self.table_model = RentalTableModel(self.system, self)
+        self.table = QTableView()
+        self.table.setModel(self.table_model)
+        
+        self.status_delegate = BadgeDelegate(self.table)
+        self.table.setItemDelegateForColumn(RentalTableModel.STATUS_COLUMN, self.status_delegate)
+        self.actions_delegate = RentalActionsDelegate(self.table)
+        self.actions_delegate.action_triggered.connect(self.on_rental_action)
+        self.table.setItemDelegateForColumn(RentalTableModel.ACTIONS_COLUMN, self.actions_delegate)
+        self.table.setMouseTracking(True)
         
         header = self.table.horizontalHeader()
         if header:
@@ -808,7 +972,8 @@ class RentalsPage(QWidget):
         self.table.setColumnWidth(8, 50)   # Notes
         self.table.setColumnWidth(9, 180)  # Actions
         
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         self.table.setAlternatingRowColors(True)
         v_header = self.table.verticalHeader()
         if v_header:
@@ -865,40 +1030,38 @@ class RentalsPage(QWidget):
             value_label.setText(value)
     
     def refresh_data(self):
-        """Rafraîchit toutes les données."""
-        self.update_filters()
+        """
+        Rafraîchit toutes les données.
+        
+        Les filtres sont mis à jour avec leurs signaux bloqués: le tableau
+        n'est reconstruit qu'une seule fois, à la fin du rafraîchissement.
+        """
+        with ExitStack() as stack:
+            for widget in (self.status_filter, self.customer_filter,
+                           self.vehicle_filter, self.overdue_only):
+                stack.enter_context(QSignalBlocker(widget))
+            self.update_filters()
         self.update_stats()
         self.apply_filters()
     
     def update_filters(self):
-        """Met à jour les listes des filtres."""
-        # Sauvegarder les sélections
-        current_customer = self.customer_filter.currentData()
-        current_vehicle = self.vehicle_filter.currentData()
-        
-        # Clients
-        self.customer_filter.clear()
-        self.customer_filter.addItem("Tous les clients", None)
-        for customer in self.system.get_all_customers():
-            self.customer_filter.addItem(customer.full_name, customer.id)
-        
-        # Restaurer la sélection
-        if current_customer:
-            idx = self.customer_filter.findData(current_customer)
-            if idx >= 0:
-                self.customer_filter.setCurrentIndex(idx)
-        
-        # Véhicules
-        self.vehicle_filter.clear()
-        self.vehicle_filter.addItem("Tous les véhicules", None)
-        for vehicle in self.system.get_all_vehicles():
-            self.vehicle_filter.addItem(f"{vehicle.brand} {vehicle.model}", vehicle.id)
-        
-        # Restaurer la sélection
-        if current_vehicle:
-            idx = self.vehicle_filter.findData(current_vehicle)
-            if idx >= 0:
-                self.vehicle_filter.setCurrentIndex(idx)
+        """Met à jour les listes des filtres (seules les différences sont appliquées)."""
+        self._sync_choices(self.customer_filter, self.customer_choices, [
+            (customer.full_name, customer.id)
+            for customer in self.system.get_all_customers()
+        ])
+        self._sync_choices(self.vehicle_filter, self.vehicle_choices, [
+            (f"{vehicle.brand} {vehicle.model}", vehicle.id)
+            for vehicle in self.system.get_all_vehicles()
+        ])
+    
+    def _sync_choices(self, combo: QComboBox, model: ChoiceListModel, entries: list):
+        """Met à jour une liste de choix en conservant la sélection si elle existe encore."""
+        selected = combo.currentData()
+        model.set_entries(entries)
+        if combo.currentData() != selected:
+            # Élément sélectionné supprimé: retour à "Tous"
+            combo.setCurrentIndex(0)
     
     def update_stats(self):
         """Met à jour les statistiques."""
@@ -947,202 +1110,25 @@ class RentalsPage(QWidget):
     
     def display_rentals(self, rentals: list):
         """Affiche les locations dans le tableau."""
-        self.table.setRowCount(len(rentals))
-        
-        for row, rental in enumerate(rentals):
-            customer = self.system.get_customer(rental.customer_id)
-            vehicle = self.system.get_vehicle(rental.vehicle_id)
-            
-            # ID
-            id_item = QTableWidgetItem(rental.id)
-            id_item.setData(Qt.ItemDataRole.UserRole, rental)
-            self.table.setItem(row, 0, id_item)
-            
-            # Client
-            self.table.setItem(row, 1, QTableWidgetItem(customer.full_name if customer else "Inconnu"))
-            
-            # Véhicule
-            self.table.setItem(row, 2, QTableWidgetItem(f"{vehicle.brand} {vehicle.model}" if vehicle else "Inconnu"))
-            
-            # Dates
-            self.table.setItem(row, 3, QTableWidgetItem(str(rental.start_date)))
-            self.table.setItem(row, 4, QTableWidgetItem(str(rental.end_date)))
-            
-            # Statut avec badge
-            status_widget = QWidget()
-            status_layout = QHBoxLayout(status_widget)
-            status_layout.setContentsMargins(2, 2, 2, 2)
-            status_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            status_label = QLabel(rental.status.value)
-            if rental.status == RentalStatus.ACTIVE:
-                status_label.setStyleSheet("""
-                    QLabel {
-                        background-color: #f0fdf4;
-                        color: #16a34a;
-                        padding: 2px 8px;
-                        border-radius: 10px;
-                        font-weight: 600;
-                        font-size: 11px;
-                        border: 1px solid #bbf7d0;
-                    }
-                """)
-            elif rental.status == RentalStatus.RESERVED:
-                status_label.setStyleSheet("""
-                    QLabel {
-                        background-color: #eff6ff;
-                        color: #2563eb;
-                        padding: 2px 8px;
-                        border-radius: 10px;
-                        font-weight: 600;
-                        font-size: 11px;
-                        border: 1px solid #bfdbfe;
-                    }
-                """)
-            elif rental.status == RentalStatus.COMPLETED:
-                status_label.setStyleSheet("""
-                    QLabel {
-                        background-color: #f1f5f9;
-                        color: #64748b;
-                        padding: 2px 8px;
-                        border-radius: 10px;
-                        font-weight: 600;
-                        font-size: 11px;
-                        border: 1px solid #e2e8f0;
-                    }
-                """)
-            else:
-                status_label.setStyleSheet("""
-                    QLabel {
-                        background-color: #fef2f2;
-                        color: #dc2626;
-                        padding: 2px 8px;
-                        border-radius: 10px;
-                        font-weight: 600;
-                        font-size: 11px;
-                        border: 1px solid #fecaca;
-                    }
-                """)
-            status_layout.addWidget(status_label)
-            self.table.setCellWidget(row, 5, status_widget)
-            
-            # Coût
-            self.table.setItem(row, 6, QTableWidgetItem(f"{rental.total_cost:.2f}€"))
-            
-            # Jours restants / Retard
-            if rental.status == RentalStatus.ACTIVE:
-                if rental.is_overdue():
-                    late_item = QTableWidgetItem(f"-{abs(rental.days_remaining())} j")
-                    late_item.setForeground(Qt.GlobalColor.red)
-                else:
-                    late_item = QTableWidgetItem(f"{rental.days_remaining()} j")
-                    late_item.setForeground(Qt.GlobalColor.darkGreen)
-            elif rental.status == RentalStatus.RESERVED:
-                days_until = (rental.start_date - date.today()).days
-                late_item = QTableWidgetItem(f"dans {days_until} j")
-                late_item.setForeground(Qt.GlobalColor.darkBlue)
-            else:
-                late_item = QTableWidgetItem("-")
-            self.table.setItem(row, 7, late_item)
-            
-            # Notes
-            notes_item = QTableWidgetItem("" if rental.notes else "")
-            if rental.notes:
-                notes_item.setIcon(get_icon("documents", "#64748b", 16))
-            notes_item.setToolTip(rental.notes if rental.notes else "Pas de notes")
-            self.table.setItem(row, 8, notes_item)
-            
-            # Actions
-            actions_widget = QWidget()
-            actions_layout = QHBoxLayout(actions_widget)
-            actions_layout.setContentsMargins(4, 0, 4, 0)
-            actions_layout.setSpacing(4)
-            actions_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            # Bouton details
-            detail_btn = create_action_button(
-                "eye", "Voir les détails",
-                icon_color="#64748b",
-                bg_color="#f1f5f9",
-                hover_color="#e2e8f0",
-                border_color="#e2e8f0",
-                size=26
-            )
-            detail_btn.clicked.connect(lambda checked, r=rental: self.show_rental_details_for(r))
-            actions_layout.addWidget(detail_btn)
-            
-            if rental.status == RentalStatus.RESERVED:
-                # Demarrer
-                start_btn = create_action_button(
-                    "play", "Démarrer la location",
-                    icon_color="#ffffff",
-                    bg_color="#22c55e",
-                    hover_color="#16a34a",
-                    border_color="#16a34a",
-                    size=26
-                )
-                start_btn.clicked.connect(lambda checked, r=rental: self.start_rental(r))
-                actions_layout.addWidget(start_btn)
-                
-                # Modifier
-                edit_btn = create_action_button(
-                    "edit", "Modifier",
-                    icon_color="#3b82f6",
-                    bg_color="#eff6ff",
-                    hover_color="#dbeafe",
-                    border_color="#bfdbfe",
-                    size=26
-                )
-                edit_btn.clicked.connect(lambda checked, r=rental: self.edit_rental(r))
-                actions_layout.addWidget(edit_btn)
-            
-            if rental.status == RentalStatus.ACTIVE:
-                # Terminer
-                complete_btn = create_action_button(
-                    "check", "Terminer la location",
-                    icon_color="#ffffff",
-                    bg_color="#22c55e",
-                    hover_color="#16a34a",
-                    border_color="#16a34a",
-                    size=26
-                )
-                complete_btn.clicked.connect(lambda checked, r=rental: self.complete_rental(r))
-                actions_layout.addWidget(complete_btn)
-                
-                # Prolonger
-                extend_btn = create_action_button(
-                    "calendar", "Prolonger",
-                    icon_color="#8b5cf6",
-                    bg_color="#f5f3ff",
-                    hover_color="#ede9fe",
-                    border_color="#ddd6fe",
-                    size=26
-                )
-                extend_btn.clicked.connect(lambda checked, r=rental: self.edit_rental(r))
-                actions_layout.addWidget(extend_btn)
-            
-            if rental.status in [RentalStatus.ACTIVE, RentalStatus.RESERVED]:
-                # Annuler
-                cancel_btn = create_action_button(
-                    "cancel", "Annuler",
-                    icon_color="#ffffff",
-                    bg_color="#ef4444",
-                    hover_color="#dc2626",
-                    border_color="#dc2626",
-                    size=26
-                )
-                cancel_btn.clicked.connect(lambda checked, r=rental: self.cancel_rental(r))
-                actions_layout.addWidget(cancel_btn)
-            
-            self.table.setCellWidget(row, 9, actions_widget)
+        self.table_model.set_items(rentals)
+    
+    def on_rental_action(self, action: str, rental: Rental):
+        """Exécute l'action cliquée dans la colonne des actions."""
+        handlers = {
+            "details": self.show_rental_details_for,
+            "start": self.start_rental,
+            "edit": self.edit_rental,
+            "complete": self.complete_rental,
+            "extend": self.edit_rental,
+            "cancel": self.cancel_rental,
+        }
+        handlers[action](rental)
     
     def show_rental_details(self, index):
         """Affiche les détails d'une location (double-clic)."""
-        item = self.table.item(index.row(), 0)
-        if item:
-            rental = item.data(Qt.ItemDataRole.UserRole)
-            if rental:
-                self.show_rental_details_for(rental)
+        rental = self.table_model.item_at(index.row())
+        if rental:
+            self.show_rental_details_for(rental)
     
     def show_rental_details_for(self, rental: Rental):
         """Affiche le dialogue des détails."""
@@ -0,0 +1,140 @@
+"""
+Calcul des données de la page des rapports hors du thread de l'interface.
+
+Toutes les données de la page sont calculées en une fois par une tâche
+QThreadPool. Les données du système (et le classement des clients) sont
+copiées sous son verrou; les rapports sont ensuite calculés sur la copie,
+sans bloquer les modifications. Le résultat ne contient que
+des valeurs simples (nombres, textes, dates): l'interface l'applique
+ensuite sans relire le système.
+"""
+
+from datetime import date
+from typing import Callable, Dict
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from car_rental_system import CarRentalSystem
+
+
+class ReportCancelled(Exception):
+    """Le calcul a été annulé (résultat périmé)."""
+
+
+def compute_report_data(
+    system: CarRentalSystem,
+    start: date,
+    end: date,
+    is_cancelled: Callable[[], bool] = lambda: False
+) -> Dict:
+    """
+    Calcule toutes les données affichées par la page des rapports.
+    
+    Chaque rapport n'est généré qu'une fois. L'annulation est vérifiée
+    entre deux rapports.
+    
+    Args:
+        system: Système de location
+        start: Début de la période du chiffre d'affaires
+        end: Fin de la période du chiffre d'affaires
+        is_cancelled: Fonction indiquant si le résultat est devenu inutile
+    
+    Returns:
+        Dictionnaire (stats, revenue, period_revenue, available, top_customers,
+        maintenance)
+    
+    Raises:
+        ReportCancelled: Si le calcul a été annulé
+    """
+    def check_cancelled():
+        if is_cancelled():
+            raise ReportCancelled()
+    
+    with system.lock:
+        copy = system.snapshot_system()
+        # Classement tenu à jour par le système: lu directement (K clients)
+        top_customers = [
+            {
+                'full_name': c.full_name,
+                'total_rentals': c.get_total_rentals(),
+                'is_loyal': c.is_loyal_customer(),
+                'loyalty_discount': c.get_loyalty_discount(),
+                'is_blocked': c.is_blocked
+            }
+            for c in system.get_top_customers(10, by="rentals")
+        ]
+    check_cancelled()
+    
+    stats = copy.generate_statistics_report()
+    check_cancelled()
+    revenue = copy.generate_revenue_report()
+    check_cancelled()
+    period_revenue = copy.generate_revenue_report(start, end)
+    check_cancelled()
+    available = copy.generate_available_vehicles_report()
+    check_cancelled()
+    
+    maintenance = [
+        {
+            'id': v.id,
+            'label': f"{v.brand} {v.model} ({v.year})",
+            'mileage': v.mileage,
+            'last_maintenance_date': v.last_maintenance_date,
+            'state': v.state
+        }
+        for v in copy.get_all_vehicles() if v.needs_maintenance()
+    ]
+    
+    return {
+        'stats': stats,
+        'revenue': revenue,
+        'period_revenue': period_revenue,
+        'available': available,
+        'top_customers': top_customers,
+        'maintenance': maintenance
+    }
+
+
+class ReportTaskSignals(QObject):
+    """Signaux d'une tâche de calcul (émis depuis le thread de calcul)."""
+    
+    finished = pyqtSignal(int, object)  # (génération, données)
+    failed = pyqtSignal(int, str)  # (génération, message)
+
+
+class ReportTask(QRunnable):
+    """
+    Tâche de calcul des données de la page des rapports.
+    
+    Chaque tâche porte un numéro de génération: la page ignore le résultat
+    d'une génération dépassée, et cancel() interrompt le calcul au plus tôt.
+    """
+    
+    def __init__(self, generation: int, system: CarRentalSystem, start: date, end: date):
+        super().__init__()
+        self.generation = generation
+        self.system = system
+        self.start = start
+        self.end = end
+        self.signals = ReportTaskSignals()
+        self._cancelled = False
+    
+    def cancel(self) -> None:
+        """Demande l'abandon du calcul."""
+        self._cancelled = True
+    
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+    
+    def run(self) -> None:
+        if self._cancelled:
+            return
+        try:
+            data = compute_report_data(self.system, self.start, self.end, self.is_cancelled)
+        except ReportCancelled:
+            return
+        except Exception as e:
+            self.signals.failed.emit(self.generation, str(e))
+            return
+        if not self._cancelled:
+            self.signals.finished.emit(self.generation, data)
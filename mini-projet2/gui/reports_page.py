@@ -7,13 +7,15 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QFrame, QPushButton, QTableWidget, QTableWidgetItem,
     QHeaderView, QDateEdit, QGroupBox,
-    QScrollArea, QComboBox
+    QScrollArea, QComboBox, QMessageBox
 )
-from PyQt6.QtCore import Qt, QDate
+from PyQt6.QtCore import Qt, QDate, QThreadPool
 from PyQt6.QtGui import QFont, QColor
 
 from car_rental_system import CarRentalSystem
 from gui.icons import get_icon, ICON_COLORS
+from gui.delegates import BadgeDelegate, BadgeRole, CustomerBadge
+from gui.report_worker import ReportTask
 
 
 class StatCard(QFrame):
@@ -128,6 +130,24 @@ class ReportSection(QFrame):
     def add_widget(self, widget: QWidget):
         """Ajoute un widget au contenu."""
         self.content_layout.addWidget(widget)
+    
+    def clear(self):
+        """Efface le contenu de la section."""
+        while self.content_layout.count():
+            item = self.content_layout.takeAt(0)
+            if item:
+                widget = item.widget()
+                if widget:
+                    widget.deleteLater()
+                else:
+                    sub_layout = item.layout()
+                    if sub_layout:
+                        while sub_layout.count():
+                            sub_item = sub_layout.takeAt(0)
+                            if sub_item:
+                                sub_widget = sub_item.widget()
+                                if sub_widget:
+                                    sub_widget.deleteLater()
 
 
 class ReportsPage(QWidget):
@@ -136,6 +156,13 @@ class ReportsPage(QWidget):
     def __init__(self, system: CarRentalSystem):
         super().__init__()
         self.system = system
+        
+        # Calcul des rapports hors du thread de l'interface (un calcul à la fois)
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(1)
+        self._current_task = None
+        self._generation = 0
+        
         self.setup_ui()
         self.refresh_data()
     
@@ -297,6 +324,7 @@ class ReportsPage(QWidget):
             header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
             header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
             header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
+        self.top_customers_table.setItemDelegateForColumn(4, BadgeDelegate(self.top_customers_table))
         
         self.top_customers_table.setAlternatingRowColors(True)
         v_header = self.top_customers_table.verticalHeader()
@@ -348,6 +376,7 @@ class ReportsPage(QWidget):
             header2.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
             header2.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
             header2.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
+        self.maintenance_table.setItemDelegateForColumn(4, BadgeDelegate(self.maintenance_table))
         
         self.maintenance_table.setAlternatingRowColors(True)
         v_header2 = self.maintenance_table.verticalHeader()
@@ -406,21 +435,65 @@ class ReportsPage(QWidget):
             elif period == "Tout":
                 self.start_date.setDate(QDate(2020, 1, 1))
             self.end_date.setDate(today)
+            self.refresh_data()
     
     def refresh_data(self):
-        """Rafraîchit toutes les données."""
-        self.refresh_stats()
-        self.refresh_revenue_section()
-        self.refresh_vehicle_type_section()
-        self.refresh_fleet_section()
-        self.refresh_customers_section()
-        self.refresh_top_customers()
-        self.refresh_maintenance()
+        """
+        Lance le calcul des rapports en arrière-plan.
+        
+        Un calcul encore en attente ou en cours est abandonné: seul le
+        résultat de la dernière demande (ex: dernière période) est affiché.
+        """
+        if self._current_task is not None:
+            self._current_task.cancel()
+        self._thread_pool.clear()
+        
+        start_qdate = self.start_date.date()
+        end_qdate = self.end_date.date()
+        start = date(start_qdate.year(), start_qdate.month(), start_qdate.day())
+        end = date(end_qdate.year(), end_qdate.month(), end_qdate.day())
+        
+        self._generation += 1
+        task = ReportTask(self._generation, self.system, start, end)
+        task.signals.finished.connect(self.on_report_ready)
+        task.signals.failed.connect(self.on_report_failed)
+        self._current_task = task
+        self._thread_pool.start(task)
     
-    def refresh_stats(self):
+    def wait_for_reports(self, msecs: int = -1) -> bool:
+        """Attend la fin du calcul en cours (utile avant de fermer)."""
+        return self._thread_pool.waitForDone(msecs)
+    
+    def on_report_ready(self, generation: int, data: dict):
+        """Applique les données calculées, si elles sont toujours d'actualité."""
+        if generation != self._generation:
+            return
+        self._current_task = None
+        
+        # Toutes les sections sont mises à jour puis redessinées en une fois
+        self.setUpdatesEnabled(False)
+        try:
+            self.refresh_stats(data)
+            self.refresh_revenue_section(data)
+            self.refresh_vehicle_type_section(data)
+            self.refresh_fleet_section(data)
+            self.refresh_customers_section(data)
+            self.refresh_top_customers(data)
+            self.refresh_maintenance(data)
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def on_report_failed(self, generation: int, message: str):
+        """Signale l'échec du calcul des rapports."""
+        if generation != self._generation:
+            return
+        self._current_task = None
+        QMessageBox.warning(self, "Rapports", f"Impossible de calculer les rapports:\n{message}")
+    
+    def refresh_stats(self, data: dict):
         """Rafraîchit les statistiques rapides."""
-        stats = self.system.generate_statistics_report()
-        revenue = self.system.generate_revenue_report()
+        stats = data['stats']
+        revenue = data['revenue']
         
         self.stat_revenue.set_value(f"{revenue.get('total_revenue', 0):.0f} €")
         self.stat_rentals.set_value(str(revenue.get('total_rentals_completed', 0)))
@@ -429,31 +502,12 @@ class ReportsPage(QWidget):
         utilization = stats.get('fleet', {}).get('utilization_rate', 0)
         self.stat_utilization.set_value(f"{utilization:.1f}%")
     
-    def refresh_revenue_section(self):
+    def refresh_revenue_section(self, data: dict):
         """Rafraîchit la section chiffre d'affaires."""
         # Effacer le contenu
-        while self.revenue_section.content_layout.count():
-            item = self.revenue_section.content_layout.takeAt(0)
-            if item:
-                widget = item.widget()
-                if widget:
-                    widget.deleteLater()
-                else:
-                    sub_layout = item.layout()
-                    if sub_layout:
-                        while sub_layout.count():
-                            sub_item = sub_layout.takeAt(0)
-                            if sub_item:
-                                sub_widget = sub_item.widget()
-                                if sub_widget:
-                                    sub_widget.deleteLater()
+        self.revenue_section.clear()
         
-        start_qdate = self.start_date.date()
-        end_qdate = self.end_date.date()
-        start = date(start_qdate.year(), start_qdate.month(), start_qdate.day())
-        end = date(end_qdate.year(), end_qdate.month(), end_qdate.day())
-        
-        report = self.system.generate_revenue_report(start, end)
+        report = data['period_revenue']
         
         self.revenue_section.add_stat_row("Chiffre d'affaires total", f"{report.get('total_revenue', 0):.2f} €", True)
         self.revenue_section.add_stat_row("Revenus de base", f"{report.get('total_base_revenue', 0):.2f} €")
@@ -461,31 +515,12 @@ class ReportsPage(QWidget):
         self.revenue_section.add_stat_row("Locations terminées", str(report.get('total_rentals_completed', 0)))
         self.revenue_section.add_stat_row("Valeur moyenne", f"{report.get('average_rental_value', 0):.2f} €")
     
-    def refresh_vehicle_type_section(self):
+    def refresh_vehicle_type_section(self, data: dict):
         """Rafraîchit la section revenus par type."""
         # Effacer le contenu
-        while self.vehicle_type_section.content_layout.count():
-            item = self.vehicle_type_section.content_layout.takeAt(0)
-            if item:
-                widget = item.widget()
-                if widget:
-                    widget.deleteLater()
-                else:
-                    sub_layout = item.layout()
-                    if sub_layout:
-                        while sub_layout.count():
-                            sub_item = sub_layout.takeAt(0)
-                            if sub_item:
-                                sub_widget = sub_item.widget()
-                                if sub_widget:
-                                    sub_widget.deleteLater()
-        
-        start_qdate = self.start_date.date()
-        end_qdate = self.end_date.date()
-        start = date(start_qdate.year(), start_qdate.month(), start_qdate.day())
-        end = date(end_qdate.year(), end_qdate.month(), end_qdate.day())
+        self.vehicle_type_section.clear()
         
-        report = self.system.generate_revenue_report(start, end)
+        report = data['period_revenue']
         
         for vtype, revenue in report.get('revenue_by_vehicle_type', {}).items():
             self.vehicle_type_section.add_stat_row(vtype, f"{revenue:.2f} €")
@@ -495,28 +530,13 @@ class ReportsPage(QWidget):
             empty_label.setStyleSheet("color: #94a3b8; font-style: italic;")
             self.vehicle_type_section.add_widget(empty_label)
     
-    def refresh_fleet_section(self):
+    def refresh_fleet_section(self, data: dict):
         """Rafraîchit la section flotte."""
         # Effacer le contenu
-        while self.fleet_section.content_layout.count():
-            item = self.fleet_section.content_layout.takeAt(0)
-            if item:
-                widget = item.widget()
-                if widget:
-                    widget.deleteLater()
-                else:
-                    sub_layout = item.layout()
-                    if sub_layout:
-                        while sub_layout.count():
-                            sub_item = sub_layout.takeAt(0)
-                            if sub_item:
-                                sub_widget = sub_item.widget()
-                                if sub_widget:
-                                    sub_widget.deleteLater()
+        self.fleet_section.clear()
         
-        report = self.system.generate_available_vehicles_report()
-        stats = self.system.generate_statistics_report()
-        fleet = stats.get('fleet', {})
+        report = data['available']
+        fleet = data['stats'].get('fleet', {})
         
         self.fleet_section.add_stat_row("Total véhicules", str(fleet.get('total_vehicles', 0)), True)
         self.fleet_section.add_stat_row("Disponibles", str(report.get('total_available', 0)))
@@ -528,27 +548,12 @@ class ReportsPage(QWidget):
         for vtype, count in fleet.get('by_type', {}).items():
             self.fleet_section.add_stat_row(f"  {vtype}", str(count))
     
-    def refresh_customers_section(self):
+    def refresh_customers_section(self, data: dict):
         """Rafraîchit la section clients."""
         # Effacer le contenu
-        while self.customers_section.content_layout.count():
-            item = self.customers_section.content_layout.takeAt(0)
-            if item:
-                widget = item.widget()
-                if widget:
-                    widget.deleteLater()
-                else:
-                    sub_layout = item.layout()
-                    if sub_layout:
-                        while sub_layout.count():
-                            sub_item = sub_layout.takeAt(0)
-                            if sub_item:
-                                sub_widget = sub_item.widget()
-                                if sub_widget:
-                                    sub_widget.deleteLater()
+        self.customers_section.clear()
         
-        stats = self.system.generate_statistics_report()
-        customers_stats = stats.get('customers', {})
+        customers_stats = data['stats'].get('customers', {})
         
         self.customers_section.add_stat_row("Total clients", str(customers_stats.get('total_customers', 0)), True)
         self.customers_section.add_stat_row("Clients fidèles", str(customers_stats.get('loyal_customers', 0)))
@@ -563,30 +568,26 @@ class ReportsPage(QWidget):
         self.customers_section.add_stat_row("10+ locations", "10% de réduction")
         self.customers_section.add_stat_row("20+ locations", "15% de réduction")
     
-    def refresh_top_customers(self):
+    def refresh_top_customers(self, data: dict):
         """Rafraîchit le tableau des meilleurs clients."""
-        customers = sorted(
-            self.system.get_all_customers(),
-            key=lambda c: c.get_total_rentals(),
-            reverse=True
-        )[:10]
+        customers = data['top_customers']
         
         self.top_customers_table.setRowCount(len(customers))
         
         for row, c in enumerate(customers):
             # Rang et nom du client
             rank_prefix = ["#1", "#2", "#3"][row] if row < 3 else f"#{row + 1}"
-            name_item = QTableWidgetItem(f"{rank_prefix} {c.full_name}")
+            name_item = QTableWidgetItem(f"{rank_prefix} {c['full_name']}")
             name_item.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold if row < 3 else QFont.Weight.Normal))
             self.top_customers_table.setItem(row, 0, name_item)
             
             # Nombre de locations
-            rentals_item = QTableWidgetItem(str(c.get_total_rentals()))
+            rentals_item = QTableWidgetItem(str(c['total_rentals']))
             rentals_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
             self.top_customers_table.setItem(row, 1, rentals_item)
             
             # Fidelite avec couleur
-            if c.is_loyal_customer():
+            if c['is_loyal']:
                 loyalty_item = QTableWidgetItem("Fidele")
                 loyalty_item.setForeground(QColor("#f59e0b"))
             else:
@@ -596,7 +597,7 @@ class ReportsPage(QWidget):
             self.top_customers_table.setItem(row, 2, loyalty_item)
             
             # Réduction
-            discount = c.get_loyalty_discount() * 100
+            discount = c['loyalty_discount'] * 100
             discount_item = QTableWidgetItem(f"{discount:.0f}%" if discount > 0 else "-")
             discount_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
             if discount > 0:
@@ -604,14 +605,10 @@ class ReportsPage(QWidget):
                 discount_item.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
             self.top_customers_table.setItem(row, 3, discount_item)
             
-            # Statut
-            if c.is_blocked:
-                status_item = QTableWidgetItem("Bloque")
-                status_item.setForeground(QColor("#dc2626"))
-            else:
-                status_item = QTableWidgetItem("Actif")
-                status_item.setForeground(QColor("#059669"))
-            status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+            # Statut (badge peint par BadgeDelegate)
+            status = CustomerBadge.BLOCKED if c['is_blocked'] else CustomerBadge.ACTIVE
+            status_item = QTableWidgetItem(status.value)
+            status_item.setData(BadgeRole, status)
             self.top_customers_table.setItem(row, 4, status_item)
         
         # Si aucun client
@@ -623,28 +620,26 @@ class ReportsPage(QWidget):
             for col in range(1, 5):
                 self.top_customers_table.setItem(0, col, QTableWidgetItem(""))
     
-    def refresh_maintenance(self):
+    def refresh_maintenance(self, data: dict):
         """Rafraîchit le tableau de maintenance."""
-        vehicles_needing_maintenance = [
-            v for v in self.system.get_all_vehicles() if v.needs_maintenance()
-        ]
+        vehicles_needing_maintenance = data['maintenance']
         
         self.maintenance_table.setRowCount(len(vehicles_needing_maintenance))
         
         for row, v in enumerate(vehicles_needing_maintenance):
             # ID
-            id_item = QTableWidgetItem(v.id)
+            id_item = QTableWidgetItem(v['id'])
             id_item.setFont(QFont("Consolas", 9))
             id_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
             self.maintenance_table.setItem(row, 0, id_item)
             
             # Véhicule
-            vehicle_item = QTableWidgetItem(f"{v.brand} {v.model} ({v.year})")
+            vehicle_item = QTableWidgetItem(v['label'])
             vehicle_item.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
             self.maintenance_table.setItem(row, 1, vehicle_item)
             
             # Kilométrage avec alerte visuelle
-            mileage = v.mileage
+            mileage = v['mileage']
             mileage_item = QTableWidgetItem(f"{mileage:,.0f} km")
             mileage_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
             if mileage > 50000:
@@ -655,9 +650,10 @@ class ReportsPage(QWidget):
             self.maintenance_table.setItem(row, 2, mileage_item)
             
             # Derniere maintenance
-            if v.last_maintenance_date:
-                days_since = (date.today() - v.last_maintenance_date).days
-                date_str = v.last_maintenance_date.strftime("%d/%m/%Y")
+            last_maintenance_date = v['last_maintenance_date']
+            if last_maintenance_date:
+                days_since = (date.today() - last_maintenance_date).days
+                date_str = last_maintenance_date.strftime("%d/%m/%Y")
                 maintenance_item = QTableWidgetItem(f"{date_str} ({days_since}j)")
                 if days_since > 180:
                     maintenance_item.setForeground(QColor("#dc2626"))
@@ -670,17 +666,9 @@ class ReportsPage(QWidget):
             maintenance_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
             self.maintenance_table.setItem(row, 3, maintenance_item)
             
-            # Etat avec icone
-            state_text = {
-                "En maintenance": "Maintenance",
-                "Hors service": "Hors service",
-                "Disponible": "A reviser",
-                "Reserve": "A reviser",
-                "Loue": "A reviser"
-            }.get(v.state.value, v.state.value)
-            state_item = QTableWidgetItem(state_text)
-            state_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            state_item.setForeground(QColor("#b45309"))
+            # État (badge peint par BadgeDelegate)
+            state_item = QTableWidgetItem(v['state'].value)
+            state_item.setData(BadgeRole, v['state'])
             self.maintenance_table.setItem(row, 4, state_item)
         
         # Si aucun vehicule a maintenir
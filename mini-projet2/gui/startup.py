@@ -0,0 +1,74 @@
+"""
+Mesure du temps de démarrage de l'interface.
+
+Chaque étape du démarrage est marquée par un nom et le temps écoulé depuis
+l'origine (en millisecondes). Les mesures peuvent être ajoutées à un
+fichier JSON Lines pour suivre le temps jusqu'à la première image d'une
+version à l'autre.
+"""
+
+import json
+import logging
+import platform
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimer:
+    """
+    Chronomètre des étapes du démarrage.
+    
+    Args:
+        origin: Instant de référence (time.perf_counter()); maintenant par défaut
+    """
+    
+    def __init__(self, origin: Optional[float] = None):
+        self.origin = time.perf_counter() if origin is None else origin
+        self._marks: Dict[str, float] = {}
+    
+    def mark(self, name: str) -> float:
+        """
+        Enregistre une étape (seule la première occurrence compte).
+        
+        Returns:
+            Temps écoulé depuis l'origine pour cette étape (ms)
+        """
+        if name not in self._marks:
+            self._marks[name] = (time.perf_counter() - self.origin) * 1000
+        return self._marks[name]
+    
+    def has_mark(self, name: str) -> bool:
+        return name in self._marks
+    
+    def as_dict(self) -> Dict[str, float]:
+        """Retourne les étapes dans l'ordre, en millisecondes arrondies."""
+        return {name: round(elapsed, 1) for name, elapsed in self._marks.items()}
+    
+    def summary(self) -> str:
+        """Résumé lisible, par exemple "window_created 12.0 ms, first_frame 48.3 ms"."""
+        return ", ".join(f"{name} {elapsed:.1f} ms" for name, elapsed in self._marks.items())
+    
+    def append_to(self, path: str, **extra) -> None:
+        """
+        Ajoute les mesures au fichier JSON Lines indiqué (une ligne par démarrage).
+        
+        Args:
+            path: Fichier de suivi
+            **extra: Informations complémentaires (version, jeu de données...)
+        """
+        record = {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            **extra,
+            'marks_ms': self.as_dict()
+        }
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        logger.info(f"Temps de démarrage ajoutés à {path}")
@@ -5,16 +5,46 @@ Page de gestion des véhicules.
 from typing import Optional
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QFrame, QPushButton, QTableWidget, QTableWidgetItem,
+    QLabel, QFrame, QPushButton, QTableView,
     QHeaderView, QDialog, QFormLayout, QLineEdit, QComboBox,
     QSpinBox, QDoubleSpinBox, QCheckBox, QMessageBox,
     QScrollArea, QGroupBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 
 from car_rental_system import CarRentalSystem
 from models.vehicle import Vehicle, Car, Truck, Motorcycle, VehicleCategory, VehicleState
-from gui.icons import get_icon, create_action_button
+from gui.icons import get_icon
+from gui.delegates import BadgeDelegate, ActionButtonsDelegate, EDIT_DELETE_ACTIONS
+from gui.entity_table import (
+    Column, EntityTableModel, IncrementalFilterProxyModel, SEARCH_DEBOUNCE_MS
+)
+
+
+VEHICLE_COLUMNS = [
+    Column("ID", lambda v: v.id),
+    Column("Type", lambda v: v.get_vehicle_type()),
+    Column("Marque", lambda v: v.brand),
+    Column("Modèle", lambda v: v.model),
+    Column("Catégorie", lambda v: v.category.value),
+    Column("Tarif/jour", lambda v: f"{v.daily_rate:.2f} €"),
+    Column("État", badge=lambda v: v.state),
+    Column("Année", lambda v: str(v.year)),
+    Column("Actions"),
+]
+
+
+def vehicle_search_text(vehicle: Vehicle) -> str:
+    """Texte dans lequel la recherche est faite (marque, modèle, immatriculation)."""
+    return f"{vehicle.brand}\n{vehicle.model}\n{vehicle.license_plate}"
+
+
+def vehicle_accepts(vehicle: Vehicle, filters: tuple) -> bool:
+    """Filtres de sélection (type, état) de la page des véhicules."""
+    type_filter, state_filter = filters
+    if type_filter != "Tous les types" and vehicle.get_vehicle_type() != type_filter:
+        return False
+    return not state_filter or vehicle.state == state_filter
 
 
 class VehicleDialog(QDialog):
@@ -393,9 +423,15 @@ class VehiclesPage(QWidget):
         
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText("Rechercher...")
-        self.search_edit.textChanged.connect(self.apply_filters)
         self.search_edit.setMaximumWidth(250)
         
+        # La recherche attend une pause de frappe; les listes filtrent tout de suite
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.apply_filters)
+        self.search_edit.textChanged.connect(self.search_timer.start)
+        
         filter_layout.addWidget(filter_label)
         filter_layout.addWidget(self.type_filter)
         filter_layout.addWidget(self.state_filter)
@@ -404,13 +440,20 @@ class VehiclesPage(QWidget):
         
         layout.addLayout(filter_layout)
         
-        # Tableau des véhicules
-        self.table = QTableWidget()
-        self.table.setColumnCount(9)
-        self.table.setHorizontalHeaderLabels([
-            "ID", "Type", "Marque", "Modèle", "Catégorie", 
-            "Tarif/jour", "État", "Année", "Actions"
-        ])
+        # Tableau des véhicules (modèle, filtre incrémental, délégués peints)
+        self.model = EntityTableModel(VEHICLE_COLUMNS, self)
+        self.proxy = IncrementalFilterProxyModel(vehicle_search_text, vehicle_accepts, self)
+        self.proxy.setSourceModel(self.model)
+        
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
+        self.table.setItemDelegateForColumn(6, BadgeDelegate(self.table))
+        self.actions_delegate = ActionButtonsDelegate(
+            EDIT_DELETE_ACTIONS, self.table, button_size=28, spacing=6
+        )
+        self.actions_delegate.action_triggered.connect(self.on_vehicle_action)
+        self.table.setItemDelegateForColumn(8, self.actions_delegate)
+        self.table.setMouseTracking(True)
         
         # Configuration du tableau
         header = self.table.horizontalHeader()
@@ -434,7 +477,7 @@ class VehiclesPage(QWidget):
         self.table.setColumnWidth(7, 60)   # Année
         self.table.setColumnWidth(8, 120)  # Actions
         
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.table.setAlternatingRowColors(True)
         v_header = self.table.verticalHeader()
         if v_header:
@@ -447,135 +490,25 @@ class VehiclesPage(QWidget):
     def refresh_data(self):
         """Rafraîchit les données du tableau."""
         self.all_vehicles = self.system.get_all_vehicles()
-        self.apply_filters()
+        self.model.set_items(self.all_vehicles)
     
     def apply_filters(self):
-        """Applique les filtres et affiche les véhicules."""
-        vehicles = self.all_vehicles
-        
-        # Filtre par type
-        type_filter = self.type_filter.currentText()
-        if type_filter != "Tous les types":
-            vehicles = [v for v in vehicles if v.get_vehicle_type() == type_filter]
-        
-        # Filtre par état
-        state_data = self.state_filter.currentData()
-        if state_data:
-            vehicles = [v for v in vehicles if v.state == state_data]
-        
-        # Filtre par recherche
-        search = self.search_edit.text().lower()
-        if search:
-            vehicles = [v for v in vehicles 
-                       if search in v.brand.lower() 
-                       or search in v.model.lower()
-                       or search in v.license_plate.lower()]
-        
-        self.display_vehicles(vehicles)
+        """
+        Applique les filtres au tableau.
+        
+        Le filtre est incrémental: seules les lignes qui apparaissent ou
+        disparaissent sont transmises à la vue.
+        """
+        self.search_timer.stop()
+        filters = (self.type_filter.currentText(), self.state_filter.currentData())
+        self.proxy.set_filter(self.search_edit.text(), filters)
     
-    def display_vehicles(self, vehicles: list):
-        """Affiche les véhicules dans le tableau."""
-        self.table.setRowCount(len(vehicles))
-        
-        for row, vehicle in enumerate(vehicles):
-            self.table.setItem(row, 0, QTableWidgetItem(vehicle.id))
-            self.table.setItem(row, 1, QTableWidgetItem(vehicle.get_vehicle_type()))
-            self.table.setItem(row, 2, QTableWidgetItem(vehicle.brand))
-            self.table.setItem(row, 3, QTableWidgetItem(vehicle.model))
-            self.table.setItem(row, 4, QTableWidgetItem(vehicle.category.value))
-            self.table.setItem(row, 5, QTableWidgetItem(f"{vehicle.daily_rate:.2f} €"))
-            
-            # État avec badge
-            state_widget = QWidget()
-            state_layout = QHBoxLayout(state_widget)
-            state_layout.setContentsMargins(2, 2, 2, 2)
-            state_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            state_label = QLabel(vehicle.state.value)
-            if vehicle.state == VehicleState.AVAILABLE:
-                state_label.setStyleSheet("""
-                    QLabel {
-                        background-color: #f0fdf4;
-                        color: #16a34a;
-                        padding: 2px 8px;
-                        border-radius: 10px;
-                        font-weight: 600;
-                        font-size: 11px;
-                        border: 1px solid #bbf7d0;
-                    }
-                """)
-            elif vehicle.state == VehicleState.RENTED:
-                state_label.setStyleSheet("""
-                    QLabel {
-                        background-color: #fefce8;
-                        color: #ca8a04;
-                        padding: 2px 8px;
-                        border-radius: 10px;
-                        font-weight: 600;
-                        font-size: 11px;
-                        border: 1px solid #fef08a;
-                    }
-                """)
-            elif vehicle.state == VehicleState.MAINTENANCE:
-                state_label.setStyleSheet("""
-                    QLabel {
-                        background-color: #eff6ff;
-                        color: #2563eb;
-                        padding: 2px 8px;
-                        border-radius: 10px;
-                        font-weight: 600;
-                        font-size: 11px;
-                        border: 1px solid #bfdbfe;
-                    }
-                """)
-            else:
-                state_label.setStyleSheet("""
-                    QLabel {
-                        background-color: #fef2f2;
-                        color: #dc2626;
-                        padding: 2px 8px;
-                        border-radius: 10px;
-                        font-weight: 600;
-                        font-size: 11px;
-                        border: 1px solid #fecaca;
-                    }
-                """)
-            state_layout.addWidget(state_label)
-            self.table.setCellWidget(row, 6, state_widget)
-            
-            self.table.setItem(row, 7, QTableWidgetItem(str(vehicle.year)))
-            
-            # Boutons d'action
-            actions_widget = QWidget()
-            actions_layout = QHBoxLayout(actions_widget)
-            actions_layout.setContentsMargins(4, 0, 4, 0)
-            actions_layout.setSpacing(6)
-            actions_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            edit_btn = create_action_button(
-                "edit", "Modifier",
-                icon_color="#3b82f6",
-                bg_color="#eff6ff",
-                hover_color="#dbeafe",
-                border_color="#bfdbfe",
-                size=28
-            )
-            edit_btn.clicked.connect(lambda checked, v=vehicle: self.edit_vehicle(v))
-            
-            delete_btn = create_action_button(
-                "delete", "Supprimer",
-                icon_color="#ef4444",
-                bg_color="#fef2f2",
-                hover_color="#fee2e2",
-                border_color="#fecaca",
-                size=28
-            )
-            delete_btn.clicked.connect(lambda checked, v=vehicle: self.delete_vehicle(v))
-            
-            actions_layout.addWidget(edit_btn)
-            actions_layout.addWidget(delete_btn)
-            
-            self.table.setCellWidget(row, 8, actions_widget)
+    def on_vehicle_action(self, action: str, vehicle: Vehicle):
+        """Exécute l'action cliquée sur une ligne du tableau."""
+        if action == "edit":
+            self.edit_vehicle(vehicle)
+        elif action == "delete":
+            self.delete_vehicle(vehicle)
     
     def add_vehicle(self):
         """Ouvre le dialogue pour ajouter un véhicule."""
@@ -593,16 +526,16 @@ class VehiclesPage(QWidget):
         """Ouvre le dialogue pour modifier un véhicule."""
         dialog = VehicleDialog(self, vehicle)
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            # Supprimer l'ancien et ajouter le nouveau
-            old_state = vehicle.state  # Conserver l'état via le getter public
-            self.system.remove_vehicle(vehicle.id)
+            # Remplacer le véhicule (même ID), même s'il est en location
             new_vehicle = dialog.get_vehicle()
             if new_vehicle:
-                new_vehicle.state = old_state  # Utiliser le setter public
-                self.system.add_vehicle(new_vehicle)
-            self.refresh_data()
-            self.data_changed.emit()
-            QMessageBox.information(self, "Succès", "Véhicule modifié avec succès!")
+                new_vehicle.state = vehicle.state  # Conserver l'état via le setter public
+            if new_vehicle and self.system.update_vehicle(new_vehicle):
+                self.refresh_data()
+                self.data_changed.emit()
+                QMessageBox.information(self, "Succès", "Véhicule modifié avec succès!")
+            else:
+                QMessageBox.warning(self, "Erreur", "Impossible de modifier le véhicule.")
     
     def delete_vehicle(self, vehicle: Vehicle):
         """Supprime un véhicule."""
@@ -7,12 +7,15 @@ Usage:
     python main.py --gui        # Lance l'interface graphique
     python main.py --console    # Lance la démonstration en console
     python main.py --test       # Lance tous les tests unitaires
+    python main.py --startup-timings temps.jsonl  # Enregistre les temps de démarrage
+    python main.py --generate 10000 # Génère un jeu de données synthétique
     python main.py --help       # Affiche l'aide
 
 Système de Location de Véhicules - IRA3 Python Mini-Projet 2
 """
 
 import sys
+import time
 import argparse
 import subprocess
 from pathlib import Path
@@ -22,13 +25,26 @@ from datetime import date, timedelta
 PROJECT_ROOT = Path(__file__).parent
 
 
-def launch_gui():
-    """Lance l'interface graphique PyQt6."""
+def launch_gui(
+    startup_timings: str | None = None,
+    data_dir: str = "data",
+    rentals_format: str = "json"
+):
+    """
+    Lance l'interface graphique PyQt6.
+    
+    Args:
+        startup_timings: Fichier JSON Lines où ajouter les temps de démarrage
+        data_dir: Répertoire des données
+        rentals_format: Format des locations (json, jsonl ou partitioned)
+    """
     print("Lancement de l'interface graphique...")
+    started_at = time.perf_counter()
     
     try:
         from PyQt6.QtWidgets import QApplication
-        from gui.main_window import MainWindow
+        from gui.main_window import MainWindow, APP_VERSION
+        from gui.startup import StartupTimer
         from gui.styles import get_full_stylesheet
         
         # Créer l'application
@@ -38,8 +54,15 @@ def launch_gui():
         app.setStyleSheet(get_full_stylesheet())
         
         # Créer et afficher la fenêtre principale
-        # MainWindow crée son propre système avec données de démo
-        window = MainWindow()
+        # MainWindow crée son propre système et charge les données après le premier affichage
+        startup_timer = StartupTimer(origin=started_at)
+        window = MainWindow(
+            data_dir=data_dir, rentals_format=rentals_format, startup_timer=startup_timer
+        )
+        if startup_timings:
+            window.loading_finished.connect(
+                lambda: startup_timer.append_to(startup_timings, version=APP_VERSION)
+            )
         window.show()
         
         # Lancer la boucle d'événements
@@ -439,6 +462,50 @@ def demo_age_restrictions(system) -> None:
             print(f"   [X] {vehicle.get_vehicle_type()} {vehicle.brand} {vehicle.model}: {reason}")
 
 
+def generate_data(args) -> int:
+    """
+    Génère un jeu de données synthétique et le sauvegarde.
+    
+    Args:
+        args: Arguments de la ligne de commande (--generate, --customers,
+            --years, --rentals, --seed, --data-dir, --rentals-format)
+    
+    Returns:
+        Code de sortie
+    """
+    from models.data_generator import SyntheticDataGenerator
+    from models.persistence import DataPersistence
+    
+    print(f"[...] Generation de {args.generate} vehicules (graine {args.seed})...")
+    started_at = time.perf_counter()
+    try:
+        dataset = SyntheticDataGenerator(seed=args.seed).generate(
+            args.generate,
+            num_customers=args.customers,
+            years=args.years,
+            num_rentals=args.rentals
+        )
+    except ValueError as e:
+        print(f"[ERREUR] {e}")
+        return 1
+    generated_at = time.perf_counter()
+    
+    print(f"   Vehicules: {len(dataset.vehicles)}")
+    print(f"   Clients: {len(dataset.customers)}")
+    print(f"   Locations: {len(dataset.rentals)}")
+    for status, count in dataset.status_counts().items():
+        print(f"      {status.value}: {count}")
+    print(f"   Generees en {generated_at - started_at:.2f} s")
+    
+    persistence = DataPersistence(args.data_dir, args.rentals_format)
+    if not dataset.save(persistence):
+        print(f"[ERREUR] Echec de la sauvegarde dans {persistence.data_dir}")
+        return 1
+    print(f"[OK] Sauvegarde dans {persistence.data_dir} ({args.rentals_format}) "
+          f"en {time.perf_counter() - generated_at:.2f} s")
+    return 0
+
+
 def print_help():
     """Affiche l'aide detaillee."""
     print("""
@@ -453,12 +520,19 @@ def print_help():
 |    --gui, -g      Lance l'interface graphique (defaut)       |
 |    --console, -c  Lance la demo en mode console              |
 |    --test, -t     Lance tous les tests unitaires             |
+|    --startup-timings FICHIER                                 |
+|                   Enregistre les temps de demarrage (JSONL)  |
+|    --generate N   Genere N vehicules, clients et locations   |
+|      --customers N, --years A, --rentals N, --seed S,        |
+|      --data-dir DOSSIER, --rentals-format json|jsonl|...     |
+|                   (aussi pris en compte par l'interface)     |
 |    --help, -h     Affiche cette aide                         |
 |                                                              |
 |  EXEMPLES:                                                   |
 |    python main.py              # Interface graphique         |
 |    python main.py --console    # Mode console                |
 |    python main.py --test       # Tests unitaires             |
+|    python main.py --generate 10000 --rentals 1000000         |
 |                                                              |
 |  FICHIERS:                                                   |
 |    main.py          - Point d'entree principal               |
@@ -492,6 +566,53 @@ def main():
         action="store_true",
         help="Lance les tests unitaires"
     )
+    parser.add_argument(
+        "--startup-timings",
+        metavar="FICHIER",
+        help="Ajoute les temps de démarrage de l'interface au fichier (JSON Lines)"
+    )
+    parser.add_argument(
+        "--generate",
+        type=int,
+        metavar="N",
+        help="Génère un jeu de données synthétique de N véhicules"
+    )
+    parser.add_argument(
+        "--customers",
+        type=int,
+        metavar="N",
+        help="Nombre de clients générés (deux par véhicule par défaut)"
+    )
+    parser.add_argument(
+        "--years",
+        type=float,
+        default=2.0,
+        help="Profondeur de l'historique généré, en années"
+    )
+    parser.add_argument(
+        "--rentals",
+        type=int,
+        metavar="N",
+        help="Nombre approximatif de locations générées (remplace --years)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Graine du générateur (même graine, mêmes données)"
+    )
+    parser.add_argument(
+        "--data-dir",
+        default="data",
+        metavar="DOSSIER",
+        help="Répertoire des données (interface et données générées)"
+    )
+    parser.add_argument(
+        "--rentals-format",
+        choices=("json", "jsonl", "partitioned"),
+        default="json",
+        help="Format des locations (interface et données générées)"
+    )
     parser.add_argument(
         "--help", "-h",
         action="store_true",
@@ -509,13 +630,17 @@ def main():
     if args.test:
         return launch_tests(remaining)
     
+    # Générer un jeu de données
+    if args.generate is not None:
+        return generate_data(args)
+    
     # Lancer le mode console
     if args.console:
         launch_console()
         return 0
     
     # Par défaut: lancer l'interface graphique
-    launch_gui()
+    launch_gui(args.startup_timings, args.data_dir, args.rentals_format)
     return 0
 
 
@@ -0,0 +1,144 @@
+"""
+Module de calculs analytiques vectorisés (NumPy) sur l'historique des locations.
+
+Les fonctions reçoivent des tableaux déjà extraits des objets métier, pour
+que le coût ne dépende que du nombre de locations et du nombre de jours.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+
+def daily_occupancy(
+    starts: Sequence[int],
+    ends: Sequence[int],
+    groups: Sequence[int],
+    num_groups: int,
+    first_day: int,
+    last_day: int
+) -> np.ndarray:
+    """
+    Compte, pour chaque groupe et chaque jour, les intervalles qui le couvrent.
+
+    Balayage par tableau de différences: +1 au premier jour de chaque
+    intervalle, -1 au lendemain du dernier, puis somme cumulée. Le coût est
+    en O(intervalles + jours), quelle que soit la longueur des intervalles.
+
+    Args:
+        starts: Premier jour de chaque intervalle (ordinal, inclus)
+        ends: Dernier jour de chaque intervalle (ordinal, inclus)
+        groups: Indice de groupe de chaque intervalle (0 à num_groups - 1)
+        num_groups: Nombre de groupes
+        first_day: Premier jour de la période (ordinal)
+        last_day: Dernier jour de la période (ordinal)
+
+    Returns:
+        Tableau (num_groups, nb jours) du nombre d'intervalles par jour
+    """
+    num_days = last_day - first_day + 1
+    if num_days <= 0 or num_groups <= 0:
+        return np.zeros((max(num_groups, 0), max(num_days, 0)), dtype=np.int64)
+
+    starts = np.asarray(starts, dtype=np.int64)
+    ends = np.asarray(ends, dtype=np.int64)
+    groups = np.asarray(groups, dtype=np.int64)
+
+    # Ne garder que les intervalles qui recoupent la période, puis les borner
+    overlap = (ends >= first_day) & (starts <= last_day)
+    starts = np.maximum(starts[overlap], first_day) - first_day
+    ends = np.minimum(ends[overlap], last_day) - first_day + 1
+    groups = groups[overlap]
+
+    # Une colonne de plus pour les -1 posés au lendemain du dernier jour
+    width = num_days + 1
+    diff = np.bincount(groups * width + starts, minlength=num_groups * width)
+    diff -= np.bincount(groups * width + ends, minlength=num_groups * width)
+
+    return np.cumsum(diff.reshape(num_groups, width), axis=1)[:, :num_days]
+
+
+def index_groups(keys: Sequence[str]) -> Tuple[List[str], Dict[str, int]]:
+    """
+    Numérote des clés de groupe dans l'ordre de première apparition.
+
+    Returns:
+        Tuple (liste des clés, dictionnaire clé -> indice)
+    """
+    indices: Dict[str, int] = {}
+    for key in keys:
+        if key not in indices:
+            indices[key] = len(indices)
+    return list(indices), indices
+
+
+# Ordinal du 1970-01-01, origine des dates NumPy (datetime64)
+_EPOCH_ORDINAL = 719163
+
+
+def weekday_indices(first_day: int, num_days: int) -> np.ndarray:
+    """Jour de la semaine (0 = lundi) de chaque jour de la période."""
+    return (np.arange(first_day, first_day + num_days) - 1) % 7
+
+
+def month_indices(first_day: int, num_days: int) -> np.ndarray:
+    """Mois (0 = janvier) de chaque jour de la période."""
+    days = np.arange(num_days) + (first_day - _EPOCH_ORDINAL)
+    return days.astype('datetime64[D]').astype('datetime64[M]').astype(np.int64) % 12
+
+
+def mean_profile(series: np.ndarray, labels: np.ndarray, num_labels: int) -> np.ndarray:
+    """
+    Moyenne de chaque série par étiquette (jour de semaine, mois...).
+
+    Args:
+        series: Tableau (groupes, jours)
+        labels: Étiquette de chaque jour (0 à num_labels - 1)
+        num_labels: Nombre d'étiquettes
+
+    Returns:
+        Tableau (groupes, num_labels); 0 pour une étiquette sans jour
+    """
+    one_hot = np.zeros((len(labels), num_labels))
+    one_hot[np.arange(len(labels)), labels] = 1.0
+    counts = one_hot.sum(axis=0)
+    sums = series @ one_hot
+    return np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
+
+
+def smoothed_forecast(
+    series: np.ndarray,
+    weekdays: np.ndarray,
+    horizon_weekdays: np.ndarray,
+    alpha: float
+) -> np.ndarray:
+    """
+    Prévision par lissage exponentiel avec saisonnalité hebdomadaire additive.
+
+    L'effet de chaque jour de semaine (écart à la moyenne) est retiré de la
+    série, le niveau est lissé, puis l'effet est rajouté sur l'horizon. Le
+    niveau final d'un lissage exponentiel simple est une somme pondérée
+    (poids alpha * (1 - alpha)^âge): il est calculé en un seul produit
+    matriciel pour tous les groupes, sans boucle sur les jours.
+
+    Args:
+        series: Tableau (groupes, jours) de l'historique
+        weekdays: Jour de semaine de chaque jour de l'historique
+        horizon_weekdays: Jour de semaine de chaque jour à prévoir
+        alpha: Coefficient de lissage (0 < alpha <= 1)
+
+    Returns:
+        Tableau (groupes, jours à prévoir), sans valeur négative
+    """
+    num_days = series.shape[1]
+    effects = mean_profile(series, weekdays, 7)
+    effects -= series.mean(axis=1, keepdims=True)
+    adjusted = series - effects[:, weekdays]
+
+    # Le premier jour sert de niveau initial: il reçoit le poids restant
+    ages = np.arange(num_days - 1, -1, -1)
+    weights = alpha * (1.0 - alpha) ** ages
+    weights[0] = (1.0 - alpha) ** (num_days - 1)
+    level = adjusted @ weights
+
+    return np.maximum(level[:, None] + effects[:, horizon_weekdays], 0.0)
@@ -0,0 +1,221 @@
+"""
+Module de sauvegarde automatique.
+
+Le service s'abonne aux événements de CarRentalSystem, regroupe les
+rafales de modifications sur une fenêtre de temps, puis sauvegarde dans un
+thread dédié: l'appelant (ex: l'interface graphique) n'attend jamais
+l'écriture des fichiers.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from models.events import SystemEvent, VehicleEvent, CustomerEvent, RentalEvent
+from models.persistence import DataPersistence
+
+logger = logging.getLogger(__name__)
+
+
+class AutosaveService:
+    """
+    Sauvegarde automatique en arrière-plan, avec regroupement des écritures.
+
+    La première modification ouvre une fenêtre de `delay` secondes; toutes
+    les modifications reçues pendant cette fenêtre donnent lieu à une seule
+    sauvegarde. Seule la conversion des données en enregistrements est
+    faite sous le verrou du système (l'état écrit est cohérent); l'écriture
+    des fichiers se fait ensuite sans bloquer les modifications.
+
+    Attributes:
+        system: Système de location surveillé
+        persistence: Gestionnaire de persistance utilisé pour écrire
+        delay: Fenêtre de regroupement en secondes
+        last_saved_at: Date de la dernière sauvegarde réussie
+        last_error: Message de la dernière erreur de sauvegarde
+        saves: Nombre de sauvegardes effectuées
+        errors: Nombre de sauvegardes échouées
+    """
+
+    DEFAULT_DELAY = 2.0
+
+    def __init__(
+        self,
+        system,
+        persistence: DataPersistence,
+        delay: float = DEFAULT_DELAY
+    ):
+        self.system = system
+        self.persistence = persistence
+        self.delay = delay
+        self.last_saved_at: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+        self.saves = 0
+        self.errors = 0
+
+        self._condition = threading.Condition()
+        self._pending = 0
+        self._first_change_at: Optional[float] = None
+        self._flush_requested = False
+        self._saving = False
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+    # === Cycle de vie ===
+
+    def start(self) -> None:
+        """Abonne le service au système et démarre le thread de sauvegarde."""
+        if self._thread is not None:
+            return
+        self._stopping = False
+        # DataReloaded n'est pas une modification: les données viennent du disque
+        self.system.events.subscribe_batch(
+            self.on_system_events, (VehicleEvent, CustomerEvent, RentalEvent)
+        )
+        self._thread = threading.Thread(
+            target=self._run, name="autosave", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Sauvegarde automatique démarrée (fenêtre: {self.delay}s)")
+
+    def stop(self, flush: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Arrête le service.
+
+        Args:
+            flush: Sauvegarder d'abord les modifications en attente
+                (sinon elles sont abandonnées)
+            timeout: Attente maximale du thread en secondes
+        """
+        if self._thread is None:
+            return
+        self.system.events.unsubscribe(self.on_system_events)
+        if flush:
+            self.flush(timeout)
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        self._thread = None
+        logger.info("Sauvegarde automatique arrêtée")
+
+    # === Modifications ===
+
+    def on_system_events(self, events: List[SystemEvent]) -> None:
+        """Compte les événements livrés comme modifications à sauvegarder."""
+        self.mark_dirty(len(events))
+
+    def mark_dirty(self, changes: int = 1) -> None:
+        """
+        Signale des modifications à sauvegarder.
+
+        Args:
+            changes: Nombre de modifications
+        """
+        with self._condition:
+            self._pending += changes
+            if self._first_change_at is None:
+                self._first_change_at = time.monotonic()
+            self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Sauvegarde immédiatement les modifications en attente.
+
+        Args:
+            timeout: Attente maximale en secondes (None: sans limite)
+
+        Returns:
+            True si tout a été sauvegardé, False en cas d'échec ou de délai dépassé
+        """
+        if self._thread is None:
+            return self._pending == 0
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            errors_before = self.errors
+            self._flush_requested = True
+            self._condition.notify_all()
+            while (self._pending or self._saving) and self.errors == errors_before:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            return self.errors == errors_before
+
+    @property
+    def pending_changes(self) -> int:
+        """Nombre de modifications pas encore sauvegardées."""
+        return self._pending
+
+    def get_status(self) -> Dict:
+        """
+        Retourne l'état du service.
+
+        Returns:
+            Dictionnaire (last_saved_at, pending_changes, saving, last_error, saves)
+        """
+        with self._condition:
+            return {
+                'last_saved_at': self.last_saved_at,
+                'pending_changes': self._pending,
+                'saving': self._saving,
+                'last_error': self.last_error,
+                'saves': self.saves
+            }
+
+    # === Thread de sauvegarde ===
+
+    def _run(self) -> None:
+        """Boucle du thread: attend la fin de la fenêtre puis sauvegarde."""
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopping:
+                    self._flush_requested = False
+                    self._condition.wait()
+                if self._stopping:
+                    # flush() a déjà sauvegardé ce qui devait l'être
+                    return
+
+                # Laisser la fenêtre de regroupement se terminer
+                while not self._flush_requested and not self._stopping:
+                    remaining = self._first_change_at + self.delay - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+
+                batch = self._pending
+                self._pending = 0
+                self._first_change_at = None
+                self._flush_requested = False
+                self._saving = True
+
+            self._save(batch)
+
+            with self._condition:
+                self._saving = False
+                self._condition.notify_all()
+
+    def _save(self, batch: int) -> None:
+        """Copie l'état du système sous son verrou, puis l'écrit hors verrou."""
+        try:
+            with self.system.lock:
+                records = self.persistence.export_records(*self.system.snapshot())
+            self.persistence.save_records(records)
+        except Exception as e:
+            logger.error(f"Échec de la sauvegarde automatique: {e}")
+            with self._condition:
+                self.last_error = str(e)
+                self.errors += 1
+                # Les modifications restent à sauvegarder
+                self._pending += batch
+                if self._first_change_at is None:
+                    self._first_change_at = time.monotonic()
+            return
+
+        with self._condition:
+            self.last_saved_at = datetime.now()
+            self.last_error = None
+            self.saves += 1
+        logger.info(f"Sauvegarde automatique: {batch} modification(s) enregistrée(s)")
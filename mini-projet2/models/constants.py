@@ -79,3 +79,17 @@ class LicenseTypes:
     TRUCK_LIGHT = "B"
     TRUCK_MEDIUM = "C1"
     TRUCK_HEAVY = "C"
+
+
+class ForecastConstants:
+    """Constantes de la prévision de la demande."""
+    
+    DEFAULT_WEEKS = 4  # Horizon par défaut
+    SMOOTHING_ALPHA = 0.3  # Lissage exponentiel du niveau (0 < alpha <= 1)
+    
+    # Libellés des profils
+    WEEKDAY_NAMES = ("lundi", "mardi", "mercredi", "jeudi", "vendredi", "samedi", "dimanche")
+    MONTH_NAMES = (
+        "janvier", "février", "mars", "avril", "mai", "juin", "juillet",
+        "août", "septembre", "octobre", "novembre", "décembre"
+    )
@@ -0,0 +1,722 @@
+"""
+Générateur de jeux de données synthétiques (flotte, clients, locations).
+
+Le générateur est déterministe: mêmes paramètres, même graine et même date
+de référence donnent les mêmes entités, identifiants compris. La flotte,
+les clients et les locations ont chacun leur propre flux aléatoire, si bien
+que changer le nombre de clients ne change pas la flotte.
+
+Les tirages sont vectorisés avec NumPy; seuls les objets finaux sont
+construits en Python (les locations par Rental.restore, avec une seule
+instance de date par jour), ce qui permet de produire un million de
+locations en quelques secondes.
+
+Distributions:
+- flotte: trois quarts de voitures, des utilitaires (dont quelques poids
+  lourds, permis C1/C) et des motos (permis A1/A), modèles et tarifs tirés
+  d'un catalogue, véhicules de 0 à 8 ans;
+- clients: âges de 18 à 85 ans par tranches, permis B obtenu peu après
+  18 ans (quelques permis de moins d'un an), permis moto ou poids lourd
+  pour une minorité, quelques clients bloqués;
+- locations: pour chaque véhicule, une suite de locations sans
+  chevauchement (surtout courtes, parfois d'un mois) séparées par des
+  jours d'inactivité. Dans le passé elles sont terminées (parfois rendues
+  en retard) ou annulées; celle qui couvre aujourd'hui est en cours (et
+  quelques locations finies depuis peu ne sont pas encore rendues); dans
+  l'avenir, elles sont réservées ou annulées. Chaque location est tirée
+  parmi les clients autorisés à conduire le véhicule, avec une fidélité
+  inégale (quelques clients louent beaucoup).
+
+Exemple:
+    dataset = SyntheticDataGenerator(seed=42).generate(num_vehicles=10_000)
+    dataset.load_into(system)            # ou dataset.save(persistence)
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from models.customer import Customer
+from models.rental import Rental, RentalStatus
+from models.utils import calculate_years_difference, gc_paused
+from models.vehicle import Car, Motorcycle, Truck, Vehicle, VehicleCategory, VehicleState
+
+logger = logging.getLogger(__name__)
+
+# === Catalogue de la flotte ===
+
+# (marque, modèle, catégorie, tarif de base, portes, places, carburant, boîte)
+CAR_MODELS = (
+    ("Renault", "Clio", VehicleCategory.ECONOMY, 35.0, 5, 5, "essence", "manuelle"),
+    ("Peugeot", "208", VehicleCategory.ECONOMY, 38.0, 5, 5, "essence", "manuelle"),
+    ("Dacia", "Sandero", VehicleCategory.ECONOMY, 30.0, 5, 5, "essence", "manuelle"),
+    ("Citroën", "C3", VehicleCategory.ECONOMY, 36.0, 5, 5, "diesel", "manuelle"),
+    ("Peugeot", "308", VehicleCategory.STANDARD, 50.0, 5, 5, "diesel", "manuelle"),
+    ("Volkswagen", "Golf", VehicleCategory.STANDARD, 55.0, 5, 5, "essence", "automatique"),
+    ("Toyota", "Corolla", VehicleCategory.STANDARD, 52.0, 5, 5, "hybride", "automatique"),
+    ("Renault", "Mégane E-Tech", VehicleCategory.STANDARD, 58.0, 5, 5, "électrique", "automatique"),
+    ("BMW", "Série 3", VehicleCategory.PREMIUM, 85.0, 4, 5, "diesel", "automatique"),
+    ("Audi", "A4", VehicleCategory.PREMIUM, 90.0, 4, 5, "essence", "automatique"),
+    ("Tesla", "Model 3", VehicleCategory.PREMIUM, 95.0, 4, 5, "électrique", "automatique"),
+    ("Mercedes", "Classe S", VehicleCategory.LUXURY, 180.0, 4, 5, "hybride", "automatique"),
+    ("Porsche", "911", VehicleCategory.SPORT, 250.0, 2, 2, "essence", "automatique"),
+)
+# Part de chaque modèle dans les voitures (les économiques dominent)
+CAR_WEIGHTS = (16, 14, 12, 10, 10, 8, 8, 6, 5, 4, 4, 2, 1)
+
+# (marque, modèle, tarif de base, volume m³, poids max kg, hayon)
+TRUCK_MODELS = (
+    ("Renault", "Kangoo", 45.0, 3.5, 2200, False),
+    ("Renault", "Master", 80.0, 12.0, 3500, False),
+    ("Peugeot", "Boxer", 85.0, 15.0, 3500, True),
+    ("Iveco", "Daily", 120.0, 20.0, 7000, True),
+    ("Mercedes", "Atego", 180.0, 40.0, 12000, True),
+)
+TRUCK_WEIGHTS = (30, 30, 25, 10, 5)
+
+# (marque, modèle, catégorie, tarif de base, cylindrée cm³, type)
+MOTORCYCLE_MODELS = (
+    ("Honda", "CB125R", VehicleCategory.ECONOMY, 30.0, 125, "roadster"),
+    ("Yamaha", "NMAX 125", VehicleCategory.ECONOMY, 28.0, 125, "scooter"),
+    ("Yamaha", "MT-07", VehicleCategory.STANDARD, 60.0, 689, "roadster"),
+    ("BMW", "R 1250 GS", VehicleCategory.PREMIUM, 110.0, 1254, "trail"),
+    ("Ducati", "Panigale V4", VehicleCategory.SPORT, 180.0, 1103, "sport"),
+)
+MOTORCYCLE_WEIGHTS = (30, 30, 20, 15, 5)
+
+# Répartition de la flotte: voitures, utilitaires, motos
+FLEET_MIX = (0.75, 0.15, 0.10)
+
+# Véhicules immobilisés hors location (part de la flotte)
+MAINTENANCE_SHARE = 0.03
+OUT_OF_SERVICE_SHARE = 0.01
+
+# === Clients ===
+
+FIRST_NAMES = (
+    "Jean", "Marie", "Pierre", "Sophie", "Lucas", "Camille", "Thomas", "Léa",
+    "Nicolas", "Julie", "Hugo", "Chloé", "Antoine", "Manon", "Louis", "Emma",
+    "Mathieu", "Sarah", "Julien", "Laura", "Karim", "Inès", "Mehdi", "Yasmine",
+    "Paul", "Clara", "Maxime", "Anaïs", "Romain", "Zoé", "Alexandre", "Lina",
+)
+LAST_NAMES = (
+    "Martin", "Bernard", "Dubois", "Thomas", "Robert", "Richard", "Petit",
+    "Durand", "Leroy", "Moreau", "Simon", "Laurent", "Lefebvre", "Michel",
+    "Garcia", "David", "Bertrand", "Roux", "Vincent", "Fournier", "Morel",
+    "Girard", "André", "Mercier", "Dupont", "Lambert", "Bonnet", "François",
+    "Martinez", "Benali", "Nguyen", "Rousseau",
+)
+CITIES = (
+    "Toulouse", "Paris", "Lyon", "Marseille", "Bordeaux", "Montpellier",
+    "Nantes", "Lille", "Nice", "Rennes", "Strasbourg", "Albi",
+)
+STREETS = ("rue de la République", "avenue Jean Jaurès", "boulevard Victor Hugo",
+           "rue des Lilas", "allée des Pins", "place du Capitole")
+
+# Tranches d'âge des conducteurs: (âge min, âge max, part)
+AGE_BANDS = (
+    (18, 24, 0.10), (25, 34, 0.19), (35, 44, 0.19), (45, 54, 0.18),
+    (55, 64, 0.16), (65, 74, 0.12), (75, 85, 0.06),
+)
+
+# Part des clients titulaires de chaque permis (en plus du B)
+LICENSE_A_SHARE = 0.10     # A (inclut A1), dès 20 ans
+LICENSE_A1_SHARE = 0.04    # A1 seul
+LICENSE_C_SHARE = 0.03     # C (inclut C1), dès 21 ans
+LICENSE_C1_SHARE = 0.04    # C1 seul
+LICENSE_B_SHARE = 0.98
+
+BLOCKED_SHARE = 0.005
+BLOCKED_REASONS = ("Impayé", "Dégradation du véhicule", "Retards répétés", "Fraude au permis")
+
+# === Locations ===
+
+# Durée (jours): loi log-normale, bornée à 45 jours
+DURATION_MEDIAN_DAYS = 3.0
+DURATION_SIGMA = 0.9
+MAX_DURATION_DAYS = 45
+# Inactivité entre deux locations: loi géométrique, paramètre propre au
+# véhicule (véhicules plus ou moins demandés)
+GAP_P_RANGE = (0.15, 0.6)
+# Durée moyenne observée d'un cycle location + inactivité (jours), pour
+# déduire la profondeur d'historique d'un nombre de locations visé
+MEAN_CYCLE_DAYS = 7.4
+# Réservations acceptées jusqu'à ce nombre de jours dans l'avenir
+BOOKING_HORIZON_DAYS = 90
+
+PAST_CANCELLATION_RATE = 0.06
+FUTURE_CANCELLATION_RATE = 0.08
+LATE_RETURN_RATE = 0.07
+MAX_DAYS_LATE = 3
+# Locations finies dans les derniers jours et pas encore rendues
+OVERDUE_WINDOW_DAYS = 5
+OVERDUE_RATE = 0.25
+
+# Paliers de fidélité (nombre de locations précédentes, réduction)
+LOYALTY_TIERS = ((20, 0.15), (10, 0.10), (5, 0.05))
+
+# Limite de cases (véhicules × locations) tirées à la fois
+CHUNK_CELLS = 2_000_000
+
+# Codes de statut des tableaux NumPy
+_RESERVED, _ACTIVE, _COMPLETED, _CANCELLED = range(4)
+_STATUSES = (RentalStatus.RESERVED, RentalStatus.ACTIVE, RentalStatus.COMPLETED,
+             RentalStatus.CANCELLED)
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+@dataclass
+class SyntheticDataset:
+    """Jeu de données généré, prêt à charger dans le système ou à sauvegarder."""
+    vehicles: Dict[str, Vehicle]
+    customers: Dict[str, Customer]
+    rentals: Dict[str, Rental]
+
+    def load_into(self, system) -> None:
+        """Remplace les données d'un CarRentalSystem par ce jeu de données."""
+        system.load_data(self.vehicles, self.customers, self.rentals)
+
+    def save(self, persistence) -> bool:
+        """Sauvegarde le jeu de données avec un DataPersistence (son format)."""
+        return persistence.save_all(self.vehicles, self.customers, self.rentals)
+
+    def status_counts(self) -> Dict[RentalStatus, int]:
+        """Nombre de locations par statut."""
+        counts = {status: 0 for status in RentalStatus}
+        for rental in self.rentals.values():
+            counts[rental.status] += 1
+        return counts
+
+
+class SyntheticDataGenerator:
+    """
+    Générateur déterministe de flotte, de clients et d'historique de locations.
+
+    Args:
+        seed: Graine des tirages
+        today: Date de référence (aujourd'hui par défaut): les locations
+            passées sont clôturées, celle qui la couvre est en cours
+    """
+
+    def __init__(self, seed: int = 0, today: Optional[date] = None):
+        self.seed = seed
+        self.today = today or date.today()
+        vehicle_seed, customer_seed, rental_seed = np.random.SeedSequence(seed).spawn(3)
+        self._vehicle_seed = vehicle_seed
+        self._customer_seed = customer_seed
+        self._rental_seed = rental_seed
+
+    def generate(
+        self,
+        num_vehicles: int,
+        num_customers: Optional[int] = None,
+        years: float = 2.0,
+        num_rentals: Optional[int] = None
+    ) -> SyntheticDataset:
+        """
+        Génère un jeu de données complet.
+
+        Args:
+            num_vehicles: Taille de la flotte
+            num_customers: Nombre de clients (deux par véhicule par défaut)
+            years: Profondeur de l'historique des locations, en années
+            num_rentals: Nombre approximatif de locations visé; s'il est
+                donné, il détermine la profondeur de l'historique
+
+        Returns:
+            Le jeu de données
+
+        Raises:
+            ValueError: Si un nombre demandé est négatif
+        """
+        if num_vehicles < 0 or (num_customers is not None and num_customers < 0):
+            raise ValueError("Les nombres de véhicules et de clients doivent être positifs")
+        if num_customers is None:
+            num_customers = 2 * num_vehicles
+
+        history_days = int(years * 365)
+        if num_rentals is not None:
+            if num_rentals < 0:
+                raise ValueError("Le nombre de locations doit être positif")
+            per_vehicle = num_rentals / max(num_vehicles, 1)
+            history_days = max(int(per_vehicle * MEAN_CYCLE_DAYS) - BOOKING_HORIZON_DAYS, 0)
+
+        vehicles = self.generate_vehicles(num_vehicles)
+        customers = self.generate_customers(num_customers)
+        rentals = self.generate_rentals(vehicles, customers, history_days)
+        return SyntheticDataset(vehicles, customers, rentals)
+
+    # === Flotte ===
+
+    def generate_vehicles(self, count: int) -> Dict[str, Vehicle]:
+        """
+        Génère une flotte (voitures, utilitaires, motos).
+
+        Args:
+            count: Nombre de véhicules
+
+        Returns:
+            Dictionnaire des véhicules {id: vehicle}, tous disponibles
+        """
+        rng = np.random.default_rng(self._vehicle_seed)
+        kinds = rng.choice(3, size=count, p=FLEET_MIX)
+        car_models = rng.choice(len(CAR_MODELS), size=count, p=_normalized(CAR_WEIGHTS))
+        truck_models = rng.choice(len(TRUCK_MODELS), size=count, p=_normalized(TRUCK_WEIGHTS))
+        moto_models = rng.choice(len(MOTORCYCLE_MODELS), size=count, p=_normalized(MOTORCYCLE_WEIGHTS))
+        ages = rng.integers(0, 9, size=count)
+        # Tarif: prix de base ±15 %, un peu moins cher pour les véhicules anciens
+        rate_factors = rng.uniform(0.85, 1.15, size=count) * (1 - 0.02 * ages)
+        mileages = np.round(ages * rng.uniform(8_000, 25_000, size=count) + rng.uniform(0, 5_000, size=count))
+
+        vehicles: Dict[str, Vehicle] = {}
+        rows = zip(kinds.tolist(), car_models.tolist(), truck_models.tolist(), moto_models.tolist(),
+                   ages.tolist(), rate_factors.tolist(), mileages.tolist())
+        year = self.today.year
+        for index, (kind, car, truck, moto, age, factor, mileage) in enumerate(rows):
+            vehicle_id = f"V{index:07d}"
+            plate = _license_plate(index)
+            if kind == 0:
+                brand, model, category, rate, doors, seats, fuel, gearbox = CAR_MODELS[car]
+                vehicle = Car(
+                    brand=brand, model=model, category=category,
+                    daily_rate=round(rate * factor, 2), year=year - age, license_plate=plate,
+                    num_doors=doors, num_seats=seats, fuel_type=fuel, transmission=gearbox,
+                    mileage=mileage, vehicle_id=vehicle_id
+                )
+            elif kind == 1:
+                brand, model, rate, volume, weight, tail_lift = TRUCK_MODELS[truck]
+                vehicle = Truck(
+                    brand=brand, model=model, category=VehicleCategory.UTILITY,
+                    daily_rate=round(rate * factor, 2), year=year - age, license_plate=plate,
+                    cargo_capacity=volume, max_weight=weight, has_tail_lift=tail_lift,
+                    mileage=mileage, vehicle_id=vehicle_id
+                )
+            else:
+                brand, model, category, rate, engine, moto_type = MOTORCYCLE_MODELS[moto]
+                vehicle = Motorcycle(
+                    brand=brand, model=model, category=category,
+                    daily_rate=round(rate * factor, 2), year=year - age, license_plate=plate,
+                    engine_size=engine, motorcycle_type=moto_type,
+                    mileage=mileage // 3, vehicle_id=vehicle_id
+                )
+            vehicles[vehicle_id] = vehicle
+        return vehicles
+
+    # === Clients ===
+
+    def generate_customers(self, count: int) -> Dict[str, Customer]:
+        """
+        Génère des clients (âges, permis et dates d'obtention réalistes).
+
+        Args:
+            count: Nombre de clients
+
+        Returns:
+            Dictionnaire des clients {id: customer}, sans historique
+        """
+        rng = np.random.default_rng(self._customer_seed)
+        today = self.today.toordinal()
+
+        bands = rng.choice(len(AGE_BANDS), size=count, p=_normalized([band[2] for band in AGE_BANDS]))
+        low = np.array([band[0] for band in AGE_BANDS])[bands]
+        high = np.array([band[1] for band in AGE_BANDS])[bands] + 1
+        ages = low + rng.random(count) * (high - low)
+        birth = today - np.floor(ages * 365.2425).astype(np.int64)
+
+        # Permis B obtenu peu après 18 ans (quelques permis très récents)
+        license_age = 18 + rng.exponential(1.5, size=count)
+        license_age = np.minimum(license_age, ages - rng.random(count) * 0.5)
+        license_day = np.minimum(birth + np.floor(license_age * 365.2425).astype(np.int64), today)
+
+        draws = rng.random((count, 4))
+        has_b = draws[:, 0] < LICENSE_B_SHARE
+        has_a = (draws[:, 1] < LICENSE_A_SHARE) & (ages >= 20)
+        has_a1 = has_a | (draws[:, 1] > 1 - LICENSE_A1_SHARE)
+        has_c = (draws[:, 2] < LICENSE_C_SHARE) & (ages >= 21)
+        has_c1 = has_c | (draws[:, 2] > 1 - LICENSE_C1_SHARE)
+        blocked = draws[:, 3] < BLOCKED_SHARE
+
+        first_names = rng.integers(0, len(FIRST_NAMES), size=count)
+        last_names = rng.integers(0, len(LAST_NAMES), size=count)
+        license_numbers = rng.integers(10**11, 10**12, size=count)
+        phones = rng.integers(0, 10**8, size=count)
+        mobile = rng.choice((6, 7), size=count)
+        addresses = rng.integers(1, 200, size=count)
+        streets = rng.integers(0, len(STREETS), size=count)
+        cities = rng.integers(0, len(CITIES), size=count)
+        reasons = rng.integers(0, len(BLOCKED_REASONS), size=count)
+
+        from_ordinal = date.fromordinal
+        customers: Dict[str, Customer] = {}
+        rows = zip(
+            first_names.tolist(), last_names.tolist(), birth.tolist(), license_day.tolist(),
+            has_b.tolist(), has_a.tolist(), has_a1.tolist(), has_c.tolist(), has_c1.tolist(),
+            license_numbers.tolist(), phones.tolist(), mobile.tolist(),
+            addresses.tolist(), streets.tolist(), cities.tolist(), blocked.tolist(), reasons.tolist()
+        )
+        with gc_paused():
+            for index, (first, last, born, licensed, b, a, a1, c, c1, number, phone, prefix,
+                        street_number, street, city, is_blocked, reason) in enumerate(rows):
+                first_name = FIRST_NAMES[first]
+                last_name = LAST_NAMES[last]
+                licenses = {kind for kind, held in (("B", b), ("A", a), ("A1", a1), ("C", c), ("C1", c1))
+                            if held}
+                customer_id = f"C{index:07d}"
+                customer = Customer(
+                    first_name=first_name,
+                    last_name=last_name,
+                    birth_date=from_ordinal(born),
+                    license_number=str(number),
+                    license_types=licenses or {"B"},
+                    license_date=from_ordinal(licensed),
+                    email=f"{_ascii(first_name)}.{_ascii(last_name)}.{index}@exemple.fr",
+                    phone=f"0{prefix}{phone:08d}",
+                    address=f"{street_number} {STREETS[street]}, {CITIES[city]}",
+                    customer_id=customer_id
+                )
+                if is_blocked:
+                    customer.block(BLOCKED_REASONS[reason])
+                customers[customer_id] = customer
+        return customers
+
+    # === Locations ===
+
+    def generate_rentals(
+        self,
+        vehicles: Dict[str, Vehicle],
+        customers: Dict[str, Customer],
+        history_days: int = 730
+    ) -> Dict[str, Rental]:
+        """
+        Génère l'historique et les réservations de chaque véhicule.
+
+        Met aussi à jour les véhicules (kilométrage, état loué, maintenance)
+        et l'historique des clients.
+
+        Args:
+            vehicles: Flotte (générée ou non)
+            customers: Clients (générés ou non)
+            history_days: Profondeur de l'historique, en jours
+
+        Returns:
+            Dictionnaire des locations {id: rental}, identifiants dans l'ordre
+            chronologique
+        """
+        rng = np.random.default_rng(self._rental_seed)
+        vehicle_list = list(vehicles.values())
+        customer_list = list(customers.values())
+        today = self.today.toordinal()
+        first_day = today - history_days
+        last_day = today + BOOKING_HORIZON_DAYS
+
+        # Séquences de locations par blocs de véhicules
+        columns = int((last_day - first_day + MAX_DURATION_DAYS) / (MEAN_CYCLE_DAYS * 0.7)) + 8
+        chunk = max(CHUNK_CELLS // columns, 1)
+        parts = [
+            self._vehicle_sequences(rng, offset, min(offset + chunk, len(vehicle_list)),
+                                    columns, first_day, last_day, today)
+            for offset in range(0, len(vehicle_list), chunk)
+        ]
+        if parts:
+            (vehicle_index, start, end, status, returned, late, start_mileage,
+             distance) = (np.concatenate(arrays) for arrays in zip(*parts))
+        else:
+            vehicle_index = start = end = status = returned = late = np.zeros(0, dtype=np.int64)
+            start_mileage = distance = np.zeros(0)
+
+        customer_index = self._assign_customers(rng, vehicle_list, customer_list, vehicle_index, today)
+        keep = customer_index >= 0
+        if not keep.all():
+            logger.warning(f"{int((~keep).sum())} locations sans client autorisé ignorées")
+            (vehicle_index, start, end, status, returned, late, start_mileage, distance,
+             customer_index) = (array[keep] for array in (
+                vehicle_index, start, end, status, returned, late, start_mileage, distance,
+                customer_index))
+
+        # Identifiants dans l'ordre chronologique
+        order = np.lexsort((vehicle_index, start))
+        (vehicle_index, start, end, status, returned, late, start_mileage, distance,
+         customer_index) = (array[order] for array in (
+            vehicle_index, start, end, status, returned, late, start_mileage, distance,
+            customer_index))
+
+        discount = self._loyalty_discounts(customer_index, len(customer_list))
+        rates = np.array([vehicle.daily_rate for vehicle in vehicle_list])[vehicle_index]
+        # Compteur au départ: kilométrage initial du véhicule plus ses locations terminées
+        start_mileage += np.array([vehicle.mileage for vehicle in vehicle_list])[vehicle_index]
+        # Réservation faite quelques jours avant le début (au plus tard aujourd'hui), en journée
+        lead_days = rng.geometric(0.12, size=len(start)) - 1
+        created = ((np.minimum(start - lead_days, today) - _EPOCH_ORDINAL) * 86_400
+                   + rng.integers(8 * 3600, 20 * 3600, size=len(start)))
+
+        rentals = self._build_rentals(
+            vehicle_list, customer_list, vehicle_index, customer_index, start, end, status,
+            returned, late, start_mileage, distance, discount, rates, created
+        )
+        self._update_entities(vehicle_list, customer_list, rentals, vehicle_index, customer_index,
+                              status, start_mileage + distance, rng)
+        return rentals
+
+    def _vehicle_sequences(
+        self,
+        rng: np.random.Generator,
+        first: int,
+        last: int,
+        columns: int,
+        first_day: int,
+        last_day: int,
+        today: int
+    ) -> Tuple[np.ndarray, ...]:
+        """
+        Tire les locations sans chevauchement des véhicules [first, last).
+
+        Chaque ligne d'une matrice (véhicules × locations) est la suite des
+        locations d'un véhicule; les cases hors de la période sont écartées
+        à la fin.
+        """
+        count = last - first
+        shape = (count, columns)
+        durations = np.clip(
+            np.rint(rng.lognormal(np.log(DURATION_MEDIAN_DAYS), DURATION_SIGMA, size=shape)),
+            1, MAX_DURATION_DAYS
+        ).astype(np.int64)
+        demand = rng.uniform(*GAP_P_RANGE, size=(count, 1))
+        gaps = rng.geometric(demand, size=shape).astype(np.int64)
+
+        # Début de chaque location: après la fin de la précédente et l'inactivité
+        origin = first_day - MAX_DURATION_DAYS - rng.integers(0, 30, size=(count, 1))
+        start = origin + np.cumsum(durations + gaps, axis=1) - durations
+        end = start + durations - 1
+        next_start = np.empty_like(start)
+        next_start[:, :-1] = start[:, 1:]
+        next_start[:, -1] = np.iinfo(np.int64).max // 2
+
+        draws = rng.random(shape)
+        status = np.full(shape, _COMPLETED, dtype=np.int8)
+        status[end >= today] = _ACTIVE
+        future = start > today
+        status[future] = np.where(draws[future] < FUTURE_CANCELLATION_RATE, _CANCELLED, _RESERVED)
+        past = end < today
+        status[past & (draws < PAST_CANCELLATION_RATE)] = _CANCELLED
+
+        # Retours en retard: jamais au-delà du début suivant ni d'aujourd'hui
+        late = np.zeros(shape, dtype=np.int64)
+        completed = status == _COMPLETED
+        late_draws = rng.random(shape)
+        is_late = completed & (late_draws < LATE_RETURN_RATE)
+        late_days = rng.integers(1, MAX_DAYS_LATE + 1, size=shape)
+        late = np.where(is_late, np.minimum(late_days, np.minimum(next_start - end - 1, today - end)), 0)
+        late = np.maximum(late, 0)
+
+        # Locations finies depuis peu, pas encore rendues (en retard)
+        overdue = (completed & (end >= today - OVERDUE_WINDOW_DAYS) & (next_start > today)
+                   & (late_draws > 1 - OVERDUE_RATE))
+        status[overdue] = _ACTIVE
+        late[overdue] = 0
+        completed &= ~overdue
+
+        returned = np.where(completed, end + late, -1)
+
+        # Kilométrage: compteur cumulé des locations terminées
+        daily_km = rng.uniform(60, 220, size=(count, 1))
+        distance = np.where(
+            completed,
+            np.rint((end + late - start + 1) * daily_km * rng.uniform(0.4, 1.4, size=shape)),
+            0.0
+        )
+        start_mileage = np.cumsum(distance, axis=1) - distance
+
+        kept = (end >= first_day) & (start <= last_day)
+        vehicle_index = np.broadcast_to(np.arange(first, last)[:, None], shape)
+        return (vehicle_index[kept], start[kept], end[kept], status[kept], returned[kept],
+                late[kept], start_mileage[kept], distance[kept])
+
+    def _assign_customers(
+        self,
+        rng: np.random.Generator,
+        vehicles: List[Vehicle],
+        customers: List[Customer],
+        vehicle_index: np.ndarray,
+        today: int
+    ) -> np.ndarray:
+        """
+        Tire le client de chaque location parmi ceux qui peuvent conduire le véhicule.
+
+        La popularité des clients suit une loi de Zipf: quelques clients
+        fidèles louent beaucoup. Les clients bloqués ne louent pas.
+
+        Returns:
+            Index du client de chaque location (-1 si aucun client autorisé)
+        """
+        result = np.full(len(vehicle_index), -1, dtype=np.int64)
+        if not customers or not len(vehicle_index):
+            return result
+
+        reference = date.fromordinal(today)
+        ages = np.array([calculate_years_difference(customer.birth_date, reference)
+                         for customer in customers])
+        licensed_years = np.array([calculate_years_difference(customer.license_date, reference)
+                                   for customer in customers])
+        blocked = np.array([customer.is_blocked for customer in customers])
+        popularity = 1.0 / (rng.permutation(len(customers)) + 10.0) ** 0.9
+        license_holders: Dict[str, np.ndarray] = {}
+
+        rules: Dict[Tuple[str, int], int] = {}
+        vehicle_rule = np.array([
+            rules.setdefault((vehicle.get_required_license(), vehicle.get_minimum_driver_age()), len(rules))
+            for vehicle in vehicles
+        ])
+        rental_rule = vehicle_rule[vehicle_index]
+        for (license_type, minimum_age), rule in rules.items():
+            if license_type not in license_holders:
+                license_holders[license_type] = np.array(
+                    [customer.has_license(license_type) for customer in customers])
+            eligible = np.flatnonzero(
+                license_holders[license_type] & (ages >= minimum_age) & (licensed_years >= 1) & ~blocked)
+            positions = np.flatnonzero(rental_rule == rule)
+            if not len(eligible) or not len(positions):
+                continue
+            weights = popularity[eligible]
+            result[positions] = rng.choice(eligible, size=len(positions), p=weights / weights.sum())
+        return result
+
+    @staticmethod
+    def _loyalty_discounts(customer_index: np.ndarray, num_customers: int) -> np.ndarray:
+        """Réduction fidélité de chaque location, selon les locations précédentes du client."""
+        discount = np.zeros(len(customer_index))
+        if not len(customer_index):
+            return discount
+        # Rang de chaque location parmi celles de son client (ordre chronologique)
+        order = np.argsort(customer_index, kind="stable")
+        counts = np.bincount(customer_index, minlength=num_customers)
+        group_start = np.repeat(np.cumsum(counts) - counts, counts)
+        rank = np.empty(len(customer_index), dtype=np.int64)
+        rank[order] = np.arange(len(customer_index)) - group_start
+        for min_rentals, rate in reversed(LOYALTY_TIERS):
+            discount[rank >= min_rentals] = rate
+        return discount
+
+    def _build_rentals(
+        self,
+        vehicles: List[Vehicle],
+        customers: List[Customer],
+        vehicle_index: np.ndarray,
+        customer_index: np.ndarray,
+        start: np.ndarray,
+        end: np.ndarray,
+        status: np.ndarray,
+        returned: np.ndarray,
+        late: np.ndarray,
+        start_mileage: np.ndarray,
+        distance: np.ndarray,
+        discount: np.ndarray,
+        rates: np.ndarray,
+        created: np.ndarray
+    ) -> Dict[str, Rental]:
+        """Construit les locations à partir des tableaux, par Rental.restore."""
+        if not len(start):
+            return {}
+        # Une seule instance de date par jour, partagée par toutes les locations
+        first_day = int(start.min())
+        last_day = int(max(end.max(), returned.max()))
+        days = [date.fromordinal(ordinal) for ordinal in range(first_day, last_day + 1)]
+        returned_offset = np.where(returned >= 0, returned - first_day, -1).tolist()
+        created_at = created.astype("datetime64[s]").astype(object).tolist()
+        vehicle_ids = [vehicle.id for vehicle in vehicles]
+        customer_ids = [customer.id for customer in customers]
+        completed = status == _COMPLETED
+        end_mileage = np.where(completed, start_mileage + distance, np.nan).tolist()
+        penalty = (late * Rental.LATE_RETURN_PENALTY_PER_DAY).tolist()
+
+        restore = Rental.restore
+        rentals: Dict[str, Rental] = {}
+        rows = zip(
+            vehicle_index.tolist(), customer_index.tolist(), (start - first_day).tolist(),
+            (end - first_day).tolist(), returned_offset, status.tolist(), rates.tolist(),
+            discount.tolist(), penalty, start_mileage.tolist(), end_mileage, created_at
+        )
+        with gc_paused():
+            for index, (vehicle, customer, start_offset, end_offset, return_offset, code, rate,
+                        loyalty, fee, mileage, final_mileage, created_on) in enumerate(rows):
+                rental_id = f"R{index:08d}"
+                rentals[rental_id] = restore(
+                    rental_id, customer_ids[customer], vehicle_ids[vehicle],
+                    days[start_offset], days[end_offset],
+                    days[return_offset] if return_offset >= 0 else None,
+                    _STATUSES[code], rate, mileage,
+                    None if final_mileage != final_mileage else final_mileage,
+                    fee, created_on, "", loyalty
+                )
+        return rentals
+
+    @staticmethod
+    def _update_entities(
+        vehicles: List[Vehicle],
+        customers: List[Customer],
+        rentals: Dict[str, Rental],
+        vehicle_index: np.ndarray,
+        customer_index: np.ndarray,
+        status: np.ndarray,
+        odometer: np.ndarray,
+        rng: np.random.Generator
+    ) -> None:
+        """Reporte les locations sur les véhicules (kilométrage, état) et les clients."""
+        if len(vehicles):
+            # Kilométrage: compteur au retour de la dernière location terminée
+            mileage = np.array([vehicle.mileage for vehicle in vehicles])
+            np.maximum.at(mileage, vehicle_index, odometer)
+            rented = np.zeros(len(vehicles), dtype=bool)
+            rented[vehicle_index[status == _ACTIVE]] = True
+            immobilized = rng.random(len(vehicles))
+            for index, (vehicle, final_mileage) in enumerate(zip(vehicles, mileage.tolist())):
+                vehicle.mileage = final_mileage
+                if rented[index]:
+                    vehicle.state = VehicleState.RENTED
+                elif immobilized[index] < MAINTENANCE_SHARE:
+                    vehicle.state = VehicleState.MAINTENANCE
+                elif immobilized[index] < MAINTENANCE_SHARE + OUT_OF_SERVICE_SHARE:
+                    vehicle.state = VehicleState.OUT_OF_SERVICE
+
+        # Historique des clients, dans l'ordre chronologique des locations
+        rental_ids = list(rentals)
+        order = np.argsort(customer_index, kind="stable").tolist()
+        counts = np.bincount(customer_index, minlength=len(customers)).tolist() if len(customers) else []
+        is_open = ((status == _RESERVED) | (status == _ACTIVE)).tolist()
+        position = 0
+        for customer, count in zip(customers, counts):
+            if not count:
+                continue
+            own = order[position:position + count]
+            position += count
+            customer.restore_state(
+                rental_history=[rental_ids[i] for i in own],
+                active_rentals=[rental_ids[i] for i in own if is_open[i]],
+                is_blocked=customer.is_blocked,
+                blocked_reason=customer.blocked_reason
+            )
+
+
+def _normalized(weights) -> np.ndarray:
+    weights = np.asarray(weights, dtype=float)
+    return weights / weights.sum()
+
+
+def _license_plate(index: int) -> str:
+    """Immatriculation unique au format AA-123-AA, déduite de l'index."""
+    letters = "ABCDEFGHJKLMNPQRSTVWXYZ"  # Sans I, O ni U, comme en France
+    number = index % 999 + 1
+    index //= 999
+    suffix = letters[index % len(letters)] + letters[index // len(letters) % len(letters)]
+    index //= len(letters) ** 2
+    prefix = letters[index // len(letters) % len(letters)] + letters[index % len(letters)]
+    return f"{prefix}-{number:03d}-{suffix}"
+
+
+def _ascii(text: str) -> str:
+    """Version minuscule et sans accents d'un nom (pour les adresses email)."""
+    replacements = str.maketrans("àâäçéèêëîïôöùûüÿ", "aaaceeeeiioouuuy")
+    return text.lower().translate(replacements).replace(" ", "-")
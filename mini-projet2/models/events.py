@@ -0,0 +1,247 @@
+"""
+Module des événements du système et de leur bus de publication.
+
+Chaque modification du système publie des événements typés qui ne portent
+que des identifiants (véhicule, client, location): les abonnés relisent
+l'entité s'ils en ont besoin, et peuvent ne mettre à jour que ce qui a
+changé au lieu de tout recharger.
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Tuple, Type, Union
+
+logger = logging.getLogger(__name__)
+
+
+# === Événements ===
+
+@dataclass(frozen=True)
+class SystemEvent:
+    """Événement de base (s'abonner à ce type reçoit tous les événements)."""
+
+
+@dataclass(frozen=True)
+class DataReloaded(SystemEvent):
+    """Les données ont été remplacées en bloc (chargement, historique)."""
+
+
+@dataclass(frozen=True)
+class VehicleEvent(SystemEvent):
+    """Événement concernant un véhicule."""
+    vehicle_id: str
+
+
+@dataclass(frozen=True)
+class VehicleAdded(VehicleEvent):
+    """Véhicule ajouté à la flotte."""
+
+
+@dataclass(frozen=True)
+class VehicleRemoved(VehicleEvent):
+    """Véhicule retiré de la flotte."""
+
+
+@dataclass(frozen=True)
+class VehicleUpdated(VehicleEvent):
+    """Véhicule modifié (marque, modèle, tarif, état...)."""
+
+
+@dataclass(frozen=True)
+class CustomerEvent(SystemEvent):
+    """Événement concernant un client."""
+    customer_id: str
+
+
+@dataclass(frozen=True)
+class CustomerAdded(CustomerEvent):
+    """Client ajouté."""
+
+
+@dataclass(frozen=True)
+class CustomerRemoved(CustomerEvent):
+    """Client retiré."""
+
+
+@dataclass(frozen=True)
+class CustomerUpdated(CustomerEvent):
+    """Client modifié (coordonnées, permis...)."""
+
+
+@dataclass(frozen=True)
+class CustomerBlocked(CustomerEvent):
+    """Client bloqué."""
+
+
+@dataclass(frozen=True)
+class CustomerUnblocked(CustomerEvent):
+    """Client débloqué."""
+
+
+@dataclass(frozen=True)
+class RentalEvent(SystemEvent):
+    """Événement concernant une location (avec son client et son véhicule)."""
+    rental_id: str
+    customer_id: str
+    vehicle_id: str
+
+
+@dataclass(frozen=True)
+class RentalCreated(RentalEvent):
+    """Location créée (réservée, ou démarrée si elle commence aujourd'hui)."""
+
+
+@dataclass(frozen=True)
+class RentalStarted(RentalEvent):
+    """Location démarrée: le véhicule est loué."""
+
+
+@dataclass(frozen=True)
+class RentalCompleted(RentalEvent):
+    """Location terminée: le véhicule est rendu."""
+
+
+@dataclass(frozen=True)
+class RentalCancelled(RentalEvent):
+    """Location annulée."""
+
+
+@dataclass(frozen=True)
+class RentalExtended(RentalEvent):
+    """Date de fin d'une location repoussée."""
+
+
+@dataclass(frozen=True)
+class RentalUpdated(RentalEvent):
+    """Location modifiée (date de fin avancée, notes)."""
+
+
+EventTypes = Union[Type[SystemEvent], Tuple[Type[SystemEvent], ...]]
+
+
+# === Bus ===
+
+class EventBus:
+    """
+    Bus de publication/abonnement des événements du système.
+
+    Un abonné choisit les types d'événements qu'il reçoit (un type parent
+    couvre ses sous-types) et la forme de la livraison:
+    - subscribe(): un appel par événement;
+    - subscribe_batch(): un appel par livraison, avec la liste des
+      événements livrés ensemble.
+
+    Dans un bloc batch(), les événements publiés par le thread courant sont
+    retenus puis livrés en une seule fois à la sortie du bloc le plus
+    externe. Les exceptions des abonnés sont journalisées sans interrompre
+    la livraison aux autres abonnés.
+    """
+
+    def __init__(self):
+        self._handlers: List[Tuple[EventTypes, Callable, bool]] = []
+        self._handlers_lock = threading.Lock()
+        self._local = threading.local()
+
+    # --- Abonnements ---
+
+    def subscribe(
+        self,
+        event_types: EventTypes,
+        handler: Callable[[SystemEvent], None]
+    ) -> None:
+        """
+        Abonne une fonction, appelée pour chaque événement des types donnés.
+
+        Args:
+            event_types: Type ou tuple de types d'événements
+            handler: Fonction appelée avec l'événement
+        """
+        with self._handlers_lock:
+            self._handlers.append((event_types, handler, False))
+
+    def subscribe_batch(
+        self,
+        handler: Callable[[List[SystemEvent]], None],
+        event_types: EventTypes = SystemEvent
+    ) -> None:
+        """
+        Abonne une fonction, appelée une fois par livraison.
+
+        Args:
+            handler: Fonction appelée avec la liste des événements livrés
+                (jamais vide)
+            event_types: Type ou tuple de types d'événements (tous par défaut)
+        """
+        with self._handlers_lock:
+            self._handlers.append((event_types, handler, True))
+
+    def unsubscribe(self, handler: Callable) -> None:
+        """Désabonne une fonction (de tous ses abonnements)."""
+        with self._handlers_lock:
+            self._handlers = [entry for entry in self._handlers if entry[1] != handler]
+
+    # --- Publication ---
+
+    def publish(self, *events: SystemEvent) -> None:
+        """
+        Publie des événements (retenus si un lot est ouvert dans ce thread).
+
+        Args:
+            *events: Événements, livrés dans l'ordre
+        """
+        if not events:
+            return
+        if self._batch_depth() > 0:
+            self._local.pending.extend(events)
+        else:
+            self._deliver(list(events))
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Regroupe les événements publiés dans le bloc en une seule livraison.
+
+        Les blocs peuvent être imbriqués: seule la sortie du plus externe
+        livre les événements, même si le bloc se termine par une exception
+        (les modifications déjà faites ont eu lieu).
+        """
+        if self._batch_depth() == 0:
+            self._local.pending = []
+        self._local.depth = self._batch_depth() + 1
+        try:
+            yield
+        finally:
+            self._local.depth -= 1
+            if self._local.depth == 0:
+                events, self._local.pending = self._local.pending, []
+                if events:
+                    self._deliver(events)
+
+    def _batch_depth(self) -> int:
+        return getattr(self._local, 'depth', 0)
+
+    def _deliver(self, events: List[SystemEvent]) -> None:
+        """Livre des événements à chaque abonné concerné."""
+        with self._handlers_lock:
+            handlers = list(self._handlers)
+
+        for event_types, handler, batched in handlers:
+            matching = [event for event in events if isinstance(event, event_types)]
+            if not matching:
+                continue
+            if batched:
+                self._call(handler, matching)
+            else:
+                # Une erreur sur un événement n'empêche pas la livraison des suivants
+                for event in matching:
+                    self._call(handler, event)
+
+    @staticmethod
+    def _call(handler: Callable, argument) -> None:
+        """Appelle un abonné en journalisant son éventuelle exception."""
+        try:
+            handler(argument)
+        except Exception:
+            logger.exception(f"Erreur d'un abonné aux événements ({handler!r})")
@@ -263,3 +263,14 @@ class DataSaveError(PersistenceError):
             code="DATA_SAVE_ERROR"
         )
         self.filepath = filepath
+
+
+class SnapshotError(PersistenceError):
+    """Snapshot binaire illisible, corrompu ou de version non supportée."""
+    
+    def __init__(self, reason: str):
+        super().__init__(
+            f"Snapshot invalide: {reason}",
+            code="SNAPSHOT_ERROR"
+        )
+        self.reason = reason
@@ -0,0 +1,279 @@
+"""
+Module du catalogue de flotte en lecture seule, projeté en mémoire.
+
+Le catalogue est un fichier à enregistrements de taille fixe, triés par ID,
+suivis d'un tas de chaînes UTF-8 (ID, marque, modèle, immatriculation).
+Il est lu via mmap: plusieurs processus partagent la même copie en cache
+disque, et rien n'est désérialisé à l'ouverture. Seuls les enregistrements
+consultés sont décodés.
+
+Format (version 1, little-endian):
+    En-tête:         magic (6 octets) | version (u16) | nb véhicules (u32)
+    Enregistrement:  ID, marque, modèle, immatriculation (offset u32 puis
+                     longueur u16 dans le tas) | type (u8) | catégorie (u8)
+                     | état (u8) | tarif journalier (f64) | kilométrage (f64)
+                     | année (u16)
+    Tas:             chaînes UTF-8 concaténées
+"""
+
+import mmap
+import struct
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set
+
+from models.vehicle import Vehicle, Car, Truck, Motorcycle, VehicleCategory, VehicleState
+from models.exceptions import DataLoadError
+
+CATALOG_MAGIC = b"RCFLT\x00"
+CATALOG_VERSION = 1
+
+_HEADER = struct.Struct("<6sHI")
+_RECORD = struct.Struct("<4I4H3Bxdd H6x")
+
+# Codes stockés dans le fichier (l'ordre fait partie du format)
+_TYPES: List[str] = [Car.VEHICLE_TYPE, Truck.VEHICLE_TYPE, Motorcycle.VEHICLE_TYPE]
+_CATEGORIES: List[VehicleCategory] = list(VehicleCategory)
+_STATES: List[VehicleState] = list(VehicleState)
+_TYPE_CODES = {name: code for code, name in enumerate(_TYPES)}
+_CATEGORY_CODES = {category: code for code, category in enumerate(_CATEGORIES)}
+_STATE_CODES = {state: code for code, state in enumerate(_STATES)}
+
+
+class MappedVehicle(NamedTuple):
+    """Vue en lecture seule d'un véhicule du catalogue."""
+    id: str
+    vehicle_type: str
+    brand: str
+    model: str
+    category: VehicleCategory
+    state: VehicleState
+    daily_rate: float
+    year: int
+    license_plate: str
+    mileage: float
+
+    def get_vehicle_type(self) -> str:
+        return self.vehicle_type
+
+    def is_available(self) -> bool:
+        return self.state == VehicleState.AVAILABLE
+
+
+def export_fleet_catalog(vehicles: Dict[str, Vehicle], path: str | Path) -> int:
+    """
+    Écrit le catalogue de la flotte (via un fichier temporaire renommé).
+
+    Le renommage laisse les lecteurs déjà ouverts sur l'ancienne version.
+
+    Args:
+        vehicles: Dictionnaire des véhicules {id: vehicle}
+        path: Fichier de destination
+
+    Returns:
+        Taille du catalogue en octets
+    """
+    path = Path(path)
+    ordered = sorted(vehicles.values(), key=lambda v: v.id.encode('utf-8'))
+
+    heap = bytearray()
+    records = bytearray()
+
+    def add_string(value: str) -> tuple:
+        encoded = value.encode('utf-8')
+        offset = len(heap)
+        heap.extend(encoded)
+        return offset, len(encoded)
+
+    for vehicle in ordered:
+        id_ref, brand_ref, model_ref, plate_ref = (
+            add_string(vehicle.id), add_string(vehicle.brand),
+            add_string(vehicle.model), add_string(vehicle.license_plate)
+        )
+        records.extend(_RECORD.pack(
+            id_ref[0], brand_ref[0], model_ref[0], plate_ref[0],
+            id_ref[1], brand_ref[1], model_ref[1], plate_ref[1],
+            _TYPE_CODES[vehicle.get_vehicle_type()],
+            _CATEGORY_CODES[vehicle.category],
+            _STATE_CODES[vehicle.state],
+            vehicle.daily_rate, vehicle.mileage, vehicle.year
+        ))
+
+    data = _HEADER.pack(CATALOG_MAGIC, CATALOG_VERSION, len(ordered)) + records + heap
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
+    return len(data)
+
+
+class MappedFleet:
+    """
+    Lecteur du catalogue de flotte projeté en mémoire.
+
+    Propose les mêmes recherches que CarRentalSystem (get_vehicle,
+    search_vehicles, get_available_vehicles) et renvoie des MappedVehicle.
+    L'état des véhicules est celui du moment de l'export.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        try:
+            with open(self.path, 'rb') as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise DataLoadError(str(self.path), str(e))
+
+        if len(self._mmap) < _HEADER.size:
+            self.close()
+            raise DataLoadError(str(self.path), "fichier tronqué")
+        magic, version, count = _HEADER.unpack_from(self._mmap, 0)
+        if magic != CATALOG_MAGIC:
+            self.close()
+            raise DataLoadError(str(self.path), "ce n'est pas un catalogue de flotte")
+        if version != CATALOG_VERSION:
+            self.close()
+            raise DataLoadError(str(self.path), f"version {version} non supportée")
+
+        self._count = count
+        heap_start = _HEADER.size + count * _RECORD.size
+        if len(self._mmap) < heap_start:
+            self.close()
+            raise DataLoadError(str(self.path), "fichier tronqué")
+        self._view = memoryview(self._mmap)
+        self._records = self._view[_HEADER.size:heap_start]
+        self._heap = self._view[heap_start:]
+
+    def close(self) -> None:
+        """Libère la projection mémoire."""
+        for name in ('_records', '_heap', '_view'):
+            view = self.__dict__.pop(name, None)
+            if view is not None:
+                view.release()
+        if not self._mmap.closed:
+            self._mmap.close()
+
+    def __enter__(self) -> "MappedFleet":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    # === Décodage ===
+
+    def _string(self, offset: int, length: int) -> str:
+        return str(self._heap[offset:offset + length], 'utf-8')
+
+    def _make_vehicle(self, record: tuple) -> MappedVehicle:
+        (id_off, brand_off, model_off, plate_off,
+         id_len, brand_len, model_len, plate_len,
+         type_code, category_code, state_code, daily_rate, mileage, year) = record
+        return MappedVehicle(
+            self._string(id_off, id_len), _TYPES[type_code],
+            self._string(brand_off, brand_len), self._string(model_off, model_len),
+            _CATEGORIES[category_code], _STATES[state_code], daily_rate, year,
+            self._string(plate_off, plate_len), mileage
+        )
+
+    def _iter_records(self) -> Iterator[tuple]:
+        return _RECORD.iter_unpack(self._records)
+
+    # === Recherches ===
+
+    def get_vehicle(self, vehicle_id: str) -> Optional[MappedVehicle]:
+        """Récupère un véhicule par son ID (recherche dichotomique)."""
+        target = vehicle_id.encode('utf-8')
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            record = _RECORD.unpack_from(self._records, middle * _RECORD.size)
+            current = bytes(self._heap[record[0]:record[0] + record[4]])
+            if current < target:
+                low = middle + 1
+            elif current > target:
+                high = middle
+            else:
+                return self._make_vehicle(record)
+        return None
+
+    def get_all_vehicles(self) -> List[MappedVehicle]:
+        """Retourne tous les véhicules du catalogue."""
+        return [self._make_vehicle(record) for record in self._iter_records()]
+
+    def search_vehicles(
+        self,
+        brand: Optional[str] = None,
+        model: Optional[str] = None,
+        max_daily_rate: Optional[float] = None,
+        min_year: Optional[int] = None
+    ) -> List[MappedVehicle]:
+        """
+        Recherche des véhicules selon plusieurs critères.
+
+        Les critères numériques sont testés avant de décoder les chaînes.
+
+        Args:
+            brand: Marque recherchée
+            model: Modèle recherché
+            max_daily_rate: Tarif maximum journalier
+            min_year: Année minimum
+
+        Returns:
+            Liste des véhicules correspondants
+        """
+        brand = brand.lower() if brand else None
+        model = model.lower() if model else None
+        results = []
+
+        for record in self._iter_records():
+            if max_daily_rate and record[11] > max_daily_rate:
+                continue
+            if min_year and record[13] < min_year:
+                continue
+            if brand and brand not in self._string(record[1], record[5]).lower():
+                continue
+            if model and model not in self._string(record[2], record[6]).lower():
+                continue
+            results.append(self._make_vehicle(record))
+
+        return results
+
+    def get_available_vehicles(
+        self,
+        vehicle_type: Optional[str] = None,
+        category: Optional[VehicleCategory] = None,
+        unavailable_ids: Optional[Set[str]] = None
+    ) -> List[MappedVehicle]:
+        """
+        Retourne les véhicules disponibles selon les critères.
+
+        Le catalogue ne contient pas les locations: pour une période donnée,
+        passer les IDs des véhicules déjà réservés dans `unavailable_ids`.
+
+        Args:
+            vehicle_type: Type de véhicule (Voiture, Camion, Moto)
+            category: Catégorie de véhicule
+            unavailable_ids: IDs des véhicules à exclure
+
+        Returns:
+            Liste des véhicules disponibles
+        """
+        available_code = _STATE_CODES[VehicleState.AVAILABLE]
+        type_code = _TYPE_CODES.get(vehicle_type, -1) if vehicle_type else None
+        category_code = _CATEGORY_CODES[category] if category else None
+        results = []
+
+        for record in self._iter_records():
+            if record[10] != available_code:
+                continue
+            if type_code is not None and record[8] != type_code:
+                continue
+            if category_code is not None and record[9] != category_code:
+                continue
+            vehicle = self._make_vehicle(record)
+            if unavailable_ids and vehicle.id in unavailable_ids:
+                continue
+            results.append(vehicle)
+
+        return results
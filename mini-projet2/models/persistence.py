@@ -1,18 +1,32 @@
 """
 Module de persistance pour le système de location de voitures.
 Gère la sauvegarde et le chargement des données en JSON.
+
+Les locations peuvent aussi être stockées au format JSON Lines
+(un enregistrement par ligne), lu en flux pour limiter la mémoire, ou
+partitionnées: locations ouvertes d'un côté, historique par mois de l'autre
+(chargé à la demande, voir HistoricalRentalStore).
 """
 
+import hashlib
 import json
 import logging
+import shutil
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable, Iterator, Iterable, List
 
 from models import vehicle as vehicle_module
 from models.customer import Customer
 from models.rental import Rental, RentalStatus
-from models.exceptions import DataLoadError, DataSaveError
+from models.exceptions import DataLoadError, DataSaveError, SnapshotError
+from models.snapshot import read_snapshot, write_snapshot
+from models.mapped_fleet import MappedFleet, export_fleet_catalog
+from models.utils import gc_paused, memoized_date_parser
+from models.vehicle_codec import encode_vehicle, decode_vehicle
 
 # Références locales pour les classes de véhicules
 Car = vehicle_module.Car
@@ -24,6 +38,12 @@ VehicleState = vehicle_module.VehicleState
 # Configuration du logging
 logger = logging.getLogger(__name__)
 
+# Callback de progression: (locations chargées, octets lus, taille totale)
+ProgressCallback = Callable[[int, int, int], None]
+
+# Statuts (noms d'enum) des locations encore ouvertes
+OPEN_RENTAL_STATUSES = frozenset({RentalStatus.RESERVED.name, RentalStatus.ACTIVE.name})
+
 
 class DateTimeEncoder(json.JSONEncoder):
     """Encodeur JSON personnalisé pour les dates et datetime."""
@@ -46,6 +66,288 @@ def datetime_decoder(dct: Dict) -> Any:
     return dct
 
 
+def restore_rentals(records: Iterable[Dict]) -> Dict[str, Rental]:
+    """
+    Restaure en masse des locations sauvegardées (voir Rental.from_record).
+    
+    Les dates sont mémoïsées et le ramasse-miettes est suspendu pendant la
+    construction, ce qui rend ce chemin bien plus rapide que le constructeur.
+    
+    Args:
+        records: Enregistrements produits par to_dict
+        
+    Returns:
+        Dictionnaire des locations {id: rental}
+    """
+    parse_date = memoized_date_parser()
+    from_record = Rental.from_record
+    with gc_paused():
+        return {
+            item['id']: from_record(item, parse_date)
+            for item in records
+        }
+
+
+class HistoricalRentalStore:
+    """
+    Stockage des locations clôturées (terminées/annulées), partitionné par mois.
+    
+    Chaque mois est un fichier JSON Lines (AAAA-MM.jsonl), déterminé par la
+    date de retour effective (ou la date de fin prévue à défaut). Un index
+    indique quels mois concernent chaque client et chaque véhicule, ainsi
+    que le premier jour de début de chaque mois, afin de ne lire que les
+    partitions utiles. Les partitions lues sont gardées dans un cache LRU.
+    
+    Le magasin peut être lu depuis plusieurs threads (ex: rapports calculés
+    en arrière-plan): un verrou protège le cache et l'index.
+    
+    Attributes:
+        directory: Répertoire des partitions
+        cache_size: Nombre maximum de partitions gardées en mémoire
+        partitions_loaded: Nombre de partitions lues depuis le disque
+    """
+    
+    INDEX_FILE = "index.json"
+    DEFAULT_CACHE_SIZE = 12
+    
+    def __init__(self, directory: str | Path, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.cache_size = max(1, cache_size)
+        self.partitions_loaded = 0
+        self._cache: "OrderedDict[str, Dict[str, Rental]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._index = self._read_index()
+    
+    @staticmethod
+    def partition_key(rental: Rental) -> str:
+        """Retourne le mois (AAAA-MM) de la partition d'une location."""
+        return (rental.actual_return_date or rental.end_date).strftime("%Y-%m")
+    
+    @property
+    def index_path(self) -> Path:
+        return self.directory / self.INDEX_FILE
+    
+    def partition_path(self, month: str) -> Path:
+        return self.directory / f"{month}.jsonl"
+    
+    # === Index ===
+    
+    def _read_index(self) -> Dict[str, Dict]:
+        if not self.index_path.exists():
+            return {'partitions': {}, 'customers': {}, 'vehicles': {}, 'first_starts': {}}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except json.JSONDecodeError as e:
+            raise DataLoadError(str(self.index_path), f"JSON invalide: {e}")
+        # Index antérieur sans premiers jours: ces mois ne sont jamais écartés
+        index.setdefault('first_starts', {})
+        return index
+    
+    def _write_index(self) -> None:
+        with open(self.index_path, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f, ensure_ascii=False)
+    
+    def months(self) -> List[str]:
+        """Retourne les mois disponibles, triés."""
+        with self._lock:
+            return sorted(self._index['partitions'])
+    
+    def months_for_customer(self, customer_id: str) -> List[str]:
+        """Retourne les mois contenant des locations du client."""
+        with self._lock:
+            return sorted(self._index['customers'].get(customer_id, []))
+    
+    def months_for_vehicle(self, vehicle_id: str) -> List[str]:
+        """Retourne les mois contenant des locations du véhicule."""
+        with self._lock:
+            return sorted(self._index['vehicles'].get(vehicle_id, []))
+    
+    def months_in_period(self, start_date: date, end_date: date) -> List[str]:
+        """Retourne les mois disponibles recouvrant la période."""
+        first, last = start_date.strftime("%Y-%m"), end_date.strftime("%Y-%m")
+        return [m for m in self.months() if first <= m <= last]
+    
+    def months_occupied_in_period(self, start_date: date, end_date: date) -> List[str]:
+        """
+        Retourne les mois pouvant contenir une location qui recoupe la période.
+        
+        Une location clôturée est rangée au mois de son retour: il est au
+        plus tôt celui du début de la période. Les mois dont toutes les
+        locations commencent après la fin de la période sont écartés.
+        """
+        first, last_day = start_date.strftime("%Y-%m"), end_date.isoformat()
+        with self._lock:
+            first_starts = self._index['first_starts']
+            return [
+                m for m in self.months()
+                if m >= first and first_starts.get(m, "") <= last_day
+            ]
+    
+    def count(self) -> int:
+        """Nombre total de locations historisées."""
+        with self._lock:
+            return sum(self._index['partitions'].values())
+    
+    # === Lecture ===
+    
+    def _read_records(self, month: str) -> Dict[str, Dict]:
+        """Lit les enregistrements bruts d'une partition."""
+        path = self.partition_path(month)
+        records: Dict[str, Dict] = {}
+        if not path.exists():
+            return records
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        item = json.loads(line)
+                        records[item['id']] = item
+        except json.JSONDecodeError as e:
+            raise DataLoadError(str(path), f"JSON invalide: {e}")
+        return records
+    
+    def get_partition(self, month: str) -> Dict[str, Rental]:
+        """
+        Retourne les locations d'un mois, en les chargeant si nécessaire.
+        
+        Args:
+            month: Mois au format AAAA-MM
+            
+        Returns:
+            Dictionnaire des locations {id: rental}
+        """
+        with self._lock:
+            partition = self._cache.get(month)
+            if partition is not None:
+                self._cache.move_to_end(month)
+                return partition
+            
+            partition = self._load_partition(month)
+            self._cache[month] = partition
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            return partition
+    
+    def _load_partition(self, month: str) -> Dict[str, Rental]:
+        """Lit et restaure une partition, sans passer par le cache."""
+        try:
+            partition = restore_rentals(self._read_records(month).values())
+        except DataLoadError:
+            raise
+        except Exception as e:
+            raise DataLoadError(str(self.partition_path(month)), str(e))
+        self.partitions_loaded += 1
+        logger.info(f"Partition {month} chargée ({len(partition)} locations)")
+        return partition
+    
+    def iter_rentals(self, months: Iterable[str]) -> Iterator[Rental]:
+        """
+        Parcourt les locations des mois donnés.
+        
+        Un parcours plus long que le cache ne le remplit pas: il en
+        évincerait les partitions utiles pour ne garder que ses derniers
+        mois. Les partitions déjà en cache sont tout de même réutilisées.
+        
+        Le verrou n'est tenu que pendant l'obtention de chaque partition,
+        pas pendant le parcours.
+        """
+        months = list(months)
+        if len(months) <= self.cache_size:
+            for month in months:
+                yield from self.get_partition(month).values()
+            return
+        for month in months:
+            with self._lock:
+                partition = self._cache.get(month)
+                if partition is None:
+                    partition = self._load_partition(month)
+            yield from partition.values()
+    
+    # === Écriture ===
+    
+    def merge(self, rentals: Iterable[Rental]) -> int:
+        """
+        Ajoute ou met à jour des locations clôturées dans leurs partitions.
+        
+        Seules les partitions concernées dont le contenu change sont réécrites.
+        
+        Args:
+            rentals: Locations terminées ou annulées
+            
+        Returns:
+            Nombre de locations écrites (nouvelles ou modifiées)
+        """
+        return self.merge_records(DataPersistence._rental_to_record(rental) for rental in rentals)
+    
+    def merge_records(self, rentals: Iterable[Dict[str, Any]]) -> int:
+        """
+        Comme merge, pour des locations déjà converties en enregistrements.
+        
+        Args:
+            rentals: Enregistrements (DataPersistence._rental_to_record)
+            
+        Returns:
+            Nombre de locations écrites (nouvelles ou modifiées)
+        """
+        by_month: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for rental in rentals:
+            # Dates ISO: les 7 premiers caractères donnent le mois (AAAA-MM)
+            by_month[(rental['actual_return_date'] or rental['end_date'])[:7]].append(rental)
+        
+        with self._lock:
+            written = 0
+            for month, month_rentals in by_month.items():
+                records = self._read_records(month)
+                changed = 0
+                for record in month_rentals:
+                    if records.get(record['id']) != record:
+                        records[record['id']] = record
+                        changed += 1
+                if not changed:
+                    continue
+            
+                path = self.partition_path(month)
+                tmp_path = path.with_name(path.name + ".tmp")
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    for item in records.values():
+                        f.write(json.dumps(item, ensure_ascii=False))
+                        f.write("\n")
+                tmp_path.replace(path)
+            
+                self._index['partitions'][month] = len(records)
+                self._index['first_starts'][month] = min(
+                    item['start_date'] for item in records.values()
+                )
+                for item in records.values():
+                    for key, entity_id in (('customers', item['customer_id']),
+                                           ('vehicles', item['vehicle_id'])):
+                        months = self._index[key].setdefault(entity_id, [])
+                        if month not in months:
+                            months.append(month)
+                self._cache.pop(month, None)
+                written += changed
+            
+            if written:
+                self._write_index()
+            return written
+    
+    def clear(self) -> None:
+        """Supprime toutes les partitions."""
+        with self._lock:
+            self._cache.clear()
+            self._index = {'partitions': {}, 'customers': {}, 'vehicles': {}, 'first_starts': {}}
+            if self.directory.exists():
+                shutil.rmtree(self.directory)
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+
+def _load_rentals_worker(data_dir: str, rentals_format: str) -> Dict[str, Rental]:
+    """Charge les locations dans un processus séparé (voir DataPersistence.load_all)."""
+    return DataPersistence(data_dir, rentals_format).load_rentals()
+
+
 class DataPersistence:
     """
     Classe gérant la persistance des données du système de location.
@@ -57,21 +359,45 @@ class DataPersistence:
         vehicles_file: Fichier des véhicules
         customers_file: Fichier des clients
         rentals_file: Fichier des locations
+        rentals_format: Format des locations ("json", "jsonl" ou "partitioned")
     """
     
     DEFAULT_DATA_DIR = "data"
     VEHICLES_FILE = "vehicles.json"
     CUSTOMERS_FILE = "customers.json"
     RENTALS_FILE = "rentals.json"
+    RENTALS_JSONL_FILE = "rentals.jsonl"
+    SNAPSHOT_FILE = "snapshot.bin"
+    CATALOG_FILE = "fleet.catalog"
+    OPEN_RENTALS_FILE = "rentals_open.jsonl"
+    HISTORY_DIR = "rentals_history"
     
-    def __init__(self, data_dir: str | Path = DEFAULT_DATA_DIR):
+    RENTALS_FORMATS = ("json", "jsonl", "partitioned")
+    
+    def __init__(
+        self,
+        data_dir: str | Path = DEFAULT_DATA_DIR,
+        rentals_format: str = "json"
+    ):
         """
         Initialise le gestionnaire de persistance.
         
         Args:
             data_dir: Répertoire de stockage des données
+            rentals_format: Format de sauvegarde des locations
+                ("json" pour un tableau, "jsonl" pour une ligne par location,
+                "partitioned" pour séparer locations ouvertes et historique)
         """
+        if rentals_format not in self.RENTALS_FORMATS:
+            raise ValueError(f"Format de locations inconnu: {rentals_format}")
         self.data_dir = Path(data_dir)
+        self.rentals_format = rentals_format
+        self._history_store: Optional[HistoricalRentalStore] = None
+        # Empreinte du dernier contenu écrit/lu par fichier: (digest, mtime, taille)
+        self._digests: Dict[Path, tuple] = {}
+        self._write_stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {'written': 0, 'skipped': 0}
+        )
         self._ensure_data_dir()
     
     def _ensure_data_dir(self) -> None:
@@ -90,6 +416,94 @@ class DataPersistence:
     def rentals_path(self) -> Path:
         return self.data_dir / self.RENTALS_FILE
     
+    @property
+    def rentals_jsonl_path(self) -> Path:
+        return self.data_dir / self.RENTALS_JSONL_FILE
+    
+    @property
+    def snapshot_path(self) -> Path:
+        return self.data_dir / self.SNAPSHOT_FILE
+    
+    @property
+    def catalog_path(self) -> Path:
+        return self.data_dir / self.CATALOG_FILE
+    
+    @property
+    def open_rentals_path(self) -> Path:
+        return self.data_dir / self.OPEN_RENTALS_FILE
+    
+    @property
+    def history_store(self) -> HistoricalRentalStore:
+        """Stockage de l'historique des locations (format "partitioned")."""
+        if self._history_store is None:
+            self._history_store = HistoricalRentalStore(self.data_dir / self.HISTORY_DIR)
+        return self._history_store
+    
+    # === Détection des changements ===
+    
+    @staticmethod
+    def _digest(chunks: Iterable[bytes]) -> bytes:
+        """Calcule l'empreinte BLAKE2 d'un contenu."""
+        hasher = hashlib.blake2b(digest_size=16)
+        for chunk in chunks:
+            hasher.update(chunk)
+        return hasher.digest()
+    
+    def _remember_digest(self, path: Path, digest: bytes) -> None:
+        """Associe une empreinte à l'état actuel du fichier sur disque."""
+        stat = path.stat()
+        self._digests[path] = (digest, stat.st_mtime_ns, stat.st_size)
+    
+    def _is_unchanged(self, path: Path, digest: bytes) -> bool:
+        """Vérifie que le fichier contient déjà ce contenu (et n'a pas été modifié depuis)."""
+        known = self._digests.get(path)
+        if known is None or known[0] != digest or not path.exists():
+            return False
+        stat = path.stat()
+        return (known[1], known[2]) == (stat.st_mtime_ns, stat.st_size)
+    
+    def _write_if_changed(self, collection: str, path: Path, chunks: Iterable[str]) -> bool:
+        """
+        Écrit un contenu sérialisé, sauf s'il est identique au fichier existant.
+        
+        Args:
+            collection: Nom de la collection (pour les statistiques)
+            path: Fichier de destination
+            chunks: Morceaux de texte composant le fichier
+            
+        Returns:
+            True si le fichier a été écrit, False si l'écriture a été évitée
+        """
+        encoded = [chunk.encode('utf-8') for chunk in chunks]
+        digest = self._digest(encoded)
+        
+        if self._is_unchanged(path, digest):
+            self._write_stats[collection]['skipped'] += 1
+            logger.debug(f"{path.name} inchangé, écriture évitée")
+            return False
+        
+        with open(path, 'wb') as f:
+            f.writelines(encoded)
+        self._remember_digest(path, digest)
+        self._write_stats[collection]['written'] += 1
+        return True
+    
+    def get_write_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Retourne le nombre d'écritures effectuées et évitées par collection.
+        
+        Returns:
+            Dictionnaire {collection: {'written': n, 'skipped': n}}
+        """
+        return {name: dict(stats) for name, stats in self._write_stats.items()}
+    
+    def _read_json_file(self, path: Path) -> Any:
+        """Lit un fichier JSON et mémorise son empreinte."""
+        raw = path.read_bytes()
+        data = json.loads(raw)
+        self._remember_digest(path, self._digest([raw]))
+        return data
+    
     # === Sauvegarde ===
     
     def save_vehicles(self, vehicles: Dict[str, Any]) -> bool:
@@ -102,33 +516,16 @@ class DataPersistence:
         Returns:
             True si la sauvegarde a réussi
         """
+        return self._save_vehicle_records(encode_vehicle(vehicle) for vehicle in vehicles.values())
+    
+    def _save_vehicle_records(self, records: Iterable[Dict[str, Any]]) -> bool:
+        """Écrit des véhicules déjà convertis (voir export_records)."""
         try:
-            data = []
-            for vehicle in vehicles.values():
-                vehicle_data = vehicle.to_dict()
-                # Ajouter les informations spécifiques selon le type
-                if isinstance(vehicle, Car):
-                    vehicle_data['_class'] = 'Car'
-                    vehicle_data['num_doors'] = vehicle.num_doors
-                    vehicle_data['num_seats'] = vehicle.num_seats
-                    vehicle_data['fuel_type'] = vehicle.fuel_type
-                    vehicle_data['transmission'] = vehicle.transmission
-                elif isinstance(vehicle, Truck):
-                    vehicle_data['_class'] = 'Truck'
-                    vehicle_data['cargo_capacity'] = vehicle.cargo_capacity
-                    vehicle_data['max_weight'] = vehicle.max_weight
-                    vehicle_data['has_tail_lift'] = vehicle.has_tail_lift
-                elif isinstance(vehicle, Motorcycle):
-                    vehicle_data['_class'] = 'Motorcycle'
-                    vehicle_data['engine_size'] = vehicle.engine_size
-                    vehicle_data['motorcycle_type'] = vehicle.motorcycle_type
-                
-                data.append(vehicle_data)
+            data = list(records)
+            content = json.dumps(data, cls=DateTimeEncoder, indent=2, ensure_ascii=False)
             
-            with open(self.vehicles_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, cls=DateTimeEncoder, indent=2, ensure_ascii=False)
-            
-            logger.info(f"Sauvegarde de {len(data)} véhicules réussie")
+            if self._write_if_changed('vehicles', self.vehicles_path, [content]):
+                logger.info(f"Sauvegarde de {len(data)} véhicules réussie")
             return True
             
         except Exception as e:
@@ -145,31 +542,18 @@ class DataPersistence:
         Returns:
             True si la sauvegarde a réussi
         """
+        return self._save_customer_records(
+            self._customer_to_record(customer) for customer in customers.values()
+        )
+    
+    def _save_customer_records(self, records: Iterable[Dict[str, Any]]) -> bool:
+        """Écrit des clients déjà convertis (voir export_records)."""
         try:
-            data = []
-            for customer in customers.values():
-                customer_data = {
-                    'id': customer.id,
-                    'first_name': customer.first_name,
-                    'last_name': customer.last_name,
-                    'birth_date': customer.birth_date.isoformat(),
-                    'license_number': customer.license_number,
-                    'license_types': list(customer.license_types),
-                    'license_date': customer.license_date.isoformat(),
-                    'email': customer.email,
-                    'phone': customer.phone,
-                    'address': customer.address,
-                    'rental_history': customer.rental_history,
-                    'active_rentals': customer.active_rentals,
-                    'is_blocked': customer.is_blocked,
-                    'blocked_reason': customer.blocked_reason
-                }
-                data.append(customer_data)
-            
-            with open(self.customers_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
-            logger.info(f"Sauvegarde de {len(data)} clients réussie")
+            data = list(records)
+            content = json.dumps(data, indent=2, ensure_ascii=False)
+            
+            if self._write_if_changed('customers', self.customers_path, [content]):
+                logger.info(f"Sauvegarde de {len(data)} clients réussie")
             return True
             
         except Exception as e:
@@ -186,23 +570,127 @@ class DataPersistence:
         Returns:
             True si la sauvegarde a réussi
         """
+        return self._save_rental_records(
+            self._rental_to_record(rental) for rental in rentals.values()
+        )
+    
+    def _save_rental_records(self, records: Iterable[Dict[str, Any]]) -> bool:
+        """Écrit des locations déjà converties, selon le format choisi."""
+        if self.rentals_format == "jsonl":
+            return self._save_rental_records_jsonl(records, self.rentals_jsonl_path)
+        if self.rentals_format == "partitioned":
+            return self._save_rental_records_partitioned(records)
+        
         try:
-            data = []
-            for rental in rentals.values():
-                rental_data = rental.to_dict()
-                rental_data['_status'] = rental.status.name  # Sauver le nom de l'enum
-                data.append(rental_data)
-            
-            with open(self.rentals_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            data = list(records)
+            content = json.dumps(data, indent=2, ensure_ascii=False)
             
-            logger.info(f"Sauvegarde de {len(data)} locations réussie")
+            if self._write_if_changed('rentals', self.rentals_path, [content]):
+                logger.info(f"Sauvegarde de {len(data)} locations réussie")
             return True
             
         except Exception as e:
             logger.error(f"Erreur lors de la sauvegarde des locations: {e}")
             raise DataSaveError(str(self.rentals_path), str(e))
     
+    def save_rentals_jsonl(
+        self,
+        rentals: Dict[str, Rental],
+        path: Optional[Path] = None
+    ) -> bool:
+        """
+        Sauvegarde les locations au format JSON Lines (une location par ligne).
+        
+        Args:
+            rentals: Dictionnaire des locations {id: rental}
+            path: Fichier de destination (rentals.jsonl par défaut)
+            
+        Returns:
+            True si la sauvegarde a réussi
+        """
+        return self._save_rental_records_jsonl(
+            (self._rental_to_record(rental) for rental in rentals.values()),
+            path or self.rentals_jsonl_path
+        )
+    
+    def _save_rental_records_jsonl(self, records: Iterable[Dict[str, Any]], path: Path) -> bool:
+        """Écrit des locations déjà converties au format JSON Lines."""
+        try:
+            lines = [json.dumps(record, ensure_ascii=False) + "\n" for record in records]
+            
+            if self._write_if_changed('rentals', path, lines):
+                logger.info(f"Sauvegarde de {len(lines)} locations (JSON Lines) réussie")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Erreur lors de la sauvegarde des locations: {e}")
+            raise DataSaveError(str(path), str(e))
+    
+    def save_rentals_partitioned(self, rentals: Dict[str, Rental]) -> bool:
+        """
+        Sauvegarde les locations ouvertes et fusionne les autres dans l'historique.
+        
+        Les locations réservées/en cours réécrivent le fichier des locations
+        ouvertes; les locations clôturées sont ajoutées à leur partition
+        mensuelle, sans toucher aux autres mois.
+        
+        Args:
+            rentals: Dictionnaire des locations {id: rental}
+            
+        Returns:
+            True si la sauvegarde a réussi
+        """
+        return self._save_rental_records_partitioned(
+            self._rental_to_record(rental) for rental in rentals.values()
+        )
+    
+    def _save_rental_records_partitioned(self, records: Iterable[Dict[str, Any]]) -> bool:
+        """Sépare des locations déjà converties entre ouvertes et historisées."""
+        open_records = []
+        closed_records = []
+        for record in records:
+            if record['_status'] in OPEN_RENTAL_STATUSES:
+                open_records.append(record)
+            else:
+                closed_records.append(record)
+        
+        self._save_rental_records_jsonl(open_records, self.open_rentals_path)
+        try:
+            written = self.history_store.merge_records(closed_records)
+        except Exception as e:
+            logger.error(f"Erreur lors de l'historisation des locations: {e}")
+            raise DataSaveError(str(self.history_store.directory), str(e))
+        
+        logger.info(f"{written} locations historisées")
+        return True
+    
+    @staticmethod
+    def _customer_to_record(customer: Customer) -> Dict[str, Any]:
+        """Convertit un client en enregistrement persistable."""
+        return {
+            'id': customer.id,
+            'first_name': customer.first_name,
+            'last_name': customer.last_name,
+            'birth_date': customer.birth_date.isoformat(),
+            'license_number': customer.license_number,
+            'license_types': list(customer.license_types),
+            'license_date': customer.license_date.isoformat(),
+            'email': customer.email,
+            'phone': customer.phone,
+            'address': customer.address,
+            'rental_history': customer.rental_history,
+            'active_rentals': customer.active_rentals,
+            'is_blocked': customer.is_blocked,
+            'blocked_reason': customer.blocked_reason
+        }
+    
+    @staticmethod
+    def _rental_to_record(rental: Rental) -> Dict[str, Any]:
+        """Convertit une location en enregistrement persistable."""
+        rental_data = rental.to_dict()
+        rental_data['_status'] = rental.status.name  # Sauver le nom de l'enum
+        return rental_data
+    
     def save_all(
         self,
         vehicles: Dict[str, Any],
@@ -217,15 +705,113 @@ class DataPersistence:
             customers: Dictionnaire des clients
             rentals: Dictionnaire des locations
             
+        Returns:
+            True si toutes les sauvegardes ont réussi
+        """
+        return self.save_records(self.export_records(vehicles, customers, rentals))
+    
+    @classmethod
+    def export_records(
+        cls,
+        vehicles: Dict[str, Any],
+        customers: Dict[str, Customer],
+        rentals: Dict[str, Rental]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Convertit toutes les données en enregistrements, sans rien écrire.
+        
+        Les enregistrements ne partagent rien avec les entités: ils peuvent
+        être écrits (save_records) pendant que le système est modifié.
+        
+        Args:
+            vehicles: Dictionnaire des véhicules
+            customers: Dictionnaire des clients
+            rentals: Dictionnaire des locations
+            
+        Returns:
+            Dictionnaire {'vehicles', 'customers', 'rentals'} de listes d'enregistrements
+        """
+        return {
+            'vehicles': [encode_vehicle(vehicle) for vehicle in vehicles.values()],
+            'customers': [cls._customer_to_record(customer) for customer in customers.values()],
+            'rentals': [cls._rental_to_record(rental) for rental in rentals.values()],
+        }
+    
+    def save_records(self, records: Dict[str, List[Dict[str, Any]]]) -> bool:
+        """
+        Écrit des enregistrements produits par export_records.
+        
+        Args:
+            records: Enregistrements des véhicules, clients et locations
+            
         Returns:
             True si toutes les sauvegardes ont réussi
         """
         success = True
-        success = self.save_vehicles(vehicles) and success
-        success = self.save_customers(customers) and success
-        success = self.save_rentals(rentals) and success
+        success = self._save_vehicle_records(records['vehicles']) and success
+        success = self._save_customer_records(records['customers']) and success
+        success = self._save_rental_records(records['rentals']) and success
         return success
     
+    def save_snapshot(
+        self,
+        vehicles: Dict[str, Any],
+        customers: Dict[str, Customer],
+        rentals: Dict[str, Rental]
+    ) -> bool:
+        """
+        Sauvegarde l'état complet dans un snapshot binaire (voir models.snapshot).
+        
+        Contrairement aux fichiers JSON, le snapshot conserve toutes les
+        locations (y compris terminées) avec leur statut.
+        
+        Args:
+            vehicles: Dictionnaire des véhicules
+            customers: Dictionnaire des clients
+            rentals: Dictionnaire des locations
+            
+        Returns:
+            True si la sauvegarde a réussi
+        """
+        try:
+            size = write_snapshot(self.snapshot_path, vehicles, customers, rentals)
+            logger.info(f"Snapshot de {size} octets sauvegardé")
+            return True
+        except Exception as e:
+            logger.error(f"Erreur lors de la sauvegarde du snapshot: {e}")
+            raise DataSaveError(str(self.snapshot_path), str(e))
+    
+    def export_fleet_catalog(self, vehicles: Dict[str, Any]) -> bool:
+        """
+        Exporte la flotte vers le catalogue projeté en mémoire (voir MappedFleet).
+        
+        Args:
+            vehicles: Dictionnaire des véhicules {id: vehicle}
+            
+        Returns:
+            True si l'export a réussi
+        """
+        try:
+            size = export_fleet_catalog(vehicles, self.catalog_path)
+        except Exception as e:
+            logger.error(f"Erreur lors de l'export du catalogue: {e}")
+            raise DataSaveError(str(self.catalog_path), str(e))
+        
+        logger.info(f"Catalogue de {len(vehicles)} véhicules exporté ({size} octets)")
+        return True
+    
+    def open_fleet_catalog(self) -> MappedFleet:
+        """
+        Ouvre le catalogue de la flotte en lecture seule.
+        
+        Returns:
+            Le lecteur MappedFleet (à fermer avec close())
+            
+        Raises:
+            DataLoadError: Si le catalogue est absent ou invalide
+        """
+        return MappedFleet(self.catalog_path)
+    
     # === Chargement ===
     
     def load_vehicles(self) -> Dict[str, Any]:
@@ -240,14 +826,14 @@ class DataPersistence:
             return {}
         
         try:
-            with open(self.vehicles_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._read_json_file(self.vehicles_path)
             
             vehicles = {}
-            for item in data:
-                vehicle = self._create_vehicle_from_dict(item)
-                if vehicle:
-                    vehicles[vehicle.id] = vehicle
+            with gc_paused():
+                for item in data:
+                    vehicle = self._create_vehicle_from_dict(item)
+                    if vehicle:
+                        vehicles[vehicle.id] = vehicle
             
             logger.info(f"Chargement de {len(vehicles)} véhicules réussi")
             return vehicles
@@ -260,74 +846,16 @@ class DataPersistence:
             raise DataLoadError(str(self.vehicles_path), str(e))
     
     def _create_vehicle_from_dict(self, data: Dict) -> Optional[Any]:
-        """Crée un véhicule à partir d'un dictionnaire."""
-        vehicle_class = data.get('_class', data.get('type', ''))
-        
-        # Mapper le type français vers la classe
-        type_mapping = {
-            'Voiture': 'Car',
-            'Camion': 'Truck', 
-            'Moto': 'Motorcycle'
-        }
-        vehicle_class = type_mapping.get(vehicle_class, vehicle_class)
-        
-        # Récupérer la catégorie
-        category_value = data.get('category', 'standard')
-        category = VehicleCategory.STANDARD
-        for cat in VehicleCategory.__members__.values():
-            if cat.value == category_value:
-                category = cat
-                break
-        
-        common_args = {
-            'brand': data['brand'],
-            'model': data['model'],
-            'category': category,
-            'daily_rate': data['daily_rate'],
-            'year': data['year'],
-            'license_plate': data['license_plate'],
-            'mileage': data.get('mileage', 0),
-            'vehicle_id': data['id']
-        }
-        
+        """Crée un véhicule à partir d'un dictionnaire (voir vehicle_codec)."""
         try:
-            if vehicle_class == 'Car':
-                vehicle = Car(
-                    **common_args,
-                    num_doors=data.get('num_doors', 5),
-                    num_seats=data.get('num_seats', 5),
-                    fuel_type=data.get('fuel_type', 'essence'),
-                    transmission=data.get('transmission', 'manuelle')
-                )
-            elif vehicle_class == 'Truck':
-                vehicle = Truck(
-                    **common_args,
-                    cargo_capacity=data.get('cargo_capacity', 10),
-                    max_weight=data.get('max_weight', 3500),
-                    has_tail_lift=data.get('has_tail_lift', False)
-                )
-            elif vehicle_class == 'Motorcycle':
-                vehicle = Motorcycle(
-                    **common_args,
-                    engine_size=data.get('engine_size', 125),
-                    motorcycle_type=data.get('motorcycle_type', 'standard')
-                )
-            else:
-                logger.warning(f"Type de véhicule inconnu: {vehicle_class}")
-                return None
-            
-            # Restaurer l'état
-            state_value = data.get('state', 'disponible')
-            for state in VehicleState.__members__.values():
-                if state.value == state_value:
-                    vehicle.state = state
-                    break
-            
-            return vehicle
-            
+            vehicle = decode_vehicle(data)
         except Exception as e:
             logger.error(f"Erreur lors de la création du véhicule: {e}")
             return None
+        
+        if vehicle is None:
+            logger.warning(f"Type de véhicule inconnu: {data.get('_class', data.get('type', ''))}")
+        return vehicle
     
     def load_customers(self) -> Dict[str, Customer]:
         """
@@ -341,8 +869,7 @@ class DataPersistence:
             return {}
         
         try:
-            with open(self.customers_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._read_json_file(self.customers_path)
             
             customers = {}
             for item in data:
@@ -383,56 +910,42 @@ class DataPersistence:
         """
         Charge les locations depuis le fichier JSON.
         
-        Note: Les locations passées ne peuvent pas être recréées avec des dates
-        dans le passé. Seules les locations futures sont restaurées.
+        En format "jsonl", ou si seul le fichier JSON Lines existe, les
+        locations sont lues en flux (voir load_rentals_streaming). En format
+        "partitioned", seules les locations ouvertes sont chargées;
+        l'historique reste sur disque (voir history_store).
+        
+        Toutes les locations sont restaurées avec leur état sauvegardé
+        (statut, retour effectif, pénalité, kilométrage), historique compris.
         
         Returns:
             Dictionnaire des locations {id: rental}
         """
+        if self.rentals_format == "partitioned":
+            return self.load_rentals_streaming(path=self.open_rentals_path)
+        
+        if self.rentals_jsonl_path.exists() and (
+            self.rentals_format == "jsonl" or not self.rentals_path.exists()
+        ):
+            return self.load_rentals_streaming()
+        
         if not self.rentals_path.exists():
             logger.info("Aucun fichier de locations trouvé")
             return {}
         
         try:
-            with open(self.rentals_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._read_json_file(self.rentals_path)
             
-            rentals = {}
-            skipped = 0
-            
-            for item in data:
-                start_date = date.fromisoformat(item['start_date'])
-                end_date = date.fromisoformat(item['end_date'])
-                
-                # Ignorer les locations passées (ne peuvent pas être recréées)
-                if start_date < date.today() and item.get('_status') not in ['ACTIVE', 'RESERVED']:
-                    skipped += 1
-                    continue
-                
-                # Pour les locations passées actives, ajuster la date de début
-                if start_date < date.today():
-                    start_date = date.today()
-                
-                try:
-                    rental = Rental(
-                        customer_id=item['customer_id'],
-                        vehicle_id=item['vehicle_id'],
-                        start_date=start_date,
-                        end_date=end_date,
-                        daily_rate=item['daily_rate'],
-                        start_mileage=item.get('start_mileage', 0),
-                        rental_id=item['id']
-                    )
-                    
-                    # Restaurer la réduction appliquée
-                    if item.get('discount_applied', 0) > 0:
-                        rental.apply_discount(item['discount_applied'])
-                    
-                    rentals[rental.id] = rental
-                    
-                except Exception as e:
-                    logger.warning(f"Impossible de restaurer la location {item['id']}: {e}")
-                    skipped += 1
+            try:
+                rentals = restore_rentals(data)
+            except (KeyError, ValueError, TypeError):
+                # Enregistrement invalide: restauration une à une, en l'ignorant
+                rentals = {}
+                for item in data:
+                    rental = self._create_rental_from_dict(item)
+                    if rental is not None:
+                        rentals[rental.id] = rental
+            skipped = len(data) - len(rentals)
             
             logger.info(f"Chargement de {len(rentals)} locations réussi ({skipped} ignorées)")
             return rentals
@@ -444,16 +957,306 @@ class DataPersistence:
             logger.error(f"Erreur lors du chargement des locations: {e}")
             raise DataLoadError(str(self.rentals_path), str(e))
     
-    def load_all(self) -> tuple[Dict, Dict, Dict]:
+    def iter_rentals_jsonl(
+        self,
+        progress_callback: Optional[ProgressCallback] = None,
+        progress_every: int = 1000,
+        path: Optional[Path] = None
+    ) -> Iterator[Rental]:
+        """
+        Lit le fichier JSON Lines et produit les locations une par une.
+        
+        Seule la ligne en cours est décodée: la mémoire utilisée ne dépend
+        pas de la taille du fichier.
+        
+        Args:
+            progress_callback: Fonction appelée avec (locations chargées,
+                octets lus, taille totale) toutes les `progress_every` lignes
+                et une dernière fois en fin de lecture
+            progress_every: Fréquence d'appel du callback (en lignes);
+                0 pour n'appeler le callback qu'en fin de lecture
+            path: Fichier à lire (rentals.jsonl par défaut)
+            
+        Yields:
+            Les locations restaurées
+            
+        Raises:
+            DataLoadError: Si une ligne n'est pas du JSON valide
+        """
+        path = path or self.rentals_jsonl_path
+        if not path.exists():
+            logger.info("Aucun fichier de locations JSON Lines trouvé")
+            return
+        
+        total_bytes = path.stat().st_size
+        bytes_read = 0
+        loaded = 0
+        parse_date = memoized_date_parser()
+        hasher = hashlib.blake2b(digest_size=16)
+        
+        with open(path, 'rb') as f:
+            for line_number, raw_line in enumerate(f, start=1):
+                bytes_read += len(raw_line)
+                hasher.update(raw_line)
+                line = raw_line.strip()
+                if line:
+                    try:
+                        item = json.loads(line)
+                    except json.JSONDecodeError as e:
+                        logger.error(f"Erreur de décodage JSON ligne {line_number}: {e}")
+                        raise DataLoadError(
+                            str(path), f"JSON invalide ligne {line_number}: {e}"
+                        )
+                    
+                    rental = self._create_rental_from_dict(item, parse_date)
+                    if rental is not None:
+                        loaded += 1
+                        yield rental
+                
+                if progress_callback and progress_every > 0 and line_number % progress_every == 0:
+                    progress_callback(loaded, bytes_read, total_bytes)
+        
+        if progress_callback:
+            progress_callback(loaded, bytes_read, total_bytes)
+        
+        self._remember_digest(path, hasher.digest())
+    
+    def load_rentals_streaming(
+        self,
+        progress_callback: Optional[ProgressCallback] = None,
+        progress_every: int = 1000,
+        path: Optional[Path] = None
+    ) -> Dict[str, Rental]:
+        """
+        Charge les locations depuis le fichier JSON Lines, ligne par ligne.
+        
+        Args:
+            progress_callback: Fonction de suivi (voir iter_rentals_jsonl)
+            progress_every: Fréquence d'appel du callback (en lignes)
+            path: Fichier à lire (rentals.jsonl par défaut)
+            
+        Returns:
+            Dictionnaire des locations {id: rental}
+        """
+        path = path or self.rentals_jsonl_path
+        try:
+            rentals = {
+                rental.id: rental
+                for rental in self.iter_rentals_jsonl(progress_callback, progress_every, path)
+            }
+        except (OSError, ValueError, AttributeError) as e:
+            # Les lignes JSON invalides lèvent déjà DataLoadError
+            logger.error(f"Erreur lors du chargement des locations: {e}")
+            raise DataLoadError(str(path), str(e))
+        
+        logger.info(f"Chargement de {len(rentals)} locations (JSON Lines) réussi")
+        return rentals
+    
+    def convert_rentals_to_jsonl(self, remove_source: bool = False) -> int:
+        """
+        Convertit le fichier de locations JSON (tableau) au format JSON Lines.
+        
+        Les enregistrements sont recopiés tels quels, sans reconstruire
+        d'objet Rental, afin de ne perdre aucune location.
+        
+        Args:
+            remove_source: Supprimer le fichier JSON après conversion
+            
+        Returns:
+            Nombre d'enregistrements convertis
+        """
+        if not self.rentals_path.exists():
+            logger.info("Aucun fichier de locations à convertir")
+            return 0
+        
+        try:
+            data = self._read_json_file(self.rentals_path)
+        except json.JSONDecodeError as e:
+            logger.error(f"Erreur de décodage JSON: {e}")
+            raise DataLoadError(str(self.rentals_path), f"JSON invalide: {e}")
+        
+        try:
+            with open(self.rentals_jsonl_path, 'w', encoding='utf-8') as f:
+                for item in data:
+                    f.write(json.dumps(item, ensure_ascii=False))
+                    f.write("\n")
+        except Exception as e:
+            logger.error(f"Erreur lors de la conversion des locations: {e}")
+            raise DataSaveError(str(self.rentals_jsonl_path), str(e))
+        
+        if remove_source:
+            self.rentals_path.unlink()
+        
+        logger.info(f"Conversion de {len(data)} locations en JSON Lines réussie")
+        return len(data)
+    
+    def _create_rental_from_dict(
+        self,
+        item: Dict,
+        parse_date: Callable[[str], date] = date.fromisoformat
+    ) -> Optional[Rental]:
+        """
+        Restaure une location à partir d'un dictionnaire.
+        
+        L'état sauvegardé est repris tel quel (voir Rental.from_record), y
+        compris pour les locations terminées ou dont la date est passée.
+        
+        Returns:
+            La location, ou None si l'enregistrement est invalide
+        """
+        try:
+            return Rental.from_record(item, parse_date)
+        except (KeyError, ValueError, TypeError) as e:
+            logger.warning(f"Impossible de restaurer la location {item.get('id')}: {e}")
+            return None
+    
+    def load_all(
+        self,
+        parallel: bool = False,
+        rentals_in_process: bool = False
+    ) -> tuple[Dict, Dict, Dict]:
         """
         Charge toutes les données du système.
         
+        En format "partitioned", seules les locations ouvertes sont chargées:
+        load_into charge les données dans un système en y associant
+        l'historique, lu à la demande.
+        
+        Les liens entre collections sont ensuite vérifiés (voir check_links);
+        les incohérences sont journalisées.
+        
+        Args:
+            parallel: Lire et décoder les trois fichiers en parallèle
+                (un thread par fichier)
+            rentals_in_process: En mode parallèle, décoder les locations dans
+                un processus séparé (utile pour de très gros fichiers)
+            
         Returns:
             Tuple (vehicles, customers, rentals)
         """
-        vehicles = self.load_vehicles()
-        customers = self.load_customers()
-        rentals = self.load_rentals()
+        if parallel:
+            vehicles, customers, rentals = self._load_all_parallel(rentals_in_process)
+        else:
+            vehicles = self.load_vehicles()
+            customers = self.load_customers()
+            rentals = self.load_rentals()
+        
+        for issue in self.check_links(vehicles, customers, rentals):
+            logger.warning(issue)
+        return vehicles, customers, rentals
+    
+    def load_into(
+        self,
+        system,
+        parallel: bool = False,
+        rentals_in_process: bool = False,
+        loaded: Optional[tuple[Dict, Dict, Dict]] = None
+    ) -> None:
+        """
+        Charge les données dans un système, avec l'historique des locations.
+        
+        L'historique (format "partitioned") est associé au système s'il
+        existe sur disque: get_customer_rentals, get_vehicle_rentals et les
+        rapports y lisent les locations clôturées.
+        
+        Args:
+            system: CarRentalSystem à remplir
+            parallel: Voir load_all
+            rentals_in_process: Voir load_all
+            loaded: Résultat de load_all déjà lu (ex: dans un autre thread);
+                sinon les données sont lues ici
+        """
+        vehicles, customers, rentals = loaded or self.load_all(parallel, rentals_in_process)
+        system.load_data(vehicles, customers, rentals)
+        system.attach_history_store(self.history_store if self.has_history() else None)
+    
+    def _load_all_parallel(self, rentals_in_process: bool) -> tuple[Dict, Dict, Dict]:
+        """Charge les trois collections simultanément."""
+        process_pool = ProcessPoolExecutor(max_workers=1) if rentals_in_process else None
+        try:
+            with ThreadPoolExecutor(max_workers=3, thread_name_prefix="load") as pool:
+                vehicles_future = pool.submit(self.load_vehicles)
+                customers_future = pool.submit(self.load_customers)
+                if process_pool is not None:
+                    rentals_future = process_pool.submit(
+                        _load_rentals_worker, str(self.data_dir), self.rentals_format
+                    )
+                else:
+                    rentals_future = pool.submit(self.load_rentals)
+                
+                # result() relance l'éventuelle DataLoadError du worker
+                return (vehicles_future.result(), customers_future.result(),
+                        rentals_future.result())
+        finally:
+            if process_pool is not None:
+                process_pool.shutdown()
+    
+    @staticmethod
+    def check_links(
+        vehicles: Dict[str, Any],
+        customers: Dict[str, Customer],
+        rentals: Dict[str, Rental]
+    ) -> List[str]:
+        """
+        Vérifie les références croisées entre les collections chargées.
+        
+        Contrôle que chaque location active d'un client existe et est
+        ouverte, et que chaque location référence un véhicule de la flotte.
+        
+        Returns:
+            Liste des incohérences trouvées (vide si tout est cohérent)
+        """
+        issues = []
+        open_statuses = (RentalStatus.RESERVED, RentalStatus.ACTIVE)
+        
+        for customer in customers.values():
+            for rental_id in customer.active_rentals:
+                rental = rentals.get(rental_id)
+                if rental is None:
+                    issues.append(
+                        f"Client {customer.id}: location active {rental_id} introuvable"
+                    )
+                elif rental.status not in open_statuses:
+                    issues.append(
+                        f"Client {customer.id}: location {rental_id} "
+                        f"active mais {rental.status.value}"
+                    )
+        
+        for rental in rentals.values():
+            if rental.vehicle_id not in vehicles:
+                issues.append(
+                    f"Location {rental.id}: véhicule {rental.vehicle_id} absent de la flotte"
+                )
+        
+        return issues
+    
+    def load_snapshot(self) -> tuple[Dict, Dict, Dict]:
+        """
+        Charge l'état complet depuis le snapshot binaire.
+        
+        Returns:
+            Tuple (vehicles, customers, rentals), vides si aucun snapshot
+            
+        Raises:
+            DataLoadError: Si le snapshot est corrompu ou de version inconnue
+        """
+        if not self.snapshot_path.exists():
+            logger.info("Aucun snapshot trouvé")
+            return {}, {}, {}
+        
+        try:
+            vehicles, customers, rentals = read_snapshot(self.snapshot_path)
+        except SnapshotError as e:
+            logger.error(f"Snapshot invalide: {e.reason}")
+            raise DataLoadError(str(self.snapshot_path), e.reason)
+        except Exception as e:
+            logger.error(f"Erreur lors du chargement du snapshot: {e}")
+            raise DataLoadError(str(self.snapshot_path), str(e))
+        
+        logger.info(
+            f"Snapshot chargé: {len(vehicles)} véhicules, "
+            f"{len(customers)} clients, {len(rentals)} locations"
+        )
         return vehicles, customers, rentals
     
     def clear_all_data(self) -> bool:
@@ -464,9 +1267,14 @@ class DataPersistence:
             True si la suppression a réussi
         """
         try:
-            for path in [self.vehicles_path, self.customers_path, self.rentals_path]:
+            for path in [self.vehicles_path, self.customers_path,
+                         self.rentals_path, self.rentals_jsonl_path,
+                         self.snapshot_path, self.open_rentals_path,
+                         self.catalog_path]:
                 if path.exists():
                     path.unlink()
+            if (self.data_dir / self.HISTORY_DIR).exists():
+                self.history_store.clear()
             logger.info("Toutes les données ont été supprimées")
             return True
         except Exception as e:
@@ -478,5 +1286,12 @@ class DataPersistence:
         return any(p.exists() for p in [
             self.vehicles_path,
             self.customers_path, 
-            self.rentals_path
-        ])
+            self.rentals_path,
+            self.rentals_jsonl_path,
+            self.snapshot_path,
+            self.open_rentals_path
+        ]) or self.has_history()
+    
+    def has_history(self) -> bool:
+        """Vérifie si un historique des locations existe (format "partitioned")."""
+        return (self.data_dir / self.HISTORY_DIR / HistoricalRentalStore.INDEX_FILE).exists()
@@ -0,0 +1,290 @@
+"""
+Module du planning d'occupation de la flotte (véhicules × jours).
+
+FleetPlanning range les locations par véhicule sur une fenêtre de jours,
+sous deux formes:
+- des barres (une par location), triées par jour de début, pour
+  l'affichage détaillé: seules les lignes et les jours visibles sont
+  parcourus;
+- une matrice d'occupation (véhicules × jours, NumPy) dont sont tirés les
+  taux d'occupation par blocs, pour l'affichage dézoomé.
+
+Une modification des locations d'un véhicule ne recalcule que sa ligne
+(et le bloc de lignes qui la contient dans les grilles gardées: seules
+celles des derniers niveaux de zoom utilisés le sont).
+Une location modifiée ne touche que sa barre: un index donne la ligne de
+chaque location.
+"""
+
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from models.rental import Rental, RentalStatus
+from models.vehicle import Vehicle
+
+
+@dataclass(frozen=True)
+class PlanningBar:
+    """
+    Location affichée dans le planning.
+
+    Les jours sont relatifs au début de la fenêtre (inclus) et rognés à
+    la fenêtre.
+    """
+    rental_id: str
+    customer_id: str
+    first_day: int
+    last_day: int
+    status: RentalStatus
+
+
+class FleetPlanning:
+    """
+    Occupation de la flotte sur une fenêtre de jours.
+
+    Args:
+        start_date: Premier jour de la fenêtre
+        num_days: Nombre de jours de la fenêtre
+
+    Raises:
+        ValueError: Si la fenêtre est vide
+    """
+
+    # Nombre de grilles d'occupation gardées (derniers niveaux de zoom utilisés)
+    MAX_GRIDS = 4
+
+    def __init__(self, start_date: date, num_days: int = 365):
+        if num_days < 1:
+            raise ValueError("La fenêtre du planning doit contenir au moins un jour")
+        self.start_date = start_date
+        self.num_days = num_days
+        self._vehicle_ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._bars: List[List[PlanningBar]] = []
+        self._rental_rows: Dict[str, int] = {}
+        self._occupied = np.zeros((0, num_days), dtype=np.uint8)
+        self._grids: "OrderedDict[Tuple[int, int], np.ndarray]" = OrderedDict()
+
+    @property
+    def end_date(self) -> date:
+        """Dernier jour de la fenêtre."""
+        return self.start_date + timedelta(days=self.num_days - 1)
+
+    @property
+    def row_count(self) -> int:
+        return len(self._vehicle_ids)
+
+    @property
+    def bar_count(self) -> int:
+        return sum(len(bars) for bars in self._bars)
+
+    def vehicle_id(self, row: int) -> str:
+        return self._vehicle_ids[row]
+
+    def row_of(self, vehicle_id: str) -> Optional[int]:
+        return self._rows.get(vehicle_id)
+
+    # === Chargement et mises à jour ===
+
+    def load(
+        self,
+        vehicles: Sequence[Vehicle],
+        rentals: Iterable[Rental],
+        today: Optional[date] = None
+    ) -> None:
+        """
+        Remplace le contenu du planning.
+
+        Args:
+            vehicles: Véhicules, une ligne chacun dans l'ordre donné
+            rentals: Locations (celles des autres véhicules sont ignorées)
+            today: Date du jour (aujourd'hui par défaut)
+        """
+        self._vehicle_ids = [vehicle.id for vehicle in vehicles]
+        self._rows = {vehicle_id: row for row, vehicle_id in enumerate(self._vehicle_ids)}
+
+        by_vehicle: Dict[str, List[Rental]] = defaultdict(list)
+        for rental in rentals:
+            if rental.vehicle_id in self._rows:
+                by_vehicle[rental.vehicle_id].append(rental)
+
+        today = today or date.today()
+        self._bars = [self._make_bars(by_vehicle.get(vehicle_id, ()), today)
+                      for vehicle_id in self._vehicle_ids]
+        self._rental_rows = {
+            bar.rental_id: row for row, bars in enumerate(self._bars) for bar in bars
+        }
+        self._occupied = np.zeros((len(self._vehicle_ids), self.num_days), dtype=np.uint8)
+        for row in range(len(self._bars)):
+            self._fill_row(row)
+        self._grids.clear()
+
+    def update_vehicle(
+        self,
+        vehicle_id: str,
+        rentals: Iterable[Rental],
+        today: Optional[date] = None
+    ) -> Optional[int]:
+        """
+        Remplace les locations d'un véhicule.
+
+        Args:
+            vehicle_id: ID du véhicule
+            rentals: Toutes ses locations
+            today: Date du jour (aujourd'hui par défaut)
+
+        Returns:
+            Ligne du véhicule, ou None s'il n'est pas dans le planning
+        """
+        row = self._rows.get(vehicle_id)
+        if row is None:
+            return None
+        for bar in self._bars[row]:
+            self._rental_rows.pop(bar.rental_id, None)
+        self._bars[row] = self._make_bars(rentals, today or date.today())
+        for bar in self._bars[row]:
+            self._rental_rows[bar.rental_id] = row
+        self._row_changed(row)
+        return row
+
+    def update_rental(
+        self,
+        rental_id: str,
+        rental: Optional[Rental],
+        today: Optional[date] = None
+    ) -> Set[int]:
+        """
+        Met à jour la barre d'une seule location.
+
+        Args:
+            rental_id: ID de la location
+            rental: Location à jour, ou None si elle a disparu du système
+            today: Date du jour (aujourd'hui par défaut)
+
+        Returns:
+            Lignes modifiées (au plus deux si la location a changé de véhicule)
+        """
+        changed = set()
+        old_row = self._rental_rows.pop(rental_id, None)
+        if old_row is not None:
+            self._bars[old_row] = [bar for bar in self._bars[old_row] if bar.rental_id != rental_id]
+            changed.add(old_row)
+
+        row = self._rows.get(rental.vehicle_id) if rental is not None else None
+        if row is not None:
+            new_bars = self._make_bars([rental], today or date.today())
+            if new_bars:
+                self._bars[row] = sorted(self._bars[row] + new_bars,
+                                         key=lambda bar: (bar.first_day, bar.last_day))
+                self._rental_rows[rental_id] = row
+                changed.add(row)
+
+        for changed_row in changed:
+            self._row_changed(changed_row)
+        return changed
+
+    def _row_changed(self, row: int) -> None:
+        """Recalcule la matrice d'une ligne et son bloc dans les grilles gardées."""
+        self._fill_row(row)
+        for (row_step, day_step), grid in self._grids.items():
+            block = row // row_step
+            lines = self._occupied[block * row_step:(block + 1) * row_step]
+            grid[block] = self._block_rates(lines, row_step, day_step)[0]
+
+    def _make_bars(self, rentals: Iterable[Rental], today: date) -> List[PlanningBar]:
+        """Barres d'un véhicule dans la fenêtre, triées par jour de début."""
+        origin = self.start_date.toordinal()
+        bars = []
+        for rental in rentals:
+            last_day = rental.occupied_until(today)
+            if last_day is None:
+                continue
+            first = rental.start_date.toordinal() - origin
+            last = last_day.toordinal() - origin
+            if last < 0 or first >= self.num_days:
+                continue
+            bars.append(PlanningBar(
+                rental.id, rental.customer_id,
+                max(first, 0), min(last, self.num_days - 1), rental.status
+            ))
+        bars.sort(key=lambda bar: (bar.first_day, bar.last_day))
+        return bars
+
+    def _fill_row(self, row: int) -> None:
+        line = self._occupied[row]
+        line[:] = 0
+        for bar in self._bars[row]:
+            line[bar.first_day:bar.last_day + 1] = 1
+
+    # === Lecture ===
+
+    def bars(
+        self,
+        first_row: int,
+        last_row: int,
+        first_day: int,
+        last_day: int
+    ) -> Iterator[Tuple[int, PlanningBar]]:
+        """
+        Parcourt les barres qui recoupent une zone (bornes incluses).
+
+        Yields:
+            Tuples (ligne, barre)
+        """
+        for row in range(max(first_row, 0), min(last_row, self.row_count - 1) + 1):
+            for bar in self._bars[row]:
+                if bar.first_day > last_day:
+                    break
+                if bar.last_day >= first_day:
+                    yield row, bar
+
+    def bar_at(self, row: int, day: int) -> Optional[PlanningBar]:
+        """Retourne la barre d'une case (ligne, jour), s'il y en a une."""
+        for _, bar in self.bars(row, row, day, day):
+            return bar
+        return None
+
+    def occupancy_grid(self, row_step: int, day_step: int) -> np.ndarray:
+        """
+        Taux d'occupation (0 à 1) par bloc de row_step lignes × day_step jours.
+
+        Les MAX_GRIDS dernières grilles demandées sont gardées jusqu'au
+        prochain chargement; update_vehicle() et update_rental() les
+        tiennent à jour. Les blocs incomplets en bord de grille sont
+        rapportés à leur taille réelle.
+
+        Args:
+            row_step: Nombre de lignes par bloc (>= 1)
+            day_step: Nombre de jours par bloc (>= 1)
+
+        Returns:
+            Tableau float32 (blocs de lignes × blocs de jours), à ne pas modifier
+        """
+        key = (max(row_step, 1), max(day_step, 1))
+        grid = self._grids.get(key)
+        if grid is not None:
+            self._grids.move_to_end(key)
+            return grid
+        grid = self._block_rates(self._occupied, *key)
+        self._grids[key] = grid
+        if len(self._grids) > self.MAX_GRIDS:
+            self._grids.popitem(last=False)
+        return grid
+
+    @staticmethod
+    def _block_rates(occupied: np.ndarray, row_step: int, day_step: int) -> np.ndarray:
+        rows, days = occupied.shape
+        row_starts = np.arange(0, rows, row_step)
+        day_starts = np.arange(0, days, day_step)
+        if rows == 0:
+            return np.zeros((0, len(day_starts)), dtype=np.float32)
+
+        sums = np.add.reduceat(occupied, row_starts, axis=0, dtype=np.int32)
+        sums = np.add.reduceat(sums, day_starts, axis=1)
+        row_sizes = np.diff(np.append(row_starts, rows))
+        day_sizes = np.diff(np.append(day_starts, days))
+        return (sums / np.outer(row_sizes, day_sizes)).astype(np.float32)
@@ -0,0 +1,90 @@
+"""
+Module de classement incrémental (top-K).
+
+Le classement garde le score courant de chaque élément et un tas des
+scores: une mise à jour coûte O(log n), et lire les K premiers coûte
+O(K log n) au lieu d'un tri complet à chaque affichage.
+"""
+
+import heapq
+from typing import Dict, Hashable, List, Optional, Tuple
+
+Score = Tuple[float, ...]
+
+
+class TopKRanking:
+    """
+    Classement par score décroissant, mis à jour élément par élément.
+
+    Une mise à jour ajoute une entrée au tas sans retirer l'ancienne: les
+    entrées périmées sont ignorées à la lecture. Le tas est reconstruit dès
+    qu'il dépasse le double du nombre d'éléments, sa taille reste donc bornée.
+    À score égal, les éléments sont classés par clé croissante.
+    """
+
+    def __init__(self):
+        self._scores: Dict[Hashable, Score] = {}
+        self._heap: List[tuple] = []
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._scores
+
+    def get(self, key: Hashable, default: Optional[Score] = None) -> Optional[Score]:
+        """Retourne le score courant d'un élément."""
+        return self._scores.get(key, default)
+
+    def update(self, key: Hashable, score: Score) -> None:
+        """
+        Ajoute un élément ou modifie son score.
+
+        Args:
+            key: Identifiant de l'élément
+            score: Tuple de valeurs comparées dans l'ordre (le plus grand d'abord)
+        """
+        score = tuple(score)
+        if self._scores.get(key) == score:
+            return
+        self._scores[key] = score
+        heapq.heappush(self._heap, (tuple(-value for value in score), key, score))
+        if len(self._heap) > 2 * len(self._scores) + 16:
+            self._rebuild()
+
+    def remove(self, key: Hashable) -> None:
+        """Retire un élément du classement (sans effet s'il est absent)."""
+        self._scores.pop(key, None)
+
+    def top(self, k: int) -> List[Tuple[Hashable, Score]]:
+        """
+        Retourne les K premiers éléments.
+
+        Args:
+            k: Nombre d'éléments voulus
+
+        Returns:
+            Liste de tuples (clé, score), du meilleur au moins bon
+        """
+        results = []
+        popped = []
+        while self._heap and len(results) < k:
+            entry = heapq.heappop(self._heap)
+            _, key, score = entry
+            if self._scores.get(key) != score:
+                continue  # Entrée périmée: abandonnée
+            if results and results[-1][0] == key:
+                continue  # Doublon (score revenu à une valeur déjà poussée)
+            popped.append(entry)
+            results.append((key, score))
+        for entry in popped:
+            heapq.heappush(self._heap, entry)
+        return results
+
+    def _rebuild(self) -> None:
+        """Reconstruit le tas à partir des scores courants."""
+        self._heap = [
+            (tuple(-value for value in score), key, score)
+            for key, score in self._scores.items()
+        ]
+        heapq.heapify(self._heap)
@@ -3,7 +3,7 @@ Module de gestion des locations.
 """
 
 from datetime import date, datetime, timedelta
-from typing import Optional
+from typing import Optional, Callable
 from enum import Enum
 import uuid
 
@@ -26,6 +26,13 @@ class RentalStatus(Enum):
     CANCELLED = "annulée"
 
 
+# Correspondances nom d'enum / valeur -> statut, pour la restauration
+_STATUS_BY_KEY = {
+    **{status.value: status for status in RentalStatus},
+    **{status.name: status for status in RentalStatus},
+}
+
+
 class Rental:
     """
     Classe représentant une location de véhicule.
@@ -149,6 +156,10 @@ class Rental:
     def discount_applied(self) -> float:
         return self._discount_applied
     
+    @property
+    def created_at(self) -> datetime:
+        return self._created_at
+    
     # Méthodes de calcul
     @property
     def planned_duration(self) -> int:
@@ -313,6 +324,28 @@ class Rental:
             return (self._end_date - date.today()).days
         return 0
     
+    def occupied_until(self, today: Optional[date] = None) -> Optional[date]:
+        """
+        Retourne le dernier jour où la location occupe son véhicule.
+        
+        Une location réservée occupe son véhicule jusqu'à sa fin prévue, une
+        location en cours au moins jusqu'à aujourd'hui (retard compris), une
+        location terminée jusqu'à son retour effectif.
+        
+        Args:
+            today: Date du jour (aujourd'hui par défaut)
+            
+        Returns:
+            Dernier jour occupé, ou None pour une location annulée
+        """
+        if self._status == RentalStatus.CANCELLED:
+            return None
+        if self._status == RentalStatus.COMPLETED:
+            return self._actual_return_date or self._end_date
+        if self._status == RentalStatus.ACTIVE:
+            return max(self._end_date, today or date.today())
+        return self._end_date
+    
     def __str__(self) -> str:
         return f"Location {self._id}: {self._start_date} -> {self._end_date} ({self._status.value})"
     
@@ -343,3 +376,92 @@ class Rental:
             'notes': self._notes,
             'created_at': self._created_at.isoformat()
         }
+    
+    @classmethod
+    def from_record(
+        cls,
+        record: dict,
+        parse_date: Callable[[str], date] = date.fromisoformat
+    ) -> "Rental":
+        """
+        Restaure une location sauvegardée, sans repasser par la validation.
+        
+        Le constructeur refuse les dates passées: il ne peut pas recréer une
+        location terminée. Ici, l'état sauvegardé (statut, retour effectif,
+        pénalité, kilométrage, date de création) est repris tel quel.
+        
+        Args:
+            record: Dictionnaire produit par to_dict (la clé '_status', si
+                présente, est prioritaire sur 'status')
+            parse_date: Convertisseur de dates ISO (permet de mémoïser)
+            
+        Returns:
+            La location restaurée
+            
+        Raises:
+            KeyError: Si un champ obligatoire ou le statut est inconnu
+        """
+        actual_return_date = record.get('actual_return_date')
+        return cls.restore(
+            record['id'],
+            record['customer_id'],
+            record['vehicle_id'],
+            parse_date(record['start_date']),
+            parse_date(record['end_date']),
+            parse_date(actual_return_date) if actual_return_date else None,
+            _STATUS_BY_KEY[record.get('_status') or record['status']],
+            record['daily_rate'],
+            record.get('start_mileage', 0.0),
+            record.get('end_mileage'),
+            record.get('penalty', 0.0),
+            datetime.fromisoformat(record['created_at']),
+            record.get('notes', ''),
+            record.get('discount_applied', 0.0)
+        )
+    
+    @classmethod
+    def restore(
+        cls,
+        rental_id: str,
+        customer_id: str,
+        vehicle_id: str,
+        start_date: date,
+        end_date: date,
+        actual_return_date: Optional[date],
+        status: RentalStatus,
+        daily_rate: float,
+        start_mileage: float = 0.0,
+        end_mileage: Optional[float] = None,
+        penalty: float = 0.0,
+        created_at: Optional[datetime] = None,
+        notes: str = "",
+        discount_applied: float = 0.0
+    ) -> "Rental":
+        """
+        Recrée une location à partir de valeurs déjà typées, sans validation.
+        
+        Équivalent de from_record pour les données produites en mémoire
+        (générateur de données): ni dictionnaire intermédiaire ni analyse
+        de dates. Les attributs sont posés dans l'ordre du constructeur,
+        pour que les instances partagent la table de clés de la classe
+        (deux fois moins de mémoire qu'un __dict__ reconstruit).
+        
+        Returns:
+            La location restaurée
+        """
+        rental = cls.__new__(cls)
+        rental._id = rental_id
+        rental._customer_id = customer_id
+        rental._vehicle_id = vehicle_id
+        rental._start_date = start_date
+        rental._end_date = end_date
+        rental._actual_return_date = actual_return_date
+        rental._status = status
+        rental._daily_rate = daily_rate
+        rental._start_mileage = start_mileage
+        rental._end_mileage = end_mileage
+        rental._penalty = penalty
+        rental._created_at = created_at or datetime.now()
+        rental._notes = notes
+        rental._discount_applied = discount_applied
+        return rental
@@ -0,0 +1,64 @@
+"""
+Module d'export des rapports en flux (CSV ou JSON Lines).
+
+Les lignes sont écrites au fur et à mesure qu'elles sont produites (voir
+CarRentalSystem.iter_*_report_rows): la mémoire utilisée ne dépend pas du
+nombre de lignes.
+"""
+
+import csv
+import json
+from itertools import chain
+from typing import Dict, IO, Iterable, List, Optional
+
+EXPORT_FORMATS = ("csv", "jsonl")
+
+
+def export_report_rows(
+    rows: Iterable[Dict],
+    file: IO[str],
+    fmt: str = "csv",
+    fieldnames: Optional[List[str]] = None
+) -> int:
+    """
+    Écrit des lignes de rapport dans un fichier texte ouvert.
+
+    Args:
+        rows: Lignes du rapport (dictionnaires plats)
+        file: Fichier texte ouvert en écriture (pour le CSV, l'ouvrir avec
+            newline='')
+        fmt: "csv" ou "jsonl"
+        fieldnames: Colonnes CSV (par défaut: les clés de la première ligne;
+            les clés supplémentaires des lignes suivantes sont ignorées)
+
+    Returns:
+        Nombre de lignes écrites
+
+    Raises:
+        ValueError: Si le format est inconnu
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Format d'export inconnu: {fmt}")
+
+    count = 0
+    if fmt == "jsonl":
+        for row in rows:
+            file.write(json.dumps(row, ensure_ascii=False, default=str))
+            file.write("\n")
+            count += 1
+        return count
+
+    rows = iter(rows)
+    if fieldnames is None:
+        first = next(rows, None)
+        if first is None:
+            return 0
+        fieldnames = list(first)
+        rows = chain([first], rows)
+
+    writer = csv.DictWriter(file, fieldnames=fieldnames, extrasaction='ignore')
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
@@ -0,0 +1,455 @@
+"""
+Module de snapshot binaire pour le système de location de voitures.
+
+Un snapshot est une image fidèle de l'état en mémoire (véhicules, clients,
+locations) stockée en colonnes binaires, pour un démarrage à froid rapide.
+
+Format (version 2, little-endian):
+    En-tête:  magic (6 octets) | version (u16) | réservé (u16)
+              | nb véhicules (u32) | nb clients (u32) | nb locations (u32)
+              | taille du corps (u64) | CRC32 du corps (u32)
+    Corps:    table des chaînes (u32 taille + chaînes UTF-8 séparées par NUL)
+              puis les colonnes, chacune: type (1 octet) | nb (u32) | données
+
+Les chaînes sont stockées une seule fois dans la table et référencées par
+leur index (-1 pour None). Les dates de création (naïves, heure locale)
+sont stockées telles quelles, en microsecondes depuis datetime.min: pas de
+conversion par le fuseau horaire, ambiguë aux changements d'heure.
+"""
+
+import struct
+import sys
+import zlib
+from array import array
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from models.vehicle import Vehicle, Car, Truck, Motorcycle, VehicleCategory, VehicleState
+from models.customer import Customer
+from models.rental import Rental, RentalStatus
+from models.exceptions import SnapshotError
+from models.utils import gc_paused
+
+SNAPSHOT_MAGIC = b"RCSNAP"
+SNAPSHOT_VERSION = 2
+
+_HEADER = struct.Struct("<6sHHIIIQI")
+_U32 = struct.Struct("<I")
+_COLUMN_HEADER = struct.Struct("<cI")
+
+_NONE_INDEX = -1
+_NO_DATE = 0
+_NAN = float("nan")
+_MICROSECOND = timedelta(microseconds=1)
+
+# Codes des énumérations (l'ordre de déclaration fait foi)
+_CATEGORIES: List[VehicleCategory] = list(VehicleCategory)
+_STATES: List[VehicleState] = list(VehicleState)
+_STATUSES: List[RentalStatus] = list(RentalStatus)
+_CATEGORY_CODES = {c: i for i, c in enumerate(_CATEGORIES)}
+_STATE_CODES = {s: i for i, s in enumerate(_STATES)}
+_STATUS_CODES = {s: i for i, s in enumerate(_STATUSES)}
+
+_VEHICLE_CAR, _VEHICLE_TRUCK, _VEHICLE_MOTORCYCLE = 0, 1, 2
+
+# Colonnes de chaque collection, dans l'ordre d'écriture: (nom, typecode)
+# 'i' = int32 (index de chaîne, ordinal de date, entier), 'd' = float64, 'B' = u8,
+# 'q' = int64 (date et heure, en microsecondes depuis datetime.min)
+VEHICLE_COLUMNS = (
+    ("id", "i"), ("class", "B"), ("brand", "i"), ("model", "i"),
+    ("category", "B"), ("state", "B"), ("daily_rate", "d"), ("year", "i"),
+    ("license_plate", "i"), ("mileage", "d"),
+    ("int_a", "i"), ("int_b", "i"), ("float_a", "d"), ("float_b", "d"),
+    ("flag", "B"), ("str_a", "i"), ("str_b", "i"),
+)
+CUSTOMER_COLUMNS = (
+    ("id", "i"), ("first_name", "i"), ("last_name", "i"), ("birth_date", "i"),
+    ("license_number", "i"), ("license_types", "i"), ("license_date", "i"),
+    ("email", "i"), ("phone", "i"), ("address", "i"), ("is_blocked", "B"),
+    ("blocked_reason", "i"), ("history_len", "i"), ("active_len", "i"),
+    ("history", "i"), ("active", "i"),
+)
+RENTAL_COLUMNS = (
+    ("id", "i"), ("customer_id", "i"), ("vehicle_id", "i"),
+    ("start_date", "i"), ("end_date", "i"), ("actual_return_date", "i"),
+    ("status", "B"), ("daily_rate", "d"), ("start_mileage", "d"),
+    ("end_mileage", "d"), ("penalty", "d"), ("discount_applied", "d"),
+    ("notes", "i"), ("created_at", "q"),
+)
+
+
+class _StringTable:
+    """Table de chaînes dédupliquées (index 0 = chaîne vide)."""
+
+    def __init__(self):
+        self._index: Dict[str, int] = {"": 0}
+        self.strings: List[str] = [""]
+
+    def add(self, value) -> int:
+        if value is None:
+            return _NONE_INDEX
+        index = self._index.get(value)
+        if index is None:
+            if "\x00" in value:
+                raise SnapshotError(f"Caractère NUL interdit dans une chaîne: {value!r}")
+            index = len(self.strings)
+            self._index[value] = index
+            self.strings.append(value)
+        return index
+
+    def to_bytes(self) -> bytes:
+        return "\x00".join(self.strings).encode("utf-8")
+
+
+def _new_columns(spec) -> Dict[str, array]:
+    return {name: array(typecode) for name, typecode in spec}
+
+
+def _encode_vehicles(vehicles: Dict[str, Vehicle], strings: _StringTable) -> Dict[str, array]:
+    cols = _new_columns(VEHICLE_COLUMNS)
+    add = strings.add
+    for vehicle in vehicles.values():
+        cols["id"].append(add(vehicle.id))
+        cols["brand"].append(add(vehicle.brand))
+        cols["model"].append(add(vehicle.model))
+        cols["category"].append(_CATEGORY_CODES[vehicle.category])
+        cols["state"].append(_STATE_CODES[vehicle.state])
+        cols["daily_rate"].append(vehicle.daily_rate)
+        cols["year"].append(vehicle.year)
+        cols["license_plate"].append(add(vehicle.license_plate))
+        cols["mileage"].append(vehicle.mileage)
+
+        int_a = int_b = flag = 0
+        float_a = float_b = 0.0
+        str_a = str_b = _NONE_INDEX
+        if isinstance(vehicle, Car):
+            kind = _VEHICLE_CAR
+            int_a, int_b = vehicle.num_doors, vehicle.num_seats
+            str_a, str_b = add(vehicle.fuel_type), add(vehicle.transmission)
+        elif isinstance(vehicle, Truck):
+            kind = _VEHICLE_TRUCK
+            float_a, float_b = vehicle.cargo_capacity, vehicle.max_weight
+            flag = 1 if vehicle.has_tail_lift else 0
+        elif isinstance(vehicle, Motorcycle):
+            kind = _VEHICLE_MOTORCYCLE
+            int_a = vehicle.engine_size
+            str_a = add(vehicle.motorcycle_type)
+        else:
+            raise SnapshotError(f"Type de véhicule non supporté: {type(vehicle).__name__}")
+
+        cols["class"].append(kind)
+        cols["int_a"].append(int_a)
+        cols["int_b"].append(int_b)
+        cols["float_a"].append(float_a)
+        cols["float_b"].append(float_b)
+        cols["flag"].append(flag)
+        cols["str_a"].append(str_a)
+        cols["str_b"].append(str_b)
+    return cols
+
+
+def _encode_customers(customers: Dict[str, Customer], strings: _StringTable) -> Dict[str, array]:
+    cols = _new_columns(CUSTOMER_COLUMNS)
+    add = strings.add
+    for customer in customers.values():
+        history = customer.rental_history
+        active = customer.active_rentals
+        cols["id"].append(add(customer.id))
+        cols["first_name"].append(add(customer.first_name))
+        cols["last_name"].append(add(customer.last_name))
+        cols["birth_date"].append(customer.birth_date.toordinal())
+        cols["license_number"].append(add(customer.license_number))
+        cols["license_types"].append(add(",".join(sorted(customer.license_types))))
+        cols["license_date"].append(customer.license_date.toordinal())
+        cols["email"].append(add(customer.email))
+        cols["phone"].append(add(customer.phone))
+        cols["address"].append(add(customer.address))
+        cols["is_blocked"].append(1 if customer.is_blocked else 0)
+        cols["blocked_reason"].append(add(customer.blocked_reason))
+        cols["history_len"].append(len(history))
+        cols["active_len"].append(len(active))
+        cols["history"].extend(add(rental_id) for rental_id in history)
+        cols["active"].extend(add(rental_id) for rental_id in active)
+    return cols
+
+
+def _encode_rentals(rentals: Dict[str, Rental], strings: _StringTable) -> Dict[str, array]:
+    cols = _new_columns(RENTAL_COLUMNS)
+    add = strings.add
+    for rental in rentals.values():
+        returned = rental.actual_return_date
+        end_mileage = rental.end_mileage
+        cols["id"].append(add(rental.id))
+        cols["customer_id"].append(add(rental.customer_id))
+        cols["vehicle_id"].append(add(rental.vehicle_id))
+        cols["start_date"].append(rental.start_date.toordinal())
+        cols["end_date"].append(rental.end_date.toordinal())
+        cols["actual_return_date"].append(returned.toordinal() if returned else _NO_DATE)
+        cols["status"].append(_STATUS_CODES[rental.status])
+        cols["daily_rate"].append(rental.daily_rate)
+        cols["start_mileage"].append(rental.start_mileage)
+        cols["end_mileage"].append(_NAN if end_mileage is None else end_mileage)
+        cols["penalty"].append(rental.penalty)
+        cols["discount_applied"].append(rental.discount_applied)
+        cols["notes"].append(add(rental.notes))
+        cols["created_at"].append((rental.created_at - datetime.min) // _MICROSECOND)
+    return cols
+
+
+def _write_columns(parts: List[bytes], spec, cols: Dict[str, array]) -> None:
+    for name, typecode in spec:
+        column = cols[name]
+        if sys.byteorder != "little":
+            column = array(typecode, column)
+            column.byteswap()
+        parts.append(_COLUMN_HEADER.pack(typecode.encode("ascii"), len(column)))
+        parts.append(column.tobytes())
+
+
+def encode_snapshot(
+    vehicles: Dict[str, Vehicle],
+    customers: Dict[str, Customer],
+    rentals: Dict[str, Rental]
+) -> bytes:
+    """
+    Encode l'état du système en snapshot binaire.
+
+    Args:
+        vehicles: Dictionnaire des véhicules
+        customers: Dictionnaire des clients
+        rentals: Dictionnaire des locations
+
+    Returns:
+        Le contenu binaire du snapshot (en-tête compris)
+    """
+    strings = _StringTable()
+    vehicle_cols = _encode_vehicles(vehicles, strings)
+    customer_cols = _encode_customers(customers, strings)
+    rental_cols = _encode_rentals(rentals, strings)
+
+    string_blob = strings.to_bytes()
+    parts = [_U32.pack(len(string_blob)), string_blob]
+    _write_columns(parts, VEHICLE_COLUMNS, vehicle_cols)
+    _write_columns(parts, CUSTOMER_COLUMNS, customer_cols)
+    _write_columns(parts, RENTAL_COLUMNS, rental_cols)
+    body = b"".join(parts)
+
+    header = _HEADER.pack(
+        SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0,
+        len(vehicles), len(customers), len(rentals),
+        len(body), zlib.crc32(body)
+    )
+    return header + body
+
+
+class _Reader:
+    """Lecture séquentielle des colonnes du corps d'un snapshot."""
+
+    def __init__(self, body: memoryview):
+        self._body = body
+        self._pos = 0
+
+    def read_strings(self) -> List[str]:
+        (size,) = _U32.unpack_from(self._body, self._pos)
+        self._pos += _U32.size
+        blob = bytes(self._body[self._pos:self._pos + size])
+        self._pos += size
+        return blob.decode("utf-8").split("\x00")
+
+    def read_columns(self, spec, expected: int) -> Dict[str, array]:
+        cols = {}
+        for name, typecode in spec:
+            raw_typecode, count = _COLUMN_HEADER.unpack_from(self._body, self._pos)
+            self._pos += _COLUMN_HEADER.size
+            if raw_typecode.decode("ascii") != typecode:
+                raise SnapshotError(f"Colonne '{name}' de type inattendu")
+            column = array(typecode)
+            size = count * column.itemsize
+            column.frombytes(self._body[self._pos:self._pos + size])
+            self._pos += size
+            if sys.byteorder != "little":
+                column.byteswap()
+            cols[name] = column
+        if len(cols[spec[0][0]]) != expected:
+            raise SnapshotError("Nombre d'enregistrements incohérent avec l'en-tête")
+        return cols
+
+
+def _decode_vehicles(cols: Dict[str, array], strings: List[str]) -> Dict[str, Vehicle]:
+    vehicles: Dict[str, Vehicle] = {}
+    for i in range(len(cols["id"])):
+        common = dict(
+            brand=strings[cols["brand"][i]],
+            model=strings[cols["model"][i]],
+            category=_CATEGORIES[cols["category"][i]],
+            daily_rate=cols["daily_rate"][i],
+            year=cols["year"][i],
+            license_plate=strings[cols["license_plate"][i]],
+            mileage=cols["mileage"][i],
+            vehicle_id=strings[cols["id"][i]],
+        )
+        kind = cols["class"][i]
+        if kind == _VEHICLE_CAR:
+            vehicle = Car(
+                **common,
+                num_doors=cols["int_a"][i],
+                num_seats=cols["int_b"][i],
+                fuel_type=strings[cols["str_a"][i]],
+                transmission=strings[cols["str_b"][i]],
+            )
+        elif kind == _VEHICLE_TRUCK:
+            vehicle = Truck(
+                **common,
+                cargo_capacity=cols["float_a"][i],
+                max_weight=cols["float_b"][i],
+                has_tail_lift=bool(cols["flag"][i]),
+            )
+        elif kind == _VEHICLE_MOTORCYCLE:
+            vehicle = Motorcycle(
+                **common,
+                engine_size=cols["int_a"][i],
+                motorcycle_type=strings[cols["str_a"][i]],
+            )
+        else:
+            raise SnapshotError(f"Code de véhicule inconnu: {kind}")
+        vehicle.state = _STATES[cols["state"][i]]
+        vehicles[vehicle.id] = vehicle
+    return vehicles
+
+
+def _decode_customers(cols: Dict[str, array], strings: List[str]) -> Dict[str, Customer]:
+    customers: Dict[str, Customer] = {}
+    from_ordinal = date.fromordinal
+    history, active = cols["history"], cols["active"]
+    history_pos = active_pos = 0
+    for i in range(len(cols["id"])):
+        license_types = strings[cols["license_types"][i]]
+        customer = Customer(
+            first_name=strings[cols["first_name"][i]],
+            last_name=strings[cols["last_name"][i]],
+            birth_date=from_ordinal(cols["birth_date"][i]),
+            license_number=strings[cols["license_number"][i]],
+            license_types=set(license_types.split(",")) if license_types else set(),
+            license_date=from_ordinal(cols["license_date"][i]),
+            email=strings[cols["email"][i]],
+            phone=strings[cols["phone"][i]],
+            address=strings[cols["address"][i]],
+            customer_id=strings[cols["id"][i]],
+        )
+        history_end = history_pos + cols["history_len"][i]
+        active_end = active_pos + cols["active_len"][i]
+        reason_index = cols["blocked_reason"][i]
+        customer.restore_state(
+            rental_history=[strings[k] for k in history[history_pos:history_end]],
+            active_rentals=[strings[k] for k in active[active_pos:active_end]],
+            is_blocked=bool(cols["is_blocked"][i]),
+            blocked_reason=None if reason_index == _NONE_INDEX else strings[reason_index],
+        )
+        history_pos, active_pos = history_end, active_end
+        customers[customer.id] = customer
+    return customers
+
+
+def _decode_rentals(cols: Dict[str, array], strings: List[str]) -> Dict[str, Rental]:
+    """
+    Reconstruit les locations telles qu'elles étaient en mémoire.
+
+    Le snapshot étant une image de l'état déjà validé, le constructeur de
+    Rental (qui refuse les dates passées) n'est pas rappelé.
+    """
+    rentals: Dict[str, Rental] = {}
+    restore = Rental.restore
+    statuses = _STATUSES
+
+    # Les dates se répètent beaucoup: une seule instance par jour
+    dates: Dict[int, date] = {}
+
+    def to_date(ordinal: int) -> date:
+        value = dates.get(ordinal)
+        if value is None:
+            value = dates[ordinal] = date.fromordinal(ordinal)
+        return value
+
+    columns = [cols[name] for name, _ in RENTAL_COLUMNS]
+    for (id_, customer, vehicle, start, end, returned, status, rate,
+         start_km, end_km, penalty, discount, notes, created) in zip(*columns):
+        rental_id = strings[id_]
+        rentals[rental_id] = restore(
+            rental_id, strings[customer], strings[vehicle], to_date(start), to_date(end),
+            to_date(returned) if returned else None, statuses[status], rate, start_km,
+            None if end_km != end_km else end_km, penalty,
+            datetime.min + created * _MICROSECOND, strings[notes], discount
+        )
+    return rentals
+
+
+def decode_snapshot(data: bytes) -> Tuple[Dict, Dict, Dict]:
+    """
+    Décode un snapshot binaire.
+
+    Args:
+        data: Contenu binaire du snapshot
+
+    Returns:
+        Tuple (vehicles, customers, rentals)
+
+    Raises:
+        SnapshotError: Si le snapshot est tronqué, corrompu ou d'une autre version
+    """
+    if len(data) < _HEADER.size:
+        raise SnapshotError("Snapshot tronqué (en-tête incomplet)")
+
+    (magic, version, _, n_vehicles, n_customers, n_rentals,
+     body_size, checksum) = _HEADER.unpack_from(data, 0)
+    if magic != SNAPSHOT_MAGIC:
+        raise SnapshotError("Fichier qui n'est pas un snapshot")
+    if version != SNAPSHOT_VERSION:
+        raise SnapshotError(f"Version de snapshot non supportée: {version}")
+
+    body = memoryview(data)[_HEADER.size:]
+    if len(body) != body_size:
+        raise SnapshotError("Snapshot tronqué (corps incomplet)")
+    if zlib.crc32(body) != checksum:
+        raise SnapshotError("Somme de contrôle invalide")
+
+    try:
+        reader = _Reader(body)
+        strings = reader.read_strings()
+        vehicle_cols = reader.read_columns(VEHICLE_COLUMNS, n_vehicles)
+        customer_cols = reader.read_columns(CUSTOMER_COLUMNS, n_customers)
+        rental_cols = reader.read_columns(RENTAL_COLUMNS, n_rentals)
+    except (struct.error, ValueError) as e:
+        raise SnapshotError(f"Snapshot mal formé: {e}")
+
+    with gc_paused():
+        return (
+            _decode_vehicles(vehicle_cols, strings),
+            _decode_customers(customer_cols, strings),
+            _decode_rentals(rental_cols, strings),
+        )
+
+
+def write_snapshot(
+    path: str | Path,
+    vehicles: Dict[str, Vehicle],
+    customers: Dict[str, Customer],
+    rentals: Dict[str, Rental]
+) -> int:
+    """
+    Écrit un snapshot sur disque (via un fichier temporaire renommé).
+
+    Returns:
+        Taille du snapshot en octets
+    """
+    path = Path(path)
+    data = encode_snapshot(vehicles, customers, rentals)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
+    return len(data)
+
+
+def read_snapshot(path: str | Path) -> Tuple[Dict, Dict, Dict]:
+    """Lit un snapshot depuis le disque (voir decode_snapshot)."""
+    return decode_snapshot(Path(path).read_bytes())
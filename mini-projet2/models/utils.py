@@ -2,8 +2,11 @@
 Module utilitaire avec des fonctions helpers réutilisables.
 """
 
+import gc
+import threading
+from contextlib import contextmanager
 from datetime import date
-from typing import Tuple
+from typing import Callable, Dict, Iterator, Tuple
 
 
 def calculate_years_difference(from_date: date, to_date: date | None = None) -> int:
@@ -91,3 +94,54 @@ def calculate_rental_discount(days: int, base_cost: float) -> Tuple[float, float
     
     final_cost = base_cost * (1 - discount)
     return final_cost, discount
+
+
+# Suspensions du GC en cours (tous threads confondus), sous _gc_lock
+_gc_lock = threading.Lock()
+_gc_pause_depth = 0
+_gc_was_enabled = False
+
+
+@contextmanager
+def gc_paused() -> Iterator[None]:
+    """
+    Suspend le ramasse-miettes cyclique pendant une construction massive.
+    
+    Les objets créés ne forment pas de cycles; sans cela, chaque passage du
+    GC reparcourt tous les objets déjà créés.
+    
+    Le GC est global au processus: les suspensions de plusieurs threads
+    sont comptées, la première le désactive et la dernière le réactive
+    (s'il était actif avant la première).
+    """
+    global _gc_pause_depth, _gc_was_enabled
+    with _gc_lock:
+        if _gc_pause_depth == 0:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pause_depth += 1
+    try:
+        yield
+    finally:
+        with _gc_lock:
+            _gc_pause_depth -= 1
+            if _gc_pause_depth == 0 and _gc_was_enabled:
+                gc.enable()
+
+
+def memoized_date_parser() -> Callable[[str], date]:
+    """
+    Retourne un convertisseur ISO -> date qui réutilise les dates déjà vues.
+    
+    Les dates se répètent beaucoup dans un historique de locations: chaque
+    jour n'est analysé et alloué qu'une seule fois.
+    """
+    cache: Dict[str, date] = {}
+    
+    def parse(value: str) -> date:
+        parsed = cache.get(value)
+        if parsed is None:
+            parsed = cache[value] = date.fromisoformat(value)
+        return parsed
+    
+    return parse
@@ -5,7 +5,7 @@ Contient la hiérarchie de classes Vehicle, Car, Truck, Motorcycle.
 from abc import ABC, abstractmethod
 from enum import Enum
 from datetime import datetime, date
-from typing import Optional, List
+from typing import Optional, List, Tuple, Any
 import uuid
 
 # Constantes locales pour éviter les imports circulaires
@@ -71,8 +71,15 @@ class Vehicle(ABC):
         license_plate (str): Numéro d'immatriculation
         mileage (float): Kilométrage actuel
         maintenance_history (List[dict]): Historique d'entretien
+    
+    Les sous-classes déclarent leur libellé (VEHICLE_TYPE) et leurs champs
+    sauvegardés (PERSISTED_FIELDS: paires (nom, valeur par défaut), le nom
+    étant à la fois la propriété et l'argument du constructeur).
     """
     
+    VEHICLE_TYPE: str = ""
+    PERSISTED_FIELDS: Tuple[Tuple[str, Any], ...] = ()
+    
     def __init__(
         self,
         brand: str,
@@ -284,6 +291,14 @@ class Car(Vehicle):
         transmission (str): Type de transmission
     """
     
+    VEHICLE_TYPE = "Voiture"
+    PERSISTED_FIELDS = (
+        ('num_doors', 5),
+        ('num_seats', 5),
+        ('fuel_type', "essence"),
+        ('transmission', "manuelle"),
+    )
+    
     def __init__(
         self,
         brand: str,
@@ -325,7 +340,7 @@ class Car(Vehicle):
         return self._transmission
     
     def get_vehicle_type(self) -> str:
-        return "Voiture"
+        return self.VEHICLE_TYPE
     
     def get_minimum_driver_age(self) -> int:
         """Retourne l'âge minimum selon la catégorie du véhicule."""
@@ -361,6 +376,13 @@ class Truck(Vehicle):
         has_tail_lift (bool): Présence d'un hayon élévateur
     """
     
+    VEHICLE_TYPE = "Camion"
+    PERSISTED_FIELDS = (
+        ('cargo_capacity', 10),
+        ('max_weight', 3500),
+        ('has_tail_lift', False),
+    )
+    
     def __init__(
         self,
         brand: str,
@@ -396,7 +418,7 @@ class Truck(Vehicle):
         return self._has_tail_lift
     
     def get_vehicle_type(self) -> str:
-        return "Camion"
+        return self.VEHICLE_TYPE
     
     def get_minimum_driver_age(self) -> int:
         """Retourne l'âge minimum selon le poids du camion."""
@@ -433,6 +455,12 @@ class Motorcycle(Vehicle):
         motorcycle_type (str): Type de moto (sport, touring, etc.)
     """
     
+    VEHICLE_TYPE = "Moto"
+    PERSISTED_FIELDS = (
+        ('engine_size', 125),
+        ('motorcycle_type', "standard"),
+    )
+    
     def __init__(
         self,
         brand: str,
@@ -462,7 +490,7 @@ class Motorcycle(Vehicle):
         return self._motorcycle_type
     
     def get_vehicle_type(self) -> str:
-        return "Moto"
+        return self.VEHICLE_TYPE
     
     def get_minimum_driver_age(self) -> int:
         """Retourne l'âge minimum selon la cylindrée."""
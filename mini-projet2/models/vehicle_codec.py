@@ -0,0 +1,145 @@
+"""
+Module de sérialisation des véhicules.
+
+Chaque sous-classe de Vehicle déclare une fois ses champs sauvegardés
+(PERSISTED_FIELDS). Un codec est construit par classe à l'enregistrement:
+les lecteurs d'attributs, les valeurs par défaut et les correspondances
+valeur -> enum sont précalculés, pour que l'encodage et le décodage de
+chaque véhicule ne fassent plus ni recherche ni test de type.
+"""
+
+from operator import attrgetter
+from typing import Any, Dict, Optional, Type
+
+from models.vehicle import Vehicle, Car, Truck, Motorcycle, VehicleCategory, VehicleState
+
+# Correspondances valeur sauvegardée -> membre d'enum
+CATEGORY_BY_VALUE: Dict[str, VehicleCategory] = {c.value: c for c in VehicleCategory}
+STATE_BY_VALUE: Dict[str, VehicleState] = {s.value: s for s in VehicleState}
+
+# Champs communs à tous les véhicules: (nom sauvegardé, attribut lu),
+# les énumérations étant sauvegardées par leur valeur
+BASE_FIELDS = (
+    ('brand', '_brand'),
+    ('model', '_model'),
+    ('category', '_category.value'),
+    ('daily_rate', '_daily_rate'),
+    ('state', '_state.value'),
+    ('year', '_year'),
+    ('license_plate', '_license_plate'),
+    ('mileage', '_mileage'),
+)
+
+
+class VehicleCodec:
+    """
+    Encodeur/décodeur d'une classe de véhicule.
+
+    Attributes:
+        vehicle_class: Classe concrète de véhicule
+        class_name: Nom sauvegardé dans le champ '_class'
+        type_name: Libellé français (champ 'type')
+    """
+
+    def __init__(self, vehicle_class: Type[Vehicle]):
+        self.vehicle_class = vehicle_class
+        self.class_name = vehicle_class.__name__
+        self.type_name = vehicle_class.VEHICLE_TYPE
+        self._fields = tuple(vehicle_class.PERSISTED_FIELDS)
+        # Champs sauvegardés et leurs lecteurs, communs puis propres à la classe
+        self._getters = tuple(
+            [(name, attrgetter(attribute)) for name, attribute in BASE_FIELDS]
+            + [(name, attrgetter(name)) for name, _ in self._fields]
+        )
+
+    def encode(self, vehicle: Vehicle) -> Dict[str, Any]:
+        """
+        Convertit un véhicule en dictionnaire sauvegardable.
+
+        Seuls les champs déclarés sont lus (les valeurs dérivées, comme
+        l'âge minimum, ne sont pas sauvegardées), plus le type et le nom
+        de classe ('_class').
+        """
+        data = {'id': vehicle.id, 'type': self.type_name}
+        for name, get in self._getters:
+            data[name] = get(vehicle)
+        data['_class'] = self.class_name
+        return data
+
+    def decode(self, data: Dict[str, Any]) -> Vehicle:
+        """
+        Reconstruit un véhicule depuis un dictionnaire sauvegardé.
+
+        Raises:
+            KeyError: Si un champ obligatoire manque
+        """
+        get = data.get
+        vehicle = self.vehicle_class(
+            brand=data['brand'],
+            model=data['model'],
+            category=CATEGORY_BY_VALUE.get(get('category'), VehicleCategory.STANDARD),
+            daily_rate=data['daily_rate'],
+            year=data['year'],
+            license_plate=data['license_plate'],
+            mileage=get('mileage', 0),
+            vehicle_id=data['id'],
+            **{name: get(name, default) for name, default in self._fields}
+        )
+        state = STATE_BY_VALUE.get(get('state'))
+        if state is not None:
+            vehicle.state = state
+        return vehicle
+
+
+# Registre: classe -> codec, et nom de classe ou libellé -> codec
+_CODECS_BY_CLASS: Dict[type, VehicleCodec] = {}
+_CODECS_BY_NAME: Dict[str, VehicleCodec] = {}
+
+
+def register_vehicle_class(vehicle_class: Type[Vehicle]) -> VehicleCodec:
+    """
+    Enregistre une classe de véhicule et construit son codec.
+
+    Args:
+        vehicle_class: Sous-classe concrète de Vehicle
+
+    Returns:
+        Le codec créé
+    """
+    codec = VehicleCodec(vehicle_class)
+    _CODECS_BY_CLASS[vehicle_class] = codec
+    _CODECS_BY_NAME[codec.class_name] = codec
+    _CODECS_BY_NAME[codec.type_name] = codec
+    return codec
+
+
+def get_codec(name: str) -> Optional[VehicleCodec]:
+    """Retourne le codec d'un nom de classe ('Car') ou d'un libellé ('Voiture')."""
+    return _CODECS_BY_NAME.get(name)
+
+
+def encode_vehicle(vehicle: Vehicle) -> Dict[str, Any]:
+    """
+    Encode un véhicule avec le codec de sa classe.
+
+    Raises:
+        KeyError: Si la classe du véhicule n'est pas enregistrée
+    """
+    return _CODECS_BY_CLASS[type(vehicle)].encode(vehicle)
+
+
+def decode_vehicle(data: Dict[str, Any]) -> Optional[Vehicle]:
+    """
+    Décode un véhicule selon son champ '_class' (ou 'type' à défaut).
+
+    Returns:
+        Le véhicule, ou None si le type est inconnu
+    """
+    codec = _CODECS_BY_NAME.get(data.get('_class') or data.get('type', ''))
+    if codec is None:
+        return None
+    return codec.decode(data)
+
+
+for _vehicle_class in (Car, Truck, Motorcycle):
+    register_vehicle_class(_vehicle_class)
@@ -10,6 +10,7 @@ Usage:
     python run_tests.py --cov        # Avec couverture de code
     python run_tests.py --html       # Génère un rapport HTML
     python run_tests.py <test_file>  # Lance un fichier de test spécifique
+    python run_tests.py --bench      # Benchmarks comparés à la référence
 """
 
 import sys
@@ -112,6 +113,34 @@ def run_specific_tests(test_name: str) -> int:
     return subprocess.run(pytest_args).returncode
 
 
+def run_benchmarks(tiers: str, max_regression: float) -> int:
+    """
+    Lance la suite de benchmarks et la compare à la référence enregistrée.
+    
+    Args:
+        tiers: Paliers à mesurer, séparés par des virgules (1k, 100k, 1M)
+        max_regression: Ralentissement toléré par opération, en pourcents
+        
+    Returns:
+        Code de retour (0 = aucune régression)
+    """
+    project_root = get_project_root()
+    
+    bench_args = [
+        sys.executable,
+        str(project_root / "benchmarks" / "bench_suite.py"),
+        "--tiers", tiers,
+        "--compare",
+        "--max-regression", str(max_regression)
+    ]
+    
+    print("=" * 60)
+    print("[BENCH] BENCHMARKS DES OPERATIONS DU SYSTEME")
+    print("=" * 60)
+    
+    return subprocess.run(bench_args).returncode
+
+
 def list_tests() -> None:
     """Affiche la liste des fichiers de tests disponibles."""
     project_root = get_project_root()
@@ -142,6 +171,8 @@ Exemples:
   python run_tests.py --list             Liste les fichiers de tests
   python run_tests.py test_vehicle.py    Lance uniquement les tests de véhicules
   python run_tests.py -k "rental"        Lance les tests contenant "rental"
+  python run_tests.py --bench            Benchmarks (palier 100k) comparés à la référence
+  python run_tests.py --bench --bench-tiers 100k,1M --max-regression 10
         """
     )
     
@@ -186,6 +217,25 @@ Exemples:
         help="Arrêter au premier échec"
     )
     
+    parser.add_argument(
+        "--bench",
+        action="store_true",
+        help="Lancer les benchmarks et les comparer à la référence"
+    )
+    parser.add_argument(
+        "--bench-tiers",
+        default="100k",
+        metavar="PALIERS",
+        help="Paliers des benchmarks (1k, 100k, 1M, séparés par des virgules)"
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=20.0,
+        metavar="POURCENT",
+        help="Ralentissement toléré par opération avant échec (en %%)"
+    )
+    
     args = parser.parse_args()
     
     # Liste des tests
@@ -193,6 +243,10 @@ Exemples:
         list_tests()
         return 0
     
+    # Benchmarks
+    if args.bench:
+        return run_benchmarks(args.bench_tiers, args.max_regression)
+    
     # Couverture
     if args.cov:
         return run_with_coverage()
@@ -0,0 +1,107 @@
+"""
+Tests unitaires pour le service de sauvegarde automatique.
+"""
+
+import pytest
+import threading
+from datetime import date
+
+import sys
+sys.path.insert(0, '..')
+
+from car_rental_system import CarRentalSystem
+from models.autosave import AutosaveService
+from models.persistence import DataPersistence
+from models.vehicle import Car, VehicleCategory
+
+
+class TestAutosaveService:
+    """Tests pour la classe AutosaveService."""
+
+    @pytest.fixture
+    def system(self):
+        """Crée un système vide."""
+        return CarRentalSystem("Test Agency")
+
+    @pytest.fixture
+    def autosave(self, system, tmp_path):
+        """Crée un service de sauvegarde avec une longue fenêtre."""
+        service = AutosaveService(system, DataPersistence(tmp_path), delay=60.0)
+        service.start()
+        yield service
+        service.stop(flush=False)
+
+    def add_cars(self, system, count):
+        for i in range(count):
+            system.add_vehicle(Car(
+                brand="Renault", model="Clio", category=VehicleCategory.ECONOMY,
+                daily_rate=45.0, year=2022, license_plate=f"AB-{i:03d}-CD",
+                vehicle_id=f"VEH{i:03d}"
+            ))
+
+    def test_mutations_are_coalesced(self, system, autosave):
+        """Test du regroupement des modifications en une sauvegarde."""
+        self.add_cars(system, 5)
+
+        assert autosave.pending_changes == 5
+        assert autosave.flush(timeout=5)
+        status = autosave.get_status()
+        assert status['saves'] == 1
+        assert status['pending_changes'] == 0
+        assert status['last_saved_at'] is not None
+        assert len(autosave.persistence.load_vehicles()) == 5
+
+    def test_window_expiry_saves(self, system, tmp_path):
+        """Test de la sauvegarde à la fin de la fenêtre."""
+        service = AutosaveService(system, DataPersistence(tmp_path), delay=0.05)
+        service.start()
+        self.add_cars(system, 2)
+
+        service.stop(flush=True, timeout=5)
+
+        assert service.saves >= 1
+        assert service.pending_changes == 0
+
+    def test_stop_without_flush_discards(self, system, autosave):
+        """Test de l'arrêt sans sauvegarde."""
+        self.add_cars(system, 1)
+
+        autosave.stop(flush=False, timeout=5)
+        self.add_cars(system, 1)
+
+        assert autosave.saves == 0
+        assert not autosave.persistence.data_exists()
+
+    def test_reload_is_not_a_change(self, system, autosave):
+        """Test qu'un rechargement des données ne déclenche pas de sauvegarde."""
+        system.load_data({}, {}, {})
+
+        assert autosave.pending_changes == 0
+
+    def test_refused_mutation_not_pending(self, system, autosave):
+        """Test qu'une modification refusée ne déclenche pas de sauvegarde."""
+        self.add_cars(system, 1)
+        self.add_cars(system, 1)
+
+        assert autosave.pending_changes == 1
+
+    def test_write_outside_lock(self, system, autosave, monkeypatch):
+        """Test que l'écriture des fichiers ne tient pas le verrou du système."""
+        self.add_cars(system, 1)
+        lock_free = []
+        save_records = autosave.persistence.save_records
+
+        def checking_save_records(records):
+            # Un autre thread doit pouvoir prendre le verrou pendant l'écriture
+            thread = threading.Thread(
+                target=lambda: lock_free.append(system.lock.acquire(timeout=1))
+                and system.lock.release()
+            )
+            thread.start()
+            thread.join()
+            return save_records(records)
+
+        monkeypatch.setattr(autosave.persistence, "save_records", checking_save_records)
+
+        assert autosave.flush(timeout=5)
+        assert lock_free == [True]
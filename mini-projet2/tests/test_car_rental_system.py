@@ -2,6 +2,8 @@
 Tests unitaires pour la classe CarRentalSystem.
 """
 
+import io
+import json
 import pytest
 from datetime import date, timedelta
 
@@ -11,7 +13,9 @@ sys.path.insert(0, '..')
 from car_rental_system import CarRentalSystem
 from models.vehicle import Car, Truck, Motorcycle, VehicleCategory, VehicleState
 from models.customer import Customer
-from models.rental import RentalStatus
+from models.rental import Rental, RentalStatus
+from models.events import SystemEvent
+from models.report_export import export_report_rows
 
 
 class TestCarRentalSystem:
@@ -101,6 +105,20 @@ class TestCarRentalSystem:
         system.add_vehicle(sample_car)
         assert system.add_vehicle(sample_car) == False
     
+    def test_refused_mutation_keeps_version(self, system, sample_car):
+        """Test qu'une modification refusée ne change pas la version des données."""
+        system.add_vehicle(sample_car)
+        version = system.data_version
+        changes = []
+        system.events.subscribe(SystemEvent, changes.append)
+        
+        assert system.add_vehicle(sample_car) == False
+        assert system.remove_vehicle("NOTFOUND") == False
+        system.check_and_update_rentals()
+        
+        assert system.data_version == version
+        assert changes == []
+    
     def test_remove_vehicle(self, system, sample_car):
         """Test de suppression de véhicule."""
         system.add_vehicle(sample_car)
@@ -111,6 +129,24 @@ class TestCarRentalSystem:
         """Test de suppression de véhicule inexistant."""
         assert system.remove_vehicle("NOTFOUND") == False
     
+    def test_update_vehicle(self, system, sample_car):
+        """Test de modification d'un véhicule (même ID)."""
+        system.add_vehicle(sample_car)
+        edited = Car(
+            brand="Renault", model="Mégane", category=VehicleCategory.STANDARD,
+            daily_rate=55.0, year=2022, license_plate="AB-123-CD",
+            vehicle_id="CAR001"
+        )
+        
+        assert system.update_vehicle(edited) == True
+        assert system.get_vehicle("CAR001").model == "Mégane"
+        assert len(system.get_all_vehicles()) == 1
+        assert system.update_vehicle(Car(
+            brand="Renault", model="Clio", category=VehicleCategory.ECONOMY,
+            daily_rate=45.0, year=2022, license_plate="ZZ-999-ZZ",
+            vehicle_id="NOTFOUND"
+        )) == False
+    
     def test_get_vehicle(self, populated_system):
         """Test de récupération de véhicule."""
         vehicle = populated_system.get_vehicle("CAR001")
@@ -133,6 +169,20 @@ class TestCarRentalSystem:
         economy = populated_system.get_available_vehicles(category=VehicleCategory.ECONOMY)
         assert len(economy) == 1
     
+    def test_get_available_vehicles_for_period(self, populated_system):
+        """Test de disponibilité sur une période (locations réservées exclues)."""
+        start = date.today() + timedelta(days=5)
+        end = start + timedelta(days=3)
+        populated_system.create_rental("CUST001", "CAR001", start, end)
+        
+        assert populated_system.get_booked_vehicle_ids(end, end + timedelta(days=2)) == {"CAR001"}
+        assert populated_system.get_booked_vehicle_ids(end + timedelta(days=1), end + timedelta(days=2)) == set()
+        
+        available = populated_system.get_available_vehicles(
+            start_date=start - timedelta(days=2), end_date=start
+        )
+        assert [v.id for v in available] == ["TRK001"]
+    
     def test_search_vehicles_by_brand(self, populated_system):
         """Test de recherche par marque."""
         results = populated_system.search_vehicles(brand="Renault")
@@ -302,6 +352,34 @@ class TestCarRentalSystem:
         
         assert success == True
     
+    def test_update_rental(self, populated_system):
+        """Test de modification d'une location (date de fin avancée, notes)."""
+        start = date.today() + timedelta(days=1)
+        end = start + timedelta(days=3)
+        
+        rental, _ = populated_system.create_rental(
+            "CUST001", "CAR001", start, end, notes="Livraison à l'agence"
+        )
+        assert rental.notes == "Livraison à l'agence"
+        
+        success, _ = populated_system.update_rental(
+            rental.id, end_date=start + timedelta(days=1), notes="Retour tardif"
+        )
+        assert success == True
+        assert rental.end_date == start + timedelta(days=1)
+        assert rental.notes == "Retour tardif"
+        
+        # Une prolongation passe par extend_rental
+        success, _ = populated_system.update_rental(rental.id, end_date=end)
+        assert success == False
+        assert rental.end_date == start + timedelta(days=1)
+        
+        # Date de fin antérieure au début refusée
+        success, _ = populated_system.update_rental(rental.id, end_date=date.today())
+        assert success == False
+        
+        assert populated_system.update_rental("UNKNOWN", notes="x")[0] == False
+    
     def test_get_active_rentals(self, populated_system):
         """Test de récupération des locations actives."""
         start = date.today()
@@ -358,6 +436,25 @@ class TestCarRentalSystem:
         assert report['fleet']['total_vehicles'] == 2
         assert report['customers']['total_customers'] == 1
     
+    def test_snapshot_system(self, populated_system):
+        """Test des rapports calculés sur une copie du système."""
+        copy = populated_system.snapshot_system()
+        assert (copy.generate_statistics_report()['fleet']
+                == populated_system.generate_statistics_report()['fleet'])
+        
+        populated_system.remove_vehicle(populated_system.get_all_vehicles()[0].id)
+        
+        assert len(copy.get_all_vehicles()) == len(populated_system.get_all_vehicles()) + 1
+        
+        # Les entités sont copiées: une location créée ensuite n'y apparaît pas
+        vehicle = populated_system.get_all_vehicles()[0]
+        populated_system.create_rental(
+            "CUST001", vehicle.id, date.today(), date.today() + timedelta(days=1)
+        )
+        assert copy.get_customer("CUST001").get_total_rentals() == 0
+        assert copy.get_vehicle(vehicle.id).state == VehicleState.AVAILABLE
+        assert populated_system.get_vehicle(vehicle.id).state == VehicleState.RENTED
+    
     def test_get_summary(self, populated_system):
         """Test du résumé."""
         summary = populated_system.get_summary()
@@ -365,7 +462,234 @@ class TestCarRentalSystem:
         assert summary['agency'] == "TestAgency"
         assert summary['total_vehicles'] == 2
         assert summary['total_customers'] == 1
+    
+    # === Tests de l'export en flux ===
+    
+    def test_available_vehicles_report_rows(self, populated_system):
+        """Test que le rapport réutilise une seule sérialisation par véhicule."""
+        report = populated_system.generate_available_vehicles_report()
+        
+        car_row = report['by_type']['Voiture'][0]
+        assert car_row is report['vehicles'][0]
+        assert car_row is report['by_category']['économique'][0]
+    
+    @pytest.mark.parametrize("fmt", ["csv", "jsonl"])
+    def test_export_active_rentals(self, populated_system, fmt):
+        """Test de l'export en flux des locations en cours."""
+        start = date.today()
+        populated_system.create_rental("CUST001", "CAR001", start, start + timedelta(days=3))
+        populated_system.create_rental("CUST001", "TRK001", start, start + timedelta(days=2))
+        output = io.StringIO()
+        
+        count = export_report_rows(
+            populated_system.iter_active_rentals_report_rows(), output, fmt
+        )
+        
+        lines = output.getvalue().splitlines()
+        assert count == 2
+        if fmt == "csv":
+            assert lines[0].startswith("id,customer_id,vehicle_id")
+            assert len(lines) == 3
+        else:
+            assert json.loads(lines[1])['customer_name'] == "Jean Dupont"
 
+    
+    # === Tests du classement des clients ===
+    
+    @pytest.fixture
+    def ranked_system(self, populated_system):
+        """Ajoute un second client, sans location, au système."""
+        populated_system.add_customer(Customer(
+            first_name="Paul",
+            last_name="Bernard",
+            birth_date=date(1985, 3, 10),
+            license_number="555555555555",
+            license_types={"B", "C"},
+            license_date=date(2005, 4, 1),
+            email="paul.bernard@email.com",
+            phone="0611223344",
+            customer_id="CUST000"
+        ))
+        return populated_system
+    
+    def test_top_customers_updated_incrementally(self, ranked_system):
+        """Test que le classement suit les créations de locations."""
+        ranking = ranked_system.get_top_customers(2)
+        assert [c.id for c in ranking] == ["CUST000", "CUST001"]
+        
+        today = date.today()
+        ranked_system.create_rental(
+            "CUST001", "CAR001", today + timedelta(days=1), today + timedelta(days=2)
+        )
+        
+        ranking = ranked_system.get_top_customers(2, by="rentals")
+        assert [c.id for c in ranking] == ["CUST001", "CUST000"]
+        assert [c.id for c in ranked_system.get_top_customers(1)] == ["CUST001"]
+    
+    def test_top_customers_by_revenue(self, ranked_system):
+        """Test du classement par chiffre d'affaires."""
+        ranked_system.get_top_customers(by="revenue")
+        today = date.today()
+        rental, _ = ranked_system.create_rental("CUST001", "CAR001", today, today)
+        ranked_system.create_rental(
+            "CUST000", "TRK001", today + timedelta(days=5), today + timedelta(days=6)
+        )
+        ranked_system.complete_rental(rental.id, today)
+        
+        ranking = ranked_system.get_top_customers(2, by="revenue")
+        assert [c.id for c in ranking] == ["CUST001", "CUST000"]
+        
+        ranked_system.remove_customer("CUST001")
+        ranking = ranked_system.get_top_customers(2, by="revenue")
+        assert [c.id for c in ranking] == ["CUST000"]
+    
+    def test_update_customer_keeps_ranking(self, ranked_system):
+        """Test qu'une modification de client conserve son chiffre d'affaires."""
+        ranked_system.get_top_customers(by="revenue")
+        today = date.today()
+        rental, _ = ranked_system.create_rental("CUST000", "CAR001", today, today)
+        ranked_system.complete_rental(rental.id, today)
+        
+        # Même chemin que la page clients: nouveau client, état restauré
+        old = ranked_system.get_customer("CUST000")
+        edited = Customer(
+            first_name="Paul",
+            last_name="Bernard",
+            birth_date=date(1985, 3, 10),
+            license_number="555555555555",
+            license_types={"B", "C"},
+            license_date=date(2005, 4, 1),
+            email="paul.b@email.com",
+            phone="0611223344",
+            customer_id="CUST000"
+        )
+        edited.restore_state(
+            rental_history=old.rental_history,
+            active_rentals=old.active_rentals,
+            is_blocked=old.is_blocked,
+            blocked_reason=old.blocked_reason
+        )
+        
+        assert ranked_system.update_customer(edited) == True
+        assert ranked_system.get_customer("CUST000").email == "paul.b@email.com"
+        ranking = ranked_system.get_top_customers(2, by="revenue")
+        assert [c.id for c in ranking] == ["CUST000", "CUST001"]
+        assert ranking[0] is edited
+        assert ranked_system.get_top_customers(1, by="rentals")[0] is edited
+        
+        edited_unknown = Customer(
+            first_name="Luc", last_name="Martin", birth_date=date(1990, 1, 1),
+            license_number="999999999999", license_types={"B"},
+            license_date=date(2010, 1, 1), email="luc@email.com",
+            phone="0600000000", customer_id="NOTFOUND"
+        )
+        assert ranked_system.update_customer(edited_unknown) == False
+    
+    def test_top_customers_invalid_criterion(self, populated_system):
+        """Test d'un critère de classement inconnu."""
+        with pytest.raises(ValueError):
+            populated_system.get_top_customers(by="age")
+    
+    # === Tests de la série d'utilisation ===
+    
+    def test_utilization_series_by_type(self, populated_system):
+        """Test de l'occupation journalière par type de véhicule."""
+        today = date.today()
+        populated_system.create_rental(
+            "CUST001", "CAR001", today + timedelta(days=1), today + timedelta(days=3)
+        )
+        truck_rental, _ = populated_system.create_rental(
+            "CUST001", "TRK001", today + timedelta(days=2), today + timedelta(days=2)
+        )
+        populated_system.cancel_rental(truck_rental.id)
+        
+        report = populated_system.generate_utilization_series(
+            today, today + timedelta(days=4)
+        )
+        
+        assert report['dates'][0] == today.isoformat()
+        assert len(report['dates']) == 5
+        assert report['series']['Voiture']['occupied'] == [0, 1, 1, 1, 0]
+        assert report['series']['Voiture']['utilization_rate'][1] == 100.0
+        assert report['series']['Camion']['occupied'] == [0, 0, 0, 0, 0]
+    
+    def test_utilization_series_by_vehicle(self, populated_system):
+        """Test du regroupement par véhicule et des bornes de la période."""
+        today = date.today()
+        populated_system.create_rental(
+            "CUST001", "CAR001", today, today + timedelta(days=9)
+        )
+        
+        report = populated_system.generate_utilization_series(
+            today + timedelta(days=8), today + timedelta(days=11), group_by="vehicle"
+        )
+        
+        assert report['series']['CAR001']['occupied'] == [1, 1, 0, 0]
+        assert report['series']['CAR001']['average_utilization'] == 50.0
+    
+    def test_utilization_series_invalid_group(self, populated_system):
+        """Test d'un regroupement inconnu."""
+        with pytest.raises(ValueError):
+            populated_system.generate_utilization_series(
+                date.today(), date.today(), group_by="brand"
+            )
+    
+    # === Tests de la prévision de la demande ===
+    
+    @pytest.fixture
+    def weekend_system(self, populated_system):
+        """Système dont la voiture a été louée chaque week-end pendant 8 semaines."""
+        today = date.today()
+        last_saturday = today - timedelta(days=(today.weekday() - 5) % 7 or 7)
+        rentals = {}
+        for week in range(8):
+            saturday = last_saturday - timedelta(weeks=week)
+            sunday = saturday + timedelta(days=1)
+            rental = Rental.from_record({
+                'id': f"RENT{week:03d}", 'customer_id': "CUST001",
+                'vehicle_id': "CAR001", 'start_date': saturday.isoformat(),
+                'end_date': sunday.isoformat(),
+                'actual_return_date': sunday.isoformat(), 'status': "terminée",
+                'daily_rate': 45.0, 'created_at': "2020-01-01T10:00:00"
+            })
+            rentals[rental.id] = rental
+        system = populated_system
+        vehicles, customers, _ = system.snapshot()
+        system.load_data(vehicles, customers, rentals)
+        return system
+    
+    def test_demand_forecast_weekly_profile(self, weekend_system):
+        """Test que la prévision reproduit la saisonnalité hebdomadaire."""
+        report = weekend_system.generate_demand_forecast_report(weeks=2)
+        economy = report['series']['économique']
+        
+        assert economy['weekday_profile']['samedi'] > economy['weekday_profile']['mardi']
+        assert len(economy['forecast']) == 2
+        assert len(economy['forecast'][0]['daily']) == 7
+        assert economy['recommended_fleet'] == 1
+        
+        first_week = economy['forecast'][0]
+        week_start = date.fromisoformat(first_week['week_start'])
+        saturday = (5 - week_start.weekday()) % 7
+        tuesday = (1 - week_start.weekday()) % 7
+        assert first_week['daily'][saturday] > first_week['daily'][tuesday]
+        assert sum(report['series']['utilitaire']['daily_demand']) == 0
+    
+    def test_demand_forecast_cached_by_data_version(self, weekend_system, young_customer):
+        """Test du cache de la prévision, invalidé par une modification."""
+        report = weekend_system.generate_demand_forecast_report(group_by="type")
+        assert weekend_system.generate_demand_forecast_report(group_by="type") is report
+        
+        weekend_system.add_customer(young_customer)
+        
+        assert weekend_system.generate_demand_forecast_report(group_by="type") is not report
+    
+    def test_demand_forecast_invalid_parameters(self, populated_system):
+        """Test des paramètres invalides de la prévision."""
+        with pytest.raises(ValueError):
+            populated_system.generate_demand_forecast_report(group_by="vehicle")
+        with pytest.raises(ValueError):
+            populated_system.generate_demand_forecast_report(weeks=0)
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
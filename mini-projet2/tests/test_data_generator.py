@@ -0,0 +1,130 @@
+"""
+Tests unitaires pour le générateur de données synthétiques.
+"""
+
+import pytest
+from collections import defaultdict
+from datetime import date
+
+import sys
+sys.path.insert(0, '..')
+
+from car_rental_system import CarRentalSystem
+from models.data_generator import SyntheticDataGenerator
+from models.persistence import DataPersistence
+from models.rental import RentalStatus
+from models.vehicle import VehicleState
+
+
+TODAY = date(2026, 6, 15)
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    """Jeu de données partagé (généré une seule fois)."""
+    return SyntheticDataGenerator(seed=7, today=TODAY).generate(200)
+
+
+class TestSyntheticDataGenerator:
+    """Tests pour la classe SyntheticDataGenerator."""
+
+    def test_sizes(self, dataset):
+        """Test des tailles générées (deux clients par véhicule par défaut)."""
+        assert len(dataset.vehicles) == 200
+        assert len(dataset.customers) == 400
+        assert len(dataset.rentals) > 200 * 50
+
+    def test_deterministic(self, dataset):
+        """Test que la même graine produit les mêmes données."""
+        other = SyntheticDataGenerator(seed=7, today=TODAY).generate(200)
+        assert list(other.rentals) == list(dataset.rentals)
+        assert ([r.to_dict() for r in other.rentals.values()]
+                == [r.to_dict() for r in dataset.rentals.values()])
+        assert ([c.to_dict() for c in other.customers.values()]
+                == [c.to_dict() for c in dataset.customers.values()])
+        assert ([v.to_dict() for v in other.vehicles.values()]
+                == [v.to_dict() for v in dataset.vehicles.values()])
+
+        different = SyntheticDataGenerator(seed=8, today=TODAY).generate(200)
+        assert ([r.to_dict() for r in different.rentals.values()]
+                != [r.to_dict() for r in dataset.rentals.values()])
+
+    def test_all_statuses(self, dataset):
+        """Test que tous les statuts sont représentés."""
+        counts = dataset.status_counts()
+        assert all(counts[status] > 0 for status in RentalStatus)
+        assert counts[RentalStatus.COMPLETED] > counts[RentalStatus.RESERVED]
+
+    def test_no_overlap(self, dataset):
+        """Test qu'un véhicule n'est jamais loué deux fois le même jour."""
+        by_vehicle = defaultdict(list)
+        for rental in dataset.rentals.values():
+            last_day = rental.occupied_until(TODAY)
+            if last_day is not None:
+                by_vehicle[rental.vehicle_id].append((rental.start_date, last_day))
+        for periods in by_vehicle.values():
+            periods.sort()
+            for (_, previous_end), (next_start, _) in zip(periods, periods[1:]):
+                assert next_start > previous_end
+
+    def test_statuses_consistent_with_dates(self, dataset):
+        """Test de la cohérence entre statut, dates et kilométrage."""
+        for rental in dataset.rentals.values():
+            assert rental.created_at.date() <= TODAY
+            if rental.status == RentalStatus.COMPLETED:
+                assert rental.actual_return_date <= TODAY
+                assert rental.end_mileage >= rental.start_mileage
+            elif rental.status == RentalStatus.ACTIVE:
+                assert rental.start_date <= TODAY
+                assert dataset.vehicles[rental.vehicle_id].state == VehicleState.RENTED
+            elif rental.status == RentalStatus.RESERVED:
+                assert rental.start_date > TODAY
+
+    def test_customers_allowed_to_rent(self, dataset):
+        """Test que chaque location respecte le permis et l'âge du client."""
+        for rental in dataset.rentals.values():
+            vehicle = dataset.vehicles[rental.vehicle_id]
+            customer = dataset.customers[rental.customer_id]
+            assert vehicle.get_required_license() in customer.license_types
+
+    def test_customer_history(self, dataset):
+        """Test que l'historique des clients reprend leurs locations."""
+        total = sum(len(c.rental_history) for c in dataset.customers.values())
+        assert total == len(dataset.rentals)
+        for customer in dataset.customers.values():
+            for rental_id in customer.active_rentals:
+                assert dataset.rentals[rental_id].status in (
+                    RentalStatus.RESERVED, RentalStatus.ACTIVE)
+
+    def test_target_rentals(self):
+        """Test du nombre de locations visé."""
+        dataset = SyntheticDataGenerator(seed=1, today=TODAY).generate(100, num_rentals=20000)
+        assert 16000 < len(dataset.rentals) < 24000
+
+    def test_negative_count(self):
+        """Test qu'un nombre négatif est refusé."""
+        with pytest.raises(ValueError):
+            SyntheticDataGenerator().generate(-1)
+
+    def test_load_into_system(self, dataset):
+        """Test du chargement dans un CarRentalSystem."""
+        system = CarRentalSystem("Test")
+        dataset.load_into(system)
+        assert len(system.get_all_vehicles()) == 200
+        assert len(system.get_all_customers()) == 400
+        assert len(system.get_all_rentals()) == len(dataset.rentals)
+
+    def test_save_and_load(self, tmp_path):
+        """Test de la sauvegarde par DataPersistence."""
+        dataset = SyntheticDataGenerator(seed=3, today=TODAY).generate(20)
+        assert dataset.save(DataPersistence(tmp_path, "jsonl"))
+
+        vehicles, customers, rentals = DataPersistence(tmp_path, "jsonl").load_all()
+        assert set(vehicles) == set(dataset.vehicles)
+        assert set(customers) == set(dataset.customers)
+        assert ([r.to_dict() for r in rentals.values()]
+                == [r.to_dict() for r in dataset.rentals.values()])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
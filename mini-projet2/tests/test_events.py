@@ -0,0 +1,223 @@
+"""
+Tests unitaires pour le bus d'événements et les événements du système.
+"""
+
+import pytest
+from datetime import date, timedelta
+
+import sys
+sys.path.insert(0, '..')
+
+from car_rental_system import CarRentalSystem
+from models.customer import Customer
+from models.events import (
+    EventBus, SystemEvent, DataReloaded,
+    VehicleEvent, VehicleAdded, VehicleRemoved, VehicleUpdated,
+    CustomerAdded, CustomerBlocked, CustomerUnblocked,
+    RentalEvent, RentalCreated, RentalStarted, RentalCompleted,
+    RentalCancelled, RentalExtended, RentalUpdated
+)
+from models.vehicle import Car, VehicleCategory
+
+
+class TestEventBus:
+    """Tests pour la classe EventBus."""
+
+    def test_subscribe_by_type(self):
+        """Un abonné ne reçoit que les types demandés (et leurs sous-types)."""
+        bus = EventBus()
+        vehicle_events, added = [], []
+        bus.subscribe(VehicleEvent, vehicle_events.append)
+        bus.subscribe(VehicleAdded, added.append)
+
+        bus.publish(VehicleAdded("V1"), CustomerAdded("C1"), VehicleRemoved("V2"))
+
+        assert vehicle_events == [VehicleAdded("V1"), VehicleRemoved("V2")]
+        assert added == [VehicleAdded("V1")]
+
+    def test_batch_delivers_once(self):
+        """Les événements d'un lot sont livrés ensemble à la sortie du lot."""
+        bus = EventBus()
+        deliveries = []
+        bus.subscribe_batch(deliveries.append)
+
+        with bus.batch():
+            bus.publish(VehicleAdded("V1"))
+            with bus.batch():
+                bus.publish(VehicleAdded("V2"))
+            assert deliveries == []
+
+        assert deliveries == [[VehicleAdded("V1"), VehicleAdded("V2")]]
+
+    def test_batch_filters_by_type(self):
+        """Un abonné par lot ne reçoit que ses types, et rien si aucun ne correspond."""
+        bus = EventBus()
+        deliveries = []
+        bus.subscribe_batch(deliveries.append, (CustomerBlocked, CustomerUnblocked))
+
+        with bus.batch():
+            bus.publish(VehicleAdded("V1"), CustomerBlocked("C1"))
+        bus.publish(VehicleAdded("V2"))
+
+        assert deliveries == [[CustomerBlocked("C1")]]
+
+    def test_failing_handler_does_not_stop_delivery(self):
+        """L'erreur d'un abonné n'empêche pas la livraison aux autres."""
+        bus = EventBus()
+        received = []
+
+        def failing(event):
+            raise RuntimeError("abonné en échec")
+
+        bus.subscribe(SystemEvent, failing)
+        bus.subscribe(SystemEvent, received.append)
+        bus.publish(DataReloaded())
+
+        assert received == [DataReloaded()]
+
+    def test_failing_event_does_not_stop_following_events(self):
+        """L'erreur sur un événement n'empêche pas la livraison des suivants."""
+        bus = EventBus()
+        received = []
+
+        def failing_on_first(event):
+            if event.vehicle_id == "V1":
+                raise RuntimeError("abonné en échec")
+            received.append(event)
+
+        bus.subscribe(VehicleAdded, failing_on_first)
+        with bus.batch():
+            bus.publish(VehicleAdded("V1"), VehicleAdded("V2"))
+
+        assert received == [VehicleAdded("V2")]
+
+    def test_unsubscribe(self):
+        """Un abonné désabonné ne reçoit plus rien."""
+        bus = EventBus()
+        received = []
+        bus.subscribe(SystemEvent, received.append)
+        bus.unsubscribe(received.append)
+        bus.publish(DataReloaded())
+        assert received == []
+
+
+class TestSystemEvents:
+    """Tests des événements publiés par CarRentalSystem."""
+
+    @pytest.fixture
+    def system(self):
+        """Crée un système avec un véhicule et un client."""
+        system = CarRentalSystem("Test Agency")
+        system.add_vehicle(Car(
+            brand="Renault", model="Clio", category=VehicleCategory.ECONOMY,
+            daily_rate=45.0, year=2022, license_plate="AB-123-CD",
+            vehicle_id="CAR001"
+        ))
+        system.add_customer(Customer(
+            first_name="Jean", last_name="Dupont",
+            birth_date=date(1985, 3, 15),
+            license_number="123456789012",
+            license_types={"B"},
+            license_date=date(2005, 6, 20),
+            email="jean.dupont@email.com",
+            phone="0612345678",
+            customer_id="CUST001"
+        ))
+        return system
+
+    @pytest.fixture
+    def events(self, system):
+        """Liste des événements publiés par le système."""
+        received = []
+        system.events.subscribe(SystemEvent, received.append)
+        return received
+
+    def test_vehicle_events(self, system, events):
+        """Ajout et retrait de véhicule."""
+        car = Car(
+            brand="Peugeot", model="308", category=VehicleCategory.STANDARD,
+            daily_rate=50.0, year=2023, license_plate="EF-456-GH",
+            vehicle_id="CAR002"
+        )
+        system.add_vehicle(car)
+        system.add_vehicle(car)  # Doublon refusé: pas d'événement
+        system.update_vehicle(car)
+        system.remove_vehicle("CAR002")
+
+        assert events == [
+            VehicleAdded("CAR002"), VehicleUpdated("CAR002"), VehicleRemoved("CAR002")
+        ]
+
+    def test_rental_lifecycle_events(self, system, events):
+        """Création, démarrage, prolongation et fin d'une location."""
+        start = date.today() + timedelta(days=1)
+        rental, _ = system.create_rental("CUST001", "CAR001", start, start + timedelta(days=3))
+        system.start_rental(rental.id)
+        system.extend_rental(rental.id, start + timedelta(days=5))
+        system.complete_rental(rental.id, start + timedelta(days=5))
+
+        ids = (rental.id, "CUST001", "CAR001")
+        assert events == [
+            RentalCreated(*ids), RentalStarted(*ids),
+            RentalExtended(*ids), RentalCompleted(*ids)
+        ]
+
+    def test_rental_update_events(self, system, events):
+        """Modification des notes et de la date de fin d'une location."""
+        start = date.today() + timedelta(days=1)
+        rental, _ = system.create_rental(
+            "CUST001", "CAR001", start, start + timedelta(days=3), notes="Siège bébé"
+        )
+        version = system.data_version
+        system.update_rental(rental.id, notes="Siège bébé")  # Inchangé: pas d'événement
+        system.update_rental(rental.id, end_date=start + timedelta(days=1), notes="GPS")
+
+        ids = (rental.id, "CUST001", "CAR001")
+        assert events == [RentalCreated(*ids), RentalUpdated(*ids)]
+        assert system.data_version == version + 1
+
+    def test_rental_starting_today(self, system, events):
+        """Une location qui commence aujourd'hui est créée puis démarrée."""
+        today = date.today()
+        rental, _ = system.create_rental("CUST001", "CAR001", today, today + timedelta(days=2))
+        system.cancel_rental(rental.id)
+
+        assert [type(event) for event in events] == [RentalCreated, RentalStarted, RentalCancelled]
+        assert all(isinstance(event, RentalEvent) for event in events)
+
+    def test_failed_operation_publishes_nothing(self, system, events):
+        """Une opération refusée ne publie aucun événement."""
+        rental, _ = system.create_rental("UNKNOWN", "CAR001", date.today(), date.today())
+        assert rental is None
+        assert system.start_rental("UNKNOWN")[0] is False
+        assert events == []
+
+    def test_block_and_unblock_customer(self, system, events):
+        """Blocage et déblocage d'un client."""
+        assert system.block_customer("CUST001", "Impayé") is True
+        assert system.block_customer("CUST001", "Impayé") is False
+        assert system.get_customer("CUST001").is_blocked
+        assert system.unblock_customer("CUST001") is True
+
+        assert events == [CustomerBlocked("CUST001"), CustomerUnblocked("CUST001")]
+
+    def test_batch_events(self, system):
+        """Les modifications d'un bloc batch_events sont livrées en une fois."""
+        deliveries = []
+        system.events.subscribe_batch(deliveries.append, VehicleEvent)
+
+        with system.batch_events():
+            for i in range(3):
+                system.add_vehicle(Car(
+                    brand="Renault", model="Clio", category=VehicleCategory.ECONOMY,
+                    daily_rate=45.0, year=2022, license_plate=f"XY-{i:03d}-ZZ",
+                    vehicle_id=f"VEH{i:03d}"
+                ))
+
+        assert deliveries == [[VehicleAdded(f"VEH{i:03d}") for i in range(3)]]
+
+    def test_load_data_publishes_reload(self, system, events):
+        """Un chargement en bloc publie DataReloaded."""
+        vehicles, customers, rentals = system.snapshot()
+        system.load_data(vehicles, customers, rentals)
+        assert events == [DataReloaded()]
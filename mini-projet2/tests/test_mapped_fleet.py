@@ -0,0 +1,76 @@
+"""
+Tests unitaires pour le catalogue de flotte projeté en mémoire.
+"""
+
+import pytest
+
+import sys
+sys.path.insert(0, '..')
+
+from models.mapped_fleet import MappedFleet, export_fleet_catalog
+from models.vehicle import Car, Truck, Motorcycle, VehicleCategory, VehicleState
+from models.exceptions import DataLoadError
+
+
+class TestMappedFleet:
+    """Tests pour la classe MappedFleet."""
+
+    @pytest.fixture
+    def vehicles(self):
+        """Crée une petite flotte variée."""
+        fleet = [
+            Car("Renault", "Clio", VehicleCategory.ECONOMY, 35.0, 2022, "AB-123-CD",
+                vehicle_id="VEH003"),
+            Car("Peugeot", "308", VehicleCategory.STANDARD, 50.0, 2023, "EF-456-GH",
+                mileage=12000.0, vehicle_id="VEH001"),
+            Truck("Renault", "Master", VehicleCategory.UTILITY, 70.0, 2021, "TR-111-CK",
+                  cargo_capacity=12.0, max_weight=3000, vehicle_id="VEH002"),
+            Motorcycle("Yamaha", "MT-07", VehicleCategory.SPORT, 60.0, 2020, "MO-222-TO",
+                       engine_size=689, vehicle_id="VÉH004"),
+        ]
+        fleet[1].state = VehicleState.MAINTENANCE
+        return {vehicle.id: vehicle for vehicle in fleet}
+
+    @pytest.fixture
+    def fleet(self, vehicles, tmp_path):
+        """Exporte puis ouvre le catalogue."""
+        path = tmp_path / "fleet.catalog"
+        export_fleet_catalog(vehicles, path)
+        with MappedFleet(path) as mapped:
+            yield mapped
+
+    def test_get_vehicle(self, fleet):
+        """Test de la recherche par ID."""
+        vehicle = fleet.get_vehicle("VEH001")
+
+        assert len(fleet) == 4
+        assert vehicle.brand == "Peugeot"
+        assert vehicle.mileage == 12000.0
+        assert vehicle.state == VehicleState.MAINTENANCE
+        assert fleet.get_vehicle("VÉH004").get_vehicle_type() == "Moto"
+        assert fleet.get_vehicle("VEH999") is None
+
+    def test_search_vehicles(self, fleet):
+        """Test de la recherche multicritère."""
+        assert {v.id for v in fleet.search_vehicles(brand="renault")} == {"VEH002", "VEH003"}
+        assert [v.id for v in fleet.search_vehicles(max_daily_rate=40)] == ["VEH003"]
+        assert [v.id for v in fleet.search_vehicles(min_year=2023)] == ["VEH001"]
+
+    def test_get_available_vehicles(self, fleet):
+        """Test du filtrage des véhicules disponibles."""
+        available = fleet.get_available_vehicles()
+        cars = fleet.get_available_vehicles(vehicle_type="Voiture")
+        free = fleet.get_available_vehicles(unavailable_ids={"VEH002"})
+
+        assert {v.id for v in available} == {"VEH002", "VEH003", "VÉH004"}
+        assert [v.id for v in cars] == ["VEH003"]
+        assert "VEH002" not in {v.id for v in free}
+        assert fleet.get_available_vehicles(category=VehicleCategory.SPORT)[0].year == 2020
+
+    def test_invalid_catalog(self, tmp_path):
+        """Test d'un fichier qui n'est pas un catalogue."""
+        path = tmp_path / "fleet.catalog"
+        path.write_bytes(b"pas un catalogue")
+
+        with pytest.raises(DataLoadError):
+            MappedFleet(path)
@@ -0,0 +1,427 @@
+"""
+Tests unitaires pour la classe DataPersistence.
+"""
+
+import gc
+import json
+import pytest
+import threading
+from datetime import date, datetime, timedelta
+
+import sys
+sys.path.insert(0, '..')
+
+from models.persistence import DataPersistence, HistoricalRentalStore
+from models.vehicle import Car, VehicleCategory
+from models.customer import Customer
+from models.rental import Rental, RentalStatus
+from models.exceptions import DataLoadError
+from models.utils import gc_paused
+from car_rental_system import CarRentalSystem
+
+
+class TestDataPersistence:
+    """Tests pour la classe DataPersistence."""
+
+    @pytest.fixture
+    def persistence(self, tmp_path):
+        """Crée un gestionnaire de persistance dans un dossier temporaire."""
+        return DataPersistence(tmp_path)
+
+    @pytest.fixture
+    def sample_rentals(self):
+        """Crée quelques locations futures."""
+        start = date.today() + timedelta(days=1)
+        rentals = {}
+        for i in range(5):
+            rental = Rental(
+                customer_id=f"CUST{i:03d}",
+                vehicle_id=f"VEH{i:03d}",
+                start_date=start,
+                end_date=start + timedelta(days=i + 1),
+                daily_rate=40.0 + i,
+                rental_id=f"RENT{i:03d}"
+            )
+            rentals[rental.id] = rental
+        return rentals
+
+    # === JSON Lines ===
+
+    def test_jsonl_roundtrip(self, tmp_path, sample_rentals):
+        """Test de sauvegarde/chargement au format JSON Lines."""
+        persistence = DataPersistence(tmp_path, rentals_format="jsonl")
+        persistence.save_rentals(sample_rentals)
+
+        lines = persistence.rentals_jsonl_path.read_text(encoding='utf-8').splitlines()
+        assert len(lines) == 5
+
+        loaded = persistence.load_rentals()
+        assert set(loaded) == set(sample_rentals)
+        assert loaded["RENT002"].daily_rate == 42.0
+
+    def test_streaming_progress_callback(self, persistence, sample_rentals):
+        """Test du suivi de progression du chargement en flux."""
+        persistence.save_rentals_jsonl(sample_rentals)
+        calls = []
+
+        loaded = persistence.load_rentals_streaming(
+            progress_callback=lambda n, read, total: calls.append((n, read, total)),
+            progress_every=2
+        )
+
+        assert len(loaded) == 5
+        assert [n for n, _, _ in calls] == [2, 4, 5]
+        assert calls[-1][1] == calls[-1][2]
+
+    def test_streaming_progress_only_at_end(self, persistence, sample_rentals):
+        """Test de progress_every=0: un seul appel, en fin de lecture."""
+        persistence.save_rentals_jsonl(sample_rentals)
+        calls = []
+
+        persistence.load_rentals_streaming(
+            progress_callback=lambda n, read, total: calls.append(n),
+            progress_every=0
+        )
+
+        assert calls == [5]
+
+    def test_convert_rentals_to_jsonl(self, persistence, sample_rentals):
+        """Test de conversion du tableau JSON vers JSON Lines."""
+        persistence.save_rentals(sample_rentals)
+
+        converted = persistence.convert_rentals_to_jsonl(remove_source=True)
+
+        assert converted == 5
+        assert not persistence.rentals_path.exists()
+        assert set(persistence.load_rentals()) == set(sample_rentals)
+
+    def test_invalid_jsonl_line(self, persistence):
+        """Test d'une ligne JSON Lines invalide."""
+        persistence.rentals_jsonl_path.write_text("\n{pas du json\n", encoding='utf-8')
+
+        with pytest.raises(DataLoadError):
+            persistence.load_rentals_streaming()
+
+    def test_invalid_rentals_format(self, tmp_path):
+        """Test d'un format de locations inconnu."""
+        with pytest.raises(ValueError):
+            DataPersistence(tmp_path, rentals_format="xml")
+
+    def test_reload_keeps_completed_history(self, persistence, sample_rentals):
+        """Test que les locations terminées survivent au rechargement."""
+        rental = sample_rentals["RENT001"]
+        rental.complete_rental(rental.end_date + timedelta(days=2), end_mileage=1200.0)
+        sample_rentals["RENT002"].cancel_rental()
+
+        persistence.save_rentals(sample_rentals)
+        loaded = persistence.load_rentals()
+
+        restored = loaded["RENT001"]
+        assert restored.status == RentalStatus.COMPLETED
+        assert restored.actual_return_date == rental.actual_return_date
+        assert restored.penalty == rental.penalty > 0
+        assert restored.end_mileage == 1200.0
+        assert restored.created_at == rental.created_at
+        assert loaded["RENT002"].status == RentalStatus.CANCELLED
+
+    def test_past_rentals_not_dropped(self, persistence):
+        """Test que les locations passées ne sont ni ignorées ni décalées."""
+        record = {
+            'id': "OLD001", 'customer_id': "CUST000", 'vehicle_id': "VEH000",
+            'start_date': "2021-01-04", 'end_date': "2021-01-08",
+            'actual_return_date': "2021-01-08", '_status': "COMPLETED",
+            'status': "terminée", 'daily_rate': 40.0, 'created_at': "2021-01-01T09:00:00"
+        }
+        persistence.rentals_path.write_text(json.dumps([record]), encoding='utf-8')
+
+        loaded = persistence.load_rentals()
+
+        assert loaded["OLD001"].start_date == date(2021, 1, 4)
+        assert loaded["OLD001"].total_cost == 200.0
+
+    # === Chargement parallèle ===
+
+    @pytest.mark.parametrize("in_process", [False, True])
+    def test_parallel_load_all(self, persistence, sample_rentals, in_process):
+        """Test du chargement parallèle des trois fichiers."""
+        car = Car(
+            brand="Renault", model="Clio", category=VehicleCategory.ECONOMY,
+            daily_rate=45.0, year=2022, license_plate="AB-123-CD",
+            vehicle_id="VEH000"
+        )
+        persistence.save_all({car.id: car}, {}, sample_rentals)
+
+        vehicles, customers, rentals = persistence.load_all(
+            parallel=True, rentals_in_process=in_process
+        )
+
+        assert set(vehicles) == {"VEH000"}
+        assert customers == {}
+        assert set(rentals) == set(sample_rentals)
+        assert rentals["RENT003"].daily_rate == 43.0
+
+    def test_check_links(self, sample_rentals):
+        """Test de la vérification des références croisées."""
+        customer = Customer(
+            first_name="Jean", last_name="Dupont",
+            birth_date=date(1990, 5, 15), license_number="123456789012",
+            license_types={"B"}, license_date=date(2010, 6, 20),
+            email="jean.dupont@email.com", phone="0612345678",
+            customer_id="CUST000"
+        )
+        customer.add_rental("RENT000")
+        customer.add_rental("RENT999")
+        vehicles = {f"VEH{i:03d}": None for i in range(4)}
+
+        issues = DataPersistence.check_links(
+            vehicles, {customer.id: customer}, sample_rentals
+        )
+
+        assert len(issues) == 2
+        assert "RENT999" in issues[0]
+        assert "VEH004" in issues[1]
+
+    # === Snapshot binaire ===
+
+    def test_snapshot_roundtrip(self, persistence, sample_rentals):
+        """Test de sauvegarde/chargement du snapshot binaire."""
+        car = Car(
+            brand="Renault", model="Clio", category=VehicleCategory.ECONOMY,
+            daily_rate=45.0, year=2022, license_plate="AB-123-CD",
+            vehicle_id="VEH000"
+        )
+        customer = Customer(
+            first_name="Jean", last_name="Dupont",
+            birth_date=date(1990, 5, 15), license_number="123456789012",
+            license_types={"B", "A"}, license_date=date(2010, 6, 20),
+            email="jean.dupont@email.com", phone="0612345678",
+            customer_id="CUST000"
+        )
+        customer.add_rental("RENT000")
+        customer.block("Impayé")
+        rental = sample_rentals["RENT000"]
+        rental.notes = "Siège bébé"
+        rental.complete_rental(rental.end_date, end_mileage=150.0)
+        # Heure locale ambiguë (changement d'heure d'octobre)
+        rental._created_at = datetime(2025, 10, 26, 2, 30, 15, 123456)
+
+        persistence.save_snapshot({car.id: car}, {customer.id: customer}, sample_rentals)
+        vehicles, customers, rentals = persistence.load_snapshot()
+
+        assert vehicles["VEH000"].license_plate == "AB-123-CD"
+        assert isinstance(vehicles["VEH000"], Car)
+        loaded_customer = customers["CUST000"]
+        assert loaded_customer.license_types == {"B", "A"}
+        assert loaded_customer.active_rentals == ["RENT000"]
+        assert loaded_customer.blocked_reason == "Impayé"
+        loaded_rental = rentals["RENT000"]
+        assert loaded_rental.status == RentalStatus.COMPLETED
+        assert loaded_rental.end_mileage == 150.0
+        assert loaded_rental.notes == "Siège bébé"
+        assert loaded_rental.total_cost == rental.total_cost
+        assert loaded_rental.created_at == datetime(2025, 10, 26, 2, 30, 15, 123456)
+        assert rentals["RENT001"].end_mileage is None
+
+    def test_snapshot_checksum(self, persistence, sample_rentals):
+        """Test de détection d'un snapshot corrompu."""
+        persistence.save_snapshot({}, {}, sample_rentals)
+        data = bytearray(persistence.snapshot_path.read_bytes())
+        data[-1] ^= 0xFF
+        persistence.snapshot_path.write_bytes(bytes(data))
+
+        with pytest.raises(DataLoadError):
+            persistence.load_snapshot()
+
+    # === Historique partitionné ===
+
+    def test_partitioned_save_loads_only_open(self, tmp_path, sample_rentals):
+        """Test que seules les locations ouvertes sont chargées."""
+        persistence = DataPersistence(tmp_path, rentals_format="partitioned")
+        for rental_id in ("RENT000", "RENT001"):
+            rental = sample_rentals[rental_id]
+            rental.complete_rental(rental.end_date)
+        sample_rentals["RENT002"].cancel_rental()
+
+        persistence.save_rentals(sample_rentals)
+        loaded = persistence.load_rentals()
+
+        assert set(loaded) == {"RENT003", "RENT004"}
+        store = persistence.history_store
+        assert store.count() == 3
+        assert store.months_for_customer("CUST001") == [
+            HistoricalRentalStore.partition_key(sample_rentals["RENT001"])
+        ]
+        assert store.partitions_loaded == 0
+
+    def test_history_partition_lru(self, tmp_path, sample_rentals):
+        """Test du cache LRU des partitions."""
+        store = HistoricalRentalStore(tmp_path / "history", cache_size=1)
+        rentals = list(sample_rentals.values())
+        rentals[0].complete_rental(rentals[0].end_date)
+        rentals[1].complete_rental(rentals[1].end_date + timedelta(days=40))
+        store.merge(rentals[:2])
+        first, second = (store.partition_key(r) for r in rentals[:2])
+
+        restored = store.get_partition(first)["RENT000"]
+        store.get_partition(first)
+        store.get_partition(second)
+        store.get_partition(first)
+
+        assert restored.status == RentalStatus.COMPLETED
+        assert restored.actual_return_date == rentals[0].end_date
+        assert store.partitions_loaded == 3
+
+    def test_history_months_occupied_in_period(self, tmp_path, sample_rentals):
+        """Test que seules les partitions utiles à une période sont retenues."""
+        store = HistoricalRentalStore(tmp_path / "history")
+        rentals = list(sample_rentals.values())
+        rentals[0].complete_rental(rentals[0].end_date)
+        rentals[1].complete_rental(rentals[1].end_date + timedelta(days=40))
+        store.merge(rentals[:2])
+        first, second = (store.partition_key(r) for r in rentals[:2])
+        start = rentals[0].start_date
+
+        assert store.months_occupied_in_period(start, start) == [first, second]
+        # Le retour tardif reste dans la période suivante
+        later = start + timedelta(days=35)
+        assert store.months_occupied_in_period(later, later) == [second]
+        assert store.months_occupied_in_period(start - timedelta(days=400),
+                                               start - timedelta(days=300)) == []
+
+    def test_history_long_walk_keeps_cache(self, tmp_path, sample_rentals):
+        """Test qu'un parcours plus long que le cache ne l'évince pas."""
+        store = HistoricalRentalStore(tmp_path / "history", cache_size=1)
+        rentals = list(sample_rentals.values())
+        rentals[0].complete_rental(rentals[0].end_date)
+        rentals[1].complete_rental(rentals[1].end_date + timedelta(days=40))
+        store.merge(rentals[:2])
+        first, second = (store.partition_key(r) for r in rentals[:2])
+
+        store.get_partition(first)
+        assert len(list(store.iter_rentals([first, second]))) == 2
+        store.get_partition(first)
+
+        assert store.partitions_loaded == 2
+
+    def test_history_concurrent_reads(self, tmp_path, sample_rentals):
+        """Test de lectures simultanées avec un petit cache (évictions)."""
+        store = HistoricalRentalStore(tmp_path / "history", cache_size=1)
+        rentals = list(sample_rentals.values())
+        for i, rental in enumerate(rentals):
+            rental.complete_rental(rental.end_date + timedelta(days=40 * i))
+        store.merge(rentals)
+        months = store.months()
+        errors = []
+
+        def reader():
+            try:
+                for _ in range(50):
+                    for month in months:
+                        assert store.get_partition(month)
+                    assert len(list(store.iter_rentals(months))) == 5
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=reader) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(30)
+
+        assert errors == []
+        assert len(store._cache) == 1
+
+    def test_data_exists_with_history_only(self, tmp_path, sample_rentals):
+        """Test qu'un dossier ne contenant que l'historique n'est pas vide."""
+        persistence = DataPersistence(tmp_path)
+        assert not persistence.data_exists()
+
+        rental = sample_rentals["RENT000"]
+        rental.complete_rental(rental.end_date)
+        persistence.history_store.merge([rental])
+
+        assert persistence.data_exists()
+
+    def test_load_into_without_history(self, persistence, sample_rentals):
+        """Test du chargement dans un système sans historique sur disque."""
+        persistence.save_all({}, {}, sample_rentals)
+        system = CarRentalSystem()
+
+        persistence.load_into(system)
+
+        assert len(system.get_all_rentals()) == 5
+        assert system._history_store is None
+
+    def test_system_reads_history_on_demand(self, tmp_path, sample_rentals):
+        """Test de l'accès à l'historique depuis CarRentalSystem (load_into)."""
+        persistence = DataPersistence(tmp_path, rentals_format="partitioned")
+        completed = sample_rentals["RENT000"]
+        completed.complete_rental(completed.end_date)
+        persistence.save_rentals(sample_rentals)
+
+        system = CarRentalSystem()
+        DataPersistence(tmp_path, rentals_format="partitioned").load_into(system)
+
+        assert [r.id for r in system.get_customer_rentals("CUST000")] == ["RENT000"]
+        assert [r.id for r in system.get_vehicle_rentals("VEH001")] == ["RENT001"]
+        report = system.generate_revenue_report(completed.start_date, completed.end_date)
+        assert report['total_rentals_completed'] == 1
+        assert report['total_revenue'] == completed.total_cost
+
+    # === Détection des changements ===
+
+    def test_unchanged_save_is_skipped(self, persistence, sample_rentals):
+        """Test qu'une sauvegarde identique n'écrit pas sur disque."""
+        persistence.save_all({}, {}, sample_rentals)
+        persistence.save_all({}, {}, sample_rentals)
+        sample_rentals["RENT000"].notes = "Modifiée"
+        persistence.save_rentals(sample_rentals)
+
+        stats = persistence.get_write_stats()
+        assert stats['vehicles'] == {'written': 1, 'skipped': 1}
+        assert stats['rentals'] == {'written': 2, 'skipped': 1}
+
+    def test_loaded_file_not_rewritten(self, tmp_path, sample_rentals):
+        """Test qu'un fichier rechargé puis resauvegardé tel quel n'est pas réécrit."""
+        DataPersistence(tmp_path, rentals_format="jsonl").save_rentals(sample_rentals)
+        persistence = DataPersistence(tmp_path, rentals_format="jsonl")
+
+        persistence.save_rentals(persistence.load_rentals())
+
+        assert persistence.get_write_stats()['rentals'] == {'written': 0, 'skipped': 1}
+
+    def test_external_change_is_rewritten(self, persistence, sample_rentals):
+        """Test qu'un fichier modifié hors de l'application est réécrit."""
+        persistence.save_rentals(sample_rentals)
+        persistence.rentals_path.write_text("[]", encoding='utf-8')
+
+        persistence.save_rentals(sample_rentals)
+
+        assert persistence.get_write_stats()['rentals']['written'] == 2
+        assert len(persistence.load_rentals()) == 5
+
+
+class TestGcPaused:
+    """Tests pour la suspension du ramasse-miettes."""
+
+    def test_overlapping_pauses(self):
+        """Le GC reste suspendu tant qu'un thread est dans gc_paused."""
+        inside = threading.Event()
+        release = threading.Event()
+
+        def worker():
+            with gc_paused():
+                inside.set()
+                release.wait(5)
+
+        assert gc.isenabled()
+        thread = threading.Thread(target=worker)
+        with gc_paused():
+            thread.start()
+            inside.wait(5)
+        # Le thread est encore dans son bloc: le GC reste suspendu
+        assert not gc.isenabled()
+        release.set()
+        thread.join(5)
+
+        assert gc.isenabled()
@@ -0,0 +1,163 @@
+"""
+Tests unitaires pour le planning d'occupation de la flotte.
+"""
+
+import pytest
+from datetime import date, timedelta
+
+import numpy as np
+
+import sys
+sys.path.insert(0, '..')
+
+from car_rental_system import CarRentalSystem
+from models.customer import Customer
+from models.planning import FleetPlanning
+from models.rental import Rental, RentalStatus
+from models.vehicle import Car, VehicleCategory
+
+
+def make_car(index: int) -> Car:
+    return Car(
+        brand="Renault", model="Clio", category=VehicleCategory.ECONOMY,
+        daily_rate=45.0, year=2022, license_plate=f"AB-{index:03d}-CD",
+        vehicle_id=f"CAR{index:03d}"
+    )
+
+
+def make_rental(vehicle_id: str, start: date, days: int, rental_id: str) -> Rental:
+    return Rental(
+        customer_id="CUST001", vehicle_id=vehicle_id,
+        start_date=start, end_date=start + timedelta(days=days - 1),
+        daily_rate=45.0, rental_id=rental_id
+    )
+
+
+class TestFleetPlanning:
+    """Tests pour la classe FleetPlanning."""
+
+    @pytest.fixture
+    def start(self):
+        return date.today() + timedelta(days=1)
+
+    @pytest.fixture
+    def planning(self, start):
+        """Planning de 30 jours sur 4 véhicules, 3 locations."""
+        vehicles = [make_car(i) for i in range(4)]
+        rentals = [
+            make_rental("CAR000", start, 3, "R1"),
+            make_rental("CAR000", start + timedelta(days=10), 5, "R2"),
+            make_rental("CAR002", start + timedelta(days=25), 10, "R3"),  # Dépasse la fenêtre
+            make_rental("UNKNOWN", start, 3, "R4"),
+        ]
+        planning = FleetPlanning(start, 30)
+        planning.load(vehicles, rentals)
+        return planning
+
+    def test_invalid_window(self, start):
+        """Une fenêtre vide est refusée."""
+        with pytest.raises(ValueError):
+            FleetPlanning(start, 0)
+
+    def test_load(self, planning, start):
+        """Une ligne par véhicule, barres rognées à la fenêtre."""
+        assert planning.row_count == 4
+        assert planning.row_of("CAR002") == 2
+        assert planning.row_of("UNKNOWN") is None
+        assert planning.end_date == start + timedelta(days=29)
+        assert planning.bar_count == 3
+
+        bars = [bar for _, bar in planning.bars(2, 2, 0, 29)]
+        assert [(bar.rental_id, bar.first_day, bar.last_day) for bar in bars] == [("R3", 25, 29)]
+        assert bars[0].status == RentalStatus.RESERVED
+
+    def test_bars_culling(self, planning):
+        """Seules les barres qui recoupent la zone sont renvoyées."""
+        assert [bar.rental_id for _, bar in planning.bars(0, 3, 5, 12)] == ["R2"]
+        assert [bar.rental_id for _, bar in planning.bars(1, 1, 0, 29)] == []
+        assert planning.bar_at(0, 2).rental_id == "R1"
+        assert planning.bar_at(0, 3) is None
+
+    def test_occupancy_grid(self, planning):
+        """Taux d'occupation par blocs, blocs de bord compris."""
+        grid = planning.occupancy_grid(2, 10)
+        assert grid.shape == (2, 3)
+        # Lignes 0-1, jours 0-9: 3 jours occupés sur 20 cases
+        assert grid[0, 0] == pytest.approx(3 / 20)
+        assert grid[0, 1] == pytest.approx(5 / 20)
+        assert grid[1, 2] == pytest.approx(5 / 20)
+        assert planning.occupancy_grid(1, 1).sum() == 3 + 5 + 5
+
+    def test_grid_cache_bounded(self, planning):
+        """Seules les grilles des derniers niveaux de zoom sont gardées."""
+        first = planning.occupancy_grid(1, 1)
+        for day_step in range(2, FleetPlanning.MAX_GRIDS + 2):
+            planning.occupancy_grid(1, day_step)
+
+        assert len(planning._grids) == FleetPlanning.MAX_GRIDS
+        assert planning.occupancy_grid(1, 1) is not first
+        assert planning.occupancy_grid(1, 1) is planning.occupancy_grid(1, 1)
+
+    def test_update_vehicle(self, planning, start):
+        """La mise à jour d'un véhicule tient les grilles calculées à jour."""
+        grid = planning.occupancy_grid(2, 10)
+        rental = make_rental("CAR001", start, 10, "R5")
+        assert planning.update_vehicle("CAR001", [rental]) == 1
+        assert planning.update_vehicle("UNKNOWN", [rental]) is None
+
+        assert grid[0, 0] == pytest.approx(13 / 20)
+        expected = FleetPlanning._block_rates(planning._occupied, 2, 10)
+        assert np.allclose(planning.occupancy_grid(2, 10), expected)
+
+        rental.cancel_rental()
+        planning.update_vehicle("CAR001", [rental])
+        assert planning.bar_at(1, 0) is None
+        assert grid[0, 0] == pytest.approx(3 / 20)
+
+    def test_update_rental(self, planning, start):
+        """Une location modifiée ne touche que sa barre, même si elle change de véhicule."""
+        grid = planning.occupancy_grid(1, 1)
+        rental = make_rental("CAR000", start + timedelta(days=4), 2, "R5")
+        assert planning.update_rental("R5", rental) == {0}
+        assert [bar.rental_id for _, bar in planning.bars(0, 0, 0, 29)] == ["R1", "R5", "R2"]
+
+        moved = make_rental("CAR003", start + timedelta(days=4), 2, "R5")
+        assert planning.update_rental("R5", moved) == {0, 3}
+        assert planning.bar_at(0, 4) is None
+        assert planning.bar_at(3, 4).rental_id == "R5"
+        assert grid[3, 4] == 1
+
+        assert planning.update_rental("R5", None) == {3}
+        assert planning.bar_count == 3
+        assert grid.sum() == 3 + 5 + 5
+
+
+class TestRentalsBetween:
+    """Tests de CarRentalSystem.get_rentals_between."""
+
+    def test_rentals_between(self):
+        """Seules les locations non annulées qui recoupent la période sont renvoyées."""
+        system = CarRentalSystem("Test Agency")
+        for i in range(2):
+            system.add_vehicle(make_car(i))
+        system.add_customer(Customer(
+            first_name="Jean", last_name="Dupont",
+            birth_date=date(1985, 3, 15),
+            license_number="123456789012",
+            license_types={"B"},
+            license_date=date(2005, 6, 20),
+            email="jean.dupont@email.com",
+            phone="0612345678",
+            customer_id="CUST001"
+        ))
+        start = date.today() + timedelta(days=1)
+        first, _ = system.create_rental("CUST001", "CAR000", start, start + timedelta(days=2))
+        later, _ = system.create_rental(
+            "CUST001", "CAR001", start + timedelta(days=20), start + timedelta(days=22)
+        )
+        cancelled, _ = system.create_rental("CUST001", "CAR001", start, start + timedelta(days=2))
+        system.cancel_rental(cancelled.id)
+
+        found = system.get_rentals_between(start + timedelta(days=1), start + timedelta(days=5))
+        assert [rental.id for rental in found] == [first.id]
+        assert len(system.get_rentals_between(start, start + timedelta(days=30))) == 2
@@ -209,6 +209,20 @@ class TestRental:
         expected = (active_rental.end_date - date.today()).days
         assert active_rental.days_remaining() == expected
     
+    def test_rental_occupied_until(self, sample_rental, active_rental, future_date):
+        """Test du dernier jour d'occupation du véhicule selon le statut."""
+        assert sample_rental.occupied_until() == sample_rental.end_date
+        
+        # En retard: occupé au moins jusqu'à aujourd'hui
+        late_today = active_rental.end_date + timedelta(days=3)
+        assert active_rental.occupied_until(late_today) == late_today
+        
+        active_rental.complete_rental(date.today() + timedelta(days=2))
+        assert active_rental.occupied_until() == date.today() + timedelta(days=2)
+        
+        sample_rental.cancel_rental()
+        assert sample_rental.occupied_until() is None
+    
     def test_rental_distance_traveled(self, sample_rental):
         """Test du calcul de distance."""
         assert sample_rental.distance_traveled is None
@@ -237,6 +251,27 @@ class TestRental:
         string = str(sample_rental)
         assert "Location" in string
         assert "réservée" in string
+    
+    def test_rental_from_record_past(self):
+        """Test de la restauration d'une location terminée dans le passé."""
+        record = {
+            'id': "RENT001", 'customer_id': "CUST001", 'vehicle_id': "VEH001",
+            'start_date': "2020-03-01", 'end_date': "2020-03-05",
+            'actual_return_date': "2020-03-07", 'status': "terminée",
+            'daily_rate': 50.0, 'discount_applied': 0.0, 'penalty': 100.0,
+            'start_mileage': 10000.0, 'end_mileage': 10350.0, 'notes': "",
+            'created_at': "2020-02-20T10:00:00"
+        }
+        
+        rental = Rental.from_record(record)
+        
+        assert rental.status == RentalStatus.COMPLETED
+        assert rental.start_date == date(2020, 3, 1)
+        assert rental.actual_return_date == date(2020, 3, 7)
+        assert rental.penalty == 100.0
+        assert rental.distance_traveled == 350.0
+        assert rental.created_at.year == 2020
+        assert rental.to_dict()['status'] == "terminée"
 
 
 if __name__ == "__main__":
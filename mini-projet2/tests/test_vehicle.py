@@ -12,6 +12,7 @@ from models.vehicle import (
     Vehicle, Car, Truck, Motorcycle,
     VehicleState, VehicleCategory
 )
+from models.vehicle_codec import encode_vehicle, decode_vehicle, get_codec
 
 
 class TestVehicleState:
@@ -333,5 +334,53 @@ class TestMotorcycle:
         assert cost == expected
 
 
+
+class TestVehicleCodec:
+    """Tests pour le registre de codecs de véhicules."""
+    
+    @pytest.mark.parametrize("vehicle", [
+        Car("Renault", "Clio", VehicleCategory.ECONOMY, 45.0, 2022, "AB-123-CD",
+            num_doors=3, fuel_type="diesel", vehicle_id="VEH001"),
+        Truck("Renault", "Master", VehicleCategory.UTILITY, 90.0, 2021, "EF-456-GH",
+              cargo_capacity=12.0, max_weight=3500, has_tail_lift=True, vehicle_id="VEH002"),
+        Motorcycle("Yamaha", "MT-07", VehicleCategory.SPORT, 70.0, 2023, "IJ-789-KL",
+                   engine_size=689, motorcycle_type="roadster", vehicle_id="VEH003"),
+    ])
+    def test_roundtrip(self, vehicle):
+        """Test d'encodage puis décodage de chaque type de véhicule."""
+        vehicle.state = VehicleState.MAINTENANCE
+        
+        data = encode_vehicle(vehicle)
+        restored = decode_vehicle(data)
+        
+        assert data['_class'] == type(vehicle).__name__
+        assert data['state'] == VehicleState.MAINTENANCE.value
+        assert 'minimum_age' not in data
+        assert {k: v for k, v in vehicle.to_dict().items()
+                if k not in ('minimum_age', 'required_license')}.items() <= data.items()
+        assert type(restored) is type(vehicle)
+        assert restored.state == VehicleState.MAINTENANCE
+        assert restored.to_dict() == vehicle.to_dict()
+    
+    def test_decode_by_french_type(self):
+        """Test du décodage d'un ancien enregistrement sans '_class'."""
+        data = {
+            'id': "VEH010", 'type': "Moto", 'brand': "Honda", 'model': "CB125",
+            'category': "économique", 'daily_rate': 30.0, 'year': 2020,
+            'license_plate': "MN-012-OP"
+        }
+        
+        moto = decode_vehicle(data)
+        
+        assert isinstance(moto, Motorcycle)
+        assert moto.engine_size == 125
+        assert moto.state == VehicleState.AVAILABLE
+    
+    def test_unknown_type(self):
+        """Test d'un type de véhicule inconnu."""
+        assert decode_vehicle({'_class': "Bateau"}) is None
+        assert get_codec("Voiture").vehicle_class is Car
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])